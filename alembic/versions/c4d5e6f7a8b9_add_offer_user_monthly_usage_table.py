@@ -0,0 +1,54 @@
+"""add offer_user_monthly_usage table
+
+Revision ID: c4d5e6f7a8b9
+Revises: b3e4f5a6c7d8
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d5e6f7a8b9"
+down_revision: Union[str, Sequence[str], None] = "b3e4f5a6c7d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "offer_user_monthly_usage",
+        sa.Column("offer_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column(
+            "cashback_amount",
+            sa.Numeric(precision=12, scale=2),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["offer_id"], ["offers.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("offer_id", "user_id", "month"),
+    )
+
+    # Backfill from existing purchases so caps count cashback granted before
+    # this table existed. Rejected and reversed purchases no longer use cap.
+    op.execute("""
+        INSERT INTO offer_user_monthly_usage (offer_id, user_id, month, cashback_amount)
+        SELECT offer_id, user_id, date_trunc('month', created_at)::date,
+               SUM(cashback_amount)
+        FROM purchases
+        WHERE offer_id IS NOT NULL AND status IN ('pending', 'confirmed')
+        GROUP BY offer_id, user_id, date_trunc('month', created_at)::date
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("offer_user_monthly_usage")
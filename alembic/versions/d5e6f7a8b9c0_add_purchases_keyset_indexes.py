@@ -0,0 +1,43 @@
+"""add purchases keyset pagination indexes
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: Union[str, Sequence[str], None] = "c4d5e6f7a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_purchases_created_at_id",
+        "purchases",
+        ["created_at", "id"],
+        unique=False,
+    )
+    # Supersedes ix_purchases_user_id: the leading column still serves
+    # user_id lookups, and the rest matches the per-user listing order.
+    op.create_index(
+        "ix_purchases_user_id_created_at_id",
+        "purchases",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_purchases_user_id", table_name="purchases")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_purchases_user_id", "purchases", ["user_id"], unique=False)
+    op.drop_index("ix_purchases_user_id_created_at_id", table_name="purchases")
+    op.drop_index("ix_purchases_created_at_id", table_name="purchases")
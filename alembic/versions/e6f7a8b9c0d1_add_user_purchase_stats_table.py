@@ -0,0 +1,60 @@
+"""add user_purchase_stats table
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d1"
+down_revision: Union[str, Sequence[str], None] = "d5e6f7a8b9c0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_purchase_stats",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column(
+            "purchase_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column(
+            "amount_total",
+            sa.Numeric(precision=14, scale=2),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "cashback_total",
+            sa.Numeric(precision=14, scale=2),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "status"),
+    )
+
+    # Backfill from existing purchases; from here on the repository keeps the
+    # counters in step with every insert and status change.
+    op.execute("""
+        INSERT INTO user_purchase_stats
+            (user_id, status, purchase_count, amount_total, cashback_total)
+        SELECT user_id, status, COUNT(*), SUM(amount), SUM(cashback_amount)
+        FROM purchases
+        GROUP BY user_id, status
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_purchase_stats")
@@ -0,0 +1,51 @@
+"""add partial indexes on live offers
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e2"
+down_revision: Union[str, Sequence[str], None] = "e6f7a8b9c0d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Offers that already ended are indexed until the first offer sweep
+    # deactivates them.
+    # Supersedes ix_offers_merchant_active for the active-offer lookups;
+    # ix_offers_merchant_id still serves the admin listing's merchant filter.
+    op.create_index(
+        "ix_offers_live_merchant_id",
+        "offers",
+        ["merchant_id"],
+        unique=False,
+        postgresql_where=sa.text("active"),
+    )
+    op.create_index(
+        "ix_offers_live_end_date",
+        "offers",
+        ["end_date"],
+        unique=False,
+        postgresql_where=sa.text("active"),
+    )
+    op.drop_index("ix_offers_merchant_active", table_name="offers")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_offers_merchant_active", "offers", ["merchant_id", "active"], unique=False
+    )
+    op.drop_index("ix_offers_live_end_date", table_name="offers")
+    op.drop_index("ix_offers_live_merchant_id", table_name="offers")
@@ -9,14 +9,20 @@ from app.auth.exceptions import (
 )
 from app.auth.schemas import Login, RefreshTokenRequest, TokenResponse
 from app.auth.services import AuthService
+from app.core.current_user import get_current_admin_user
 from app.core.errors.builders import (
     authentication_error,
     error_response,
     internal_server_error,
+    service_unavailable_error,
 )
 from app.core.errors.codes import ErrorCode
 from app.core.logging import logging
+from app.core.password_hashing import PasswordHasher, PasswordHashingBusyException
+from app.core.schemas import PasswordHashingStatsOut
 from app.core.unit_of_work import UnitOfWorkABC
+from app.users.composition import get_password_hasher_pool
+from app.users.models import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -38,6 +44,13 @@ async def login(
     except (UserNotFoundException, PasswordVerificationException):
         raise authentication_error("Invalid email or password.")
 
+    except PasswordHashingBusyException as exc:
+        logging.warning("Login shed: password hashing queue is full.")
+        raise service_unavailable_error(
+            message="Too many logins are in progress. Please retry later.",
+            retry_after_seconds=exc.retry_after_seconds,
+        )
+
     except Exception as e:
         logging.error(
             "An unexpected error occurred during login.", extra={"error": str(e)}
@@ -87,3 +100,17 @@ async def refresh(
             extra={"error": str(e)},
         )
         raise internal_server_error()
+
+
+@router.get(
+    "/password-hashing",
+    description=(
+        "Statistics of this worker's password hashing pool (bcrypt), used by "
+        "login and registration. Admin access required."
+    ),
+)
+async def get_password_hashing_stats(
+    password_hasher: PasswordHasher = Depends(get_password_hasher_pool),
+    _current_user: User = Depends(get_current_admin_user),
+) -> PasswordHashingStatsOut:
+    return PasswordHashingStatsOut.model_validate(password_hasher.stats())
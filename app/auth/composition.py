@@ -1,19 +1,34 @@
-from typing import Callable
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from fastapi import Depends
-from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.clients import UsersClient
+from app.auth.jobs.purge_refresh_tokens import make_purge_refresh_tokens_task
 from app.auth.repositories import RefreshTokenRepository
 from app.auth.services import AuthService
 from app.auth.token_provider import JwtOAuth2TokenProvider, OAuth2TokenProviderABC
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.core.database import get_async_db
+from app.core.database import AsyncSessionLocal, get_async_db
+from app.core.scheduler import ScheduledTask
 from app.core.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWorkABC
+from app.users.composition import get_password_hasher_pool
 from app.users.repositories import UserRepository
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Process-wide: every request builds its own token provider, but verified
+# tokens must be remembered across requests. Entries also expire at the
+# token's exp, which the provider checks on every hit.
+_verified_token_cache: TTLCache[bytes, Any] = TTLCache(
+    max_size=settings.verified_token_cache_max_size,
+    ttl_seconds=settings.oauth_access_token_ttl * 60,
+)
+
+
+def get_verified_token_cache() -> TTLCache[bytes, Any]:
+    return _verified_token_cache
 
 
 def get_users_client(user_repository: UserRepository = Depends()):
@@ -22,12 +37,14 @@ def get_users_client(user_repository: UserRepository = Depends()):
 
 def get_token_provider():
     return JwtOAuth2TokenProvider(
-        settings.oauth_access_token_ttl, settings.oauth_refresh_token_ttl
+        settings.oauth_access_token_ttl,
+        settings.oauth_refresh_token_ttl,
+        verified_token_cache=get_verified_token_cache(),
     )
 
 
-def get_password_verifier() -> Callable[[str, str], bool]:
-    return pwd_context.verify
+def get_password_verifier() -> Callable[[str, str], Awaitable[bool]]:
+    return get_password_hasher_pool().verify
 
 
 def get_refresh_token_repository():
@@ -44,8 +61,23 @@ def get_auth_service(
     refresh_token_repository: RefreshTokenRepository = Depends(
         get_refresh_token_repository
     ),
-    verify_password: Callable[[str, str], bool] = Depends(get_password_verifier),
+    verify_password: Callable[[str, str], Awaitable[bool]] = Depends(
+        get_password_verifier
+    ),
 ):
     return AuthService(
         users_client, token_provider, refresh_token_repository, verify_password
     )
+
+
+def get_purge_refresh_tokens_task() -> ScheduledTask:
+    return make_purge_refresh_tokens_task(
+        repository=RefreshTokenRepository(),
+        db_session_factory=AsyncSessionLocal,
+        batch_size=settings.refresh_token_purge_batch_size,
+        pause_seconds=settings.refresh_token_purge_pause_seconds,
+        used_retention=timedelta(
+            hours=settings.refresh_token_purge_used_retention_hours
+        ),
+        now_provider=lambda: datetime.now(timezone.utc),
+    )
@@ -0,0 +1,5 @@
+"""Auth background jobs.
+
+Jobs are wired in ``app/auth/composition.py`` and scheduled in
+``app/main.py``.
+"""
@@ -0,0 +1,89 @@
+"""Refresh token purge.
+
+Every login and refresh inserts a ``refresh_tokens`` row and nothing else
+removes one, so the table and its ``token_hash`` unique index grow with every
+rotation. The purge deletes tokens that can no longer be redeemed:
+
+- expired tokens, and
+- used tokens, once they are older than the retention period. Until then a
+  replayed token is still recognised and answered with ``TOKEN_REVOKED``;
+  after it, a replay gets the generic invalid-token error.
+
+Deletes run in small keyset batches, each its own short transaction, with a
+pause between them so row locks, WAL volume and replication lag stay bounded
+while the table catches up after a long backlog.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.repositories import RefreshTokenRepositoryABC
+from app.core.logging import logger
+from app.core.scheduler import ScheduledTask
+
+
+def make_purge_refresh_tokens_task(
+    *,
+    repository: RefreshTokenRepositoryABC,
+    db_session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int,
+    pause_seconds: float,
+    used_retention: timedelta,
+    now_provider: Callable[[], datetime],
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> ScheduledTask:
+    """Return a ScheduledTask that deletes expired and retained-out used tokens.
+
+    A run walks the table once in primary-key order and stops after the
+    first short batch. An interrupted run keeps the batches already done.
+    """
+
+    async def task() -> None:
+        now = now_provider()
+        used_before = now - used_retention
+        started = clock()
+        deleted = 0
+        batches = 0
+        after_id: str | None = None
+        try:
+            while True:
+                async with db_session_factory() as db:
+                    ids = await repository.delete_stale_batch(
+                        db,
+                        now=now,
+                        used_before=used_before,
+                        after_id=after_id,
+                        batch_size=batch_size,
+                    )
+                    await db.commit()
+                batches += 1
+                deleted += len(ids)
+                if len(ids) < batch_size:
+                    break
+                after_id = max(ids)
+                await sleep(pause_seconds)
+        except Exception as e:
+            # The scheduler loop stops on an exception; the next run retries.
+            logger.error(
+                "Refresh token purge failed.",
+                extra={"error": str(e), "deleted_count": deleted},
+            )
+            return
+        if deleted:
+            elapsed = clock() - started
+            logger.info(
+                "Stale refresh tokens purged.",
+                extra={
+                    "deleted_count": deleted,
+                    "batch_count": batches,
+                    "elapsed_seconds": round(elapsed, 3),
+                    "rows_per_second": round(deleted / elapsed) if elapsed else None,
+                },
+            )
+
+    return task
@@ -2,11 +2,13 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import DateTime, delete, insert, literal, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.models import RefreshToken
+from app.users.models import User
 
 
 class RefreshTokenRepositoryABC(ABC):
@@ -32,10 +34,46 @@ class RefreshTokenRepositoryABC(ABC):
         pass
 
     @abstractmethod
-    async def mark_as_used(
-        self, db: AsyncSession, token_id: str, used_at: datetime
-    ) -> None:
-        """Mark a token as used (enforce single-use)."""
+    async def consume(
+        self, db: AsyncSession, token_hash: str, used_at: datetime
+    ) -> str | None:
+        """Mark an unused, unexpired token as used and return its user ID.
+
+        Returns None when no such token exists (unknown, expired or already
+        used), in which case nothing is changed.
+        """
+        pass
+
+    @abstractmethod
+    async def issue(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        token_hash: str,
+        issued_at: datetime,
+        expires_at: datetime,
+    ) -> str | None:
+        """Store a new token for an existing user and return the user's role.
+
+        Returns None, storing nothing, when the user does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_stale_batch(
+        self,
+        db: AsyncSession,
+        *,
+        now: datetime,
+        used_before: datetime,
+        after_id: str | None,
+        batch_size: int,
+    ) -> list[str]:
+        """Delete up to batch_size expired or used tokens and return their IDs.
+
+        Tokens count as used once used_at is before used_before. Only tokens
+        whose ID sorts after after_id are considered.
+        """
         pass
 
 
@@ -70,14 +108,102 @@ class RefreshTokenRepository(RefreshTokenRepositoryABC):
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
-    async def mark_as_used(
-        self, db: AsyncSession, token_id: str, used_at: datetime
-    ) -> None:
-        """Mark a token as used and increment rotation count."""
-        query = select(RefreshToken).where(RefreshToken.id == token_id)
+    async def consume(
+        self, db: AsyncSession, token_hash: str, used_at: datetime
+    ) -> str | None:
+        """Mark an unused, unexpired token as used and return its user ID.
+
+        The conditions and the write are one statement, so two concurrent
+        refreshes with the same token cannot both succeed: the row lock makes
+        the second one re-check ``used_at`` and match nothing.
+        """
+        query = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.expires_at > used_at,
+            )
+            .values(used_at=used_at, rotation_count=RefreshToken.rotation_count + 1)
+            .returning(RefreshToken.user_id)
+        )
         result = await db.execute(query)
-        token = result.scalar_one_or_none()
-        if token:
-            token.used_at = used_at
-            token.rotation_count += 1
-            await db.flush()
+        return result.scalar_one_or_none()
+
+    async def issue(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        token_hash: str,
+        issued_at: datetime,
+        expires_at: datetime,
+    ) -> str | None:
+        """Store a new token for an existing user and return the user's role.
+
+        One statement: the insert selects from the user row, so it stores
+        nothing for an unknown user, and the same row supplies the role.
+        """
+        target_user = select(User.id, User.role).where(User.id == user_id).cte()
+        issued = (
+            insert(RefreshToken)
+            .from_select(
+                [
+                    RefreshToken.id,
+                    RefreshToken.user_id,
+                    RefreshToken.token_hash,
+                    RefreshToken.issued_at,
+                    RefreshToken.expires_at,
+                    RefreshToken.rotation_count,
+                ],
+                select(
+                    literal(str(uuid4())),
+                    target_user.c.id,
+                    literal(token_hash),
+                    literal(issued_at, DateTime(timezone=True)),
+                    literal(expires_at, DateTime(timezone=True)),
+                    literal(0),
+                ),
+            )
+            .returning(RefreshToken.user_id)
+            .cte()
+        )
+        query = select(target_user.c.role).join_from(
+            target_user, issued, issued.c.user_id == target_user.c.id
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def delete_stale_batch(
+        self,
+        db: AsyncSession,
+        *,
+        now: datetime,
+        used_before: datetime,
+        after_id: str | None,
+        batch_size: int,
+    ) -> list[str]:
+        # Keyset batch on the primary key: each batch starts where the last
+        # one ended instead of rescanning the rows it kept. SKIP LOCKED leaves
+        # tokens a concurrent refresh is consuming to the next run.
+        batch = (
+            select(RefreshToken.id)
+            .where(
+                or_(
+                    RefreshToken.expires_at <= now,
+                    RefreshToken.used_at < used_before,
+                )
+            )
+            .order_by(RefreshToken.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        if after_id is not None:
+            batch = batch.where(RefreshToken.id > after_id)
+        stmt = (
+            delete(RefreshToken)
+            .where(RefreshToken.id.in_(batch.scalar_subquery()))
+            .returning(RefreshToken.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
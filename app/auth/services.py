@@ -1,5 +1,6 @@
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable
+from typing import Any, NoReturn
 
 from app.auth import policies
 from app.auth.clients import UsersClientABC
@@ -21,7 +22,7 @@ class AuthService:
         users_client: UsersClientABC,
         token_provider: OAuth2TokenProviderABC,
         refresh_token_repository: RefreshTokenRepositoryABC,
-        verify_password: Callable[[str, str], bool],
+        verify_password: Callable[[str, str], Awaitable[bool]],
     ):
         self.users_client = users_client
         self.token_provider = token_provider
@@ -40,7 +41,7 @@ class AuthService:
         # Enforce business rules via policies
         policies.enforce_user_exists(user, email)
         policies.enforce_password_valid(
-            self.verify_password(password, str(user.hashed_password))
+            await self.verify_password(password, str(user.hashed_password))
         )
 
         # Create access token
@@ -81,43 +82,36 @@ class AuthService:
             user_id = self.token_provider.verify_refresh_token(refresh_token)
             token_hash = self.token_provider.hash_refresh_token(refresh_token)
 
-            # Look up the refresh token in the database
-            stored_token = await self.refresh_token_repository.get_by_hash(
-                uow.session, token_hash
-            )
-
             now = datetime.now(timezone.utc)
 
-            # Enforce business rules via policies
-            policies.enforce_refresh_token_exists(stored_token, user_id)
-            policies.enforce_refresh_token_not_expired(stored_token, now)
-            policies.enforce_refresh_token_not_used(stored_token)
-
-            # Mark the old token as used (enforce single-use)
-            await self.refresh_token_repository.mark_as_used(
-                uow.session, stored_token.id, now
+            # Mark the old token as used (enforce single-use) in one conditional
+            # write; only one of several concurrent refreshes can win it
+            consumed = await self.refresh_token_repository.consume(
+                uow.session, token_hash, now
             )
-
-            # Fetch user to get their role
-            user = await self.users_client.get_user_by_id(uow.session, user_id)
-            policies.enforce_user_exists_for_refresh(user, user_id)
+            if consumed is None:
+                await self._raise_for_unconsumable_token(token_hash, user_id, now, uow)
+
+            # Generate new refresh token (token rotation); the same statement
+            # returns the user's role
+            new_refresh_token = self.token_provider.create_refresh_token(user_id)
+            user_role = await self.refresh_token_repository.issue(
+                uow.session,
+                user_id=user_id,
+                token_hash=self.token_provider.hash_refresh_token(new_refresh_token),
+                issued_at=now,
+                expires_at=self._refresh_token_expiry(now),
+            )
+            policies.enforce_user_exists_for_refresh(user_role, user_id)
 
             # Generate new access token
             new_access_token = self.token_provider.create_access_token(
-                payload=TokenPayload(user_id=user_id, user_role=str(user.role))
-            )
-
-            # Generate new refresh token (token rotation)
-            new_refresh_token = await self._create_refresh_token_record(
-                user_id, now, uow
+                payload=TokenPayload(user_id=user_id, user_role=str(user_role))
             )
 
             await uow.commit()
 
-            logger.info(
-                "Token refresh successful.",
-                extra={"user_id": user_id, "old_token_id": stored_token.id},
-            )
+            logger.info("Token refresh successful.", extra={"user_id": user_id})
 
             return TokenResponse(
                 access_token=new_access_token,
@@ -131,6 +125,27 @@ class AuthService:
             logger.error("Error during token refresh.", extra={"error": str(e)})
             raise InvalidRefreshTokenException("Token refresh failed.")
 
+    async def _raise_for_unconsumable_token(
+        self, token_hash: str, user_id: str, now: datetime, uow: UnitOfWorkABC
+    ) -> NoReturn:
+        """Raise the error that explains why a token could not be consumed.
+
+        Only runs on the failure path, so the extra read costs nothing on a
+        successful refresh.
+        """
+        stored_token = await self.refresh_token_repository.get_by_hash(
+            uow.session, token_hash
+        )
+        policies.enforce_refresh_token_exists(stored_token, user_id)
+        policies.enforce_refresh_token_not_expired(stored_token, now)
+        policies.enforce_refresh_token_not_used(stored_token)
+        # The token was valid when read: a concurrent refresh expired or used
+        # it between the two statements.
+        raise InvalidRefreshTokenException("Token refresh failed.")
+
+    def _refresh_token_expiry(self, now: datetime) -> datetime:
+        return now + timedelta(minutes=self.token_provider.refresh_ttl_in_minutes)
+
     async def _create_refresh_token_record(
         self, user_id: str, now: datetime, uow: UnitOfWorkABC
     ) -> str:
@@ -151,7 +166,7 @@ class AuthService:
         """
         refresh_token = self.token_provider.create_refresh_token(user_id)
         token_hash = self.token_provider.hash_refresh_token(refresh_token)
-        expires_at = now + timedelta(minutes=self.token_provider.refresh_ttl_in_minutes)
+        expires_at = self._refresh_token_expiry(now)
 
         await self.refresh_token_repository.create(
             uow.session,
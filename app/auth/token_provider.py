@@ -1,10 +1,15 @@
+import functools
 import hashlib
 import secrets
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 from jose.exceptions import ExpiredSignatureError
 
 from app.auth.exceptions import (
@@ -14,10 +19,18 @@ from app.auth.exceptions import (
     InvalidTokenException,
 )
 from app.auth.models import TokenPayload
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.logging import logger
 
 
+@functools.cache
+def _jwt_key(secret: str, algorithm: str) -> Key:
+    # Built once per process: python-jose otherwise re-parses the secret (and
+    # tries it as a JWK) on every encode and decode.
+    return jwk.construct(secret, algorithm)
+
+
 class OAuth2TokenProviderABC(ABC):
     @abstractmethod
     def create_access_token(self, payload: TokenPayload) -> str:
@@ -52,9 +65,17 @@ class JwtOAuth2TokenProvider(OAuth2TokenProviderABC):
         self,
         access_ttl_in_minutes: float = settings.oauth_access_token_ttl,
         refresh_ttl_in_minutes: float = settings.oauth_refresh_token_ttl,
+        verified_token_cache: TTLCache[bytes, Any] | None = None,
+        clock: Callable[[], float] = time.time,
     ):
         self.access_ttl_in_minutes = access_ttl_in_minutes
         self.refresh_ttl_in_minutes = refresh_ttl_in_minutes
+        # Maps a token's SHA-256 digest to (payload, exp). Optional: without
+        # it every verification decodes and checks the signature.
+        self.verified_token_cache = verified_token_cache
+        self._clock = clock
+        self._key = _jwt_key(settings.oauth_hash_key, settings.oauth_algorithm)
+        self._algorithms = [settings.oauth_algorithm]
 
     def create_access_token(self, payload: TokenPayload) -> str:
         payload_data = asdict(payload)
@@ -64,17 +85,33 @@ class JwtOAuth2TokenProvider(OAuth2TokenProviderABC):
         payload_data["exp"] = expire_time
         payload_data["token_type"] = "access"
 
-        return jwt.encode(
-            payload_data, settings.oauth_hash_key, algorithm=settings.oauth_algorithm
-        )
+        return jwt.encode(payload_data, self._key, algorithm=settings.oauth_algorithm)
 
     def verify_access_token(self, token: str) -> TokenPayload:
+        """Return the token's payload, from the verified-token cache if possible.
+
+        A cached entry is only served before the token's ``exp``; after that
+        the token is verified again, which raises ExpiredTokenException.
+        """
+        if self.verified_token_cache is None:
+            return self._decode_access_token(token)[0]
+
+        digest = hashlib.sha256(token.encode()).digest()
+        cached = self.verified_token_cache.get(digest)
+        if cached is not None:
+            payload, expires_at = cached
+            if self._clock() < expires_at:
+                return payload
+            self.verified_token_cache.invalidate(digest)
+
+        payload, expires_at = self._decode_access_token(token)
+        if expires_at is not None:
+            self.verified_token_cache.set(digest, (payload, expires_at))
+        return payload
+
+    def _decode_access_token(self, token: str) -> tuple[TokenPayload, float | None]:
         try:
-            payload = jwt.decode(
-                token,
-                settings.oauth_hash_key,
-                algorithms=[settings.oauth_algorithm],
-            )
+            payload = jwt.decode(token, self._key, algorithms=self._algorithms)
 
             user_id = payload.get("user_id")
             user_role = payload.get("user_role")
@@ -85,7 +122,9 @@ class JwtOAuth2TokenProvider(OAuth2TokenProviderABC):
                 )
                 raise InvalidTokenException()
 
-            return TokenPayload(user_id=user_id, user_role=user_role)
+            exp = payload.get("exp")
+            expires_at = float(exp) if isinstance(exp, (int, float)) else None
+            return TokenPayload(user_id=user_id, user_role=user_role), expires_at
 
         except ExpiredSignatureError:
             raise ExpiredTokenException()
@@ -106,18 +145,12 @@ class JwtOAuth2TokenProvider(OAuth2TokenProviderABC):
             "jti": secrets.token_urlsafe(32),  # Unique token ID for revocation/tracking
         }
 
-        return jwt.encode(
-            payload, settings.oauth_hash_key, algorithm=settings.oauth_algorithm
-        )
+        return jwt.encode(payload, self._key, algorithm=settings.oauth_algorithm)
 
     def verify_refresh_token(self, token: str) -> str:
         """Verify refresh token and return the user_id."""
         try:
-            payload = jwt.decode(
-                token,
-                settings.oauth_hash_key,
-                algorithms=[settings.oauth_algorithm],
-            )
+            payload = jwt.decode(token, self._key, algorithms=self._algorithms)
 
             user_id = payload.get("user_id")
             token_type = payload.get("token_type")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal
 
 from app.cashback.models import CashbackResult
 
@@ -12,8 +12,9 @@ class CashbackCalculatorABC(ABC):
         percentage: float,
         fixed_amount: float | None,
         purchase_amount: Decimal,
+        remaining_cap: Decimal | None = None,
     ) -> CashbackResult:
-        pass
+        """Calculate cashback, clamped to *remaining_cap* when given."""
 
 
 class CashbackCalculator(CashbackCalculatorABC):
@@ -23,12 +24,13 @@ class CashbackCalculator(CashbackCalculatorABC):
         percentage: float,
         fixed_amount: float | None,
         purchase_amount: Decimal,
+        remaining_cap: Decimal | None = None,
     ) -> CashbackResult:
         if fixed_amount is not None:
             amount = Decimal(str(fixed_amount)).quantize(Decimal("0.01"))
             return CashbackResult(
                 offer_id=offer_id,
-                cashback_amount=amount,
+                cashback_amount=_clamp(amount, remaining_cap),
                 percentage_applied=None,
                 fixed_amount_applied=fixed_amount,
             )
@@ -38,7 +40,15 @@ class CashbackCalculator(CashbackCalculatorABC):
         )
         return CashbackResult(
             offer_id=offer_id,
-            cashback_amount=amount,
+            cashback_amount=_clamp(amount, remaining_cap),
             percentage_applied=percentage,
             fixed_amount_applied=None,
         )
+
+
+def _clamp(amount: Decimal, remaining_cap: Decimal | None) -> Decimal:
+    if remaining_cap is None:
+        return amount
+    # Round the cap down so the clamped amount can never exceed it
+    remaining = remaining_cap.quantize(Decimal("0.01"), rounding=ROUND_DOWN)
+    return max(Decimal("0.00"), min(amount, remaining))
@@ -1,10 +1,10 @@
 import uuid
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import ForeignKey, Index, Numeric, String, text
+from sqlalchemy import ForeignKey, Index, Numeric, PrimaryKeyConstraint, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -44,3 +44,24 @@ class CashbackTransaction(Base):
         Index("ix_cashback_transactions_user_id", "user_id"),
         Index("ix_cashback_transactions_status", "status"),
     )
+
+
+class OfferUserMonthlyUsage(Base):
+    """Cashback granted to a user under an offer in one calendar month.
+
+    Maintained incrementally (upsert on ingest, decrement on rejection and
+    reversal) so that ``monthly_cap_per_user`` is enforced with a single-row
+    read instead of summing the user's purchases.
+    """
+
+    __tablename__ = "offer_user_monthly_usage"
+
+    offer_id: Mapped[str] = mapped_column(ForeignKey("offers.id"), nullable=False)
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), nullable=False)
+    # First day of the month
+    month: Mapped[date] = mapped_column(nullable=False)
+    cashback_amount: Mapped[Decimal] = mapped_column(
+        Numeric(precision=12, scale=2), server_default=text("0"), nullable=False
+    )
+
+    __table_args__ = (PrimaryKeyConstraint("offer_id", "user_id", "month"),)
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from decimal import Decimal
 
 from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.cashback.models import CashbackTransaction
+from app.cashback.models import CashbackTransaction, OfferUserMonthlyUsage
+from app.core.pagination import TotalCount, fetch_scalar_page
 
 
 class CashbackTransactionRepositoryABC(ABC):
@@ -25,8 +28,13 @@ class CashbackTransactionRepositoryABC(ABC):
 
     @abstractmethod
     async def list_by_user_id(
-        self, db: AsyncSession, user_id: str, limit: int, offset: int
-    ) -> tuple[list[CashbackTransaction], int]:
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: int,
+        offset: int,
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[CashbackTransaction], int | None]:
         """Return a page of cashback transactions for *user_id*, newest first."""
 
 
@@ -54,24 +62,120 @@ class CashbackTransactionRepository(CashbackTransactionRepositoryABC):
         await db.execute(stmt)
 
     async def list_by_user_id(
-        self, db: AsyncSession, user_id: str, limit: int, offset: int
-    ) -> tuple[list[CashbackTransaction], int]:
-        count_stmt = (
-            select(func.count())
-            .select_from(CashbackTransaction)
-            .where(CashbackTransaction.user_id == user_id)
-        )
-        count_result = await db.execute(count_stmt)
-        total: int = count_result.scalar_one()
-
-        items_stmt = (
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: int,
+        offset: int,
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[CashbackTransaction], int | None]:
+        stmt = (
             select(CashbackTransaction)
             .where(CashbackTransaction.user_id == user_id)
             .order_by(CashbackTransaction.created_at.desc())
-            .limit(limit)
-            .offset(offset)
         )
-        items_result = await db.execute(items_stmt)
-        items = list(items_result.scalars().all())
+        return await fetch_scalar_page(
+            db, stmt, offset=offset, limit=limit, total_count=total_count
+        )
+
+
+class OfferUserMonthlyUsageRepositoryABC(ABC):
+    @abstractmethod
+    async def get_usage(
+        self, db: AsyncSession, offer_id: str, user_id: str, month: date
+    ) -> Decimal:
+        """Return the cashback already granted this month (0 if none)."""
+
+    @abstractmethod
+    async def add_usage(
+        self,
+        db: AsyncSession,
+        offer_id: str,
+        user_id: str,
+        month: date,
+        amount: Decimal,
+        cap: Decimal,
+    ) -> bool:
+        """Add *amount* to the month's usage unless that would exceed *cap*.
+
+        Returns False (and leaves the usage unchanged) when the cap would be
+        exceeded. Flushed but not committed — caller must commit.
+        """
+
+    @abstractmethod
+    async def release_usage(
+        self,
+        db: AsyncSession,
+        offer_id: str,
+        user_id: str,
+        month: date,
+        amount: Decimal,
+    ) -> None:
+        """Subtract *amount* from the month's usage, never going below zero.
+
+        Flushed but not committed — caller must commit.
+        """
+
+
+class OfferUserMonthlyUsageRepository(OfferUserMonthlyUsageRepositoryABC):
+    async def get_usage(
+        self, db: AsyncSession, offer_id: str, user_id: str, month: date
+    ) -> Decimal:
+        result = await db.execute(
+            select(OfferUserMonthlyUsage.cashback_amount).where(
+                OfferUserMonthlyUsage.offer_id == offer_id,
+                OfferUserMonthlyUsage.user_id == user_id,
+                OfferUserMonthlyUsage.month == month,
+            )
+        )
+        return result.scalar_one_or_none() or Decimal("0")
 
-        return items, total
+    async def add_usage(
+        self,
+        db: AsyncSession,
+        offer_id: str,
+        user_id: str,
+        month: date,
+        amount: Decimal,
+        cap: Decimal,
+    ) -> bool:
+        # Single upsert; the WHERE guard makes the cap check and the increment
+        # atomic. When the guard fails, Postgres still locks the existing row,
+        # so a follow-up get_usage() in the same transaction reads a value no
+        # concurrent ingest can change until we commit.
+        stmt = insert(OfferUserMonthlyUsage).values(
+            offer_id=offer_id, user_id=user_id, month=month, cashback_amount=amount
+        )
+        new_total = (
+            OfferUserMonthlyUsage.cashback_amount + stmt.excluded.cashback_amount
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["offer_id", "user_id", "month"],
+            set_={"cashback_amount": new_total},
+            where=new_total <= cap,
+        ).returning(OfferUserMonthlyUsage.cashback_amount)
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def release_usage(
+        self,
+        db: AsyncSession,
+        offer_id: str,
+        user_id: str,
+        month: date,
+        amount: Decimal,
+    ) -> None:
+        stmt = (
+            update(OfferUserMonthlyUsage)
+            .where(
+                OfferUserMonthlyUsage.offer_id == offer_id,
+                OfferUserMonthlyUsage.user_id == user_id,
+                OfferUserMonthlyUsage.month == month,
+            )
+            .values(
+                cashback_amount=func.greatest(
+                    OfferUserMonthlyUsage.cashback_amount - amount, 0
+                )
+            )
+        )
+        await db.execute(stmt)
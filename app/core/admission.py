@@ -0,0 +1,192 @@
+"""Admission control (load shedding) for expensive endpoints.
+
+When the database slows down, requests that each hold a pool connection pile
+up until clients time out, and every endpoint sharing the pool degrades with
+them. An admission controller caps how many requests of one kind run at once,
+lets a bounded number of others wait briefly for a slot, and rejects the rest
+immediately so the caller can answer ``503`` with ``Retry-After`` instead of
+queueing work it cannot finish in time.
+"""
+
+import asyncio
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from typing import NoReturn
+
+
+class AdmissionRejectedException(Exception):
+    def __init__(self, reason: str, retry_after_seconds: int) -> None:
+        super().__init__(f"Request rejected by admission control ({reason}).")
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    limit: int
+    in_flight: int
+    waiting: int
+    admitted: int
+    rejected: int
+    latency_ewma_ms: float
+
+
+class AdmissionControllerABC(ABC):
+    @abstractmethod
+    def slot(self) -> AbstractAsyncContextManager[None]:
+        """Hold one concurrency slot for the body of an ``async with`` block.
+
+        Raises:
+            AdmissionRejectedException: if the wait queue is full or no slot
+                frees up within the queue-wait deadline.
+        """
+
+    @abstractmethod
+    def stats(self) -> AdmissionStats:
+        pass
+
+
+class AdaptiveAdmissionController(AdmissionControllerABC):
+    """Concurrency limiter with a bounded FIFO wait queue and an AIMD limit.
+
+    Up to ``limit`` requests run at once. Others wait in arrival order for at
+    most ``max_queue_wait_ms``; once ``max_queue`` are waiting, new arrivals
+    are rejected without waiting at all.
+
+    The limit adapts to observed latency (additive increase, multiplicative
+    decrease): while the smoothed latency stays under ``target_latency_ms``
+    each completion raises the limit by ``1 / limit`` — about +1 per full
+    round of requests — up to ``max_limit``. Above the target the limit is
+    multiplied by ``decrease_factor``, at most once per target interval so a
+    burst of slow completions counts as one signal, down to ``min_limit``.
+
+    Not thread-safe: use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        max_queue: int,
+        max_queue_wait_ms: int,
+        target_latency_ms: int,
+        decrease_factor: float = 0.9,
+        retry_after_seconds: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit.")
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._max_queue = max_queue
+        self._max_queue_wait = max_queue_wait_ms / 1000
+        self._target_latency_ms = target_latency_ms
+        self._decrease_factor = decrease_factor
+        self._retry_after_seconds = retry_after_seconds
+        self._clock = clock
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._admitted = 0
+        self._rejected = 0
+        self._latency_ewma_ms: float | None = None
+        self._last_decrease = -math.inf
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self._acquire()
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self._release((self._clock() - started) * 1000)
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            waiting=len(self._waiters),
+            admitted=self._admitted,
+            rejected=self._rejected,
+            latency_ewma_ms=round(self._latency_ewma_ms or 0.0, 1),
+        )
+
+    async def _acquire(self) -> None:
+        # Waiters go first: a newcomer must not overtake the queue.
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            self._admitted += 1
+            return
+
+        if len(self._waiters) >= self._max_queue:
+            self._reject("queue_full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=self._max_queue_wait)
+        except asyncio.CancelledError:
+            # Client went away while waiting; hand a granted slot back.
+            if waiter.done() and not waiter.cancelled():
+                self._release(None)
+            else:
+                self._drop_waiter(waiter)
+            raise
+
+        if not waiter.done():
+            self._drop_waiter(waiter)
+            self._reject("queue_timeout")
+        # Granted: _wake_waiters() already counted us in flight.
+
+    def _drop_waiter(self, waiter: asyncio.Future[None]) -> None:
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _reject(self, reason: str) -> NoReturn:
+        self._rejected += 1
+        raise AdmissionRejectedException(reason, self._retry_after_seconds)
+
+    def _release(self, latency_ms: float | None) -> None:
+        self._in_flight -= 1
+        if latency_ms is not None:
+            self._adapt(latency_ms)
+        self._wake_waiters()
+
+    def _adapt(self, latency_ms: float) -> None:
+        if self._latency_ewma_ms is None:
+            self._latency_ewma_ms = latency_ms
+        else:
+            self._latency_ewma_ms += 0.2 * (latency_ms - self._latency_ewma_ms)
+
+        if self._latency_ewma_ms <= self._target_latency_ms:
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            return
+
+        now = self._clock()
+        if (now - self._last_decrease) * 1000 >= self._target_latency_ms:
+            self._limit = max(self._min_limit, self._limit * self._decrease_factor)
+            self._last_decrease = now
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():  # cancelled by a timed-out or disconnected caller
+                continue
+            waiter.set_result(None)
+            self._in_flight += 1
+            self._admitted += 1
@@ -0,0 +1,60 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Answers "definitely not added" or "probably added": no false negatives,
+    and a false-positive rate of about ``error_rate`` once ``capacity`` items
+    have been added (it degrades gracefully beyond that). Items cannot be
+    removed; rebuild a fresh filter instead.
+
+    Positions come from one 128-bit BLAKE2b digest split into two 64-bit
+    hashes and combined by double hashing (Kirsch–Mitzenmacher), so each
+    operation costs a single hash regardless of ``hash_count``.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self._bits = bytearray((self.bit_count + 7) // 8)
+        self._count = 0
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """Number of ``add()`` calls, including repeated items."""
+        return self._count
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def estimated_false_positive_rate(self) -> float:
+        """Expected false-positive rate for the current number of items."""
+        return (
+            1 - math.exp(-self.hash_count * self._count / self.bit_count)
+        ) ** self.hash_count
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bit_count for i in range(self.hash_count)]
@@ -0,0 +1,187 @@
+"""In-process read-through caches.
+
+Each worker process holds its own cache, so an explicit ``invalidate`` only
+reaches the process that performed the write; the TTL bounds how long other
+workers can serve the previous value.
+
+``get_or_load`` adds single-flight loading: concurrent misses for the same key
+share one load instead of each querying the database.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    hit_ratio: float
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries also expire *ttl_seconds* after being set.
+
+    When full, setting a new key evicts the least recently used entry.
+    Expired entries are dropped lazily, when looked up. Not thread-safe: use
+    from a single event loop.
+
+    ``get`` cannot tell a cached ``None`` from a miss, so only ``get_or_load``
+    caches ``None`` (a negative result).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._loads: dict[K, asyncio.Future[V]] = {}
+        # Bumped by every invalidation; a load that overlaps one may have read
+        # the previous value, so its result is returned but not cached.
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter for callers that load and ``set`` themselves.
+
+        Read it before loading and only ``set`` the result if it is unchanged,
+        as ``get_or_load`` does.
+        """
+        return self._generation
+
+    def get(self, key: K) -> V | None:
+        value = self._lookup(key)
+        return None if value is _MISSING else value  # type: ignore[return-value]
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """Return the cached value, or load and cache it (``None`` included).
+
+        Callers that miss while a load for *key* is in flight wait for that
+        load instead of starting their own. A failed load is not cached; its
+        exception reaches every caller waiting on it.
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value  # type: ignore[return-value]
+        in_flight = self._loads.get(key)
+        if in_flight is not None:
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise  # this caller was cancelled, not the load
+                return await self.get_or_load(key, loader)
+
+        future: asyncio.Future[V] = asyncio.get_running_loop().create_future()
+        self._loads[key] = future
+        generation = self._generation
+        try:
+            loaded = await loader()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Mark it retrieved: nobody may be waiting on this load.
+                future.exception()
+            raise
+        finally:
+            if self._loads.get(key) is future:
+                del self._loads[key]
+        if generation == self._generation:
+            self.set(key, loaded)
+        future.set_result(loaded)
+        return loaded
+
+    def get_many(self, keys: Iterable[K]) -> tuple[dict[K, V], list[K]]:
+        """Return the cached values and the keys that still need loading."""
+        found: dict[K, V] = {}
+        missing: list[K] = []
+        for key in keys:
+            value = self.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        return found, missing
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        self._generation += 1
+        self._loads.pop(key, None)
+        if self._entries.pop(key, None) is not None:
+            self._invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> None:
+        """Drop every entry whose key matches *predicate*."""
+        self._generation += 1
+        for key in [key for key in self._loads if predicate(key)]:
+            del self._loads[key]
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._loads.clear()
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+
+    def _lookup(self, key: K) -> object:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._misses += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        lookups = self._hits + self._misses
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self._max_size,
+            ttl_seconds=self._ttl,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            hit_ratio=round(self._hits / lookups, 4) if lookups else 0.0,
+        )
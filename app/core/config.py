@@ -13,6 +13,28 @@ class Settings(BaseSettings):
     oauth_access_token_ttl: int = 15  # in minutes, default 15 minutes
     oauth_refresh_token_ttl: int = 43200  # in minutes; default 30 days (43200 min)
 
+    # --- verified access token cache (get_current_user)
+    # Entries never outlive the token's exp, so only the size is configurable.
+    verified_token_cache_max_size: int = 10_000
+
+    # --- authenticated principal cache (get_current_user)
+    principal_cache_max_size: int = 10_000
+    # How long a deactivated user's tokens may keep being accepted: no write
+    # path invalidates entries. Capped at the access token TTL.
+    principal_cache_ttl_seconds: int = 60
+
+    # --- password hashing (bcrypt)
+    # bcrypt runs in a dedicated thread pool so it never blocks the event loop.
+    password_hashing_max_workers: int = 4  # concurrent hashes per worker process
+    password_hashing_max_queue: int = 64  # callers beyond this get 503 at once
+
+    # --- refresh token purge
+    refresh_token_purge_interval_seconds: int = 3600
+    refresh_token_purge_batch_size: int = 1000
+    refresh_token_purge_pause_seconds: float = 0.1  # between batches
+    # Used tokens are kept this long so a replay is still reported as a reuse.
+    refresh_token_purge_used_retention_hours: int = 24
+
     # --- logging
     log_level: str = "INFO"
 
@@ -33,6 +55,38 @@ class Settings(BaseSettings):
     # pagination defaults
     default_page_size: int  # for example, 20 items per page
     max_page_size: int  # for example, 100 items per page
+    # Unfiltered admin lists called with total=estimated report the planner's
+    # row estimate once a table holds at least this many rows; smaller tables
+    # count exactly.
+    pagination_estimated_total_min_rows: int = 100_000
+
+    # --- merchant lookup cache (purchase enrichment)
+    merchant_cache_max_size: int = 10_000
+    # Upper bound on staleness in other worker processes; writes invalidate
+    # the entry in the process that made them.
+    merchant_cache_ttl_seconds: int = 300
+
+    # --- active offer cache (purchase ingestion)
+    active_offer_cache_max_size: int = 10_000
+    # Kept short: offers have validity dates and other workers only see a
+    # status change once their entry expires.
+    active_offer_cache_ttl_seconds: int = 30
+
+    # --- offer lifecycle sweeper
+    offer_sweep_interval_seconds: int = 3600
+    offer_sweep_batch_size: int = 500
+
+    # --- feature flag snapshot
+    # Changes made in other worker processes are seen within this window, at
+    # the cost of one version query per window.
+    feature_flag_snapshot_staleness_seconds: float = 5
+    # Full reload regardless of the version check.
+    feature_flag_snapshot_max_age_seconds: int = 300
+
+    # --- active offer catalog snapshot (GET /offers/active)
+    # Upper bound on staleness in other worker processes; writes invalidate
+    # the snapshot in the process that made them.
+    active_offer_catalog_max_age_seconds: int = 60
 
     # --- purchase confirmation background job
     purchase_confirmation_interval_seconds: int  # for example, 3600 seconds (1 hour)
@@ -41,6 +95,48 @@ class Settings(BaseSettings):
     # Set to empty string to disable rejection simulation.
     rejection_merchant_id: str = ""
 
+    # --- purchase group-commit ingestion
+    # When enabled, POST /purchases with "Prefer: respond-async" enqueues the
+    # purchase and returns 202; a writer task commits queued purchases in batches.
+    purchase_group_commit_enabled: bool = False
+    purchase_group_commit_max_batch_size: int = 100  # purchases per transaction
+    purchase_group_commit_max_wait_ms: int = 20  # max time a batch stays open
+    purchase_group_commit_queue_size: int = 10000  # 503 once this many are queued
+    # Tickets live in the worker that queued them, so a status poll routed to
+    # another worker could not find them: with more than one worker,
+    # respond-async requests get 503. uvicorn reads the same WEB_CONCURRENCY
+    # variable as its --workers default.
+    web_concurrency: int = 1
+
+    # --- purchase ingestion admission control (load shedding)
+    # Caps concurrent synchronous ingestions below the DB pool size so reads
+    # keep their connections during ingestion spikes; excess requests wait
+    # briefly for a slot, then get 503 with Retry-After.
+    purchase_ingest_admission_enabled: bool = True
+    purchase_ingest_concurrency_initial: int = 8
+    purchase_ingest_concurrency_min: int = 2
+    purchase_ingest_concurrency_max: int = 12  # keep below pool size + overflow
+    purchase_ingest_max_queue: int = 100  # waiters beyond this are rejected at once
+    purchase_ingest_max_queue_wait_ms: int = 250
+    # The concurrency limit shrinks while smoothed latency exceeds this.
+    purchase_ingest_target_latency_ms: int = 200
+
+    # --- purchase external_id filter (duplicate fast path)
+    purchase_external_id_filter_enabled: bool = True
+    purchase_external_id_filter_capacity: int = 1_000_000  # ~1.2 MB at 1% FP rate
+    purchase_external_id_filter_error_rate: float = 0.01
+    # The filter is loaded at startup and rebuilt on this interval.
+    purchase_external_id_filter_rebuild_interval_seconds: int = 86400
+
+    # --- purchase bulk import
+    purchase_import_chunk_size: int = 500  # rows committed per transaction
+    # Directory admins may import server-side files from. Empty disables it.
+    purchase_import_dir: str = ""
+
+    # --- purchase export
+    # Rows fetched per server-side cursor round trip while streaming an export.
+    purchase_export_fetch_size: int = 2000
+
     model_config = {
         "env_file": ".env" if os.path.exists(".env") else None,
         "extra": "ignore",
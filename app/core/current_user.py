@@ -1,20 +1,34 @@
+from dataclasses import dataclass
+from typing import Any
+
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.composition import get_verified_token_cache
 from app.auth.exceptions import InvalidTokenException, UserInactiveException
 from app.auth.token_provider import JwtOAuth2TokenProvider, OAuth2TokenProviderABC
+from app.core.cache import TTLCache
 from app.core.database import get_async_db
 from app.core.logging import logger
-from app.users.composition import get_user_repository
+from app.users.composition import get_principal_cache, get_user_repository
 from app.users.models import User, UserRoleEnum
 from app.users.repositories import UserRepositoryABC
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login", auto_error=False)
 
 
+@dataclass(frozen=True)
+class UserPrincipal:
+    """What authorization needs from a user; cached per user ID."""
+
+    id: str
+    role: UserRoleEnum
+    active: bool
+
+
 def get_token_provider() -> OAuth2TokenProviderABC:
-    return JwtOAuth2TokenProvider()
+    return JwtOAuth2TokenProvider(verified_token_cache=get_verified_token_cache())
 
 
 async def get_current_user(
@@ -22,31 +36,47 @@ async def get_current_user(
     db: AsyncSession = Depends(get_async_db),
     token_provider: OAuth2TokenProviderABC = Depends(get_token_provider),
     user_repository: UserRepositoryABC = Depends(get_user_repository),
+    principal_cache: TTLCache[str, Any] = Depends(get_principal_cache),
 ) -> User:
+    """Return the user the access token was issued to.
+
+    The user's role and active flag come from the principal cache, so most
+    requests run no query. The returned ``User`` is transient: it only carries
+    ``id``, ``role`` and ``active``.
+    """
     if token is None:
         raise InvalidTokenException()
     logger.debug("Verifying access token.", extra={"token": token})
     payload = token_provider.verify_access_token(token)
+    user_id = payload.user_id or ""
+
+    async def load_principal() -> UserPrincipal | None:
+        user = await user_repository.get_user_by_id(db, user_id)
+        if user is None:
+            return None
+        return UserPrincipal(id=str(user.id), role=user.role, active=user.active)
 
-    user = await user_repository.get_user_by_id(db, payload.user_id or "")
+    principal: UserPrincipal | None = await principal_cache.get_or_load(
+        user_id, load_principal
+    )
 
     # Very unlikely to happen, but if the user was deleted after the token was issued,
     # we should reject the token
-    if not user:
+    if principal is None:
         logger.debug(
             "Token valid but user not found.",
             extra={"user_id": payload.user_id},
         )
         raise InvalidTokenException()
 
-    if user.active is False:
+    if principal.active is False:
         logger.debug(
             "Token valid but user is inactive.",
             extra={"user_id": payload.user_id},
         )
         raise UserInactiveException(payload.user_id)
 
-    return user
+    return User(id=principal.id, role=principal.role, active=principal.active)
 
 
 def get_current_admin_user(
@@ -133,6 +133,19 @@ def internal_server_error(
     )
 
 
+def service_unavailable_error(
+    message: str,
+    retry_after_seconds: int,
+    details: Optional[dict[str, Any]] = None,
+) -> HTTPException:
+    """Build a 503 Service Unavailable error with a Retry-After header."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=error_response(ErrorCode.SERVICE_UNAVAILABLE, message, details),
+        headers={"Retry-After": str(retry_after_seconds)},
+    )
+
+
 def error_response(
     code: str,
     message: str,
@@ -28,3 +28,6 @@ class ErrorCode(str, Enum):
 
     # 500 - Internal Server Error
     INTERNAL_SERVER_ERROR = "INTERNAL_SERVER_ERROR"
+
+    # 503 - Service Unavailable
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
@@ -122,9 +122,11 @@ def register_error_handlers(app: FastAPI) -> None:
             return JSONResponse(
                 status_code=exc.status_code,
                 content={"error": detail_dict["error"]},
+                headers=exc.headers,
             )
 
         return JSONResponse(
             status_code=exc.status_code,
             content={"error": exc.detail},
+            headers=exc.headers,
         )
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MerchantStatusChanged:
+    """Published by MerchantService after a merchant's active flag is committed.
+
+    Expected subscribers:
+    - Offers module: drops its active offer catalog, which only lists offers
+      of active merchants.
+
+    Fields:
+        merchant_id: UUID of the merchant.
+        active:      The merchant's new active flag.
+    """
+
+    merchant_id: str
+    active: bool
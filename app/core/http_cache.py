@@ -0,0 +1,76 @@
+"""HTTP conditional requests: weak ETags, If-None-Match and Cache-Control.
+
+A read endpoint tags its response with a weak ETag derived from a version of
+the resource: a catalog version when one exists, otherwise the encoded
+representation itself. When the client's ``If-None-Match`` already names that
+tag the endpoint answers ``304 Not Modified`` without a body. With a catalog
+version, the check runs before anything is encoded or read from the database.
+"""
+
+import hashlib
+
+from fastapi import Response, status
+
+# Responses are per user (or need authentication): shared caches must not
+# store them, and clients must revalidate before reuse. The revalidation is
+# what If-None-Match makes cheap.
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def weak_etag(version: str | bytes) -> str:
+    raw = version.encode() if isinstance(version, str) else version
+    return f'W/"{hashlib.sha256(raw).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether *if_none_match* names *etag*, using weak comparison.
+
+    ``If-None-Match`` can list several tags, or be ``*`` (any representation).
+    Weak comparison ignores the ``W/`` prefix on either side.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == wanted for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str, cache_control: str = PRIVATE_REVALIDATE) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def conditional_json(
+    body: bytes,
+    if_none_match: str | None,
+    *,
+    etag: str | None = None,
+    cache_control: str = PRIVATE_REVALIDATE,
+) -> Response:
+    """Return *body* as JSON, or a 304 when the client already has it.
+
+    Without an explicit *etag* the tag is derived from *body*, which saves the
+    transfer but not the work of producing the body.
+    """
+    etag = etag or weak_etag(body)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, cache_control)
+    return json_response(body, etag, cache_control)
+
+
+def json_response(
+    body: bytes, etag: str, cache_control: str = PRIVATE_REVALIDATE
+) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
@@ -0,0 +1,152 @@
+"""Pagination helpers shared by list endpoints.
+
+``fetch_page`` returns an offset page together with its total in a single
+round trip, by adding ``COUNT(*) OVER ()`` to the page query: the window is
+evaluated over every matching row before ``OFFSET``/``LIMIT`` apply. That is
+the default for every list. Clients can also skip the total, or — for an
+unfiltered admin list — opt in to reading it from planner statistics instead
+of counting a large table.
+
+Keyset (cursor) pagination resumes a listing right after the last row of the
+previous page instead of skipping ``OFFSET`` rows, so every page costs the
+same however deep the client has walked. The cursor is opaque to clients: it
+carries the sort-key values of that last row, URL-safe base64 encoded.
+"""
+
+import base64
+import json
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import BigInteger, Select, Table, cast, column, func, literal
+from sqlalchemy import select as sa_select
+from sqlalchemy import table as sa_table
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+_pg_class = sa_table("pg_class", column("oid"), column("reltuples"))
+
+
+class TotalCount(str, Enum):
+    """How a page reports the total number of matching rows."""
+
+    EXACT = "exact"  # COUNT(*) OVER () in the page query
+    ESTIMATED = "estimated"  # planner statistics; only valid for unfiltered lists
+    SKIP = "skip"  # no total at all
+
+
+class InvalidCursorException(Exception):
+    def __init__(self, cursor: str) -> None:
+        super().__init__("The pagination cursor is malformed.")
+        self.cursor = cursor
+
+
+def encode_cursor(*values: str) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[str]:
+    """Return the *size* sort-key values carried by *cursor*.
+
+    Raises:
+        InvalidCursorException: if the cursor was not produced by
+            ``encode_cursor`` with *size* values.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        raise InvalidCursorException(cursor) from None
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorException(cursor)
+    if not all(isinstance(value, str) for value in values):
+        raise InvalidCursorException(cursor)
+    return values
+
+
+def select_total_count(requested: TotalCount, *, filtered: bool) -> TotalCount:
+    """Resolve the total mode a client *requested* for an admin list.
+
+    Filtered lists always count exactly: planner statistics describe the
+    whole table, not the rows a filter matches.
+    """
+    if requested is TotalCount.ESTIMATED and filtered:
+        return TotalCount.EXACT
+    return requested
+
+
+async def fetch_page(
+    db: AsyncSession,
+    stmt: Select[Any],
+    *,
+    offset: int,
+    limit: int,
+    total_count: TotalCount = TotalCount.EXACT,
+    table: Table | None = None,
+) -> tuple[list[tuple[Any, ...]], int | None]:
+    """Return one page of *stmt*'s rows and the total, or None when skipped.
+
+    *table* is the listed table, required for ``TotalCount.ESTIMATED``. An
+    estimate below ``pagination_estimated_total_min_rows`` (or missing, for
+    a table never analyzed) falls back to an exact count, which is cheap at
+    that size. A separate count also runs when the page is past the end and
+    carries no total.
+    """
+    estimate_stmt: Select[Any] | None = None
+    if total_count is TotalCount.ESTIMATED:
+        if table is None:
+            raise ValueError("An estimated total needs the listed table.")
+        estimate_stmt = _estimated_rows(table)
+
+    page_stmt = stmt.offset(offset).limit(limit)
+    if total_count is TotalCount.EXACT:
+        page_stmt = page_stmt.add_columns(func.count().over())
+    elif estimate_stmt is not None:
+        page_stmt = page_stmt.add_columns(estimate_stmt.scalar_subquery())
+    rows = [tuple(row) for row in (await db.execute(page_stmt)).all()]
+
+    if total_count is TotalCount.SKIP:
+        return rows, None
+    total: int | None = rows[0][-1] if rows else None
+    items = [row[:-1] for row in rows]
+
+    if estimate_stmt is None:
+        if total is None:
+            total = 0 if offset == 0 else await _count(db, stmt)
+        return items, total
+
+    if total is None:
+        total = (await db.execute(estimate_stmt)).scalar_one_or_none()
+    if total is None or total < settings.pagination_estimated_total_min_rows:
+        total = await _count(db, stmt)
+    return items, total
+
+
+async def fetch_scalar_page(
+    db: AsyncSession,
+    stmt: Select[Any],
+    *,
+    offset: int,
+    limit: int,
+    total_count: TotalCount = TotalCount.EXACT,
+    table: Table | None = None,
+) -> tuple[list[Any], int | None]:
+    """Like ``fetch_page`` for single-entity selects: items are the entities."""
+    rows, total = await fetch_page(
+        db, stmt, offset=offset, limit=limit, total_count=total_count, table=table
+    )
+    return [row[0] for row in rows], total
+
+
+def _estimated_rows(table: Table) -> Select[Any]:
+    return sa_select(cast(_pg_class.c.reltuples, BigInteger)).where(
+        _pg_class.c.oid == cast(literal(table.name), REGCLASS)
+    )
+
+
+async def _count(db: AsyncSession, stmt: Select[Any]) -> int:
+    count_stmt = sa_select(func.count()).select_from(stmt.order_by(None).subquery())
+    return (await db.execute(count_stmt)).scalar_one()
@@ -0,0 +1,132 @@
+"""bcrypt hashing and verification off the event loop.
+
+A bcrypt round takes a few hundred milliseconds of CPU by design. Called
+directly from an async handler it blocks the event loop for that long, so a
+burst of logins stalls every other request on the worker, background jobs
+included. ``PasswordHasher`` runs each call in a small dedicated thread pool
+(bcrypt releases the GIL while hashing) and awaits the result.
+
+At most ``max_workers`` calls run at once. Others wait in arrival order; once
+``max_queue`` are waiting, new calls are rejected at once so the caller can
+answer ``503`` with ``Retry-After`` instead of queueing logins that would time
+out anyway.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+from passlib.context import CryptContext
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyException(Exception):
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__("Too many password hashing operations are queued.")
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(frozen=True)
+class PasswordHashingStats:
+    max_workers: int
+    max_queue: int
+    in_flight: int
+    waiting: int
+    peak_waiting: int
+    completed: int
+    rejected: int
+    wait_ewma_ms: float
+    run_ewma_ms: float
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords in a bounded thread pool.
+
+    Not thread-safe: use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        context: CryptContext,
+        *,
+        max_workers: int,
+        max_queue: int,
+        retry_after_seconds: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self._context = context
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._retry_after_seconds = retry_after_seconds
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hashing"
+        )
+        # Created lazily: it binds to the running event loop.
+        self._slots: asyncio.Semaphore | None = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._peak_waiting = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_ewma_ms: float | None = None
+        self._run_ewma_ms: float | None = None
+
+    async def hash(self, password: str) -> str:
+        """Raises PasswordHashingBusyException if the wait queue is full."""
+        return await self._run(self._context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Raises PasswordHashingBusyException if the wait queue is full."""
+        return await self._run(self._context.verify, password, hashed_password)
+
+    def stats(self) -> PasswordHashingStats:
+        return PasswordHashingStats(
+            max_workers=self._max_workers,
+            max_queue=self._max_queue,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            peak_waiting=self._peak_waiting,
+            completed=self._completed,
+            rejected=self._rejected,
+            wait_ewma_ms=round(self._wait_ewma_ms or 0.0, 1),
+            run_ewma_ms=round(self._run_ewma_ms or 0.0, 1),
+        )
+
+    async def _run(self, fn: Callable[..., T], *args: str) -> T:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_workers)
+        if self._slots.locked() and self._waiting >= self._max_queue:
+            self._rejected += 1
+            raise PasswordHashingBusyException(self._retry_after_seconds)
+
+        queued = self._clock()
+        self._waiting += 1
+        self._peak_waiting = max(self._peak_waiting, self._waiting)
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        started = self._clock()
+        self._wait_ewma_ms = _ewma(self._wait_ewma_ms, (started - queued) * 1000)
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+            self._completed += 1
+            elapsed_ms = (self._clock() - started) * 1000
+            self._run_ewma_ms = _ewma(self._run_ewma_ms, elapsed_ms)
+
+
+def _ewma(current: float | None, sample: float) -> float:
+    return sample if current is None else current + 0.2 * (sample - current)
@@ -2,6 +2,56 @@ from pydantic import BaseModel
 
 
 class PaginationOut(BaseModel):
+    """``total`` is null when the client asked to skip counting.
+
+    ``total_estimated`` is true when the client asked for an estimated total
+    of an unfiltered list; ``total`` may then be approximate.
+    """
+
+    offset: int
+    limit: int
+    total: int | None
+    total_estimated: bool = False
+
+
+class CursorPaginationOut(BaseModel):
+    """Pagination for lists that can also be walked with keyset cursors.
+
+    Pass ``next_cursor`` back as ``cursor`` to fetch the following page; it is
+    null on the last page. Pages fetched by cursor report ``offset`` 0 and
+    ``total`` null, because counting would defeat the constant cost per page.
+    ``total_estimated`` means the same as in ``PaginationOut``.
+    """
+
     offset: int
     limit: int
-    total: int
+    total: int | None
+    total_estimated: bool = False
+    next_cursor: str | None = None
+
+
+class CacheStatsOut(BaseModel):
+    model_config = {"from_attributes": True}
+
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    hit_ratio: float
+
+
+class PasswordHashingStatsOut(BaseModel):
+    model_config = {"from_attributes": True}
+
+    max_workers: int
+    max_queue: int
+    in_flight: int
+    waiting: int
+    peak_waiting: int
+    completed: int
+    rejected: int
+    wait_ewma_ms: float
+    run_ewma_ms: float
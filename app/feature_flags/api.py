@@ -8,6 +8,7 @@ from app.core.current_user import get_current_admin_user
 from app.core.database import get_async_db
 from app.core.errors.builders import internal_server_error, unprocessable_entity_error
 from app.core.logging import logging
+from app.core.pagination import TotalCount
 from app.core.schemas import PaginationOut
 from app.core.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWorkABC
 from app.feature_flags.composition import get_feature_flag_service
@@ -16,6 +17,9 @@ from app.feature_flags.exceptions import FeatureFlagScopeIdRequiredException
 from app.feature_flags.policies import validate_scope_id_required
 from app.feature_flags.schemas import (
     EvaluateFeatureFlagOut,
+    EvaluateFeatureFlagsIn,
+    EvaluateFeatureFlagsOut,
+    FeatureFlagEvaluationOut,
     FeatureFlagKeyValidator,
     FeatureFlagOut,
     FeatureFlagSet,
@@ -73,6 +77,57 @@ async def set_feature_flag(
     return FeatureFlagOut.model_validate(flag)
 
 
+@router.post(
+    "/evaluate",
+    status_code=status.HTTP_200_OK,
+    description="Evaluate several feature flags for several scopes in one call.",
+)
+async def evaluate_feature_flags(
+    body: EvaluateFeatureFlagsIn,
+    db: AsyncSession = Depends(get_async_db),
+    feature_flag_service: FeatureFlagService = Depends(get_feature_flag_service),
+    _current_user: User = Depends(get_current_admin_user),
+) -> EvaluateFeatureFlagsOut:
+    scopes = [
+        (scope.scope_type, str(scope.scope_id) if scope.scope_id is not None else None)
+        for scope in body.scopes
+    ]
+
+    # Validate scope_id requirement
+    try:
+        for scope_type, scope_id in scopes:
+            validate_scope_id_required(scope_type, scope_id)
+    except FeatureFlagScopeIdRequiredException as exc:
+        raise unprocessable_entity_error(
+            code=ErrorCode.FEATURE_FLAG_SCOPE_ID_REQUIRED,
+            message=str(exc),
+            details={"scope_type": exc.scope_type},
+        )
+
+    try:
+        results = await feature_flag_service.evaluate_many(
+            list(dict.fromkeys(body.keys)), db, list(dict.fromkeys(scopes))
+        )
+        return EvaluateFeatureFlagsOut(
+            data=[
+                FeatureFlagEvaluationOut(
+                    key=key,
+                    scope_type=scope_type,
+                    scope_id=UUID(scope_id) if scope_id is not None else None,
+                    enabled=enabled,
+                )
+                for (key, scope_type, scope_id), enabled in results.items()
+            ]
+        )
+
+    except Exception as exc:
+        logging.error(
+            "Unexpected error while evaluating feature flags.",
+            extra={"error": str(exc)},
+        )
+        raise internal_server_error()
+
+
 @router.get(
     "/{key}/evaluate",
     status_code=status.HTTP_200_OK,
@@ -131,24 +186,39 @@ async def list_feature_flags(
         le=settings.max_page_size,
         description=f"Number of results to return (max {settings.max_page_size}).",
     ),
+    total_count: TotalCount = Query(
+        default=TotalCount.EXACT,
+        alias="total",
+        description=(
+            "exact (default) counts the matching rows; estimated reads planner "
+            "statistics for an unfiltered list and sets "
+            "pagination.total_estimated; skip leaves pagination.total null."
+        ),
+    ),
     db: AsyncSession = Depends(get_async_db),
     feature_flag_service: FeatureFlagService = Depends(get_feature_flag_service),
     _current_user: User = Depends(get_current_admin_user),
 ) -> ListFeatureFlagsOut:
     try:
         scope_id_str = str(scope_id) if scope_id is not None else None
-        flags, total = await feature_flag_service.list_flags(
+        flags, total, total_estimated = await feature_flag_service.list_flags(
             db,
             key=key,
             scope_type=scope_type,
             scope_id=scope_id_str,
             offset=offset,
             limit=limit,
+            total_count=total_count,
         )
         items = [FeatureFlagOut.model_validate(flag) for flag in flags]
         return ListFeatureFlagsOut(
             data=items,
-            pagination=PaginationOut(offset=offset, limit=limit, total=total),
+            pagination=PaginationOut(
+                offset=offset,
+                limit=limit,
+                total=total,
+                total_estimated=total_estimated,
+            ),
         )
 
     except Exception as exc:
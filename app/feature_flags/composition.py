@@ -1,10 +1,27 @@
+from app.core.config import settings
 from app.feature_flags.repositories import FeatureFlagRepository
 from app.feature_flags.services import FeatureFlagService
+from app.feature_flags.snapshot import FeatureFlagSnapshot
+
+# Process-wide: the evaluate endpoint and the purchase dispatcher read it, and
+# set_flag, which invalidates it, must share one instance.
+_feature_flag_snapshot = FeatureFlagSnapshot(
+    FeatureFlagRepository(),
+    staleness_seconds=settings.feature_flag_snapshot_staleness_seconds,
+    max_age_seconds=settings.feature_flag_snapshot_max_age_seconds,
+)
 
 
 def get_feature_flag_repository() -> FeatureFlagRepository:
     return FeatureFlagRepository()
 
 
+def get_feature_flag_snapshot() -> FeatureFlagSnapshot:
+    return _feature_flag_snapshot
+
+
 def get_feature_flag_service() -> FeatureFlagService:
-    return FeatureFlagService(repository=get_feature_flag_repository())
+    return FeatureFlagService(
+        repository=get_feature_flag_repository(),
+        snapshot=get_feature_flag_snapshot(),
+    )
@@ -1,11 +1,17 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List
 
-from sqlalchemy import ColumnElement, and_, or_, select
+from sqlalchemy import ColumnElement, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalCount, fetch_scalar_page
 from app.feature_flags.models import FeatureFlag
 
+# (row count, latest updated_at): changes whenever a flag is added, removed
+# or updated.
+FeatureFlagVersion = tuple[int, datetime | None]
+
 
 class FeatureFlagRepositoryABC(ABC):
     @abstractmethod
@@ -35,33 +41,22 @@ class FeatureFlagRepositoryABC(ABC):
         scope_id: str | None = None,
         offset: int = 0,
         limit: int = 100,
-    ) -> tuple[list[FeatureFlag], int]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[FeatureFlag], int | None]:
         """List feature flags with optional filters.
 
-        Returns: (flags, total_count)
+        Returns: (flags, total_count); the total is None with TotalCount.SKIP.
         """
         pass
 
     @abstractmethod
-    async def get_multiple_by_key_and_scopes(
-        self,
-        db: AsyncSession,
-        key: str,
-        scope_specs: List[tuple[str, str | None]],
-    ) -> List[FeatureFlag]:
-        """Fetch flags for multiple scopes in a single optimized query.
-
-        Fetches all flags matching the key and any of the given scope_specs,
-        plus the global flag as fallback. Used for batch evaluation.
-
-        Args:
-            db: AsyncSession for database queries
-            key: Feature flag key (e.g., "purchase_auto_confirm")
-            scope_specs: List of (scope_type, scope_id) tuples to check
+    async def list_all(self, db: AsyncSession) -> List[FeatureFlag]:
+        """Return every flag, for the in-process snapshot."""
+        pass
 
-        Returns:
-            List of matching FeatureFlag objects (may include the global flag)
-        """
+    @abstractmethod
+    async def get_version(self, db: AsyncSession) -> FeatureFlagVersion:
+        """Return a cheap fingerprint of the table's contents."""
         pass
 
 
@@ -99,7 +94,8 @@ class FeatureFlagRepository(FeatureFlagRepositoryABC):
         scope_id: str | None = None,
         offset: int = 0,
         limit: int = 100,
-    ) -> tuple[list[FeatureFlag], int]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[FeatureFlag], int | None]:
         """List feature flags with optional filters.
 
         All filters are combined with AND semantics.
@@ -115,64 +111,27 @@ class FeatureFlagRepository(FeatureFlagRepositoryABC):
         if scope_id is not None:
             filters.append(FeatureFlag.scope_id == scope_id)
 
-        # Count query
-        count_stmt = select(FeatureFlag)
-        if filters:
-            count_stmt = count_stmt.where(*filters)
-        count_result = await db.execute(count_stmt)
-        total = len(count_result.scalars().all())
-
-        # Fetch query
         select_stmt = select(FeatureFlag)
         if filters:
             select_stmt = select_stmt.where(*filters)
-        select_stmt = (
-            select_stmt.order_by(FeatureFlag.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+        select_stmt = select_stmt.order_by(FeatureFlag.created_at.desc())
+
+        return await fetch_scalar_page(
+            db,
+            select_stmt,
+            offset=offset,
+            limit=limit,
+            total_count=total_count,
+            table=FeatureFlag.__table__,
         )
 
-        result = await db.execute(select_stmt)
-        flags = list(result.scalars().all())
-
-        return flags, total
-
-    async def get_multiple_by_key_and_scopes(
-        self,
-        db: AsyncSession,
-        key: str,
-        scope_specs: List[tuple[str, str | None]],
-    ) -> List[FeatureFlag]:
-        """Fetch flags for multiple scopes in a single optimized query.
-
-        Returns all flags matching the key and any of the scope_specs,
-        plus the global flag as fallback. Optimized to use a single query
-        with OR conditions instead of N+1 queries.
-        """
-        if not scope_specs:
-            return []
-
-        # Build conditions for each (scope_type, scope_id) pair
-        scope_conditions = [
-            and_(
-                FeatureFlag.scope_type == scope_type,
-                FeatureFlag.scope_id == scope_id,
-            )
-            for scope_type, scope_id in scope_specs
-        ]
-
-        # Always include the global flag as fallback
-        scope_conditions.append(
-            and_(
-                FeatureFlag.scope_type == "global",
-                FeatureFlag.scope_id is None,
-            )
-        )
+    async def list_all(self, db: AsyncSession) -> List[FeatureFlag]:
+        result = await db.execute(select(FeatureFlag))
+        return list(result.scalars().all())
 
-        # Fetch all matching flags in one query
-        stmt = select(FeatureFlag).where(
-            FeatureFlag.key == key,
-            or_(*scope_conditions),
+    async def get_version(self, db: AsyncSession) -> FeatureFlagVersion:
+        stmt = select(func.count(), func.max(FeatureFlag.updated_at)).select_from(
+            FeatureFlag
         )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
+        count, latest = (await db.execute(stmt)).one()
+        return count, latest
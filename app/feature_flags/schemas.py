@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -48,6 +48,38 @@ class EvaluateFeatureFlagOut(BaseModel):
     enabled: bool
 
 
+# Bounds one batch evaluation to at most this many keys × scopes.
+MAX_BATCH_KEYS = 100
+MAX_BATCH_SCOPES = 100
+
+
+class FeatureFlagScopeIn(BaseModel):
+    scope_type: Literal["global", "merchant", "user"] = "global"
+    scope_id: UUID | None = None
+
+
+class EvaluateFeatureFlagsIn(BaseModel):
+    keys: list[Annotated[str, Field(min_length=1, max_length=100)]] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_KEYS
+    )
+    scopes: list[FeatureFlagScopeIn] = Field(
+        default_factory=lambda: [FeatureFlagScopeIn()],
+        min_length=1,
+        max_length=MAX_BATCH_SCOPES,
+    )
+
+
+class FeatureFlagEvaluationOut(BaseModel):
+    key: str
+    scope_type: str
+    scope_id: UUID | None
+    enabled: bool
+
+
+class EvaluateFeatureFlagsOut(BaseModel):
+    data: list[FeatureFlagEvaluationOut]
+
+
 class ListFeatureFlagsOut(BaseModel):
     data: list[FeatureFlagOut]
     pagination: PaginationOut
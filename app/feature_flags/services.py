@@ -3,16 +3,21 @@ from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import logger
+from app.core.pagination import TotalCount, select_total_count
 from app.core.unit_of_work import UnitOfWorkABC
 from app.feature_flags.models import FeatureFlag
 from app.feature_flags.policies import validate_scope_id_required
 from app.feature_flags.repositories import FeatureFlagRepositoryABC
 from app.feature_flags.schemas import FeatureFlagSet
+from app.feature_flags.snapshot import FeatureFlagSnapshot, resolve_flag
 
 
 class FeatureFlagService:
-    def __init__(self, repository: FeatureFlagRepositoryABC) -> None:
+    def __init__(
+        self, repository: FeatureFlagRepositoryABC, snapshot: FeatureFlagSnapshot
+    ) -> None:
         self._repository = repository
+        self._snapshot = snapshot
 
     async def set_flag(
         self,
@@ -45,6 +50,7 @@ class FeatureFlagService:
             flag = await self._repository.upsert(uow.session, flag)
 
         await uow.commit()
+        self._snapshot.invalidate()
         logger.info(
             "Feature flag set.",
             extra={"key": key, "scope_type": scope_type, "scope_id": scope_id},
@@ -64,21 +70,11 @@ class FeatureFlagService:
         1. Scoped flag (matching key + scope_type + scope_id)
         2. Global flag (matching key, scope_type='global')
         3. Default: True (fail-open)
-        """
-        if scope_type != "global" and scope_id is not None:
-            scoped = await self._repository.get_by_key_and_scope(
-                db, key, scope_type, scope_id
-            )
-            if scoped is not None:
-                return scoped.enabled
-
-        global_flag = await self._repository.get_by_key_and_scope(
-            db, key, "global", None
-        )
-        if global_flag is not None:
-            return global_flag.enabled
 
-        return True
+        Served from the in-process snapshot; *db* is only used to refresh it.
+        """
+        flags = await self._snapshot.flags(db)
+        return resolve_flag(flags, key, scope_type, scope_id)
 
     async def list_flags(
         self,
@@ -88,9 +84,18 @@ class FeatureFlagService:
         scope_id: str | None = None,
         offset: int = 0,
         limit: int = 100,
-    ) -> tuple[list[FeatureFlag], int]:
-        """List feature flags with optional filters."""
-        return await self._repository.list(db, key, scope_type, scope_id, offset, limit)
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[FeatureFlag], int | None, bool]:
+        """List feature flags with optional filters.
+
+        Returns the page, the total and whether the total is an estimate.
+        """
+        filtered = any(f is not None for f in (key, scope_type, scope_id))
+        total_count = select_total_count(total_count, filtered=filtered)
+        flags, total = await self._repository.list(
+            db, key, scope_type, scope_id, offset, limit, total_count=total_count
+        )
+        return flags, total, total_count is TotalCount.ESTIMATED
 
     async def evaluate_scopes(
         self,
@@ -98,14 +103,14 @@ class FeatureFlagService:
         db: AsyncSession,
         scopes: List[tuple[str, str | None]],
     ) -> dict[tuple[str, str | None], bool]:
-        """Evaluate feature flag for multiple scopes in a single batch query.
+        """Evaluate feature flag for multiple scopes from the flag snapshot.
 
         Returns a dict mapping each (scope_type, scope_id) → enabled state.
         Resolution order for each scope: scoped flag > global flag > fail-open True.
 
         Args:
             key: Feature flag key
-            db: AsyncSession for database queries
+            db: AsyncSession, only used to refresh the snapshot
             scopes: List of (scope_type, scope_id) tuples to evaluate
 
         Returns:
@@ -115,34 +120,31 @@ class FeatureFlagService:
         if not scopes:
             return {}
 
-        # Fetch all relevant flags in one optimized query
-        flags = await self._repository.get_multiple_by_key_and_scopes(db, key, scopes)
-
-        # Separate scoped and global flags
-        global_flag = None
-        scoped_flags = {}
-        for flag in flags:
-            if flag.scope_type == "global":
-                global_flag = flag
-            else:
-                scoped_flags[(flag.scope_type, flag.scope_id)] = flag
-
-        # Resolve each scope: scoped flag > global flag > fail-open True
-        results = {}
-        for scope_type, scope_id in scopes:
-            # Check scoped flag first
-            if (scope_type, scope_id) in scoped_flags:
-                results[(scope_type, scope_id)] = scoped_flags[
-                    (scope_type, scope_id)
-                ].enabled
-                continue
-
-            # Fall back to global flag
-            if global_flag is not None:
-                results[(scope_type, scope_id)] = global_flag.enabled
-                continue
-
-            # No flag found - fail-open (default to True)
-            results[(scope_type, scope_id)] = True
-
-        return results
+        flags = await self._snapshot.flags(db)
+        return {
+            (scope_type, scope_id): resolve_flag(flags, key, scope_type, scope_id)
+            for scope_type, scope_id in scopes
+        }
+
+    async def evaluate_many(
+        self,
+        keys: List[str],
+        db: AsyncSession,
+        scopes: List[tuple[str, str | None]],
+    ) -> dict[tuple[str, str, str | None], bool]:
+        """Evaluate several feature flags for several scopes at once.
+
+        Returns a dict mapping each (key, scope_type, scope_id) → enabled state,
+        in key-then-scope order, with the same resolution as evaluate_scopes:
+        scoped flag > global flag > fail-open True. All pairs are resolved from
+        one snapshot, so they are mutually consistent.
+        """
+        if not keys or not scopes:
+            return {}
+
+        flags = await self._snapshot.flags(db)
+        return {
+            (key, scope_type, scope_id): resolve_flag(flags, key, scope_type, scope_id)
+            for key in keys
+            for scope_type, scope_id in scopes
+        }
@@ -0,0 +1,137 @@
+"""In-process snapshot of every feature flag.
+
+Flags change a few times a day but are evaluated on every dispatcher tick and
+by every caller of the evaluate endpoint. Each worker keeps all flags in a
+dict keyed by ``(key, scope_type, scope_id)``, so an evaluation is a dict
+lookup. The snapshot is reloaded on the first read after:
+
+- ``set_flag`` in this worker invalidated it,
+- a version check (row count and latest ``updated_at``), run at most once
+  every ``staleness_seconds``, shows a change made by another worker, or
+- it got older than ``max_age_seconds``. ``updated_at`` is the writing
+  transaction's start time, so a write that commits after a later-started
+  one can leave the version unchanged; the full reload bounds how long such
+  a change goes unseen.
+
+Between version checks, reads never touch the database.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import logger
+from app.feature_flags.repositories import (
+    FeatureFlagRepositoryABC,
+    FeatureFlagVersion,
+)
+
+# (key, scope_type, scope_id)
+FlagKey = tuple[str, str, str | None]
+
+
+@dataclass(frozen=True)
+class FeatureFlagSnapshotState:
+    version: FeatureFlagVersion
+    loaded_at: float
+    generation: int
+    flags: Mapping[FlagKey, bool]
+
+
+class FeatureFlagSnapshot:
+    def __init__(
+        self,
+        repository: FeatureFlagRepositoryABC,
+        staleness_seconds: float,
+        max_age_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.repository = repository
+        self.staleness_seconds = staleness_seconds
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._state: FeatureFlagSnapshotState | None = None
+        self._checked_at = 0.0
+        # Bumped by invalidate(); a snapshot loaded before the bump is stale.
+        self._generation = 0
+        self._refresh_lock = asyncio.Lock()
+
+    async def flags(self, db: AsyncSession) -> Mapping[FlagKey, bool]:
+        """Return every flag's enabled state, refreshing the snapshot if due.
+
+        *db* is only used when the version has to be checked.
+        """
+        state = self._state
+        if state is not None and self._is_checked(state):
+            return state.flags
+        # Single flight: requests arriving during a refresh wait for it and
+        # then find the snapshot checked.
+        async with self._refresh_lock:
+            state = await self._refresh(db)
+        return state.flags
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale; the next read reloads it."""
+        self._generation += 1
+
+    def _is_checked(self, state: FeatureFlagSnapshotState) -> bool:
+        if state.generation != self._generation:
+            return False
+        return self._clock() - self._checked_at < self.staleness_seconds
+
+    async def _refresh(self, db: AsyncSession) -> FeatureFlagSnapshotState:
+        state = self._state
+        if state is not None and self._is_checked(state):
+            return state
+        version = await self.repository.get_version(db)
+        if state is not None and self._is_current(state, version):
+            self._checked_at = self._clock()
+            return state
+        return await self._load(db, version)
+
+    def _is_current(
+        self, state: FeatureFlagSnapshotState, version: FeatureFlagVersion
+    ) -> bool:
+        if state.generation != self._generation or state.version != version:
+            return False
+        return self._clock() - state.loaded_at < self.max_age_seconds
+
+    async def _load(
+        self, db: AsyncSession, version: FeatureFlagVersion
+    ) -> FeatureFlagSnapshotState:
+        # Read after the version: a write in between makes the next check
+        # reload again rather than keep a snapshot newer than its version.
+        generation = self._generation
+        rows = await self.repository.list_all(db)
+        state = FeatureFlagSnapshotState(
+            version=version,
+            loaded_at=self._clock(),
+            generation=generation,
+            flags={
+                (flag.key, flag.scope_type, flag.scope_id): flag.enabled
+                for flag in rows
+            },
+        )
+        self._state = state
+        self._checked_at = state.loaded_at
+        logger.info(
+            "Feature flag snapshot loaded.", extra={"flag_count": len(state.flags)}
+        )
+        return state
+
+
+def resolve_flag(
+    flags: Mapping[FlagKey, bool],
+    key: str,
+    scope_type: str = "global",
+    scope_id: str | None = None,
+) -> bool:
+    """Resolve one flag: scoped flag > global flag > fail-open True."""
+    if scope_type != "global" and scope_id is not None:
+        scoped = flags.get((key, scope_type, scope_id))
+        if scoped is not None:
+            return scoped
+    return flags.get((key, "global", None), True)
@@ -3,6 +3,7 @@ from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.auth import api as auth_api
+from app.auth.composition import get_purge_refresh_tokens_task
 from app.core.audit.composition import subscribe_audit_handlers
 from app.core.broker import broker
 from app.core.config import settings
@@ -12,8 +13,17 @@ from app.core.scheduler import InMemoryTaskScheduler
 from app.feature_flags import api as feature_flags_api
 from app.merchants import api as merchants_api
 from app.offers import api as offers_api
+from app.offers.composition import (
+    get_active_offer_catalog,
+    get_sweep_offers_task,
+    subscribe_offer_handlers,
+)
 from app.purchases import api as purchases_api
-from app.purchases.composition import get_verify_purchases_task
+from app.purchases.composition import (
+    get_external_id_filter,
+    get_purchase_ingest_queue,
+    get_verify_purchases_task,
+)
 from app.users import api as users_api
 from app.wallets import api as wallets_api
 
@@ -27,13 +37,37 @@ scheduler.schedule(
     interval_seconds=settings.purchase_confirmation_interval_seconds,
 )
 
+scheduler.schedule(
+    "sweep_offers",
+    get_sweep_offers_task(),
+    interval_seconds=settings.offer_sweep_interval_seconds,
+)
+
+scheduler.schedule(
+    "purge_refresh_tokens",
+    get_purge_refresh_tokens_task(),
+    interval_seconds=settings.refresh_token_purge_interval_seconds,
+)
+
+# The first run loads the filter in the background right after startup.
+if settings.purchase_external_id_filter_enabled:
+    scheduler.schedule(
+        "rebuild_external_id_filter",
+        get_external_id_filter().rebuild,
+        interval_seconds=settings.purchase_external_id_filter_rebuild_interval_seconds,
+    )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Wire audit event handlers to subscribe to all audit events
     subscribe_audit_handlers(broker)
+    subscribe_offer_handlers(broker, get_active_offer_catalog())
     await scheduler.start()  # spawns background asyncio Tasks
+    if settings.purchase_group_commit_enabled:
+        await get_purchase_ingest_queue().start()
     yield
+    await get_purchase_ingest_queue().stop()  # flushes queued purchases first
     await scheduler.stop()  # cancels them cleanly on shutdown
 
 
@@ -1,8 +1,10 @@
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.current_user import get_current_admin_user
 from app.core.database import get_async_db
@@ -10,12 +12,14 @@ from app.core.errors.builders import (
     business_rule_violation_error,
     internal_server_error,
     not_found_error,
+    validation_error,
 )
 from app.core.errors.codes import ErrorCode
 from app.core.logging import logging
-from app.core.schemas import PaginationOut
+from app.core.pagination import InvalidCursorException, TotalCount
+from app.core.schemas import CacheStatsOut, CursorPaginationOut
 from app.core.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWorkABC
-from app.merchants.composition import get_merchant_service
+from app.merchants.composition import get_merchant_cache, get_merchant_service
 from app.merchants.exceptions import (
     CashbackPercentageNotValidException,
     MerchantNotFoundException,
@@ -32,6 +36,9 @@ from app.users.models import User
 
 router = APIRouter(prefix="/merchants", tags=["merchants"])
 
+# Trigrams need a few characters to narrow the search down.
+_MIN_SEARCH_LENGTH = 3
+
 
 def get_unit_of_work(db: AsyncSession = Depends(get_async_db)) -> UnitOfWorkABC:
     return SQLAlchemyUnitOfWork(db)
@@ -80,7 +87,10 @@ async def create_merchant(
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
-    description="List merchants with pagination and optional active status filtering.",
+    description=(
+        "List merchants with pagination and optional active status filtering. "
+        "With q, search merchants by name instead, best match first."
+    ),
 )
 async def list_merchants(
     offset: int = Query(default=0, ge=0, description="Number of results to skip."),
@@ -91,12 +101,59 @@ async def list_merchants(
         description=f"Number of results to return (max {settings.max_page_size}).",
     ),
     active: bool | None = Query(default=None, description="Filter by active status."),
+    total_count: TotalCount = Query(
+        default=TotalCount.EXACT,
+        alias="total",
+        description=(
+            "exact (default) counts the matching rows; estimated reads planner "
+            "statistics for an unfiltered list and sets "
+            "pagination.total_estimated; skip leaves pagination.total null."
+        ),
+    ),
+    q: str | None = Query(
+        default=None,
+        min_length=_MIN_SEARCH_LENGTH,
+        max_length=100,
+        description=(
+            "Search by name: substring and typo-tolerant matches, best match "
+            "first. Results are walked with cursors; offset is ignored and "
+            "total is null."
+        ),
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque cursor from a previous search page's next_cursor.",
+    ),
     merchant_service: MerchantService = Depends(get_merchant_service),
     db: AsyncSession = Depends(get_async_db),
     _current_user: User = Depends(get_current_admin_user),
 ) -> PaginatedMerchantsOut:
+    if q is None and cursor is not None:
+        raise validation_error(
+            code=ErrorCode.VALIDATION_ERROR,
+            message="A cursor is only valid together with q.",
+            details=[{"field": "cursor", "reason": "Pass the same q as before."}],
+        )
+
+    next_cursor: str | None = None
+    total_estimated = False
     try:
-        items, total = await merchant_service.list_merchants(offset, limit, active, db)
+        if q is None:
+            items, total, total_estimated = await merchant_service.list_merchants(
+                offset, limit, active, db, total_count=total_count
+            )
+        else:
+            items, next_cursor = await merchant_service.search_merchants(
+                q, limit, active, db, cursor=cursor
+            )
+            total = None
+
+    except InvalidCursorException as e:
+        raise validation_error(
+            code=ErrorCode.VALIDATION_ERROR,
+            message=str(e),
+            details=[{"field": "cursor", "reason": "Use a next_cursor value as is."}],
+        )
 
     except Exception as e:
         logging.error(
@@ -107,10 +164,31 @@ async def list_merchants(
 
     return PaginatedMerchantsOut(
         data=[MerchantOut.model_validate(m) for m in items],
-        pagination=PaginationOut(offset=offset, limit=limit, total=total),
+        pagination=CursorPaginationOut(
+            offset=0 if q is not None else offset,
+            limit=limit,
+            total=total,
+            total_estimated=total_estimated,
+            next_cursor=next_cursor,
+        ),
     )
 
 
+@router.get(
+    "/cache",
+    status_code=status.HTTP_200_OK,
+    description=(
+        "Statistics of this worker's merchant lookup cache, used to enrich "
+        "purchase responses with merchant names. Admin access required."
+    ),
+)
+async def get_merchant_cache_stats(
+    merchant_cache: TTLCache[str, Any] = Depends(get_merchant_cache),
+    _current_user: User = Depends(get_current_admin_user),
+) -> CacheStatsOut:
+    return CacheStatsOut.model_validate(merchant_cache.stats())
+
+
 @router.patch(
     "/{merchant_id}/status",
     status_code=status.HTTP_200_OK,
@@ -1,7 +1,23 @@
+from typing import Any
+
+from app.core.broker import broker
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.merchants.policies import enforce_cashback_percentage_validity
 from app.merchants.repository import MerchantRepository
 from app.merchants.services import MerchantService
 
+# Process-wide: readers in other modules (purchase enrichment) and the writes
+# in MerchantService that invalidate it must share one instance.
+_merchant_cache: TTLCache[str, Any] = TTLCache(
+    max_size=settings.merchant_cache_max_size,
+    ttl_seconds=settings.merchant_cache_ttl_seconds,
+)
+
+
+def get_merchant_cache() -> TTLCache[str, Any]:
+    return _merchant_cache
+
 
 def get_enforce_cashback_percentage_validity():
     return enforce_cashback_percentage_validity
@@ -13,5 +29,8 @@ def get_merchant_repository():
 
 def get_merchant_service():
     return MerchantService(
-        get_enforce_cashback_percentage_validity(), get_merchant_repository()
+        get_enforce_cashback_percentage_validity(),
+        get_merchant_repository(),
+        get_merchant_cache(),
+        broker,
     )
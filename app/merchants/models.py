@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import text
+from sqlalchemy import Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -16,6 +16,17 @@ class Merchant(Base):
     default_cashback_percentage: Mapped[float] = mapped_column()
     active: Mapped[bool] = mapped_column(server_default=text("true"))
 
+    __table_args__ = (
+        # Trigram index (pg_trgm) for the admin search by name: serves both the
+        # substring (ILIKE) and the word-similarity (<%) matches.
+        Index(
+            "ix_merchants_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
 
 # Optionally add created_at if needed
 # created_at = Column(TIMESTAMP(timezone=True), server_default="now()")
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalCount, fetch_scalar_page
 from app.merchants.models import Merchant
 
 
@@ -30,9 +31,25 @@ class MerchantRepositoryABC(ABC):
         offset: int,
         limit: int,
         active: bool | None = None,
-    ) -> tuple[list[Merchant], int]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[Merchant], int | None]:
         pass
 
+    @abstractmethod
+    async def search_merchants(
+        self,
+        db: AsyncSession,
+        query: str,
+        limit: int,
+        active: bool | None = None,
+        after: tuple[float, str] | None = None,
+    ) -> list[tuple[Merchant, float]]:
+        """Merchants whose name matches *query*, best match first, with scores.
+
+        Ties on score are ordered by ID. *after* is the (score, id) of the last
+        merchant of the previous page.
+        """
+
     @abstractmethod
     async def update_merchant_status(
         self, db: AsyncSession, merchant: Merchant, active: bool
@@ -65,18 +82,52 @@ class MerchantRepository(MerchantRepositoryABC):
         offset: int,
         limit: int,
         active: bool | None = None,
-    ) -> tuple[list[Merchant], int]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[Merchant], int | None]:
         stmt = select(Merchant)
         if active is not None:
             stmt = stmt.where(Merchant.active == active)
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = (await db.execute(count_stmt)).scalar_one()
+        return await fetch_scalar_page(
+            db,
+            stmt,
+            offset=offset,
+            limit=limit,
+            total_count=total_count,
+            table=Merchant.__table__,
+        )
 
-        items_stmt = stmt.offset(offset).limit(limit)
-        result = await db.execute(items_stmt)
-        items = list(result.scalars().all())
-        return items, total
+    async def search_merchants(
+        self,
+        db: AsyncSession,
+        query: str,
+        limit: int,
+        active: bool | None = None,
+        after: tuple[float, str] | None = None,
+    ) -> list[tuple[Merchant, float]]:
+        # A name matches when it contains the query, or when the query is close
+        # to one of its words (pg_trgm's <%, a typo-tolerant match). Both
+        # conditions are served by the trigram index on merchants.name.
+        score = func.word_similarity(query, Merchant.name)
+        stmt = select(Merchant, score).where(
+            or_(
+                Merchant.name.ilike(f"%{_escape_like(query)}%", escape="\\"),
+                literal(query).op("<%")(Merchant.name),
+            )
+        )
+        if active is not None:
+            stmt = stmt.where(Merchant.active == active)
+        if after is not None:
+            after_score, after_id = after
+            stmt = stmt.where(
+                or_(
+                    score < after_score,
+                    and_(score == after_score, Merchant.id > after_id),
+                )
+            )
+        stmt = stmt.order_by(score.desc(), Merchant.id).limit(limit)
+        rows = (await db.execute(stmt)).all()
+        return [(row[0], row[1]) for row in rows]
 
     async def update_merchant_status(
         self, db: AsyncSession, merchant: Merchant, active: bool
@@ -85,3 +136,7 @@ class MerchantRepository(MerchantRepositoryABC):
         await db.flush()
         await db.refresh(merchant)
         return merchant
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
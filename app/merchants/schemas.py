@@ -3,7 +3,7 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
-from app.core.schemas import PaginationOut
+from app.core.schemas import CursorPaginationOut
 
 
 class MerchantSchemaBase(BaseModel):
@@ -25,7 +25,7 @@ class MerchantCreate(MerchantSchemaBase):
 
 class PaginatedMerchantsOut(BaseModel):
     data: list[MerchantOut]
-    pagination: PaginationOut
+    pagination: CursorPaginationOut
 
 
 class MerchantStatusUpdate(BaseModel):
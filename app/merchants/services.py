@@ -2,7 +2,17 @@ from typing import Any, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.broker import MessageBrokerABC
+from app.core.cache import TTLCache
+from app.core.events.merchant_events import MerchantStatusChanged
 from app.core.logging import logger
+from app.core.pagination import (
+    InvalidCursorException,
+    TotalCount,
+    decode_cursor,
+    encode_cursor,
+    select_total_count,
+)
 from app.core.unit_of_work import UnitOfWorkABC
 from app.merchants.exceptions import (
     MerchantNameAlreadyExistsException,
@@ -17,9 +27,13 @@ class MerchantService:
         self,
         enforce_cashback_percentage_validity: Callable[[float], None],
         merchant_repository: MerchantRepositoryABC,
+        merchant_cache: TTLCache[str, Any],
+        broker: MessageBrokerABC,
     ):
         self.enforce_cashback_percentage_validity = enforce_cashback_percentage_validity
         self.merchant_repository = merchant_repository
+        self.merchant_cache = merchant_cache
+        self.broker = broker
 
     async def create_merchant(
         self, merchant_data: dict[str, Any], uow: UnitOfWorkABC
@@ -40,6 +54,8 @@ class MerchantService:
 
         result = await self.merchant_repository.add_merchant(uow.session, new_merchant)
         await uow.commit()
+        # After the commit, so a concurrent read cannot re-cache the old state.
+        self.merchant_cache.invalidate(str(result.id))
         return result
 
     async def list_merchants(
@@ -48,8 +64,42 @@ class MerchantService:
         limit: int,
         active: bool | None,
         db: AsyncSession,
-    ) -> tuple[list[Merchant], int]:
-        return await self.merchant_repository.list_merchants(db, offset, limit, active)
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[Merchant], int | None, bool]:
+        """Return a page of merchants, the total and whether it is an estimate."""
+        total_count = select_total_count(total_count, filtered=active is not None)
+        items, total = await self.merchant_repository.list_merchants(
+            db, offset, limit, active, total_count=total_count
+        )
+        return items, total, total_count is TotalCount.ESTIMATED
+
+    async def search_merchants(
+        self,
+        query: str,
+        limit: int,
+        active: bool | None,
+        db: AsyncSession,
+        cursor: str | None = None,
+    ) -> tuple[list[Merchant], str | None]:
+        """Return one page of merchants matching *query* and the next cursor.
+
+        Results are ranked by similarity and walked by keyset: the cursor is
+        None on the last page.
+
+        Raises:
+            InvalidCursorException: if *cursor* is malformed.
+        """
+        after = _decode_search_cursor(cursor) if cursor is not None else None
+        # One extra row tells whether another page exists without a COUNT.
+        rows = await self.merchant_repository.search_merchants(
+            db, query, limit + 1, active, after=after
+        )
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last_merchant, last_score = page[-1]
+            next_cursor = encode_cursor(repr(last_score), last_merchant.id)
+        return [merchant for merchant, _ in page], next_cursor
 
     async def set_merchant_status(
         self, merchant_id: str, active: bool, uow: UnitOfWorkABC
@@ -68,6 +118,10 @@ class MerchantService:
             uow.session, merchant, active
         )
         await uow.commit()
+        self.merchant_cache.invalidate(merchant_id)
+        await self.broker.publish(
+            MerchantStatusChanged(merchant_id=merchant_id, active=active)
+        )
         logger.info(
             "Merchant status updated.",
             extra={"merchant_id": merchant_id, "active": active},
@@ -83,3 +137,11 @@ class MerchantService:
                 extra={"merchant_name": name},
             )
             raise MerchantNameAlreadyExistsException(name)
+
+
+def _decode_search_cursor(cursor: str) -> tuple[float, str]:
+    score, merchant_id = decode_cursor(cursor, 2)
+    try:
+        return float(score), merchant_id
+    except ValueError:
+        raise InvalidCursorException(cursor) from None
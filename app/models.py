@@ -1,12 +1,12 @@
 # Import all model classes here so Alembic can discover them
 # See alembic/env.py for reference.
 from app.auth.models import RefreshToken
-from app.cashback.models import CashbackTransaction
+from app.cashback.models import CashbackTransaction, OfferUserMonthlyUsage
 from app.core.audit import AuditLog
 from app.feature_flags.models import FeatureFlag
 from app.merchants.models import Merchant
 from app.offers.models import Offer
-from app.purchases.models import Purchase
+from app.purchases.models import Purchase, PurchaseImportCheckpoint, UserPurchaseStats
 from app.users.models import User
 from app.wallets.models import Wallet
 
@@ -17,7 +17,10 @@ __all__ = [
     "User",
     "Merchant",
     "Offer",
+    "OfferUserMonthlyUsage",
     "Purchase",
+    "PurchaseImportCheckpoint",
+    "UserPurchaseStats",
     "Wallet",
     "RefreshToken",
 ]
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.current_user import get_current_user
@@ -10,6 +10,7 @@ from app.core.errors.builders import (
     internal_server_error,
     not_found_error,
 )
+from app.core.http_cache import conditional_json
 from app.core.logging import logging
 from app.offers.composition import get_offer_service
 from app.offers.exceptions import (
@@ -28,12 +29,19 @@ router = APIRouter(prefix="/offers", tags=["offers"])
 @router.get(
     "/{offer_id}",
     status_code=status.HTTP_200_OK,
+    response_model=OfferDetailsOut,
     description=(
         "Get detailed information about a specific offer."
         " Active offers are visible to all authenticated users."
         " Admin users can also view inactive offers."
+        " Supports conditional requests with If-None-Match."
     ),
     responses={
+        304: {
+            "description": (
+                "Not modified: the ETag sent in If-None-Match is still current."
+            ),
+        },
         401: {
             "description": "Missing or invalid authentication token.",
             "content": {
@@ -116,10 +124,11 @@ router = APIRouter(prefix="/offers", tags=["offers"])
 )
 async def get_offer_details(
     offer_id: str,
+    if_none_match: str | None = Header(default=None),
     offer_service: OfferService = Depends(get_offer_service),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
-) -> OfferDetailsOut:
+) -> Response:
     is_admin = current_user.role == UserRoleEnum.admin
     try:
         offer, merchant_name = await offer_service.get_offer_details(
@@ -165,7 +174,9 @@ async def get_offer_details(
         )
         raise internal_server_error()
 
-    return _map_to_offer_details_out(offer, merchant_name)
+    # Offers carry no version column: the ETag is derived from the body.
+    body = _map_to_offer_details_out(offer, merchant_name).model_dump_json()
+    return conditional_json(body.encode(), if_none_match)
 
 
 def _map_to_offer_details_out(offer: Offer, merchant_name: str) -> OfferDetailsOut:
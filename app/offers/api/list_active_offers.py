@@ -1,22 +1,16 @@
 from datetime import date
-from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.current_user import get_current_user
 from app.core.database import get_async_db
 from app.core.errors.builders import internal_server_error
+from app.core.http_cache import etag_matches, json_response, not_modified
 from app.core.logging import logging
-from app.core.schemas import PaginationOut
 from app.offers.composition import get_offer_service
-from app.offers.models import Offer
-from app.offers.schemas import (
-    ActiveOfferOut,
-    CashbackTypeEnum,
-    PaginatedActiveOffersOut,
-)
+from app.offers.schemas import PaginatedActiveOffersOut
 from app.offers.services import OfferService
 from app.users.models import User
 
@@ -26,11 +20,20 @@ router = APIRouter(prefix="/offers", tags=["offers"])
 @router.get(
     "/active",
     status_code=status.HTTP_200_OK,
+    response_model=PaginatedActiveOffersOut,
     description=(
         "List all currently active offers visible to end-users."
         " Filters: offer active, merchant active, and today within [start_date, end_date]."
+        " Served from an in-memory catalog snapshot. Responses carry a weak ETag;"
+        " send it back in If-None-Match to get 304 Not Modified while the page"
+        " is unchanged."
     ),
     responses={
+        304: {
+            "description": (
+                "Not modified: the ETag sent in If-None-Match is still current."
+            ),
+        },
         401: {
             "description": "Missing or invalid authentication token.",
             "content": {
@@ -101,16 +104,22 @@ async def list_active_offers(
         le=settings.max_page_size,
         description=f"Number of results to return (max {settings.max_page_size}).",
     ),
+    include_total: bool = Query(
+        default=True,
+        description="Set to false to skip counting; pagination.total is then null.",
+    ),
+    if_none_match: str | None = Header(default=None),
     offer_service: OfferService = Depends(get_offer_service),
     db: AsyncSession = Depends(get_async_db),
     _current_user: User = Depends(get_current_user),
-) -> PaginatedActiveOffersOut:
+) -> Response:
     try:
-        items, total = await offer_service.list_active_offers(
+        page = await offer_service.list_active_offers(
             offset,
             limit,
             date.today(),
             db,
+            include_total=include_total,
         )
     except Exception as e:
         logging.error(
@@ -119,28 +128,8 @@ async def list_active_offers(
         )
         raise internal_server_error()
 
-    return PaginatedActiveOffersOut(
-        data=[
-            _map_to_active_offer_out(offer, merchant_name)
-            for offer, merchant_name in items
-        ],
-        pagination=PaginationOut(offset=offset, limit=limit, total=total),
-    )
-
-
-def _map_to_active_offer_out(offer: Offer, merchant_name: str) -> ActiveOfferOut:
-    return ActiveOfferOut(
-        id=UUID(offer.id),
-        merchant_name=merchant_name,
-        cashback_type=(
-            CashbackTypeEnum.fixed
-            if offer.fixed_amount is not None
-            else CashbackTypeEnum.percent
-        ),
-        cashback_value=(
-            offer.fixed_amount if offer.fixed_amount is not None else offer.percentage
-        ),
-        monthly_cap=offer.monthly_cap_per_user,
-        start_date=offer.start_date,
-        end_date=offer.end_date,
-    )
+    # Checked before the body is encoded: a match costs no encoding at all.
+    if etag_matches(if_none_match, page.etag):
+        return not_modified(page.etag)
+    # The items are already encoded: sent as is, without re-validation.
+    return json_response(page.body, page.etag)
@@ -10,6 +10,7 @@ from app.core.database import get_async_db
 from app.core.errors.builders import internal_server_error, validation_error
 from app.core.errors.codes import ErrorCode
 from app.core.logging import logging
+from app.core.pagination import TotalCount
 from app.core.schemas import PaginationOut
 from app.offers.composition import get_offer_service
 from app.offers.schemas import OfferOut, PaginatedOffersOut
@@ -147,6 +148,15 @@ async def list_offers(
             "Return offers whose validity window starts on or before this date (YYYY-MM-DD)."
         ),
     ),
+    total_count: TotalCount = Query(
+        default=TotalCount.EXACT,
+        alias="total",
+        description=(
+            "exact (default) counts the matching rows; estimated reads planner "
+            "statistics for an unfiltered list and sets "
+            "pagination.total_estimated; skip leaves pagination.total null."
+        ),
+    ),
     offer_service: OfferService = Depends(get_offer_service),
     db: AsyncSession = Depends(get_async_db),
     _current_user: User = Depends(get_current_user),
@@ -154,7 +164,7 @@ async def list_offers(
     _validate_list_params(status_filter, date_from, date_to)
 
     try:
-        items, total = await offer_service.list_offers(
+        items, total, total_estimated = await offer_service.list_offers(
             offset,
             limit,
             _map_status_to_active(status_filter),
@@ -162,6 +172,7 @@ async def list_offers(
             date_from,
             date_to,
             db,
+            total_count=total_count,
         )
     except Exception as e:
         logging.error(
@@ -172,7 +183,9 @@ async def list_offers(
 
     return PaginatedOffersOut(
         data=[OfferOut.model_validate(item) for item in items],
-        pagination=PaginationOut(offset=offset, limit=limit, total=total),
+        pagination=PaginationOut(
+            offset=offset, limit=limit, total=total, total_estimated=total_estimated
+        ),
     )
 
 
@@ -0,0 +1,174 @@
+"""In-process snapshot of the active offer catalog (GET /offers/active).
+
+The catalog is small, changes rarely and is read by every signed-in user, so
+each worker keeps all active offers already encoded in the ``ActiveOfferOut``
+shape, and a page is a slice of that array. The snapshot is rebuilt on the
+first read after:
+
+- an offer or merchant write invalidated it (only reaches this worker),
+- the day changed (offers start and end at midnight), or
+- it got older than ``max_age_seconds``, which bounds how long other workers
+  serve a catalog this worker's writes have changed.
+
+Reads served from the snapshot never touch the database.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.http_cache import weak_etag
+from app.core.logging import logger
+from app.core.schemas import PaginationOut
+from app.offers.models import Offer
+from app.offers.repositories import OfferRepositoryABC
+from app.offers.schemas import ActiveOfferOut, CashbackTypeEnum
+
+
+@dataclass(frozen=True)
+class ActiveOfferCatalogSnapshot:
+    day: date
+    version: str
+    built_at: float
+    generation: int
+    # Each element is one ActiveOfferOut, JSON encoded.
+    items: tuple[bytes, ...]
+
+
+@dataclass(frozen=True)
+class ActiveOfferPage:
+    """One page of the catalog, tagged with a weak ETag.
+
+    The ETag is known before the body is encoded, so a conditional request
+    that matches it costs neither encoding nor a database read.
+    """
+
+    etag: str
+    items: tuple[bytes, ...]
+    pagination: PaginationOut
+
+    @property
+    def body(self) -> bytes:
+        """The page encoded as ``PaginatedActiveOffersOut``."""
+        return b"".join(
+            (
+                b'{"data":[',
+                b",".join(self.items),
+                b'],"pagination":',
+                self.pagination.model_dump_json().encode(),
+                b"}",
+            )
+        )
+
+
+class ActiveOfferCatalog:
+    def __init__(
+        self,
+        repository: OfferRepositoryABC,
+        max_age_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.repository = repository
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._snapshot: ActiveOfferCatalogSnapshot | None = None
+        # Bumped by invalidate(); a snapshot built before the bump is stale.
+        self._generation = 0
+        self._rebuild_lock = asyncio.Lock()
+
+    async def page(
+        self,
+        db: AsyncSession,
+        today: date,
+        *,
+        offset: int,
+        limit: int,
+        include_total: bool = True,
+    ) -> ActiveOfferPage:
+        """Return one page of the catalog, rebuilding the snapshot if needed.
+
+        *db* is only used when the snapshot has to be rebuilt.
+        """
+        snapshot = await self._current(db, today)
+        pagination = PaginationOut(
+            offset=offset,
+            limit=limit,
+            total=len(snapshot.items) if include_total else None,
+        )
+        end = offset + limit
+        return ActiveOfferPage(
+            etag=weak_etag(f"{snapshot.version}:{offset}:{limit}:{include_total}"),
+            items=snapshot.items[offset:end],
+            pagination=pagination,
+        )
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale; the next read rebuilds it."""
+        self._generation += 1
+
+    async def _current(
+        self, db: AsyncSession, today: date
+    ) -> ActiveOfferCatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh(snapshot, today):
+            return snapshot
+        # Single flight: requests arriving during a rebuild wait for it and
+        # then find the new snapshot fresh.
+        async with self._rebuild_lock:
+            snapshot = self._snapshot
+            if snapshot is None or not self._is_fresh(snapshot, today):
+                snapshot = await self._build(db, today)
+                self._snapshot = snapshot
+        return snapshot
+
+    def _is_fresh(self, snapshot: ActiveOfferCatalogSnapshot, today: date) -> bool:
+        if snapshot.generation != self._generation or snapshot.day != today:
+            return False
+        return self._clock() - snapshot.built_at < self.max_age_seconds
+
+    async def _build(self, db: AsyncSession, today: date) -> ActiveOfferCatalogSnapshot:
+        generation = self._generation
+        rows = await self.repository.list_active_offers(db, today)
+        items = tuple(
+            _map_to_active_offer_out(offer, merchant_name).model_dump_json().encode()
+            for offer, merchant_name in rows
+        )
+        digest = hashlib.sha256(today.isoformat().encode())
+        for item in items:
+            digest.update(item)
+        snapshot = ActiveOfferCatalogSnapshot(
+            day=today,
+            version=digest.hexdigest()[:16],
+            built_at=self._clock(),
+            generation=generation,
+            items=items,
+        )
+        logger.info(
+            "Active offer catalog rebuilt.",
+            extra={"offer_count": len(items), "version": snapshot.version},
+        )
+        return snapshot
+
+
+def _map_to_active_offer_out(offer: Offer, merchant_name: str) -> ActiveOfferOut:
+    return ActiveOfferOut(
+        id=UUID(offer.id),
+        merchant_name=merchant_name,
+        cashback_type=(
+            CashbackTypeEnum.fixed
+            if offer.fixed_amount is not None
+            else CashbackTypeEnum.percent
+        ),
+        cashback_value=(
+            offer.fixed_amount if offer.fixed_amount is not None else offer.percentage
+        ),
+        monthly_cap=offer.monthly_cap_per_user,
+        start_date=offer.start_date,
+        end_date=offer.end_date,
+    )
@@ -1,4 +1,15 @@
+from datetime import date
+from typing import Any
+
+from app.core.broker import MessageBrokerABC
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.events.merchant_events import MerchantStatusChanged
+from app.core.scheduler import ScheduledTask
 from app.merchants.repository import MerchantRepository
+from app.offers.catalog import ActiveOfferCatalog
+from app.offers.jobs.sweep_offers import make_sweep_offers_task
 from app.offers.policies import (
     enforce_cashback_value_validity,
     enforce_date_range_validity,
@@ -11,11 +22,50 @@ from app.offers.policies import (
 from app.offers.repositories import OfferRepository
 from app.offers.services import OfferService
 
+# Process-wide: purchase ingestion reads it and the writes in OfferService
+# that invalidate it must share one instance. Keyed by (merchant_id, date).
+_active_offer_cache: TTLCache[tuple[str, date], Any] = TTLCache(
+    max_size=settings.active_offer_cache_max_size,
+    ttl_seconds=settings.active_offer_cache_ttl_seconds,
+)
+
+
+def get_active_offer_cache() -> TTLCache[tuple[str, date], Any]:
+    return _active_offer_cache
+
 
 def get_offer_repository() -> OfferRepository:
     return OfferRepository()
 
 
+# Process-wide: one snapshot per worker, invalidated by offer and merchant
+# writes.
+_active_offer_catalog = ActiveOfferCatalog(
+    repository=OfferRepository(),
+    max_age_seconds=settings.active_offer_catalog_max_age_seconds,
+)
+
+
+def get_active_offer_catalog() -> ActiveOfferCatalog:
+    return _active_offer_catalog
+
+
+def subscribe_offer_handlers(
+    broker: MessageBrokerABC, active_offer_catalog: ActiveOfferCatalog
+) -> None:
+    """Subscribe the offers module to the merchant events it depends on.
+
+    Call this during application startup (in app/main.py lifespan). Merchants
+    publish the events and stay unaware of the offers module.
+    """
+
+    async def on_merchant_status_changed(event: MerchantStatusChanged) -> None:
+        # The catalog only lists offers of active merchants.
+        active_offer_catalog.invalidate()
+
+    broker.subscribe(MerchantStatusChanged, on_merchant_status_changed)
+
+
 def get_merchant_repository_for_offers() -> MerchantRepository:
     return MerchantRepository()
 
@@ -31,4 +81,15 @@ def get_offer_service() -> OfferService:
         enforce_offer_merchant_visibility=enforce_offer_merchant_visibility,
         offer_repository=get_offer_repository(),
         merchant_repository=get_merchant_repository_for_offers(),
+        active_offer_cache=get_active_offer_cache(),
+        active_offer_catalog=get_active_offer_catalog(),
+    )
+
+
+def get_sweep_offers_task() -> ScheduledTask:
+    return make_sweep_offers_task(
+        repository=OfferRepository(),
+        db_session_factory=AsyncSessionLocal,
+        batch_size=settings.offer_sweep_batch_size,
+        today_provider=date.today,
     )
@@ -0,0 +1,5 @@
+"""Offer background jobs.
+
+Jobs are wired in ``app/offers/composition.py`` and scheduled in
+``app/main.py``.
+"""
@@ -0,0 +1,64 @@
+"""Offer lifecycle sweeper.
+
+Offers keep ``active = true`` after their end date unless something turns
+them off, so every active-offer query would filter dates over the whole offer
+history. The sweeper deactivates expired offers in batched, set-based
+updates; together with the partial indexes on ``offers ... WHERE active`` this
+keeps those queries proportional to live offers.
+
+Deactivating an expired offer changes no read result (reads already filter by
+date), so no cache or catalog invalidation is needed. It does free the
+merchant for a new offer: the one-active-offer-per-merchant check ignores
+dates.
+"""
+
+from collections.abc import Callable
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.logging import logger
+from app.core.scheduler import ScheduledTask
+from app.offers.repositories import OfferRepositoryABC
+
+
+def make_sweep_offers_task(
+    *,
+    repository: OfferRepositoryABC,
+    db_session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int,
+    today_provider: Callable[[], date],
+) -> ScheduledTask:
+    """Return a ScheduledTask that deactivates every offer ended before today.
+
+    Each batch is its own short transaction, so row locks are held briefly
+    and an interrupted sweep keeps the batches already done.
+    """
+
+    async def task() -> None:
+        today = today_provider()
+        swept = 0
+        try:
+            while True:
+                async with db_session_factory() as db:
+                    merchant_ids = await repository.deactivate_expired_offers(
+                        db, today, batch_size
+                    )
+                    await db.commit()
+                swept += len(merchant_ids)
+                if len(merchant_ids) < batch_size:
+                    break
+        except Exception as e:
+            # The scheduler loop stops on an exception; the next run retries.
+            logger.error(
+                "Offer sweep failed.",
+                extra={"error": str(e), "deactivated_count": swept},
+            )
+            return
+        if swept:
+            logger.info(
+                "Expired offers deactivated.",
+                extra={"deactivated_count": swept, "today": today.isoformat()},
+            )
+
+    return task
@@ -1,7 +1,7 @@
 import uuid
 from datetime import date
 
-from sqlalchemy import ForeignKey, Index, text
+from sqlalchemy import ForeignKey, Index, func, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -23,5 +23,22 @@ class Offer(Base):
 
     __table_args__ = (
         Index("ix_offers_merchant_id", "merchant_id"),
-        Index("ix_offers_merchant_active", "merchant_id", "active"),
+        # Live offers only: the sweeper deactivates expired offers, so these
+        # stay proportional to live offers rather than the offer history.
+        Index(
+            "ix_offers_live_merchant_id",
+            "merchant_id",
+            postgresql_where=text("active"),
+        ),
+        Index("ix_offers_live_end_date", "end_date", postgresql_where=text("active")),
     )
+
+
+# Serves the admin listing's date filter, which tests whether an offer's
+# validity range overlaps the requested window (``&&``). Declared outside the
+# class because the expression needs the mapped columns.
+Index(
+    "ix_offers_validity",
+    func.daterange(Offer.start_date, Offer.end_date, literal_column("'[]'")),
+    postgresql_using="gist",
+)
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, func, literal_column, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalCount, fetch_scalar_page
 from app.offers.models import Offer
 
 # We are coupling to the Merchants module by using the Merchant model and joining on it here.
@@ -20,6 +21,28 @@ _MerchantName = str
 # if we decide to split them in the future (with performance considerations).
 # For now, we will keep it simple and just be mindful of the coupling and circular import issues.
 
+# Live-offer lookups filter on the bare ``Offer.active`` column rather than
+# ``active IS true``, so the planner matches the ``WHERE active`` predicate of
+# the partial indexes on live offers.
+
+
+# Ranges include both ends, like an offer's start_date and end_date. Rendered
+# as a literal, not a bind parameter, so the expression matches the one in
+# ix_offers_validity.
+_INCLUSIVE = literal_column("'[]'")
+
+
+def _validity_overlaps(
+    date_from: date | None, date_to: date | None
+) -> ColumnElement[bool]:
+    """Offers valid on at least one day of [date_from, date_to].
+
+    A missing bound leaves that side of the window open (NULL in daterange).
+    """
+    validity = func.daterange(Offer.start_date, Offer.end_date, _INCLUSIVE)
+    window = func.daterange(date_from, date_to, _INCLUSIVE)
+    return validity.op("&&")(window)
+
 
 class OfferRepositoryABC(ABC):
     @abstractmethod
@@ -46,18 +69,15 @@ class OfferRepositoryABC(ABC):
         merchant_id: str | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
-    ) -> tuple[list[Offer], int]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[Offer], int | None]:
         pass
 
     @abstractmethod
     async def list_active_offers(
-        self,
-        db: AsyncSession,
-        offset: int,
-        limit: int,
-        today: date,
-    ) -> tuple[list[tuple[Offer, str]], int]:
-        pass
+        self, db: AsyncSession, today: date
+    ) -> list[tuple[Offer, str]]:
+        """Every offer visible to end-users on *today*, with its merchant name."""
 
     @abstractmethod
     async def get_offer_with_merchant_name(
@@ -71,6 +91,15 @@ class OfferRepositoryABC(ABC):
     ) -> Offer:
         pass
 
+    @abstractmethod
+    async def deactivate_expired_offers(
+        self, db: AsyncSession, today: date, batch_size: int
+    ) -> list[str]:
+        """Deactivate up to *batch_size* offers that ended before *today*.
+
+        Returns the merchant IDs of the deactivated offers, one per offer.
+        """
+
 
 class OfferRepository(OfferRepositoryABC):
     async def add_offer(self, db: AsyncSession, offer: Offer) -> Offer:
@@ -88,7 +117,7 @@ class OfferRepository(OfferRepositoryABC):
     ) -> bool:
         stmt = (
             select(Offer.id)
-            .where(Offer.merchant_id == merchant_id, Offer.active.is_(True))
+            .where(Offer.merchant_id == merchant_id, Offer.active)
             .limit(1)
         )
         result = await db.execute(stmt)
@@ -103,7 +132,8 @@ class OfferRepository(OfferRepositoryABC):
         merchant_id: str | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
-    ) -> tuple[list[Offer], int]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[Offer], int | None]:
         stmt = select(Offer)
         if active is not None:
             stmt = stmt.where(Offer.active == active)
@@ -113,56 +143,41 @@ class OfferRepository(OfferRepositoryABC):
         # Overlap condition: offer validity window intersects [date_from, date_to]
         # Technically, to apply an overlap date range strategy is business logic and
         # should be in the service layer, but for simplicity we put it here (for now)
-        if date_from is not None:
-            stmt = stmt.where(Offer.end_date >= date_from)
-        if date_to is not None:
-            stmt = stmt.where(Offer.start_date <= date_to)
-
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = (await db.execute(count_stmt)).scalar_one()
-
-        items_stmt = stmt.offset(offset).limit(limit)
-        result = await db.execute(items_stmt)
-        items = list(result.scalars().all())
-        return items, total
+        if date_from is not None or date_to is not None:
+            stmt = stmt.where(_validity_overlaps(date_from, date_to))
+
+        return await fetch_scalar_page(
+            db,
+            stmt,
+            offset=offset,
+            limit=limit,
+            total_count=total_count,
+            table=Offer.__table__,
+        )
 
     async def list_active_offers(
-        self,
-        db: AsyncSession,
-        offset: int,
-        limit: int,
-        today: date,
-    ) -> tuple[list[tuple[Offer, str]], int]:
+        self, db: AsyncSession, today: date
+    ) -> list[tuple[Offer, str]]:
         from app.merchants.models import (
             Merchant,  # local import to avoid potential circular deps
         )
 
         # IMPORTANT: See note on coupling and circular import issues at the top of the file.
 
-        base_stmt = (
+        stmt = (
             select(Offer, Merchant.name)
             .join(Merchant, Offer.merchant_id == Merchant.id)
             .where(
-                Offer.active.is_(True),
-                Merchant.active.is_(True),
-                Offer.start_date <= today,
-                Offer.end_date >= today,
-            )
-        )
-        count_stmt = select(func.count()).select_from(
-            select(Offer.id)
-            .join(Merchant, Offer.merchant_id == Merchant.id)
-            .where(
-                Offer.active.is_(True),
+                Offer.active,
                 Merchant.active.is_(True),
                 Offer.start_date <= today,
                 Offer.end_date >= today,
             )
-            .subquery()
+            # A stable order, so catalog pages are stable slices.
+            .order_by(Merchant.name, Offer.id)
         )
-        total = (await db.execute(count_stmt)).scalar_one()
-        rows = (await db.execute(base_stmt.offset(offset).limit(limit))).all()
-        return [(row[0], row[1]) for row in rows], total
+        rows = (await db.execute(stmt)).all()
+        return [(row[0], row[1]) for row in rows]
 
     async def get_offer_with_merchant_name(
         self, db: AsyncSession, offer_id: str
@@ -191,3 +206,25 @@ class OfferRepository(OfferRepositoryABC):
         await db.flush()
         await db.refresh(offer)
         return offer
+
+    async def deactivate_expired_offers(
+        self, db: AsyncSession, today: date, batch_size: int
+    ) -> list[str]:
+        # One set-based UPDATE per batch. SKIP LOCKED lets sweepers in other
+        # workers take different rows instead of waiting on these.
+        batch = (
+            select(Offer.id)
+            .where(Offer.active, Offer.end_date < today)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Offer)
+            .where(Offer.id.in_(batch))
+            .values(active=False)
+            .returning(Offer.merchant_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
@@ -4,10 +4,13 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.logging import logger
+from app.core.pagination import TotalCount, select_total_count
 from app.core.unit_of_work import UnitOfWorkABC
 from app.merchants.exceptions import MerchantNotFoundException
 from app.merchants.repository import MerchantRepositoryABC
+from app.offers.catalog import ActiveOfferCatalog, ActiveOfferPage
 from app.offers.exceptions import OfferNotFoundException
 from app.offers.models import Offer
 from app.offers.repositories import OfferRepositoryABC
@@ -26,6 +29,8 @@ class OfferService:
         enforce_offer_merchant_visibility: Callable[[str, str, bool, bool], None],
         offer_repository: OfferRepositoryABC,
         merchant_repository: MerchantRepositoryABC,
+        active_offer_cache: TTLCache[tuple[str, date], Any],
+        active_offer_catalog: ActiveOfferCatalog,
     ):
         self.enforce_cashback_value_validity = enforce_cashback_value_validity
         self.enforce_date_range_validity = enforce_date_range_validity
@@ -36,6 +41,8 @@ class OfferService:
         self.enforce_offer_merchant_visibility = enforce_offer_merchant_visibility
         self.offer_repository = offer_repository
         self.merchant_repository = merchant_repository
+        self.active_offer_cache = active_offer_cache
+        self.active_offer_catalog = active_offer_catalog
 
     async def create_offer(self, data: dict[str, Any], uow: UnitOfWorkABC) -> Offer:
         # Fail fast: validate offer configuration before any DB look-up.
@@ -70,6 +77,7 @@ class OfferService:
 
         offer = await self.offer_repository.add_offer(uow.session, new_offer)
         await uow.commit()
+        self._invalidate_active_offer_reads(merchant_id)
         logger.info(
             "Offer created successfully.",
             extra={"offer_id": offer.id, "merchant_id": offer.merchant_id},
@@ -102,8 +110,12 @@ class OfferService:
         date_from: date | None,
         date_to: date | None,
         db: AsyncSession,
-    ) -> tuple[list[Offer], int]:
-        return await self.offer_repository.list_offers(
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[Offer], int | None, bool]:
+        """Return a page of offers, the total and whether it is an estimate."""
+        filtered = any(f is not None for f in (active, merchant_id, date_from, date_to))
+        total_count = select_total_count(total_count, filtered=filtered)
+        items, total = await self.offer_repository.list_offers(
             db,
             offset,
             limit,
@@ -111,7 +123,9 @@ class OfferService:
             merchant_id=str(merchant_id) if merchant_id is not None else None,
             date_from=date_from,
             date_to=date_to,
+            total_count=total_count,
         )
+        return items, total, total_count is TotalCount.ESTIMATED
 
     async def list_active_offers(
         self,
@@ -119,8 +133,11 @@ class OfferService:
         limit: int,
         today: date,
         db: AsyncSession,
-    ) -> tuple[list[tuple[Offer, str]], int]:
-        return await self.offer_repository.list_active_offers(db, offset, limit, today)
+        include_total: bool = True,
+    ) -> ActiveOfferPage:
+        return await self.active_offer_catalog.page(
+            db, today, offset=offset, limit=limit, include_total=include_total
+        )
 
     async def get_offer_details(
         self,
@@ -158,8 +175,15 @@ class OfferService:
             uow.session, offer, active
         )
         await uow.commit()
+        self._invalidate_active_offer_reads(str(updated.merchant_id))
         logger.info(
             "Offer status updated.",
             extra={"offer_id": offer_id, "active": active},
         )
         return updated
+
+    def _invalidate_active_offer_reads(self, merchant_id: str) -> None:
+        # Every cached day of the merchant: a date-ranged offer can change the
+        # answer for past and future days alike.
+        self.active_offer_cache.invalidate_where(lambda key: key[0] == merchant_id)
+        self.active_offer_catalog.invalidate()
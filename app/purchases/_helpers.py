@@ -1,4 +1,7 @@
-"""Core purchase confirmation state transition.
+"""Purchase state transitions shared by the service and the background job.
+
+Core purchase confirmation state transition
+-------------------------------------------
 
 Encapsulates the atomic state changes that confirm a purchase:
 
@@ -55,3 +58,23 @@ async def apply_purchase_confirmation(
         )
 
     return confirmed  # type: ignore[return-value]
+
+
+async def release_monthly_cap(
+    purchase: Purchase, db: AsyncSession, cashback_client: CashbackClientABC
+) -> None:
+    """Give a rejected or reversed purchase's cashback back to its monthly cap.
+
+    Must run before the purchase's ``cashback_amount`` is zeroed. The month is
+    taken from ``created_at``, the same calendar month the ingest counted it in.
+    Flushed but not committed — caller must commit.
+    """
+    if purchase.offer_id is None or purchase.cashback_amount <= Decimal("0"):
+        return
+    await cashback_client.release_monthly_usage(
+        db,
+        purchase.offer_id,
+        purchase.user_id,
+        purchase.created_at.date().replace(day=1),
+        purchase.cashback_amount,
+    )
@@ -1,8 +1,14 @@
+import json
+from collections.abc import AsyncIterator
 from datetime import date
+from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Receive, Scope, Send
 
+from app.core.config import settings
 from app.core.current_user import get_current_admin_user
 from app.core.database import get_async_db
 from app.core.errors.builders import (
@@ -11,23 +17,51 @@ from app.core.errors.builders import (
     unprocessable_entity_error,
     validation_error,
 )
+from app.core.errors.codes import ErrorCode as CoreErrorCode
 from app.core.logging import logging
-from app.core.schemas import PaginationOut
+from app.core.pagination import InvalidCursorException
+from app.core.schemas import CursorPaginationOut
 from app.core.unit_of_work import UnitOfWorkABC
-from app.purchases.composition import get_purchase_service, get_unit_of_work
+from app.purchases.bulk_import import (
+    PurchaseImporter,
+    PurchaseImportFormat,
+    parse_import_rows,
+    read_file_chunks,
+    resolve_import_file,
+)
+from app.purchases.composition import (
+    get_external_id_filter,
+    get_purchase_exporter,
+    get_purchase_importer,
+    get_purchase_service,
+    get_unit_of_work,
+)
 from app.purchases.errors import ErrorCode
 from app.purchases.exceptions import (
     InvalidPurchaseStatusException,
     PurchaseAlreadyReversedException,
+    PurchaseImportSourceUnavailableException,
     PurchaseNotFoundException,
     PurchaseNotPendingException,
 )
-from app.purchases.schemas import PaginatedPurchaseOut, PurchaseAdminOut, PurchaseOut
+from app.purchases.export import PurchaseExporter, PurchaseExportFormat
+from app.purchases.external_id_filter import ExternalIdFilterABC
+from app.purchases.schemas import (
+    ExternalIdFilterStatsOut,
+    PaginatedPurchaseOut,
+    PurchaseAdminOut,
+    PurchaseOut,
+)
 from app.purchases.services import PurchaseService
 from app.users.models import User
 
 router = APIRouter(prefix="/purchases", tags=["purchases"])
 
+_EXPORT_MEDIA_TYPES = {
+    PurchaseExportFormat.CSV: ("text/csv; charset=utf-8", "csv"),
+    PurchaseExportFormat.NDJSON: ("application/x-ndjson", "ndjson"),
+}
+
 
 @router.get(
     "/",
@@ -51,12 +85,19 @@ async def list_all_purchases(
     limit: int = Query(
         10, ge=1, le=100, description="Number of results to return (max 100)."
     ),
+    cursor: str | None = Query(
+        None,
+        description=(
+            "Opaque cursor from a previous page's next_cursor. Fetches the next "
+            "page by keyset in constant time; offset is ignored and total is null."
+        ),
+    ),
     service: PurchaseService = Depends(get_purchase_service),
     db: AsyncSession = Depends(get_async_db),
     _: User = Depends(get_current_admin_user),
 ) -> PaginatedPurchaseOut:
     try:
-        items, total = await service.list_purchases(
+        items, total, next_cursor = await service.list_purchases(
             db,
             status=status,
             user_id=user_id,
@@ -65,10 +106,18 @@ async def list_all_purchases(
             end_date=end_date,
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
     except InvalidPurchaseStatusException as e:
         raise unprocessable_entity_error(ErrorCode.INVALID_PURCHASE_STATUS, str(e))
 
+    except InvalidCursorException as e:
+        raise validation_error(
+            code=CoreErrorCode.VALIDATION_ERROR,
+            message=str(e),
+            details=[{"field": "cursor", "reason": "Use a next_cursor value as is."}],
+        )
+
     except Exception as e:
         logging.error(
             "An unexpected error occurred while listing purchases.",
@@ -78,10 +127,86 @@ async def list_all_purchases(
 
     return PaginatedPurchaseOut(
         data=[PurchaseAdminOut.model_validate(item) for item in items],
-        pagination=PaginationOut(offset=offset, limit=limit, total=total),
+        pagination=CursorPaginationOut(
+            offset=0 if cursor else offset,
+            limit=limit,
+            total=total,
+            next_cursor=next_cursor,
+        ),
     )
 
 
+@router.get(
+    "/export",
+    description=(
+        "Export every purchase matching the filters as CSV (with header) or "
+        "NDJSON, oldest first. The file is streamed from a server-side cursor, "
+        "so exports of any size use constant memory. Admin access required."
+    ),
+    response_class=StreamingResponse,
+)
+async def export_purchases(
+    status: str | None = Query(
+        None, description="Filter by status: pending, confirmed, or reversed."
+    ),
+    user_id: str | None = Query(None, description="Filter by user ID."),
+    merchant_id: str | None = Query(None, description="Filter by merchant ID."),
+    start_date: date | None = Query(
+        None,
+        description="Inclusive lower bound on created_at (ISO 8601 date: YYYY-MM-DD).",
+    ),
+    end_date: date | None = Query(
+        None,
+        description="Inclusive upper bound on created_at (ISO 8601 date: YYYY-MM-DD).",
+    ),
+    file_format: PurchaseExportFormat = Query(
+        PurchaseExportFormat.CSV,
+        alias="format",
+        description="Output format: csv (with header) or ndjson.",
+    ),
+    exporter: PurchaseExporter = Depends(get_purchase_exporter),
+    current_admin: User = Depends(get_current_admin_user),
+) -> StreamingResponse:
+    try:
+        lines = exporter.export(
+            file_format,
+            status=status,
+            user_id=user_id,
+            merchant_id=merchant_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    except InvalidPurchaseStatusException as e:
+        raise unprocessable_entity_error(ErrorCode.INVALID_PURCHASE_STATUS, str(e))
+
+    logging.info(
+        "Purchase export started.",
+        extra={"format": file_format.value, "admin_id": str(current_admin.id)},
+    )
+    media_type, extension = _EXPORT_MEDIA_TYPES[file_format]
+    return StreamingResponse(
+        lines,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="purchases.{extension}"'
+        },
+    )
+
+
+@router.get(
+    "/external-id-filter",
+    description=(
+        "Statistics of the in-memory external_id filter used to short-circuit "
+        "duplicate ingestions. Admin access required."
+    ),
+)
+async def get_external_id_filter_stats(
+    external_id_filter: ExternalIdFilterABC = Depends(get_external_id_filter),
+    _: User = Depends(get_current_admin_user),
+) -> ExternalIdFilterStatsOut:
+    return ExternalIdFilterStatsOut.model_validate(external_id_filter.stats())
+
+
 @router.patch(
     "/{purchase_id}/reverse",
     description="Reverse a purchase and its associated cashback. Admin access required.",
@@ -170,3 +295,81 @@ async def admin_confirm_purchase(
         status=purchase.status,
         cashback_amount=purchase.cashback_amount,
     )
+
+
+@router.post(
+    "/import",
+    description=(
+        "Bulk-import purchases from a streamed NDJSON or CSV request body, or from "
+        "a file in the server's import directory. Rows go through the regular "
+        "ingestion rules and are committed in chunks; re-running with the same "
+        "import_id resumes after the last committed chunk. The response streams "
+        "progress and per-row errors as NDJSON. Admin access required."
+    ),
+    response_class=StreamingResponse,
+)
+async def import_purchases(
+    request: Request,
+    import_id: str = Query(
+        ...,
+        min_length=1,
+        max_length=64,
+        description="Caller-chosen import ID; reuse it to resume an interrupted import.",
+    ),
+    file_format: PurchaseImportFormat = Query(
+        PurchaseImportFormat.NDJSON,
+        alias="format",
+        description="Source format: ndjson (one JSON object per line) or csv (with header).",
+    ),
+    source_file: str | None = Query(
+        None,
+        description="Import this file from the server's import directory instead of the body.",
+    ),
+    importer: PurchaseImporter = Depends(get_purchase_importer),
+    current_admin: User = Depends(get_current_admin_user),
+) -> StreamingResponse:
+    if source_file is not None:
+        try:
+            path = resolve_import_file(settings.purchase_import_dir, source_file)
+        except PurchaseImportSourceUnavailableException as exc:
+            raise not_found_error(
+                message=str(exc),
+                details={"resource_type": "import_file", "resource_id": source_file},
+            ) from None
+        chunks = read_file_chunks(path)
+    else:
+        chunks = request.stream()
+
+    logging.info(
+        "Purchase import started.",
+        extra={
+            "import_id": import_id,
+            "format": file_format.value,
+            "source_file": source_file,
+            "admin_id": str(current_admin.id),
+        },
+    )
+    events = importer.run(import_id, parse_import_rows(chunks, file_format))
+    return _ImportStreamingResponse(
+        _ndjson_lines(events), media_type="application/x-ndjson"
+    )
+
+
+class _ImportStreamingResponse(StreamingResponse):
+    """StreamingResponse that does not listen for client disconnects.
+
+    On ASGI servers older than spec 2.4, StreamingResponse reads ``receive()``
+    concurrently to detect disconnects, which would swallow the request body
+    messages the import is still streaming. A disconnected client surfaces as
+    a failed ``send`` instead, which aborts the import at a chunk boundary.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def _ndjson_lines(events: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    async for event in events:
+        yield json.dumps(event) + "\n"
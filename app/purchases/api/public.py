@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Depends, Query, status
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.admission import AdmissionControllerABC, AdmissionRejectedException
+from app.core.config import settings
 from app.core.current_user import get_current_user
 from app.core.database import get_async_db
 from app.core.errors.builders import (
@@ -8,12 +12,22 @@ from app.core.errors.builders import (
     forbidden_error,
     internal_server_error,
     not_found_error,
+    service_unavailable_error,
     unprocessable_entity_error,
+    validation_error,
 )
+from app.core.errors.codes import ErrorCode as CoreErrorCode
+from app.core.http_cache import conditional_json
 from app.core.logging import logging
-from app.core.schemas import PaginationOut
+from app.core.pagination import InvalidCursorException
+from app.core.schemas import CursorPaginationOut
 from app.core.unit_of_work import UnitOfWorkABC
-from app.purchases.composition import get_purchase_service, get_unit_of_work
+from app.purchases.composition import (
+    get_ingest_admission_controller,
+    get_purchase_ingest_queue,
+    get_purchase_service,
+    get_unit_of_work,
+)
 from app.purchases.errors import ErrorCode
 from app.purchases.exceptions import (
     DuplicatePurchaseException,
@@ -21,6 +35,7 @@ from app.purchases.exceptions import (
     MerchantInactiveException,
     MerchantNotFoundException,
     OfferNotAvailableException,
+    PurchaseIngestQueueFullException,
     PurchaseNotFoundException,
     PurchaseOwnershipViolationException,
     PurchaseViewForbiddenException,
@@ -28,10 +43,13 @@ from app.purchases.exceptions import (
     UserInactiveException,
     UserNotFoundException,
 )
+from app.purchases.ingest_queue import PurchaseIngestQueueABC
 from app.purchases.schemas import (
     PaginatedUserPurchaseOut,
     PurchaseCreate,
     PurchaseDetailsOut,
+    PurchaseIngestAcceptedOut,
+    PurchaseIngestStatusOut,
     PurchaseOut,
     UserPurchaseOut,
 )
@@ -44,26 +62,107 @@ router = APIRouter(prefix="/purchases", tags=["purchases"])
 users_router = APIRouter(prefix="/users", tags=["purchases"])
 
 
+async def _admit_purchase_ingestion(
+    controller: AdmissionControllerABC = Depends(get_ingest_admission_controller),
+) -> AsyncIterator[None]:
+    # A dependency (not a block inside the endpoint) so excess requests are
+    # shed before authentication opens a DB connection.
+    if not settings.purchase_ingest_admission_enabled:
+        yield
+        return
+    try:
+        async with controller.slot():
+            yield
+    except AdmissionRejectedException as exc:
+        stats = controller.stats()
+        logging.warning(
+            "Purchase ingestion shed by admission control.",
+            extra={
+                "reason": exc.reason,
+                "limit": stats.limit,
+                "in_flight": stats.in_flight,
+                "waiting": stats.waiting,
+            },
+        )
+        raise service_unavailable_error(
+            message="Purchase ingestion is temporarily overloaded. Please retry later.",
+            retry_after_seconds=exc.retry_after_seconds,
+            details={"reason": "Too many purchases are being ingested concurrently."},
+        ) from None
+
+
 @router.post(
     "/",
     status_code=status.HTTP_201_CREATED,
     description=(
         "Ingest a new purchase. This endpoint is idempotent with respect to "
         "external_id: re-submitting the same external_id yields a 409 Conflict "
-        "with details of the previously ingested purchase."
+        "with details of the previously ingested purchase. When group-commit "
+        "ingestion is enabled, sending 'Prefer: respond-async' queues the purchase "
+        "and returns 202 Accepted with a status URL instead."
     ),
+    responses={status.HTTP_202_ACCEPTED: {"model": PurchaseIngestAcceptedOut}},
+    dependencies=[Depends(_admit_purchase_ingestion)],
 )
 async def ingest_purchase(
     data: PurchaseCreate,
+    request: Request,
+    response: Response,
+    prefer: str | None = Header(None),
     service: PurchaseService = Depends(get_purchase_service),
     uow: UnitOfWorkABC = Depends(get_unit_of_work),
+    ingest_queue: PurchaseIngestQueueABC = Depends(get_purchase_ingest_queue),
     current_user: User = Depends(get_current_user),
-) -> PurchaseOut:
+) -> PurchaseOut | PurchaseIngestAcceptedOut:
+    queue_async = settings.purchase_group_commit_enabled and _prefers_async(prefer)
+    if queue_async and settings.web_concurrency > 1:
+        # The ticket would only be known to this worker, so polls landing on
+        # any other worker would 404.
+        raise service_unavailable_error(
+            message=(
+                "Asynchronous purchase ingestion is not available. "
+                "Send the request without 'Prefer: respond-async'."
+            ),
+            retry_after_seconds=60,
+            details={
+                "reason": "Ingestion tickets cannot be shared across API workers."
+            },
+        )
+
     try:
+        if queue_async:
+            # Cheap checks run now so obvious mistakes still fail synchronously;
+            # the rest happens in the group-commit writer.
+            service.validate_purchase_request(data.model_dump(), str(current_user.id))
+            ticket = ingest_queue.submit(data.model_dump(), str(current_user.id))
+            status_url = str(
+                request.url_for(
+                    "get_purchase_ingestion_status", ticket_id=ticket.ticket_id
+                )
+            )
+            response.status_code = status.HTTP_202_ACCEPTED
+            response.headers["Location"] = status_url
+            return PurchaseIngestAcceptedOut(
+                ticket_id=ticket.ticket_id,
+                status=ticket.status,
+                status_url=status_url,
+            )
+
         purchase = await service.ingest_purchase(
             data.model_dump(), str(current_user.id), uow
         )
 
+    except PurchaseIngestQueueFullException as exc:
+        logging.warning(
+            "Purchase ingest queue full; rejecting request.",
+            extra={"capacity": exc.capacity},
+        )
+        raise service_unavailable_error(
+            message="Purchase ingestion is temporarily overloaded. Please retry later.",
+            retry_after_seconds=1,
+            details={"reason": "The ingestion queue is at capacity."},
+        ) from None
+
     except PurchaseOwnershipViolationException:
         logging.debug(
             "Purchase ownership violation: user attempted to ingest for another user.",
@@ -81,20 +180,20 @@ async def ingest_purchase(
             "Duplicate purchase rejected.",
             extra={"external_id": exc.external_id},
         )
+        details: dict[str, str] = {"external_id": exc.external_id}
+        if exc.created_at is not None and exc.amount is not None:
+            details["previously_created_at"] = exc.created_at.isoformat()
+            details["previously_processed_amount"] = str(exc.amount)
+        details["action"] = (
+            "This request is idempotent and safe to retry. "
+            "You will receive the same result."
+        )
         raise business_rule_violation_error(
             code=ErrorCode.DUPLICATE_PURCHASE,
             message=(
                 f"A purchase with external ID '{exc.external_id}' has already been processed."
             ),
-            details={
-                "external_id": exc.external_id,
-                "previously_created_at": exc.created_at.isoformat(),
-                "previously_processed_amount": str(exc.amount),
-                "action": (
-                    "This request is idempotent and safe to retry. "
-                    "You will receive the same result."
-                ),
-            },
+            details=details,
         ) from None
 
     except (UserNotFoundException, UserInactiveException) as exc:
@@ -169,6 +268,42 @@ async def ingest_purchase(
     )
 
 
+def _prefers_async(prefer: str | None) -> bool:
+    if not prefer:
+        return False
+    return any(
+        token.strip().lower() == "respond-async"
+        for token in prefer.replace(";", ",").split(",")
+    )
+
+
+@router.get(
+    "/ingestions/{ticket_id}",
+    description=(
+        "Get the outcome of a purchase queued with 'Prefer: respond-async'. "
+        "Only accessible by the user who submitted it."
+    ),
+)
+async def get_purchase_ingestion_status(
+    ticket_id: str,
+    ingest_queue: PurchaseIngestQueueABC = Depends(get_purchase_ingest_queue),
+    current_user: User = Depends(get_current_user),
+) -> PurchaseIngestStatusOut:
+    ticket = ingest_queue.get_ticket(ticket_id)
+
+    # Someone else's ticket is reported as missing so ticket IDs leak nothing.
+    if ticket is None or ticket.user_id != str(current_user.id):
+        raise not_found_error(
+            message=f"Ingestion ticket with ID '{ticket_id}' does not exist.",
+            details={
+                "resource_type": "purchase_ingestion",
+                "resource_id": ticket_id,
+            },
+        )
+
+    return PurchaseIngestStatusOut.model_validate(ticket)
+
+
 @users_router.get(
     "/me/purchases",
     description="List the authenticated user's own purchases, enriched with merchant names.",
@@ -181,22 +316,38 @@ async def list_user_purchases(
     status: str | None = Query(
         None, description="Filter by status: pending, confirmed, or reversed."
     ),
+    cursor: str | None = Query(
+        None,
+        description=(
+            "Opaque cursor from a previous page's next_cursor. Fetches the next "
+            "page by keyset in constant time; offset is ignored and total is null."
+        ),
+    ),
     service: PurchaseService = Depends(get_purchase_service),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ) -> PaginatedUserPurchaseOut:
     try:
-        purchases_with_merchants, total = await service.list_user_purchases(
-            db,
-            str(current_user.id),
-            status=status,
-            offset=offset,
-            limit=limit,
+        purchases_with_merchants, total, next_cursor = (
+            await service.list_user_purchases(
+                db,
+                str(current_user.id),
+                status=status,
+                offset=offset,
+                limit=limit,
+                cursor=cursor,
+            )
         )
     except InvalidPurchaseStatusException as e:
         raise unprocessable_entity_error(
             ErrorCode.INVALID_PURCHASE_STATUS, str(e)
         ) from None
+    except InvalidCursorException as e:
+        raise validation_error(
+            code=CoreErrorCode.VALIDATION_ERROR,
+            message=str(e),
+            details=[{"field": "cursor", "reason": "Use a next_cursor value as is."}],
+        ) from None
     except Exception as e:
         logging.error(
             "An unexpected error occurred while listing user purchases.",
@@ -217,20 +368,37 @@ async def list_user_purchases(
             )
             for purchase, merchant_name in purchases_with_merchants
         ],
-        pagination=PaginationOut(offset=offset, limit=limit, total=total),
+        pagination=CursorPaginationOut(
+            offset=0 if cursor else offset,
+            limit=limit,
+            total=total,
+            next_cursor=next_cursor,
+        ),
     )
 
 
 @router.get(
     "/{purchase_id}",
-    description="Get details of a specific purchase. Only accessible by the purchase owner.",
+    response_model=PurchaseDetailsOut,
+    description=(
+        "Get details of a specific purchase. Only accessible by the purchase owner."
+        " Supports conditional requests with If-None-Match."
+    ),
+    responses={
+        304: {
+            "description": (
+                "Not modified: the ETag sent in If-None-Match is still current."
+            ),
+        },
+    },
 )
 async def get_purchase_details(
     purchase_id: str,
+    if_none_match: str | None = Header(default=None),
     service: PurchaseService = Depends(get_purchase_service),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
-) -> PurchaseDetailsOut:
+) -> Response:
     try:
         purchase, merchant_name = await service.get_purchase_details(
             purchase_id, str(current_user.id), db
@@ -266,7 +434,7 @@ async def get_purchase_details(
         )
         raise internal_server_error() from None
 
-    return PurchaseDetailsOut(
+    details = PurchaseDetailsOut(
         id=purchase.id,
         merchant_name=merchant_name,
         amount=purchase.amount,
@@ -275,3 +443,6 @@ async def get_purchase_details(
         cashback_status=None,
         created_at=purchase.created_at,
     )
+    # Purchases carry no version column: the ETag is derived from the body,
+    # which changes with the status and cashback amount.
+    return conditional_json(details.model_dump_json().encode(), if_none_match)
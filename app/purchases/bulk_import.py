@@ -0,0 +1,362 @@
+"""Streaming bulk import of purchases (affiliate backfills).
+
+The source — an HTTP request body or a file in the configured import
+directory — is consumed as a byte stream and parsed line by line, so memory
+use is bounded by ``chunk_size`` rows regardless of the upload size; a line
+that is too long or not valid UTF-8 is reported as a row error. Valid rows go
+through the regular ingestion rules in chunks of ``chunk_size``; each chunk
+is committed in one transaction together with the import checkpoint, so
+re-running an interrupted import with the same ``import_id`` resumes right
+after the last committed chunk.
+
+Progress and per-row errors are produced as a stream of event dicts that the
+API writes out as NDJSON while the import is still running.
+"""
+
+import asyncio
+import csv
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.errors.codes import ErrorCode as CoreErrorCode
+from app.core.logging import logger
+from app.core.unit_of_work import SQLAlchemyUnitOfWork
+from app.purchases.errors import ingest_rejection_error_code
+from app.purchases.exceptions import PurchaseImportSourceUnavailableException
+from app.purchases.schemas import PurchaseImportCreate
+from app.purchases.services import PurchaseService
+
+_FILE_READ_SIZE = 64 * 1024
+# Far above any real purchase row; longer lines are rejected, not buffered.
+_MAX_LINE_SIZE = 16 * 1024
+_LINE_TOO_LONG = f"Line is longer than {_MAX_LINE_SIZE} bytes."
+
+
+class PurchaseImportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+@dataclass
+class ImportRow:
+    """One data row of the source; ``line`` is 1-based and excludes any header."""
+
+    line: int
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Sources and incremental parsers
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def resolve_import_file(import_dir: str, source_file: str) -> Path:
+    """Resolve *source_file* inside *import_dir*, refusing anything outside it.
+
+    Raises:
+        PurchaseImportSourceUnavailableException: if server-side imports are
+            disabled, the path escapes the directory, or the file is missing.
+    """
+    if not import_dir:
+        raise PurchaseImportSourceUnavailableException(source_file)
+    base = Path(import_dir).resolve()
+    path = (base / source_file).resolve()
+    if not path.is_relative_to(base) or not path.is_file():
+        raise PurchaseImportSourceUnavailableException(source_file)
+    return path
+
+
+async def read_file_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Yield the file in fixed-size chunks without blocking the event loop."""
+    with path.open("rb") as f:
+        while chunk := await asyncio.to_thread(f.read, _FILE_READ_SIZE):
+            yield chunk
+
+
+def _decode_line(raw: bytes | bytearray) -> tuple[str | None, str | None]:
+    try:
+        return raw.decode("utf-8-sig").rstrip("\r"), None
+    except UnicodeDecodeError:
+        return None, "Line is not valid UTF-8."
+
+
+async def _iter_lines(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[str | None, str | None]]:
+    """Split the byte stream into lines, yielding ``(line, error)`` pairs.
+
+    A line that is not valid UTF-8 or longer than ``_MAX_LINE_SIZE`` bytes
+    comes back as ``(None, error)`` and the stream goes on; an overlong line
+    is discarded as it arrives instead of being buffered.
+    """
+    buffer = bytearray()
+    overlong = False
+    async for chunk in chunks:
+        start = 0
+        # Only the new chunk is scanned for newlines, never the buffer again.
+        while (end := chunk.find(b"\n", start)) != -1:
+            if overlong or len(buffer) + end - start > _MAX_LINE_SIZE:
+                yield None, _LINE_TOO_LONG
+            else:
+                buffer += chunk[start:end]
+                yield _decode_line(buffer)
+            buffer.clear()
+            overlong = False
+            start = end + 1
+        if not overlong:
+            buffer += chunk[start:]
+            if len(buffer) > _MAX_LINE_SIZE:
+                buffer.clear()
+                overlong = True
+    if overlong:
+        yield None, _LINE_TOO_LONG
+    elif buffer:
+        yield _decode_line(buffer)
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    line_number = 0
+    async for line, error in _iter_lines(chunks):
+        if line is not None and not line.strip():
+            continue
+        line_number += 1
+        if line is None:
+            yield ImportRow(line=line_number, error=error)
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ImportRow(line=line_number, error=f"Invalid JSON: {e.msg}.")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRow(line=line_number, error="Each line must be a JSON object.")
+            continue
+        yield ImportRow(line=line_number, data=data)
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    # Rows are parsed one physical line at a time: purchase fields never
+    # contain newlines, so quoted multi-line cells are not supported.
+    header: list[str] | None = None
+    line_number = 0
+    async for line, error in _iter_lines(chunks):
+        if line is not None and not line.strip():
+            continue
+        if line is None:
+            # An unreadable header is reported like a row; the next line is
+            # then taken as the header.
+            line_number += 1
+            yield ImportRow(line=line_number, error=error)
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        line_number += 1
+        if len(values) != len(header):
+            yield ImportRow(
+                line=line_number,
+                error=f"Expected {len(header)} columns, got {len(values)}.",
+            )
+            continue
+        yield ImportRow(line=line_number, data=dict(zip(header, values)))
+
+
+def parse_import_rows(
+    chunks: AsyncIterator[bytes], file_format: PurchaseImportFormat
+) -> AsyncIterator[ImportRow]:
+    if file_format == PurchaseImportFormat.CSV:
+        return parse_csv(chunks)
+    return parse_ndjson(chunks)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Importer
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class _ImportProgress:
+    rows_processed: int = 0
+    imported_count: int = 0
+    rejected_count: int = 0
+
+    def as_event(self, event_type: str) -> dict[str, Any]:
+        return {
+            "type": event_type,
+            "rows_processed": self.rows_processed,
+            "imported": self.imported_count,
+            "rejected": self.rejected_count,
+        }
+
+
+class PurchaseImporter:
+    """Runs a bulk import through the purchase ingestion rules.
+
+    Emits these events, in order:
+
+    - ``started``: once, with the number of rows skipped by resuming.
+    - ``error``: per rejected row (parse, validation or business rule).
+    - ``progress``: after every committed chunk; its counters are durable.
+    - ``completed`` or ``aborted``: once, at the end. After ``aborted`` the
+      last ``progress`` event tells how far the import got.
+    """
+
+    def __init__(
+        self,
+        service: PurchaseService,
+        db_session_factory: async_sessionmaker[AsyncSession],
+        chunk_size: int,
+    ) -> None:
+        self.service = service
+        self.db_session_factory = db_session_factory
+        self.chunk_size = chunk_size
+
+    async def run(
+        self, import_id: str, rows: AsyncIterator[ImportRow]
+    ) -> AsyncIterator[dict[str, Any]]:
+        progress = await self._load_progress(import_id)
+        resume_after = progress.rows_processed
+        yield {"type": "started", "import_id": import_id, "resume_after": resume_after}
+
+        chunk: list[tuple[int, dict[str, Any]]] = []
+        # Rows rejected before ingestion; folded into the next checkpoint.
+        pending_rejections = 0
+        last_line = resume_after
+        try:
+            async for row in rows:
+                if row.line <= resume_after:
+                    continue
+                last_line = row.line
+
+                data, reason = self._validate(row)
+                if data is None:
+                    pending_rejections += 1
+                    yield _row_error(
+                        row.line, CoreErrorCode.VALIDATION_ERROR.value, reason
+                    )
+                else:
+                    chunk.append((row.line, data))
+
+                if len(chunk) >= self.chunk_size:
+                    async for event in self._commit_chunk(
+                        import_id, chunk, last_line, pending_rejections, progress
+                    ):
+                        yield event
+                    chunk, pending_rejections = [], 0
+
+            if last_line > progress.rows_processed:
+                async for event in self._commit_chunk(
+                    import_id, chunk, last_line, pending_rejections, progress
+                ):
+                    yield event
+
+        except Exception as e:
+            logger.error(
+                "Purchase import aborted.",
+                extra={
+                    "import_id": import_id,
+                    "rows_processed": progress.rows_processed,
+                    "error": str(e),
+                },
+            )
+            yield {
+                **progress.as_event("aborted"),
+                "message": (
+                    "Import aborted by an unexpected error. "
+                    "Re-run with the same import_id to resume."
+                ),
+            }
+            return
+
+        logger.info(
+            "Purchase import completed.",
+            extra={"import_id": import_id, **progress.as_event("completed")},
+        )
+        yield progress.as_event("completed")
+
+    async def _load_progress(self, import_id: str) -> _ImportProgress:
+        async with self.db_session_factory() as db:
+            checkpoint = await self.service.get_import_checkpoint(db, import_id)
+        if checkpoint is None:
+            return _ImportProgress()
+        return _ImportProgress(
+            rows_processed=checkpoint.rows_processed,
+            imported_count=checkpoint.imported_count,
+            rejected_count=checkpoint.rejected_count,
+        )
+
+    def _validate(self, row: ImportRow) -> tuple[dict[str, Any] | None, str]:
+        if row.data is None:
+            return None, row.error or "Unreadable row."
+        try:
+            return PurchaseImportCreate.model_validate(row.data).model_dump(), ""
+        except ValidationError as e:
+            reasons = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                for err in e.errors()
+            )
+            return None, reasons
+
+    async def _commit_chunk(
+        self,
+        import_id: str,
+        chunk: list[tuple[int, dict[str, Any]]],
+        last_line: int,
+        pending_rejections: int,
+        progress: _ImportProgress,
+    ) -> AsyncIterator[dict[str, Any]]:
+        # An admin import acts on behalf of each row's user, so the row's own
+        # user_id is passed as the acting user.
+        items = [(data, str(data["user_id"])) for _, data in chunk]
+
+        async with self.db_session_factory() as db:
+            uow = SQLAlchemyUnitOfWork(db)
+            try:
+                outcomes = await self.service.import_purchase_chunk(
+                    import_id,
+                    items,
+                    uow,
+                    rows_processed=last_line,
+                    prior_imported_count=progress.imported_count,
+                    prior_rejected_count=progress.rejected_count + pending_rejections,
+                )
+            except Exception:
+                await uow.rollback()
+                raise
+
+        # Mirror the counters just committed with the checkpoint.
+        progress.rows_processed = last_line
+        progress.rejected_count += pending_rejections
+        for (line, data), outcome in zip(chunk, outcomes):
+            if isinstance(outcome, Exception):
+                progress.rejected_count += 1
+                yield _row_error(
+                    line,
+                    ingest_rejection_error_code(outcome),
+                    str(outcome),
+                    data["external_id"],
+                )
+            else:
+                progress.imported_count += 1
+        yield progress.as_event("progress")
+
+
+def _row_error(
+    line: int, code: str, message: str, external_id: str | None = None
+) -> dict[str, Any]:
+    return {
+        "type": "error",
+        "line": line,
+        "external_id": external_id,
+        "code": code,
+        "message": message,
+    }
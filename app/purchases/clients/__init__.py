@@ -7,13 +7,18 @@ from app.purchases.clients.feature_flags import (
     FeatureFlagClient,
     FeatureFlagClientABC,
 )
+from app.purchases.clients.ingest_context import (
+    IngestContextClient,
+    IngestContextClientABC,
+    IngestContextDTO,
+)
 from app.purchases.clients.merchants import (
     MerchantDTO,
     MerchantsClient,
     MerchantsClientABC,
 )
 from app.purchases.clients.offers import OfferDTO, OffersClient, OffersClientABC
-from app.purchases.clients.users import UserDTO, UsersClient, UsersClientABC
+from app.purchases.clients.users import UserDTO
 from app.purchases.clients.wallets import WalletsClient, WalletsClientABC
 
 __all__ = [
@@ -22,9 +27,10 @@ __all__ = [
     "CashbackClient",
     "FeatureFlagClientABC",
     "FeatureFlagClient",
+    "IngestContextDTO",
+    "IngestContextClientABC",
+    "IngestContextClient",
     "UserDTO",
-    "UsersClientABC",
-    "UsersClient",
     "MerchantDTO",
     "MerchantsClientABC",
     "MerchantsClient",
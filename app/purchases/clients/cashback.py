@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.cashback.calculator import CashbackCalculator, CashbackCalculatorABC
 from app.cashback.models import CashbackResult, CashbackTransactionStatus
-from app.cashback.repositories import CashbackTransactionRepository
+from app.cashback.repositories import (
+    CashbackTransactionRepository,
+    OfferUserMonthlyUsageRepository,
+)
 
 # pylint: disable=too-few-public-methods
 
@@ -36,8 +40,12 @@ class CashbackClientABC(ABC):
         percentage: float,
         fixed_amount: float | None,
         purchase_amount: Decimal,
+        remaining_cap: Decimal | None = None,
     ) -> CashbackResultDTO:
-        """Calculate the cashback amount for a purchase. Pure, no side effects."""
+        """Calculate the cashback amount for a purchase. Pure, no side effects.
+
+        When *remaining_cap* is given the amount is clamped to it.
+        """
 
     @abstractmethod
     async def create(
@@ -64,6 +72,42 @@ class CashbackClientABC(ABC):
         Flushed but not committed — caller must commit.
         """
 
+    @abstractmethod
+    async def get_monthly_usage(
+        self, db: AsyncSession, offer_id: str, user_id: str, month: date
+    ) -> Decimal:
+        """Return the cashback granted to the user under the offer this month."""
+
+    @abstractmethod
+    async def add_monthly_usage(
+        self,
+        db: AsyncSession,
+        offer_id: str,
+        user_id: str,
+        month: date,
+        amount: Decimal,
+        cap: Decimal,
+    ) -> bool:
+        """Count *amount* against the user's monthly cap for the offer.
+
+        Returns False, without changing anything, if the cap would be
+        exceeded. Flushed but not committed — caller must commit.
+        """
+
+    @abstractmethod
+    async def release_monthly_usage(
+        self,
+        db: AsyncSession,
+        offer_id: str,
+        user_id: str,
+        month: date,
+        amount: Decimal,
+    ) -> None:
+        """Give *amount* back to the user's monthly cap (rejection, reversal).
+
+        Flushed but not committed — caller must commit.
+        """
+
 
 class CashbackClient(CashbackClientABC):
     """Modular-monolith implementation.
@@ -77,6 +121,7 @@ class CashbackClient(CashbackClientABC):
     def __init__(self, calculator: CashbackCalculatorABC | None = None) -> None:
         self._calculator: CashbackCalculatorABC = calculator or CashbackCalculator()
         self._repository = CashbackTransactionRepository()
+        self._usage_repository = OfferUserMonthlyUsageRepository()
 
     def calculate(
         self,
@@ -84,12 +129,14 @@ class CashbackClient(CashbackClientABC):
         percentage: float,
         fixed_amount: float | None,
         purchase_amount: Decimal,
+        remaining_cap: Decimal | None = None,
     ) -> CashbackResultDTO:
         result: CashbackResult = self._calculator.calculate(
             offer_id=offer_id,
             percentage=percentage,
             fixed_amount=fixed_amount,
             purchase_amount=purchase_amount,
+            remaining_cap=remaining_cap,
         )
         return CashbackResultDTO(
             offer_id=result.offer_id,
@@ -110,3 +157,31 @@ class CashbackClient(CashbackClientABC):
         await self._repository.update_status(
             db, purchase_id, CashbackTransactionStatus.REVERSED.value
         )
+
+    async def get_monthly_usage(
+        self, db: AsyncSession, offer_id: str, user_id: str, month: date
+    ) -> Decimal:
+        return await self._usage_repository.get_usage(db, offer_id, user_id, month)
+
+    async def add_monthly_usage(
+        self,
+        db: AsyncSession,
+        offer_id: str,
+        user_id: str,
+        month: date,
+        amount: Decimal,
+        cap: Decimal,
+    ) -> bool:
+        return await self._usage_repository.add_usage(
+            db, offer_id, user_id, month, amount, cap
+        )
+
+    async def release_monthly_usage(
+        self,
+        db: AsyncSession,
+        offer_id: str,
+        user_id: str,
+        month: date,
+        amount: Decimal,
+    ) -> None:
+        await self._usage_repository.release_usage(db, offer_id, user_id, month, amount)
@@ -0,0 +1,149 @@
+"""Ingest context client for purchase ingestion.
+
+Resolves everything the ingestion policies need — user, merchant, the
+merchant's active offer and the user's monthly usage of that offer. The offer
+comes from the (cached) offers client; the rest is read in a single round
+trip, instead of one query per owning module.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, and_, cast, func, literal, null, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cashback.models import OfferUserMonthlyUsage
+from app.merchants.models import Merchant
+from app.purchases.clients.merchants import MerchantDTO
+from app.purchases.clients.offers import OfferDTO, OffersClientABC
+from app.purchases.clients.users import UserDTO
+from app.users.models import User
+
+
+@dataclass
+class IngestContextDTO:
+    """Everything ``ingest_purchase`` validates before writing.
+
+    Each field is ``None`` when the corresponding row does not exist (or, for
+    the offer, when no active and date-valid offer exists for the merchant).
+    ``cap_month`` is the month the purchase's cashback counts against — the
+    requested one, or the month ``now()`` will stamp into ``created_at`` — and
+    ``monthly_cashback_used`` is the cashback already granted to the user
+    under that offer in it.
+    """
+
+    user: UserDTO | None
+    merchant: MerchantDTO | None
+    offer: OfferDTO | None
+    cap_month: date
+    monthly_cashback_used: Decimal = Decimal("0")
+
+
+class IngestContextClientABC(ABC):
+    @abstractmethod
+    async def get_ingest_context(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        merchant_id: str,
+        today: date,
+        cap_month: date | None = None,
+    ) -> IngestContextDTO:
+        """Load user, merchant, active offer and its monthly usage.
+
+        The usage is read for *cap_month*, or for the current month by the
+        database clock when it is ``None``.
+        """
+
+
+class IngestContextClient(IngestContextClientABC):
+    """Modular-monolith implementation — queries the shared DB directly.
+
+    Reads across the users and merchants tables (and the offer's monthly
+    usage) in one statement. The active offer, which rarely changes and is the
+    same for every purchase at a merchant, comes from the offers client and
+    its cache. If any of those modules is extracted to a separate service,
+    replace this with a concurrent fan-out over the respective HTTP clients.
+    """
+
+    def __init__(self, offers_client: OffersClientABC) -> None:
+        self.offers_client = offers_client
+
+    async def get_ingest_context(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        merchant_id: str,
+        today: date,
+        cap_month: date | None = None,
+    ) -> IngestContextDTO:
+        offer = await self.offers_client.get_active_offer_for_merchant(
+            db, merchant_id, today
+        )
+
+        # Without an offer the usage join matches nothing (offer_id IS NULL),
+        # so the usage comes back as 0.
+        offer_id = offer.id if offer is not None else null()
+
+        # Unless given, the cap month is read from the database rather than
+        # the process clock: localtimestamp is the transaction start time in
+        # the session time zone, the same instant and zone now() stamps
+        # created_at with, so the month charged is the one
+        # release_monthly_cap and the usage backfill derive from created_at.
+        month = (
+            literal(cap_month, Date)
+            if cap_month is not None
+            else cast(func.date_trunc("month", func.localtimestamp()), Date)
+        )
+
+        # A one-row anchor LEFT JOINed to each lookup: a missing user, merchant
+        # or usage row surfaces as NULL columns instead of an empty result, so
+        # all answers come back in a single round trip.
+        anchor = select(literal(1).label("one")).subquery("ingest_anchor")
+        stmt = (
+            select(
+                User.id.label("user_id"),
+                User.active.label("user_active"),
+                Merchant.id.label("merchant_id"),
+                Merchant.active.label("merchant_active"),
+                Merchant.name.label("merchant_name"),
+                month.label("cap_month"),
+                OfferUserMonthlyUsage.cashback_amount.label("monthly_cashback_used"),
+            )
+            .select_from(anchor)
+            .outerjoin(User, User.id == user_id)
+            .outerjoin(Merchant, Merchant.id == merchant_id)
+            .outerjoin(
+                OfferUserMonthlyUsage,
+                and_(
+                    OfferUserMonthlyUsage.offer_id == offer_id,
+                    OfferUserMonthlyUsage.user_id == user_id,
+                    OfferUserMonthlyUsage.month == month,
+                ),
+            )
+        )
+        row = (await db.execute(stmt)).one()
+
+        user = (
+            UserDTO(id=row.user_id, active=row.user_active)
+            if row.user_id is not None
+            else None
+        )
+        merchant = (
+            MerchantDTO(
+                id=row.merchant_id,
+                active=row.merchant_active,
+                name=row.merchant_name,
+            )
+            if row.merchant_id is not None
+            else None
+        )
+        return IngestContextDTO(
+            user=user,
+            merchant=merchant,
+            offer=offer,
+            cap_month=row.cap_month,
+            monthly_cashback_used=row.monthly_cashback_used or Decimal("0"),
+        )
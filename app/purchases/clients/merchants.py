@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.merchants.models import Merchant
 
 
@@ -33,8 +35,16 @@ class MerchantsClient(MerchantsClientABC):
 
     Replace with an HTTP client if the merchants module is ever extracted to a
     separate service.
+
+    Lookups are read through *cache*, the merchants module's process-wide
+    merchant cache, which ``MerchantService`` invalidates on every write.
+    Unknown merchant IDs are not cached, and a result loaded while an
+    invalidation ran is returned but not cached.
     """
 
+    def __init__(self, cache: TTLCache[str, Any]) -> None:
+        self.cache = cache
+
     # TODO: This is a temporary implementation that queries the DB directly.
     # When the merchants module has async support, this should be replaced with calls to the
     # merchants repository to keep query logic where it belongs.
@@ -42,22 +52,34 @@ class MerchantsClient(MerchantsClientABC):
     async def get_merchant_by_id(
         self, db: AsyncSession, merchant_id: str
     ) -> MerchantDTO | None:
+        cached = self.cache.get(merchant_id)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.generation
         result = await db.execute(select(Merchant).where(Merchant.id == merchant_id))
         merchant = result.scalar_one_or_none()
         if merchant is None:
             return None
-        return MerchantDTO(id=merchant.id, active=merchant.active, name=merchant.name)
+        dto = MerchantDTO(id=merchant.id, active=merchant.active, name=merchant.name)
+        if self.cache.generation == generation:
+            self.cache.set(merchant_id, dto)
+        return dto
 
     async def get_merchants_by_ids(
         self, db: AsyncSession, merchant_ids: list[str]
     ) -> dict[str, MerchantDTO]:
-        if not merchant_ids:
-            return {}
-
-        result = await db.execute(select(Merchant).where(Merchant.id.in_(merchant_ids)))
-        merchants = {m.id: m for m in result.scalars().all()}
+        found, missing = self.cache.get_many(merchant_ids)
+        if not missing:
+            return found
 
-        return {
-            merchant_id: MerchantDTO(id=m.id, active=m.active, name=m.name)
-            for merchant_id, m in merchants.items()
-        }
+        # Only the IDs the cache could not answer reach the database.
+        generation = self.cache.generation
+        result = await db.execute(select(Merchant).where(Merchant.id.in_(missing)))
+        cacheable = self.cache.generation == generation
+        for m in result.scalars().all():
+            dto = MerchantDTO(id=m.id, active=m.active, name=m.name)
+            if cacheable:
+                self.cache.set(m.id, dto)
+            found[m.id] = dto
+        return found
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date
+from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.offers.models import Offer
 
 
@@ -17,6 +19,8 @@ class OfferDTO:
     end_date: date
     percentage: float
     fixed_amount: float | None
+    # None means the offer has no per-user monthly cap
+    monthly_cap_per_user: float | None = None
 
 
 class OffersClientABC(ABC):
@@ -32,10 +36,26 @@ class OffersClient(OffersClientABC):
 
     Replace with an HTTP client if the offers module is ever extracted to a
     separate service.
+
+    Reads through the offers module's active-offer cache, keyed by
+    (merchant_id, today): a new day is a new key, so an offer starting or
+    ending at midnight is never answered from the previous day's entry.
+    "No active offer" is cached too, and concurrent misses share one query.
     """
 
+    def __init__(self, cache: TTLCache[tuple[str, date], Any]) -> None:
+        self.cache = cache
+
     async def get_active_offer_for_merchant(
         self, db: AsyncSession, merchant_id: str, today: date
+    ) -> OfferDTO | None:
+        return await self.cache.get_or_load(
+            (merchant_id, today),
+            lambda: self._load_active_offer(db, merchant_id, today),
+        )
+
+    async def _load_active_offer(
+        self, db: AsyncSession, merchant_id: str, today: date
     ) -> OfferDTO | None:
         # TODO: This is a temporary implementation that queries the DB directly.
         # When the offers module has async support, this should be replaced with calls to the
@@ -43,7 +63,7 @@ class OffersClient(OffersClientABC):
         result = await db.execute(
             select(Offer).where(
                 Offer.merchant_id == merchant_id,
-                Offer.active.is_(True),
+                Offer.active,
                 Offer.start_date <= today,
                 Offer.end_date >= today,
             )
@@ -59,4 +79,5 @@ class OffersClient(OffersClientABC):
             end_date=offer.end_date,
             percentage=offer.percentage,
             fixed_amount=offer.fixed_amount,
+            monthly_cap_per_user=offer.monthly_cap_per_user,
         )
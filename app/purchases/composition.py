@@ -3,19 +3,32 @@ from datetime import datetime, timezone
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.admission import AdaptiveAdmissionController, AdmissionControllerABC
 from app.core.broker import broker
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal, get_async_db
 from app.core.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWorkABC
 from app.feature_flags.composition import get_feature_flag_service
+from app.merchants.composition import get_merchant_cache
+from app.offers.composition import get_active_offer_cache
+from app.purchases.bulk_import import PurchaseImporter
 from app.purchases.clients import (
     CashbackClient,
     FeatureFlagClient,
+    IngestContextClient,
     MerchantsClient,
     OffersClient,
-    UsersClient,
     WalletsClient,
 )
+from app.purchases.export import PurchaseExporter
+from app.purchases.external_id_filter import (
+    BloomExternalIdFilter,
+    ExternalIdFilterABC,
+)
+from app.purchases.ingest_queue import (
+    InMemoryPurchaseIngestQueue,
+    PurchaseIngestQueueABC,
+)
 from app.purchases.jobs.verify_purchases import (
     SimulatedPurchaseVerifier,
     make_verify_purchases_task,
@@ -54,14 +67,44 @@ def get_unit_of_work(db: AsyncSession = Depends(get_async_db)) -> UnitOfWorkABC:
     return SQLAlchemyUnitOfWork(db)
 
 
+# Process-wide: every request must see (and feed) the same filter.
+_external_id_filter = BloomExternalIdFilter(
+    repository=PurchaseRepository(),
+    db_session_factory=AsyncSessionLocal,
+    capacity=settings.purchase_external_id_filter_capacity,
+    error_rate=settings.purchase_external_id_filter_error_rate,
+)
+
+
+def get_external_id_filter() -> ExternalIdFilterABC:
+    return _external_id_filter
+
+
+# Process-wide: the limit only means something if all requests share it.
+_ingest_admission_controller = AdaptiveAdmissionController(
+    initial_limit=settings.purchase_ingest_concurrency_initial,
+    min_limit=settings.purchase_ingest_concurrency_min,
+    max_limit=settings.purchase_ingest_concurrency_max,
+    max_queue=settings.purchase_ingest_max_queue,
+    max_queue_wait_ms=settings.purchase_ingest_max_queue_wait_ms,
+    target_latency_ms=settings.purchase_ingest_target_latency_ms,
+)
+
+
+def get_ingest_admission_controller() -> AdmissionControllerABC:
+    return _ingest_admission_controller
+
+
 def get_purchase_service() -> PurchaseService:
     return PurchaseService(
         repository=get_purchase_repository(),
         cashback_client=get_cashback_client(),
         wallets_client=get_wallets_client(),
-        users_client=UsersClient(),
-        merchants_client=MerchantsClient(),
-        offers_client=OffersClient(),
+        merchants_client=MerchantsClient(cache=get_merchant_cache()),
+        ingest_context_client=IngestContextClient(
+            offers_client=OffersClient(cache=get_active_offer_cache())
+        ),
+        external_id_filter=get_external_id_filter(),
         enforce_purchase_ownership=enforce_purchase_ownership,
         enforce_user_active=enforce_user_active,
         enforce_merchant_active=enforce_merchant_active,
@@ -74,6 +117,22 @@ def get_purchase_service() -> PurchaseService:
     )
 
 
+def get_purchase_importer() -> PurchaseImporter:
+    return PurchaseImporter(
+        service=get_purchase_service(),
+        db_session_factory=AsyncSessionLocal,
+        chunk_size=settings.purchase_import_chunk_size,
+    )
+
+
+def get_purchase_exporter() -> PurchaseExporter:
+    return PurchaseExporter(
+        repository=get_purchase_repository(),
+        db_session_factory=AsyncSessionLocal,
+        fetch_size=settings.purchase_export_fetch_size,
+    )
+
+
 def get_verify_purchases_task():
     return make_verify_purchases_task(
         repository=PurchaseRepository(),
@@ -89,3 +148,18 @@ def get_verify_purchases_task():
         retry_interval_seconds=settings.purchase_confirmation_interval_seconds,
         datetime_provider=lambda: datetime.now(timezone.utc),
     )
+
+
+# Single process-wide queue: the writer task and the tickets it resolves must
+# be shared by every request handled by this worker.
+_purchase_ingest_queue = InMemoryPurchaseIngestQueue(
+    service_factory=get_purchase_service,
+    db_session_factory=AsyncSessionLocal,
+    max_batch_size=settings.purchase_group_commit_max_batch_size,
+    max_wait_ms=settings.purchase_group_commit_max_wait_ms,
+    queue_size=settings.purchase_group_commit_queue_size,
+)
+
+
+def get_purchase_ingest_queue() -> PurchaseIngestQueueABC:
+    return _purchase_ingest_queue
@@ -1,5 +1,17 @@
 from enum import Enum
 
+from app.core.errors.codes import ErrorCode as CoreErrorCode
+from app.purchases.exceptions import (
+    DuplicatePurchaseException,
+    MerchantInactiveException,
+    MerchantNotFoundException,
+    OfferNotAvailableException,
+    PurchaseOwnershipViolationException,
+    UnsupportedCurrencyException,
+    UserInactiveException,
+    UserNotFoundException,
+)
+
 
 class ErrorCode(str, Enum):
     MERCHANT_NOT_ELIGIBLE = "MERCHANT_NOT_ELIGIBLE"
@@ -10,3 +22,24 @@ class ErrorCode(str, Enum):
     INVALID_PURCHASE_STATUS = "INVALID_PURCHASE_STATUS"
     PURCHASE_ALREADY_REVERSED = "PURCHASE_ALREADY_REVERSED"
     PURCHASE_NOT_PENDING = "PURCHASE_NOT_PENDING"
+
+
+# Codes the ingest endpoint returns for each business-rule rejection; deferred
+# ingestion paths (group commit, bulk import) report the same ones.
+_INGEST_REJECTION_ERROR_CODES: dict[type[Exception], str] = {
+    DuplicatePurchaseException: ErrorCode.DUPLICATE_PURCHASE.value,
+    UserNotFoundException: ErrorCode.USER_NOT_ELIGIBLE.value,
+    UserInactiveException: ErrorCode.USER_NOT_ELIGIBLE.value,
+    MerchantNotFoundException: ErrorCode.MERCHANT_NOT_ELIGIBLE.value,
+    MerchantInactiveException: ErrorCode.MERCHANT_NOT_ELIGIBLE.value,
+    OfferNotAvailableException: ErrorCode.OFFER_NOT_AVAILABLE.value,
+    UnsupportedCurrencyException: ErrorCode.UNSUPPORTED_CURRENCY.value,
+    PurchaseOwnershipViolationException: CoreErrorCode.FORBIDDEN.value,
+}
+
+
+def ingest_rejection_error_code(exc: Exception) -> str:
+    """Return the API error code for an ingest rejection exception."""
+    return _INGEST_REJECTION_ERROR_CODES.get(
+        type(exc), CoreErrorCode.INTERNAL_SERVER_ERROR.value
+    )
@@ -3,7 +3,18 @@ from decimal import Decimal
 
 
 class DuplicatePurchaseException(Exception):
-    def __init__(self, external_id: str, created_at: datetime, amount: Decimal):
+    """The external_id is taken.
+
+    *created_at* and *amount* describe the original purchase; they are None
+    when it could no longer be read (deleted after the insert conflicted).
+    """
+
+    def __init__(
+        self,
+        external_id: str,
+        created_at: datetime | None = None,
+        amount: Decimal | None = None,
+    ):
         super().__init__(
             f"A purchase with external ID '{external_id}' has already been processed."
         )
@@ -115,3 +126,37 @@ class PurchaseNotPendingException(Exception):
         self.purchase_id = purchase_id
         self.current_status = current_status
         self.required_status = "pending"
+
+
+class PurchaseIngestQueueFullException(Exception):
+    """The group-commit ingest queue is at capacity; the caller should retry."""
+
+    def __init__(self, capacity: int):
+        super().__init__(
+            f"Purchase ingest queue is full ({capacity} pending). Retry later."
+        )
+        self.capacity = capacity
+
+
+# Business-rule rejections raised while ingesting a single purchase. A batch
+# ingest reports these per item instead of aborting the whole batch.
+INGEST_REJECTION_EXCEPTIONS: tuple[type[Exception], ...] = (
+    DuplicatePurchaseException,
+    UserNotFoundException,
+    UserInactiveException,
+    MerchantNotFoundException,
+    MerchantInactiveException,
+    OfferNotAvailableException,
+    UnsupportedCurrencyException,
+    PurchaseOwnershipViolationException,
+)
+
+
+class PurchaseImportSourceUnavailableException(Exception):
+    """The requested server-side import file cannot be used."""
+
+    def __init__(self, source_file: str):
+        super().__init__(
+            f"Import source '{source_file}' is not available in the import directory."
+        )
+        self.source_file = source_file
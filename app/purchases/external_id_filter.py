@@ -0,0 +1,143 @@
+"""In-process filter of known purchase external IDs.
+
+Webhook retries make most duplicate submissions; the filter lets ingestion
+recognise a *likely* duplicate and confirm it with one indexed lookup instead
+of resolving the ingest context and attempting the insert. A negative answer
+keeps the normal path, so the filter is never authoritative: the unique index
+on ``external_id`` still decides. Purchases written by other processes are
+not in this process's filter until the next rebuild — that only costs the
+fast path, never correctness.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.bloom_filter import BloomFilter
+from app.core.logging import logger
+from app.purchases.repositories import PurchaseRepositoryABC
+
+
+@dataclass(frozen=True)
+class ExternalIdFilterStats:
+    loaded: bool
+    item_count: int
+    capacity: int
+    size_bytes: int
+    hash_count: int
+    estimated_false_positive_rate: float
+    positive_lookups: int
+    false_positives: int
+
+
+class ExternalIdFilterABC(ABC):
+    @abstractmethod
+    def might_contain(self, external_id: str) -> bool:
+        """Return True if *external_id* was probably ingested already.
+
+        Always False until the filter is loaded, so callers fall back to the
+        normal ingest path.
+        """
+
+    @abstractmethod
+    def add(self, external_id: str) -> None:
+        """Record an external ID known to exist in the database."""
+
+    @abstractmethod
+    def record_false_positive(self) -> None:
+        """Report that a positive answer was not confirmed by the database."""
+
+    @abstractmethod
+    async def rebuild(self) -> None:
+        """Reload the filter from the purchases table."""
+
+    @abstractmethod
+    def stats(self) -> ExternalIdFilterStats:
+        pass
+
+
+class BloomExternalIdFilter(ExternalIdFilterABC):
+    """Bloom-filter implementation, rebuilt by streaming the external_id index.
+
+    A rebuild fills a fresh filter and swaps it in when done; IDs added while
+    it runs go to both filters so none are lost by the swap.
+    """
+
+    def __init__(
+        self,
+        repository: PurchaseRepositoryABC,
+        db_session_factory: async_sessionmaker[AsyncSession],
+        capacity: int,
+        error_rate: float,
+    ) -> None:
+        self._repository = repository
+        self._db_session_factory = db_session_factory
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._filter: BloomFilter | None = None
+        self._building: BloomFilter | None = None
+        self._positive_lookups = 0
+        self._false_positives = 0
+
+    def might_contain(self, external_id: str) -> bool:
+        if self._filter is None or external_id not in self._filter:
+            return False
+        self._positive_lookups += 1
+        return True
+
+    def add(self, external_id: str) -> None:
+        if self._filter is not None:
+            self._filter.add(external_id)
+        if self._building is not None:
+            self._building.add(external_id)
+
+    def record_false_positive(self) -> None:
+        self._false_positives += 1
+
+    async def rebuild(self) -> None:
+        if self._building is not None:
+            return  # a rebuild is already running
+
+        building = BloomFilter(self._capacity, self._error_rate)
+        self._building = building
+        try:
+            async with self._db_session_factory() as db:
+                async for external_id in self._repository.stream_external_ids(db):
+                    building.add(external_id)
+        except Exception as e:
+            logger.error(
+                "Failed to rebuild external_id filter; keeping the previous one.",
+                extra={"error": str(e)},
+            )
+            return
+        finally:
+            self._building = None
+
+        self._filter = building
+        self._positive_lookups = 0
+        self._false_positives = 0
+        stats = self.stats()
+        logger.info(
+            "External_id filter rebuilt.",
+            extra={
+                "item_count": stats.item_count,
+                "size_bytes": stats.size_bytes,
+                "estimated_false_positive_rate": stats.estimated_false_positive_rate,
+            },
+        )
+
+    def stats(self) -> ExternalIdFilterStats:
+        bloom = self._filter
+        return ExternalIdFilterStats(
+            loaded=bloom is not None,
+            item_count=len(bloom) if bloom is not None else 0,
+            capacity=self._capacity,
+            size_bytes=bloom.size_bytes if bloom is not None else 0,
+            hash_count=bloom.hash_count if bloom is not None else 0,
+            estimated_false_positive_rate=(
+                bloom.estimated_false_positive_rate() if bloom is not None else 0.0
+            ),
+            positive_lookups=self._positive_lookups,
+            false_positives=self._false_positives,
+        )
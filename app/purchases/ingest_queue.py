@@ -0,0 +1,225 @@
+"""Group-commit ingestion queue for purchases.
+
+Accepted purchases are queued in process and a single writer task commits them
+in batches — one transaction per ``max_batch_size`` purchases or per
+``max_wait_ms`` milliseconds, whichever comes first — so the per-commit cost
+(WAL flush, round trips) is paid once per batch instead of once per request.
+
+Callers get a ticket back immediately and poll it for the final outcome.
+Tickets live in memory only: a process restart loses queued purchases and
+their tickets, which is why this mode is opt-in (see ``Settings``), and
+another worker process cannot see them, which is why the API refuses this mode
+when ``web_concurrency`` is above 1.
+"""
+
+import asyncio
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.errors.codes import ErrorCode as CoreErrorCode
+from app.core.logging import logger
+from app.core.unit_of_work import SQLAlchemyUnitOfWork
+from app.purchases.errors import ingest_rejection_error_code
+from app.purchases.exceptions import (
+    INGEST_REJECTION_EXCEPTIONS,
+    PurchaseIngestQueueFullException,
+)
+from app.purchases.models import Purchase
+from app.purchases.services import PurchaseService
+
+
+class IngestTicketStatus:
+    QUEUED = "queued"
+    COMPLETED = "completed"
+    REJECTED = "rejected"
+    FAILED = "failed"
+
+
+@dataclass
+class IngestTicket:
+    ticket_id: str
+    user_id: str
+    status: str = IngestTicketStatus.QUEUED
+    purchase_id: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+@dataclass
+class _QueuedPurchase:
+    ticket: IngestTicket
+    data: dict[str, Any] = field(repr=False)
+
+
+class PurchaseIngestQueueABC(ABC):
+    """Contract for deferred, batched purchase ingestion.
+
+    Lifecycle mirrors ``TaskSchedulerABC``: call ``start()`` inside the running
+    event loop (FastAPI lifespan) and ``stop()`` at shutdown.
+    """
+
+    @abstractmethod
+    def submit(self, data: dict[str, Any], current_user_id: str) -> IngestTicket:
+        """Queue a purchase for ingestion and return its ticket.
+
+        Raises:
+            PurchaseIngestQueueFullException: if the queue is at capacity.
+        """
+
+    @abstractmethod
+    def get_ticket(self, ticket_id: str) -> IngestTicket | None:
+        """Return the ticket, or ``None`` if unknown or already evicted."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start the background writer task."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Flush everything still queued, then stop the writer task."""
+
+
+class InMemoryPurchaseIngestQueue(PurchaseIngestQueueABC):
+    """asyncio-based group-commit queue with a single writer task.
+
+    The queue is bounded so that a slow database turns into fast 503s instead
+    of unbounded memory growth. Ticket history is bounded too: the oldest
+    finished tickets are evicted once ``max_tickets`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[], PurchaseService],
+        db_session_factory: async_sessionmaker[AsyncSession],
+        max_batch_size: int,
+        max_wait_ms: int,
+        queue_size: int,
+        max_tickets: int = 100_000,
+    ) -> None:
+        self._service_factory = service_factory
+        self._db_session_factory = db_session_factory
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_ms / 1000
+        self._queue_size = queue_size
+        self._max_tickets = max_tickets
+        self._queue: asyncio.Queue[_QueuedPurchase] = asyncio.Queue(maxsize=queue_size)
+        self._tickets: OrderedDict[str, IngestTicket] = OrderedDict()
+        self._writer: asyncio.Task[None] | None = None
+
+    def submit(self, data: dict[str, Any], current_user_id: str) -> IngestTicket:
+        ticket = IngestTicket(ticket_id=str(uuid.uuid4()), user_id=current_user_id)
+        try:
+            self._queue.put_nowait(_QueuedPurchase(ticket=ticket, data=data))
+        except asyncio.QueueFull:
+            raise PurchaseIngestQueueFullException(self._queue_size) from None
+
+        self._tickets[ticket.ticket_id] = ticket
+        while len(self._tickets) > self._max_tickets:
+            self._tickets.popitem(last=False)
+        return ticket
+
+    def get_ticket(self, ticket_id: str) -> IngestTicket | None:
+        return self._tickets.get(ticket_id)
+
+    async def start(self) -> None:
+        if self._writer is None:
+            self._writer = asyncio.create_task(
+                self._run_writer(), name="purchase_ingest_writer"
+            )
+
+    async def stop(self) -> None:
+        if self._writer is None:
+            return
+        await self._queue.join()
+        self._writer.cancel()
+        self._writer = None
+
+    async def _run_writer(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                # Never let one bad batch kill the writer; the tickets say why.
+                logger.error(
+                    "Unexpected error flushing purchase ingest batch.",
+                    extra={"batch_size": len(batch), "error": str(e)},
+                )
+                for item in batch:
+                    self._resolve(item.ticket, e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _collect_batch(self) -> list[_QueuedPurchase]:
+        # Block for the first item, then keep the batch open until it is full
+        # or the first item has waited max_wait.
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_wait_seconds
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _flush(self, batch: list[_QueuedPurchase]) -> None:
+        service = self._service_factory()
+        async with self._db_session_factory() as db:
+            uow = SQLAlchemyUnitOfWork(db)
+            try:
+                outcomes = await service.ingest_purchase_batch(
+                    [(item.data, item.ticket.user_id) for item in batch], uow
+                )
+            except Exception as e:
+                # An unexpected failure poisons the whole transaction; retry
+                # item by item so a single bad purchase cannot fail its peers.
+                logger.warning(
+                    "Group commit failed; falling back to per-purchase ingestion.",
+                    extra={"batch_size": len(batch), "error": str(e)},
+                )
+                await uow.rollback()
+                outcomes = [await self._ingest_one(service, item) for item in batch]
+
+        for item, outcome in zip(batch, outcomes):
+            self._resolve(item.ticket, outcome)
+
+    async def _ingest_one(
+        self, service: PurchaseService, item: _QueuedPurchase
+    ) -> Purchase | Exception:
+        async with self._db_session_factory() as db:
+            uow = SQLAlchemyUnitOfWork(db)
+            try:
+                return await service.ingest_purchase(
+                    item.data, item.ticket.user_id, uow
+                )
+            except Exception as e:
+                await uow.rollback()
+                return e
+
+    def _resolve(self, ticket: IngestTicket, outcome: Purchase | Exception) -> None:
+        if isinstance(outcome, Purchase):
+            ticket.status = IngestTicketStatus.COMPLETED
+            ticket.purchase_id = outcome.id
+        elif isinstance(outcome, INGEST_REJECTION_EXCEPTIONS):
+            ticket.status = IngestTicketStatus.REJECTED
+            ticket.error_code = ingest_rejection_error_code(outcome)
+            ticket.error_message = str(outcome)
+        else:
+            logger.error(
+                "Queued purchase ingestion failed.",
+                extra={"ticket_id": ticket.ticket_id, "error": str(outcome)},
+            )
+            ticket.status = IngestTicketStatus.FAILED
+            ticket.error_code = CoreErrorCode.INTERNAL_SERVER_ERROR.value
+            ticket.error_message = "An unexpected error occurred. Please retry later."
@@ -18,7 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.broker import MessageBrokerABC
 from app.core.events.purchase_events import PurchaseConfirmed, PurchaseRejected
 from app.core.logging import logger
-from app.purchases._helpers import apply_purchase_confirmation
+from app.purchases._helpers import apply_purchase_confirmation, release_monthly_cap
 from app.purchases.clients import CashbackClientABC, WalletsClientABC
 from app.purchases.models import Purchase
 from app.purchases.repositories import PurchaseRepositoryABC
@@ -83,6 +83,7 @@ async def _reject_purchase(  # pyright: ignore[reportUnusedFunction]
     if cashback_amount > Decimal("0"):
         await cashback_client.reverse(db, purchase.id)
         await wallets_client.reverse_pending(db, purchase.user_id, cashback_amount)
+        await release_monthly_cap(purchase, db, cashback_client)
 
     await db.commit()
 
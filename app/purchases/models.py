@@ -2,7 +2,15 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Index, Numeric, String, text
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -29,7 +37,53 @@ class Purchase(Base):
     created_at: Mapped[datetime] = mapped_column(server_default=text("now()"))
 
     __table_args__ = (
-        Index("ix_purchases_user_id", "user_id"),
+        # Leading user_id also serves plain user_id lookups; (created_at, id)
+        # matches the listing order so keyset pages are index range scans.
+        Index("ix_purchases_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_purchases_created_at_id", "created_at", "id"),
         Index("ix_purchases_merchant_id", "merchant_id"),
         Index("ix_purchases_status", "status"),
     )
+
+
+class UserPurchaseStats(Base):
+    """Number and sums of a user's purchases in one status.
+
+    Maintained by ``PurchaseRepository`` in the same transaction as every
+    insert and status change, so per-user totals are a read of at most one
+    row per status instead of a count over ``purchases``.
+    """
+
+    __tablename__ = "user_purchase_stats"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    purchase_count: Mapped[int] = mapped_column(
+        nullable=False, server_default=text("0")
+    )
+    amount_total: Mapped[Decimal] = mapped_column(
+        Numeric(precision=14, scale=2), nullable=False, server_default=text("0")
+    )
+    cashback_total: Mapped[Decimal] = mapped_column(
+        Numeric(precision=14, scale=2), nullable=False, server_default=text("0")
+    )
+
+    __table_args__ = (PrimaryKeyConstraint("user_id", "status"),)
+
+
+class PurchaseImportCheckpoint(Base):
+    """Progress of a streamed bulk import, committed together with each chunk.
+
+    ``rows_processed`` is the number of data rows (valid or not) already
+    handled; re-running an import with the same ``import_id`` skips them.
+    """
+
+    __tablename__ = "purchase_import_checkpoints"
+
+    import_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    rows_processed: Mapped[int] = mapped_column(nullable=False, default=0)
+    imported_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    rejected_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("now()")
+    )
@@ -1,12 +1,20 @@
 from abc import ABC, abstractmethod
-from datetime import date, timedelta
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import ColumnElement, func, select
+from sqlalchemy import ColumnElement, Row, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.purchases.models import Purchase
+from app.core.pagination import TotalCount, fetch_scalar_page
+from app.purchases.models import (
+    Purchase,
+    PurchaseImportCheckpoint,
+    UserPurchaseStats,
+)
 
 
 class PurchaseRepositoryABC(ABC):
@@ -21,8 +29,16 @@ class PurchaseRepositoryABC(ABC):
         pass
 
     @abstractmethod
-    async def add_purchase(self, db: AsyncSession, purchase: Purchase) -> Purchase:
-        pass
+    async def add_purchase(
+        self, db: AsyncSession, purchase: Purchase
+    ) -> Purchase | None:
+        """Insert *purchase* unless its external_id already exists.
+
+        Returns the persisted purchase (with server defaults populated), or
+        None when another purchase already holds the same external_id.
+        The user's purchase counters are updated in the same transaction.
+        Not committed — caller must commit.
+        """
 
     @abstractmethod
     async def get_pending_purchases(self, db: AsyncSession) -> list[Purchase]:
@@ -32,7 +48,11 @@ class PurchaseRepositoryABC(ABC):
     async def update_status(
         self, db: AsyncSession, purchase_id: str, new_status: str
     ) -> Purchase | None:
-        """Update the status of a purchase and return the updated record."""
+        """Update the status of a purchase and return the updated record.
+
+        The user's purchase counters move with it. Not committed — caller
+        must commit.
+        """
 
     @abstractmethod
     async def list_purchases(
@@ -46,16 +66,90 @@ class PurchaseRepositoryABC(ABC):
         end_date: date | None = None,
         offset: int = 0,
         limit: int = settings.default_page_size,
-    ) -> tuple[list[Purchase], int]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[Purchase], int | None]:
         pass
 
+    @abstractmethod
+    async def list_purchases_after(
+        self,
+        db: AsyncSession,
+        *,
+        after: tuple[datetime, str] | None,
+        status: str | None = None,
+        user_id: str | None = None,
+        merchant_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        limit: int = settings.default_page_size,
+    ) -> list[Purchase]:
+        """Keyset page of purchases, newest first, without counting the total.
+
+        *after* is the ``(created_at, id)`` of the last row of the previous
+        page, or None for the first page.
+        """
+
+    @abstractmethod
+    async def count_user_purchases(
+        self, db: AsyncSession, user_id: str, *, status: str | None = None
+    ) -> int:
+        """Return how many purchases *user_id* has, optionally in one *status*.
+
+        Read from the ``user_purchase_stats`` counters, not from ``purchases``.
+        """
+
     @abstractmethod
     async def reverse_purchase(
         self, db: AsyncSession, purchase_id: str
     ) -> Purchase | None:
         """Set purchase status to 'reversed' and cashback_amount to 0.
 
-        Flushed but not committed — caller must commit.
+        The user's purchase counters move with it. Flushed but not committed — caller must commit.
+        """
+
+    @abstractmethod
+    def stream_purchases(
+        self,
+        db: AsyncSession,
+        *,
+        status: str | None = None,
+        user_id: str | None = None,
+        merchant_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        fetch_size: int = 1000,
+    ) -> AsyncIterator[Row[Any]]:
+        """Yield every matching purchase row, oldest first, through a
+        server-side cursor that fetches *fetch_size* rows at a time.
+
+        Rows carry the purchase columns by name but are not ORM instances, so
+        nothing accumulates in the session. The next batch is only fetched
+        once the caller has consumed the previous one.
+        """
+
+    @abstractmethod
+    def stream_external_ids(self, db: AsyncSession) -> AsyncIterator[str]:
+        """Yield every purchase external_id without loading them all at once."""
+
+    @abstractmethod
+    async def get_import_checkpoint(
+        self, db: AsyncSession, import_id: str
+    ) -> PurchaseImportCheckpoint | None:
+        pass
+
+    @abstractmethod
+    async def save_import_checkpoint(
+        self,
+        db: AsyncSession,
+        import_id: str,
+        *,
+        rows_processed: int,
+        imported_count: int,
+        rejected_count: int,
+    ) -> None:
+        """Create or advance the checkpoint for *import_id*.
+
+        Not committed — the caller commits it together with the chunk it covers.
         """
 
 
@@ -72,14 +166,46 @@ class PurchaseRepository(PurchaseRepositoryABC):
         result = await db.execute(select(Purchase).where(Purchase.id == purchase_id))
         return result.scalar_one_or_none()
 
-    async def add_purchase(self, db: AsyncSession, purchase: Purchase) -> Purchase:
-        db.add(purchase)
-        # flush() (not commit()) so the caller can batch this insert with other
-        # operations — e.g. a wallet credit — in a single atomic transaction.
-        # The caller is responsible for calling db.commit().
-        await db.flush()
-        await db.refresh(purchase)
-        return purchase
+    async def add_purchase(
+        self, db: AsyncSession, purchase: Purchase
+    ) -> Purchase | None:
+        # A single INSERT ... ON CONFLICT DO NOTHING RETURNING replaces the old
+        # SELECT-then-INSERT plus flush()/refresh() sequence: the unique index
+        # on external_id arbitrates concurrent duplicates (no IntegrityError),
+        # and RETURNING hands back server defaults (status, created_at) without
+        # a second round trip. No row returned means the external_id is taken.
+        # The caller is responsible for committing.
+        stmt = (
+            insert(Purchase)
+            .values(
+                external_id=purchase.external_id,
+                user_id=purchase.user_id,
+                merchant_id=purchase.merchant_id,
+                offer_id=purchase.offer_id,
+                amount=purchase.amount,
+                cashback_amount=purchase.cashback_amount,
+                currency=purchase.currency,
+                # Only backfilled purchases carry a date; the rest take now().
+                **(
+                    {"created_at": purchase.created_at}
+                    if purchase.created_at is not None
+                    else {}
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["external_id"])
+            .returning(Purchase)
+        )
+        inserted = (await db.execute(stmt)).scalar_one_or_none()
+        if inserted is not None:
+            await self._add_to_stats(
+                db,
+                inserted.user_id,
+                inserted.status,
+                1,
+                inserted.amount,
+                inserted.cashback_amount,
+            )
+        return inserted
 
     async def get_pending_purchases(self, db: AsyncSession) -> list[Purchase]:
         result = await db.execute(
@@ -107,6 +233,10 @@ class PurchaseRepository(PurchaseRepositoryABC):
         purchase = result.scalar_one_or_none()
         if purchase is None:
             return None
+        if purchase.status != new_status:
+            await self._move_in_stats(
+                db, purchase, purchase.status, new_status, purchase.cashback_amount
+            )
         purchase.status = new_status
         # flush() (not commit()) so the caller can batch this status update with
         # a wallet balance transition in a single atomic transaction.
@@ -126,7 +256,8 @@ class PurchaseRepository(PurchaseRepositoryABC):
         end_date: date | None = None,
         offset: int = 0,
         limit: int = settings.default_page_size,
-    ) -> tuple[list[Purchase], int]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> tuple[list[Purchase], int | None]:
         conditions = self._build_conditions(
             status=status,
             user_id=user_id,
@@ -134,19 +265,62 @@ class PurchaseRepository(PurchaseRepositoryABC):
             start_date=start_date,
             end_date=end_date,
         )
-        count_stmt = select(func.count(Purchase.id))  # pylint: disable=not-callable
-        items_stmt = select(Purchase)
-        if conditions:
-            count_stmt = count_stmt.where(*conditions)
-            items_stmt = items_stmt.where(*conditions)
-
-        total: int = (await db.execute(count_stmt)).scalar_one()
+        # id breaks created_at ties so offset and keyset pages share one order.
+        stmt = (
+            select(Purchase)
+            .where(*conditions)
+            .order_by(Purchase.created_at.desc(), Purchase.id.desc())
+        )
+        return await fetch_scalar_page(
+            db,
+            stmt,
+            offset=offset,
+            limit=limit,
+            total_count=total_count,
+        )
 
-        items_stmt = (
-            items_stmt.order_by(Purchase.created_at.desc()).offset(offset).limit(limit)
+    async def list_purchases_after(
+        self,
+        db: AsyncSession,
+        *,
+        after: tuple[datetime, str] | None,
+        status: str | None = None,
+        user_id: str | None = None,
+        merchant_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        limit: int = settings.default_page_size,
+    ) -> list[Purchase]:
+        conditions = self._build_conditions(
+            status=status,
+            user_id=user_id,
+            merchant_id=merchant_id,
+            start_date=start_date,
+            end_date=end_date,
         )
-        result = await db.execute(items_stmt)
-        return list(result.scalars().all()), total
+        if after is not None:
+            # Row comparison seeks straight into the (created_at, id) and
+            # (user_id, created_at, id) indexes: the cost of a page does not
+            # grow with how many pages came before it.
+            conditions.append(tuple_(Purchase.created_at, Purchase.id) < after)
+        stmt = (
+            select(Purchase)
+            .where(*conditions)
+            .order_by(Purchase.created_at.desc(), Purchase.id.desc())
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_user_purchases(
+        self, db: AsyncSession, user_id: str, *, status: str | None = None
+    ) -> int:
+        stmt = select(
+            func.coalesce(func.sum(UserPurchaseStats.purchase_count), 0)
+        ).where(UserPurchaseStats.user_id == user_id)
+        if status is not None:
+            stmt = stmt.where(UserPurchaseStats.status == status)
+        return (await db.execute(stmt)).scalar_one()
 
     async def reverse_purchase(
         self, db: AsyncSession, purchase_id: str
@@ -155,12 +329,131 @@ class PurchaseRepository(PurchaseRepositoryABC):
         purchase = result.scalar_one_or_none()
         if purchase is None:
             return None
+        await self._move_in_stats(
+            db, purchase, purchase.status, "reversed", Decimal("0")
+        )
         purchase.status = "reversed"
         purchase.cashback_amount = Decimal("0")
         await db.flush()
         await db.refresh(purchase)
         return purchase
 
+    async def stream_purchases(
+        self,
+        db: AsyncSession,
+        *,
+        status: str | None = None,
+        user_id: str | None = None,
+        merchant_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        fetch_size: int = 1000,
+    ) -> AsyncIterator[Row[Any]]:
+        conditions = self._build_conditions(
+            status=status,
+            user_id=user_id,
+            merchant_id=merchant_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        # Ascending (created_at, id) walks the same keyset indexes as the
+        # listings; yield_per keeps a single batch of rows in memory.
+        stmt = (
+            select(*Purchase.__table__.columns)
+            .where(*conditions)
+            .order_by(Purchase.created_at, Purchase.id)
+            .execution_options(yield_per=fetch_size)
+        )
+        result = await db.stream(stmt)
+        async for row in result:
+            yield row
+
+    async def stream_external_ids(self, db: AsyncSession) -> AsyncIterator[str]:
+        # Server-side cursor: rows arrive in batches of yield_per, so memory
+        # stays flat however many purchases exist.
+        result = await db.stream_scalars(
+            select(Purchase.external_id).execution_options(yield_per=10_000)
+        )
+        async for external_id in result:
+            yield external_id
+
+    async def get_import_checkpoint(
+        self, db: AsyncSession, import_id: str
+    ) -> PurchaseImportCheckpoint | None:
+        return await db.get(PurchaseImportCheckpoint, import_id)
+
+    async def save_import_checkpoint(
+        self,
+        db: AsyncSession,
+        import_id: str,
+        *,
+        rows_processed: int,
+        imported_count: int,
+        rejected_count: int,
+    ) -> None:
+        values = {
+            "rows_processed": rows_processed,
+            "imported_count": imported_count,
+            "rejected_count": rejected_count,
+        }
+        stmt = (
+            insert(PurchaseImportCheckpoint)
+            .values(import_id=import_id, **values)
+            .on_conflict_do_update(
+                index_elements=["import_id"],
+                set_={**values, "updated_at": func.now()},
+            )
+        )
+        await db.execute(stmt)
+
+    async def _move_in_stats(
+        self,
+        db: AsyncSession,
+        purchase: Purchase,
+        old_status: str,
+        new_status: str,
+        new_cashback_amount: Decimal,
+    ) -> None:
+        await self._add_to_stats(
+            db,
+            purchase.user_id,
+            old_status,
+            -1,
+            -purchase.amount,
+            -purchase.cashback_amount,
+        )
+        await self._add_to_stats(
+            db, purchase.user_id, new_status, 1, purchase.amount, new_cashback_amount
+        )
+
+    async def _add_to_stats(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        status: str,
+        count: int,
+        amount: Decimal,
+        cashback_amount: Decimal,
+    ) -> None:
+        # Relative upsert: concurrent transactions serialise on the counter
+        # row instead of overwriting each other's totals.
+        stmt = insert(UserPurchaseStats).values(
+            user_id=user_id,
+            status=status,
+            purchase_count=count,
+            amount_total=amount,
+            cashback_total=cashback_amount,
+        )
+        counters = ("purchase_count", "amount_total", "cashback_total")
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "status"],
+            set_={
+                name: getattr(UserPurchaseStats, name) + stmt.excluded[name]
+                for name in counters
+            },
+        )
+        await db.execute(stmt)
+
     def _build_conditions(
         self,
         *,
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
-from app.core.schemas import PaginationOut
+from app.core.schemas import CursorPaginationOut
 
 
 class PurchaseStatus(str, Enum):
@@ -46,6 +46,29 @@ class PurchaseCreate(BaseModel):
         return value
 
 
+class PurchaseImportCreate(PurchaseCreate):
+    """One row of a bulk import: an ingest request plus its purchase date."""
+
+    created_at: datetime | None = Field(
+        None,
+        description=(
+            "When the purchase happened, without a UTC offset, in the time zone "
+            "purchases are stored in. Defaults to the time of the import."
+        ),
+    )
+
+    @field_validator("created_at", mode="before")
+    def empty_created_at_is_none(cls, value: object):
+        # An empty CSV cell means "not given".
+        return None if value == "" else value
+
+    @field_validator("created_at")
+    def created_at_must_be_naive(cls, value: datetime | None):
+        if value is not None and value.tzinfo is not None:
+            raise ValueError("Created at must not include a UTC offset")
+        return value
+
+
 class PurchaseOut(BaseModel):
     model_config = {"from_attributes": True}
 
@@ -54,6 +77,37 @@ class PurchaseOut(BaseModel):
     cashback_amount: Decimal = Decimal("0")
 
 
+class PurchaseIngestAcceptedOut(BaseModel):
+    """202 body for a purchase queued for group-commit ingestion."""
+
+    ticket_id: str
+    status: str
+    status_url: str
+
+
+class PurchaseIngestStatusOut(BaseModel):
+    model_config = {"from_attributes": True}
+
+    ticket_id: str
+    status: str
+    purchase_id: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+
+
+class ExternalIdFilterStatsOut(BaseModel):
+    model_config = {"from_attributes": True}
+
+    loaded: bool
+    item_count: int
+    capacity: int
+    size_bytes: int
+    hash_count: int
+    estimated_false_positive_rate: float
+    positive_lookups: int
+    false_positives: int
+
+
 class PurchaseAdminOut(BaseModel):
     model_config = {"from_attributes": True}
 
@@ -70,7 +124,7 @@ class PurchaseAdminOut(BaseModel):
 
 class PaginatedPurchaseOut(BaseModel):
     data: list[PurchaseAdminOut]
-    pagination: PaginationOut
+    pagination: CursorPaginationOut
 
 
 class PurchaseDetailsOut(BaseModel):
@@ -99,4 +153,4 @@ class UserPurchaseOut(BaseModel):
 
 class PaginatedUserPurchaseOut(BaseModel):
     data: list[UserPurchaseOut]
-    pagination: PaginationOut
+    pagination: CursorPaginationOut
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from typing import Any, Callable
@@ -7,24 +8,31 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.broker import MessageBrokerABC
 from app.core.events.purchase_events import PurchaseConfirmedByAdmin, PurchaseReversed
 from app.core.logging import logger
+from app.core.pagination import (
+    InvalidCursorException,
+    TotalCount,
+    decode_cursor,
+    encode_cursor,
+)
 from app.core.unit_of_work import UnitOfWorkABC
-from app.purchases._helpers import apply_purchase_confirmation
+from app.purchases._helpers import apply_purchase_confirmation, release_monthly_cap
 from app.purchases.clients import (
     CashbackClientABC,
+    IngestContextClientABC,
     MerchantDTO,
     MerchantsClientABC,
     OfferDTO,
-    OffersClientABC,
     UserDTO,
-    UsersClientABC,
     WalletsClientABC,
 )
 from app.purchases.exceptions import (
+    INGEST_REJECTION_EXCEPTIONS,
     DuplicatePurchaseException,
     InvalidPurchaseStatusException,
     PurchaseNotFoundException,
 )
-from app.purchases.models import Purchase
+from app.purchases.external_id_filter import ExternalIdFilterABC
+from app.purchases.models import Purchase, PurchaseImportCheckpoint
 from app.purchases.repositories import PurchaseRepositoryABC
 from app.purchases.schemas import PurchaseStatus
 
@@ -35,9 +43,9 @@ class PurchaseService:
         repository: PurchaseRepositoryABC,
         cashback_client: CashbackClientABC,
         wallets_client: WalletsClientABC,
-        users_client: UsersClientABC,
         merchants_client: MerchantsClientABC,
-        offers_client: OffersClientABC,
+        ingest_context_client: IngestContextClientABC,
+        external_id_filter: ExternalIdFilterABC,
         enforce_purchase_ownership: Callable[[str, str], None],
         enforce_user_active: Callable[[UserDTO | None, str], None],
         enforce_merchant_active: Callable[[MerchantDTO | None, str], None],
@@ -51,9 +59,9 @@ class PurchaseService:
         self.repository = repository
         self.cashback_client = cashback_client
         self.wallets_client = wallets_client
-        self.users_client = users_client
         self.merchants_client = merchants_client
-        self.offers_client = offers_client
+        self.ingest_context_client = ingest_context_client
+        self.external_id_filter = external_id_filter
         self.enforce_purchase_ownership = enforce_purchase_ownership
         self.enforce_user_active = enforce_user_active
         self.enforce_merchant_active = enforce_merchant_active
@@ -67,6 +75,127 @@ class PurchaseService:
     async def ingest_purchase(
         self, data: dict[str, Any], current_user_id: str, uow: UnitOfWorkABC
     ) -> Purchase:
+        db = uow.session
+
+        purchase, cashback_amount = await self._insert_purchase(
+            data, current_user_id, db
+        )
+        await self.wallets_client.credit_pending(db, purchase.user_id, cashback_amount)
+
+        # Commit all changes together to ensure atomicity
+        await uow.commit()
+
+        logger.info(
+            "Purchase ingested successfully.",
+            extra={"purchase_id": purchase.id, "external_id": purchase.external_id},
+        )
+        return purchase
+
+    async def ingest_purchase_batch(
+        self, items: list[tuple[dict[str, Any], str]], uow: UnitOfWorkABC
+    ) -> list[Purchase | Exception]:
+        """Ingest many purchases in a single transaction (group commit).
+
+        Each item is a ``(data, current_user_id)`` pair, validated exactly as
+        ``ingest_purchase`` does. Items rejected by a business rule do not
+        affect the rest of the batch; their exception is returned in place of
+        the purchase, preserving input order.
+        """
+        outcomes = await self._stage_purchase_batch(items, uow.session)
+
+        # One commit (and one WAL flush) for the whole batch
+        await uow.commit()
+
+        logger.info(
+            "Purchase batch ingested.",
+            extra={
+                "batch_size": len(items),
+                "ingested_count": sum(isinstance(o, Purchase) for o in outcomes),
+            },
+        )
+        return outcomes
+
+    async def get_import_checkpoint(
+        self, db: AsyncSession, import_id: str
+    ) -> PurchaseImportCheckpoint | None:
+        return await self.repository.get_import_checkpoint(db, import_id)
+
+    async def import_purchase_chunk(
+        self,
+        import_id: str,
+        items: list[tuple[dict[str, Any], str]],
+        uow: UnitOfWorkABC,
+        *,
+        rows_processed: int,
+        prior_imported_count: int,
+        prior_rejected_count: int,
+    ) -> list[Purchase | Exception]:
+        """Ingest one chunk of a bulk import and advance its checkpoint.
+
+        Behaves like ``ingest_purchase_batch``, but the import checkpoint is
+        written in the same transaction, so a committed chunk and its
+        checkpoint can never disagree. ``prior_*_count`` are the totals before
+        this chunk, including rows the caller rejected without ingesting.
+        """
+        outcomes = await self._stage_purchase_batch(items, uow.session)
+
+        imported_count = sum(isinstance(o, Purchase) for o in outcomes)
+        await self.repository.save_import_checkpoint(
+            uow.session,
+            import_id,
+            rows_processed=rows_processed,
+            imported_count=prior_imported_count + imported_count,
+            rejected_count=prior_rejected_count + len(outcomes) - imported_count,
+        )
+        await uow.commit()
+
+        return outcomes
+
+    def validate_purchase_request(
+        self, data: dict[str, Any], current_user_id: str
+    ) -> None:
+        """Run the ingest checks that need no DB access (ownership, currency).
+
+        Lets callers reject obviously invalid requests before deferring the
+        rest of the ingestion work.
+        """
+        self.enforce_purchase_ownership(current_user_id, str(data["user_id"]))
+        self.enforce_currency_supported(data["currency"])
+
+    async def _stage_purchase_batch(
+        self, items: list[tuple[dict[str, Any], str]], db: AsyncSession
+    ) -> list[Purchase | Exception]:
+        """Insert a batch of purchases without committing.
+
+        Wallet credits are aggregated per user and applied once each.
+        """
+        outcomes: list[Purchase | Exception] = []
+        credits: dict[str, Decimal] = defaultdict(Decimal)
+
+        for data, current_user_id in items:
+            try:
+                purchase, cashback_amount = await self._insert_purchase(
+                    data, current_user_id, db
+                )
+            except INGEST_REJECTION_EXCEPTIONS as exc:
+                outcomes.append(exc)
+                continue
+            credits[purchase.user_id] += cashback_amount
+            outcomes.append(purchase)
+
+        for user_id, amount in credits.items():
+            await self.wallets_client.credit_pending(db, user_id, amount)
+
+        return outcomes
+
+    async def _insert_purchase(
+        self, data: dict[str, Any], current_user_id: str, db: AsyncSession
+    ) -> tuple[Purchase, Decimal]:
+        """Validate and insert one purchase plus its cashback transaction.
+
+        Does not touch the wallet and does not commit; returns the inserted
+        purchase together with the cashback amount to credit.
+        """
         external_id: str = data["external_id"]
         user_id: str = str(data["user_id"])
         merchant_id: str = str(data["merchant_id"])
@@ -75,43 +204,55 @@ class PurchaseService:
 
         self.enforce_purchase_ownership(current_user_id, user_id)
 
-        db = uow.session
-
-        # Get existing purchase
-        existing = await self.repository.get_by_external_id(db, external_id)
-        if existing is not None:
-            logger.debug(
-                "Duplicate purchase detected.",
-                extra={"external_id": external_id},
-            )
-            raise DuplicatePurchaseException(
-                external_id, existing.created_at, existing.amount
-            )
-
         # Ensure currency is supported
         self.enforce_currency_supported(currency)
 
-        # Get user, merchant and offer details
-        user = await self.users_client.get_user_by_id(db, user_id)
-        self.enforce_user_active(user, user_id)
-
-        merchant = await self.merchants_client.get_merchant_by_id(db, merchant_id)
-        self.enforce_merchant_active(merchant, merchant_id)
-
-        today = date.today()
-        offer = await self.offers_client.get_active_offer_for_merchant(
-            db, merchant_id, today
+        # A backfilled purchase carries its own date: the offer must have been
+        # active on it and the cap is charged in its month. Otherwise the
+        # database stamps created_at and the context reads the month from the
+        # same clock.
+        created_at: datetime | None = data.get("created_at")
+        today = created_at.date() if created_at is not None else date.today()
+        cap_month = today.replace(day=1) if created_at is not None else None
+
+        # Get user, merchant and offer details in a single round trip
+        context = await self.ingest_context_client.get_ingest_context(
+            db, user_id, merchant_id, today, cap_month=cap_month
         )
+        self.enforce_user_active(context.user, user_id)
+        self.enforce_merchant_active(context.merchant, merchant_id)
+
+        offer = context.offer
         self.enforce_offer_available(offer, merchant_id)
 
-        # Calculate cashback amount
-        cashback_result = self.cashback_client.calculate(
-            offer_id=offer.id,  # type: ignore[union-attr]
-            percentage=offer.percentage,  # type: ignore[union-attr]
-            fixed_amount=offer.fixed_amount,  # type: ignore[union-attr]
-            purchase_amount=amount,
+        # Retry fast path: a likely duplicate is confirmed with one indexed
+        # lookup before the cap is reserved. It runs after the user, merchant
+        # and offer checks so a retry gets the same error either way; a filter
+        # miss skips the lookup and the conditional insert below stays the
+        # authoritative duplicate check.
+        if self.external_id_filter.might_contain(external_id):
+            existing = await self.repository.get_by_external_id(db, external_id)
+            if existing is not None:
+                logger.debug(
+                    "Duplicate purchase detected.",
+                    extra={"external_id": external_id},
+                )
+                raise DuplicatePurchaseException(
+                    external_id, existing.created_at, existing.amount
+                )
+            self.external_id_filter.record_false_positive()
+
+        # Calculate cashback, clamped to what is left of the monthly cap, in
+        # the month release_monthly_cap later derives from created_at
+        month = context.cap_month
+        cashback_amount = await self._reserve_cashback(
+            db,
+            offer,  # type: ignore[arg-type]
+            user_id,
+            month,
+            amount,
+            context.monthly_cashback_used,
         )
-        cashback_amount = cashback_result.cashback_amount
 
         # Create new purchase record
         new_purchase = Purchase(
@@ -122,21 +263,98 @@ class PurchaseService:
             amount=amount,
             cashback_amount=cashback_amount,
             currency=currency,
+            created_at=created_at,
         )
 
-        # Flush purchase, cashback transaction, and wallet credit
+        # Insert the purchase; the unique index on external_id enforces
+        # idempotency, so duplicates (including concurrent retries) come back
+        # as None instead of requiring a prior lookup.
         result = await self.repository.add_purchase(db, new_purchase)
+        self.external_id_filter.add(external_id)
+        if result is None:
+            # Give back the cap counted above (a no-op for uncapped offers):
+            # in a batch the transaction still commits.
+            if cashback_amount > 0:
+                await self.cashback_client.release_monthly_usage(
+                    db,
+                    offer.id,  # type: ignore[union-attr]
+                    user_id,
+                    month,
+                    cashback_amount,
+                )
+            # Rare path: only now fetch the original purchase for the 409 details
+            existing = await self.repository.get_by_external_id(db, external_id)
+            logger.debug(
+                "Duplicate purchase detected.",
+                extra={"external_id": external_id},
+            )
+            if existing is None:
+                # The conflicting row was deleted since; still a duplicate.
+                raise DuplicatePurchaseException(external_id)
+            raise DuplicatePurchaseException(
+                external_id, existing.created_at, existing.amount
+            )
+
+        # Flush cashback transaction
         await self.cashback_client.create(db, result.id, user_id, cashback_amount)
-        await self.wallets_client.credit_pending(db, user_id, cashback_amount)
 
-        # Commit all changes together to ensure atomicity
-        await uow.commit()
+        return result, cashback_amount
 
-        logger.info(
-            "Purchase ingested successfully.",
-            extra={"purchase_id": result.id, "external_id": external_id},
+    async def _reserve_cashback(
+        self,
+        db: AsyncSession,
+        offer: OfferDTO,
+        user_id: str,
+        month: date,
+        purchase_amount: Decimal,
+        monthly_cashback_used: Decimal,
+    ) -> Decimal:
+        """Calculate the cashback and count it against the monthly cap.
+
+        The cap left is known from the ingest context read; the guarded
+        upsert only fails if a concurrent ingest used it up in the meantime,
+        in which case the (now locked) usage is re-read and the cashback
+        recalculated once.
+        """
+        if offer.monthly_cap_per_user is None:
+            return self._calculate_cashback(offer, purchase_amount, None)
+
+        cap = Decimal(str(offer.monthly_cap_per_user))
+        cashback_amount = self._calculate_cashback(
+            offer, purchase_amount, cap - monthly_cashback_used
         )
-        return result
+        if cashback_amount <= 0:
+            return cashback_amount
+
+        if not await self.cashback_client.add_monthly_usage(
+            db, offer.id, user_id, month, cashback_amount, cap
+        ):
+            used = await self.cashback_client.get_monthly_usage(
+                db, offer.id, user_id, month
+            )
+            cashback_amount = self._calculate_cashback(
+                offer, purchase_amount, cap - used
+            )
+            if cashback_amount > 0:
+                await self.cashback_client.add_monthly_usage(
+                    db, offer.id, user_id, month, cashback_amount, cap
+                )
+
+        return cashback_amount
+
+    def _calculate_cashback(
+        self,
+        offer: OfferDTO,
+        purchase_amount: Decimal,
+        remaining_cap: Decimal | None,
+    ) -> Decimal:
+        return self.cashback_client.calculate(
+            offer_id=offer.id,
+            percentage=offer.percentage,
+            fixed_amount=offer.fixed_amount,
+            purchase_amount=purchase_amount,
+            remaining_cap=remaining_cap,
+        ).cashback_amount
 
     async def list_purchases(
         self,
@@ -149,21 +367,32 @@ class PurchaseService:
         end_date: date | None = None,
         offset: int = 0,
         limit: int = 10,
-    ) -> tuple[list[Purchase], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[Purchase], int | None, str | None]:
+        """Return one page of purchases, the total and the next page's cursor.
+
+        With *cursor* the page is fetched by keyset, *offset* is ignored and
+        the total is None.
+
+        Raises:
+            InvalidPurchaseStatusException: if *status* is not a known status.
+            InvalidCursorException: if *cursor* is malformed.
+        """
         if status is not None:
             try:
                 PurchaseStatus(status)
             except ValueError as exc:
                 raise InvalidPurchaseStatusException(status) from exc
-        return await self.repository.list_purchases(
+        return await self._fetch_purchase_page(
             db,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
             status=status,
             user_id=user_id,
             merchant_id=merchant_id,
             start_date=start_date,
             end_date=end_date,
-            offset=offset,
-            limit=limit,
         )
 
     async def list_user_purchases(
@@ -174,19 +403,30 @@ class PurchaseService:
         status: str | None = None,
         offset: int = 0,
         limit: int = 10,
-    ) -> tuple[list[tuple[Purchase, str]], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[tuple[Purchase, str]], int | None, str | None]:
         if status is not None:
             try:
                 PurchaseStatus(status)
             except ValueError as exc:
                 raise InvalidPurchaseStatusException(status) from exc
 
-        purchases, total = await self.repository.list_purchases(
+        # The user's counters answer the total without scanning their purchases.
+        known_total = (
+            await self.repository.count_user_purchases(
+                db, current_user_id, status=status
+            )
+            if cursor is None
+            else None
+        )
+        purchases, total, next_cursor = await self._fetch_purchase_page(
             db,
-            user_id=current_user_id,
-            status=status,
             offset=offset,
             limit=limit,
+            cursor=cursor,
+            known_total=known_total,
+            user_id=current_user_id,
+            status=status,
         )
 
         # Batch-load all merchant names in a single query to avoid N+1 (ADR-019)
@@ -206,7 +446,49 @@ class PurchaseService:
             )
             for p in purchases
         ]
-        return enriched, total
+        return enriched, total, next_cursor
+
+    async def _fetch_purchase_page(
+        self,
+        db: AsyncSession,
+        *,
+        offset: int,
+        limit: int,
+        cursor: str | None,
+        known_total: int | None = None,
+        **filters: Any,
+    ) -> tuple[list[Purchase], int | None, str | None]:
+        page_total: int | None
+        if cursor is None:
+            if known_total is None:
+                purchases, page_total = await self.repository.list_purchases(
+                    db, offset=offset, limit=limit, **filters
+                )
+            else:
+                purchases, _ = await self.repository.list_purchases(
+                    db,
+                    offset=offset,
+                    limit=limit,
+                    total_count=TotalCount.SKIP,
+                    **filters,
+                )
+                page_total = known_total
+            has_more = offset + len(purchases) < (page_total or 0)
+        else:
+            # One extra row tells whether another page exists without a COUNT.
+            purchases = await self.repository.list_purchases_after(
+                db, after=_decode_purchase_cursor(cursor), limit=limit + 1, **filters
+            )
+            has_more = len(purchases) > limit
+            purchases = purchases[:limit]
+            page_total = None
+
+        next_cursor = (
+            encode_cursor(purchases[-1].created_at.isoformat(), purchases[-1].id)
+            if has_more and purchases
+            else None
+        )
+        return purchases, page_total, next_cursor
 
     async def get_purchase_details(
         self, purchase_id: str, current_user_id: str, db: AsyncSession
@@ -251,6 +533,7 @@ class PurchaseService:
 
         # Reverse cashback transaction first, then adjust wallet
         await self.cashback_client.reverse(db, purchase_id)
+        await release_monthly_cap(purchase, db, self.cashback_client)
 
         if prior_status == "pending":
             await self.wallets_client.reverse_pending(
@@ -329,3 +612,11 @@ class PurchaseService:
         )
 
         return confirmed_purchase  # type: ignore[return-value]
+
+
+def _decode_purchase_cursor(cursor: str) -> tuple[datetime, str]:
+    created_at, purchase_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), purchase_id
+    except ValueError:
+        raise InvalidCursorException(cursor) from None
@@ -5,9 +5,11 @@ from app.core.database import get_async_db
 from app.core.errors.builders import (
     business_rule_violation_error,
     internal_server_error,
+    service_unavailable_error,
     validation_error,
 )
 from app.core.logging import logging
+from app.core.password_hashing import PasswordHashingBusyException
 from app.core.unit_of_work import SQLAlchemyUnitOfWork, UnitOfWorkABC
 from app.users.composition import get_user_service
 from app.users.errors import ErrorCode
@@ -55,6 +57,12 @@ async def create_user(
                 },
             ],
         )
+    except PasswordHashingBusyException as exc:
+        logging.warning("User registration shed: password hashing queue is full.")
+        raise service_unavailable_error(
+            message="Too many registrations are in progress. Please retry later.",
+            retry_after_seconds=exc.retry_after_seconds,
+        )
     except Exception as e:
         logging.error(
             "An unexpected error occurred during user creation.",
@@ -1,20 +1,51 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.password_hashing import PasswordHasher
 from app.users.policies import enforce_password_complexity
 from app.users.repositories import UserRepository
 from app.users.services import UserService
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Process-wide: registration and login (auth module) share one bounded pool, so
+# the cap on concurrent bcrypt calls holds for the whole worker.
+_password_hasher = PasswordHasher(
+    pwd_context,
+    max_workers=settings.password_hashing_max_workers,
+    max_queue=settings.password_hashing_max_queue,
+)
+
+
+def get_password_hasher_pool() -> PasswordHasher:
+    return _password_hasher
+
+
+# Process-wide: get_current_user reads it on every authenticated request. No
+# write path changes a user's role or active flag yet, so the TTL (never more
+# than the access token TTL) is the only bound on staleness.
+_principal_cache: TTLCache[str, Any] = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=min(
+        settings.principal_cache_ttl_seconds, settings.oauth_access_token_ttl * 60
+    ),
+)
+
+
+def get_principal_cache() -> TTLCache[str, Any]:
+    return _principal_cache
+
 
 def get_enforce_password_complexity() -> Callable[[str], None]:
     return lambda password: enforce_password_complexity(password)
 
 
-def get_password_hasher() -> Callable[[str], str]:
-    return pwd_context.hash
+def get_password_hasher() -> Callable[[str], Awaitable[str]]:
+    return _password_hasher.hash
 
 
 def get_user_repository():
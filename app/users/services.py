@@ -1,4 +1,5 @@
-from typing import Any, Callable
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,7 +14,7 @@ class UserService:
     def __init__(
         self,
         enforce_password_complexity: Callable[[str], None],
-        hash_password: Callable[[str], str],
+        hash_password: Callable[[str], Awaitable[str]],
         user_repository: UserRepositoryABC,
     ):
         self.enforce_password_complexity = enforce_password_complexity
@@ -30,7 +31,7 @@ class UserService:
 
         await self._enforce_email_uniqueness(email, uow.session)
 
-        hashed_password = self.hash_password(password)
+        hashed_password = await self.hash_password(password)
         new_user = User(email=email, hashed_password=hashed_password, active=True)
 
         result = await self.user_repository.add_user(uow.session, new_user)
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.current_user import get_current_user
 from app.core.database import get_async_db
 from app.core.errors.builders import internal_server_error
+from app.core.http_cache import conditional_json
 from app.core.logging import logger
 from app.users.models import User
 from app.wallets.composition import get_wallet_service
@@ -16,19 +17,29 @@ router = APIRouter(prefix="/users", tags=["wallets"])
 @router.get(
     "/me/wallet",
     status_code=status.HTTP_200_OK,
+    response_model=WalletSummaryOut,
     description=(
         "Return the authenticated user's wallet summary "
         "(pending, available, and paid balances). "
-        "All balances are zero for users with no cashback activity."
+        "All balances are zero for users with no cashback activity. "
+        "Supports conditional requests with If-None-Match."
     ),
+    responses={
+        304: {
+            "description": (
+                "Not modified: the ETag sent in If-None-Match is still current."
+            ),
+        },
+    },
 )
 async def get_wallet_summary(
+    if_none_match: str | None = Header(default=None),
     service: WalletService = Depends(get_wallet_service),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
-) -> WalletSummaryOut:
+) -> Response:
     try:
-        return await service.get_wallet_summary(str(current_user.id), db)
+        summary = await service.get_wallet_summary(str(current_user.id), db)
     except Exception as e:
         logger.error(
             "An unexpected error occurred while retrieving wallet summary.",
@@ -36,6 +47,9 @@ async def get_wallet_summary(
         )
         raise internal_server_error() from None
 
+    # The balances are the wallet's version: the ETag is derived from the body.
+    return conditional_json(summary.model_dump_json().encode(), if_none_match)
+
 
 @router.get(
     "/me/wallet/transactions",
@@ -50,13 +64,17 @@ async def list_wallet_transactions(
         10, ge=1, le=100, description="Number of items to return (1–100)."
     ),
     offset: int = Query(0, ge=0, description="Number of items to skip."),
+    include_total: bool = Query(
+        True,
+        description="Set to false to skip counting; pagination.total is then null.",
+    ),
     service: WalletService = Depends(get_wallet_service),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ) -> PaginatedWalletTransactionOut:
     try:
         return await service.list_wallet_transactions(
-            str(current_user.id), limit, offset, db
+            str(current_user.id), limit, offset, db, include_total=include_total
         )
     except Exception as e:
         logger.error(
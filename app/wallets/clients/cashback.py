@@ -6,6 +6,7 @@ from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.cashback.repositories import CashbackTransactionRepository
+from app.core.pagination import TotalCount
 
 
 @dataclass
@@ -22,9 +23,17 @@ class CashbackClientABC(ABC):
 
     @abstractmethod
     async def list_by_user_id(
-        self, db: AsyncSession, user_id: str, limit: int, offset: int
-    ) -> tuple[list[CashbackTransactionDTO], int]:
-        """Return a page of cashback transactions for the given user, newest first."""
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: int,
+        offset: int,
+        include_total: bool = True,
+    ) -> tuple[list[CashbackTransactionDTO], int | None]:
+        """Return a page of cashback transactions for the given user, newest first.
+
+        The total is None when *include_total* is False.
+        """
 
 
 class CashbackClient(CashbackClientABC):
@@ -38,9 +47,20 @@ class CashbackClient(CashbackClientABC):
         self._repository = CashbackTransactionRepository()
 
     async def list_by_user_id(
-        self, db: AsyncSession, user_id: str, limit: int, offset: int
-    ) -> tuple[list[CashbackTransactionDTO], int]:
-        txns, total = await self._repository.list_by_user_id(db, user_id, limit, offset)
+        self,
+        db: AsyncSession,
+        user_id: str,
+        limit: int,
+        offset: int,
+        include_total: bool = True,
+    ) -> tuple[list[CashbackTransactionDTO], int | None]:
+        txns, total = await self._repository.list_by_user_id(
+            db,
+            user_id,
+            limit,
+            offset,
+            total_count=TotalCount.EXACT if include_total else TotalCount.SKIP,
+        )
         return (
             [
                 CashbackTransactionDTO(
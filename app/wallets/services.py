@@ -39,10 +39,15 @@ class WalletService:
         )
 
     async def list_wallet_transactions(
-        self, user_id: str, limit: int, offset: int, db: AsyncSession
+        self,
+        user_id: str,
+        limit: int,
+        offset: int,
+        db: AsyncSession,
+        include_total: bool = True,
     ) -> PaginatedWalletTransactionOut:
         txns, total = await self.cashback_client.list_by_user_id(
-            db, user_id, limit, offset
+            db, user_id, limit, offset, include_total=include_total
         )
         transactions = [
             WalletTransactionOut(
@@ -0,0 +1,47 @@
+"""Micro-benchmark: CPU spent verifying one access token per request.
+
+Compares a full verification (decode and HMAC check) with a hit in the
+verified-token cache, which is what repeat requests with the same bearer
+token pay. Needs the same settings as the app (.env or environment).
+
+Usage:
+    PYTHONPATH=. python scripts/bench_token_verification.py [iterations]
+"""
+
+import sys
+import time
+from typing import Any
+
+from app.auth.models import TokenPayload
+from app.auth.token_provider import JwtOAuth2TokenProvider
+from app.core.cache import TTLCache
+
+
+def _cpu_per_call_us(provider: JwtOAuth2TokenProvider, token: str, n: int) -> float:
+    started = time.process_time()
+    for _ in range(n):
+        provider.verify_access_token(token)
+    return (time.process_time() - started) / n * 1_000_000
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    payload = TokenPayload(user_id="bench-user", user_role="user")
+
+    uncached = JwtOAuth2TokenProvider()
+    cache: TTLCache[bytes, Any] = TTLCache(max_size=10_000, ttl_seconds=900)
+    cached = JwtOAuth2TokenProvider(verified_token_cache=cache)
+    token = uncached.create_access_token(payload)
+    cached.verify_access_token(token)  # warm the cache
+
+    full_us = _cpu_per_call_us(uncached, token, iterations)
+    hit_us = _cpu_per_call_us(cached, token, iterations)
+
+    print(f"iterations:           {iterations}")
+    print(f"full verification:    {full_us:8.1f} us CPU/request")
+    print(f"cache hit:            {hit_us:8.1f} us CPU/request")
+    print(f"saved per request:    {full_us - hit_us:8.1f} us ({full_us / hit_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,14 @@
 """Integration tests for POST /api/v1/auth/refresh."""
 
+import uuid
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.repositories import RefreshTokenRepository
 from tests.integration.conftest import create_user
 
 pytestmark = pytest.mark.asyncio
@@ -210,3 +214,93 @@ async def test_refresh_chain_creates_new_tokens(
         json={"refresh_token": refresh_token_3},
     )
     assert response3.status_code == status.HTTP_200_OK
+
+
+async def test_consume_marks_token_used_only_once(db: AsyncSession) -> None:
+    """The conditional update matches an unused, unexpired token exactly once."""
+    # Arrange
+    user, _ = await create_user(db)
+    repository = RefreshTokenRepository()
+    now = datetime.now(timezone.utc)
+    token = await repository.create(
+        db,
+        user_id=user.id,
+        token_hash=f"hash-{uuid.uuid4()}",
+        issued_at=now,
+        expires_at=now + timedelta(days=1),
+    )
+
+    # Act
+    first = await repository.consume(db, token.token_hash, now)
+    second = await repository.consume(db, token.token_hash, now)
+
+    # Assert
+    assert first == user.id
+    assert second is None
+    await db.refresh(token)
+    assert token.used_at is not None
+    assert token.rotation_count == 1
+
+
+async def test_consume_ignores_expired_token(db: AsyncSession) -> None:
+    # Arrange
+    user, _ = await create_user(db)
+    repository = RefreshTokenRepository()
+    now = datetime.now(timezone.utc)
+    token = await repository.create(
+        db,
+        user_id=user.id,
+        token_hash=f"hash-{uuid.uuid4()}",
+        issued_at=now - timedelta(days=2),
+        expires_at=now - timedelta(days=1),
+    )
+
+    # Act
+    consumed = await repository.consume(db, token.token_hash, now)
+
+    # Assert
+    assert consumed is None
+
+
+async def test_issue_stores_token_and_returns_user_role(db: AsyncSession) -> None:
+    # Arrange
+    user, _ = await create_user(db)
+    repository = RefreshTokenRepository()
+    now = datetime.now(timezone.utc)
+    token_hash = f"hash-{uuid.uuid4()}"
+
+    # Act
+    role = await repository.issue(
+        db,
+        user_id=user.id,
+        token_hash=token_hash,
+        issued_at=now,
+        expires_at=now + timedelta(days=1),
+    )
+
+    # Assert
+    assert role == user.role
+    stored = await repository.get_by_hash(db, token_hash)
+    assert stored is not None
+    assert stored.user_id == user.id
+    assert stored.used_at is None
+
+
+async def test_issue_stores_nothing_for_unknown_user(db: AsyncSession) -> None:
+    # Arrange
+    repository = RefreshTokenRepository()
+    now = datetime.now(timezone.utc)
+    token_hash = f"hash-{uuid.uuid4()}"
+
+    # Act
+    role = await repository.issue(
+        db,
+        user_id=str(uuid.uuid4()),
+        token_hash=token_hash,
+        issued_at=now,
+        expires_at=now + timedelta(days=1),
+    )
+
+    # Assert
+    assert role is None
+    assert await repository.get_by_hash(db, token_hash) is None
@@ -0,0 +1,89 @@
+"""Integration tests for RefreshTokenRepository.delete_stale_batch."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.models import RefreshToken
+from app.auth.repositories import RefreshTokenRepository
+from tests.integration.conftest import create_user
+
+pytestmark = pytest.mark.asyncio
+
+_NOW = datetime.now(timezone.utc)
+
+
+async def _add_token(
+    db: AsyncSession,
+    user_id: str,
+    *,
+    expires_at: datetime,
+    used_at: datetime | None = None,
+) -> RefreshToken:
+    token = RefreshToken(
+        user_id=user_id,
+        token_hash=f"hash-{uuid.uuid4()}",
+        issued_at=_NOW - timedelta(days=30),
+        expires_at=expires_at,
+        used_at=used_at,
+        rotation_count=0 if used_at is None else 1,
+    )
+    db.add(token)
+    await db.flush()
+    return token
+
+
+async def test_delete_stale_batch_removes_expired_and_old_used_tokens(
+    db: AsyncSession,
+) -> None:
+    # Arrange
+    user, _ = await create_user(db)
+    later = _NOW + timedelta(days=1)
+    expired = await _add_token(db, user.id, expires_at=_NOW - timedelta(minutes=1))
+    old_used = await _add_token(
+        db, user.id, expires_at=later, used_at=_NOW - timedelta(hours=2)
+    )
+    recently_used = await _add_token(
+        db, user.id, expires_at=later, used_at=_NOW - timedelta(minutes=5)
+    )
+    live = await _add_token(db, user.id, expires_at=later)
+
+    # Act
+    deleted = await RefreshTokenRepository().delete_stale_batch(
+        db,
+        now=_NOW,
+        used_before=_NOW - timedelta(hours=1),
+        after_id=None,
+        batch_size=100,
+    )
+
+    # Assert
+    assert set(deleted) >= {expired.id, old_used.id}
+    assert recently_used.id not in deleted
+    assert live.id not in deleted
+
+
+async def test_delete_stale_batch_resumes_after_the_keyset_cursor(
+    db: AsyncSession,
+) -> None:
+    # Arrange
+    user, _ = await create_user(db)
+    expired_at = _NOW - timedelta(minutes=1)
+    tokens = [await _add_token(db, user.id, expires_at=expired_at) for _ in range(3)]
+    cursor = min(token.id for token in tokens)
+
+    # Act
+    deleted = await RefreshTokenRepository().delete_stale_batch(
+        db,
+        now=_NOW,
+        used_before=_NOW,
+        after_id=cursor,
+        batch_size=100,
+    )
+
+    # Assert
+    assert cursor not in deleted
+    assert all(token_id > cursor for token_id in deleted)
+    assert {token.id for token in tokens} - {cursor} <= set(deleted)
@@ -17,15 +17,18 @@ import os
 import uuid
 from collections.abc import AsyncGenerator
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from passlib.context import CryptContext
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 import app.models  # noqa: F401 — registers all ORM models with Base.metadata
 from app.auth.models import TokenPayload
 from app.auth.token_provider import JwtOAuth2TokenProvider
 from app.core.database import Base, get_async_db
+from app.feature_flags.composition import get_feature_flag_snapshot
 from app.main import app
 from app.users.models import User, UserRoleEnum
 
@@ -52,6 +55,8 @@ _token_provider = JwtOAuth2TokenProvider()
 async def create_tables() -> AsyncGenerator[None, None]:
     """Create all tables once per test session; drop them on teardown."""
     async with _engine.begin() as conn:
+        # Required by the trigram index on merchant names.
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
     yield
     async with _engine.begin() as conn:
@@ -86,6 +91,13 @@ async def db() -> AsyncGenerator[AsyncSession, None]:
         await conn.rollback()
 
 
+@pytest.fixture(autouse=True)
+def reset_feature_flag_snapshot() -> None:
+    """Tests seed flags straight into their session, bypassing set_flag, and
+    roll them back afterwards; reload the process-wide snapshot for each test."""
+    get_feature_flag_snapshot().invalidate()
+
+
 # ---------------------------------------------------------------------------
 # Helper: create a user directly in the test session
 # ---------------------------------------------------------------------------
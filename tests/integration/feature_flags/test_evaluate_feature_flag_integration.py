@@ -1,4 +1,4 @@
-"""Integration tests for GET /api/v1/feature-flags/{key}/evaluate."""
+"""Integration tests for the feature flag evaluate endpoints (single and batch)."""
 
 import uuid
 
@@ -216,3 +216,84 @@ async def test_evaluate_feature_flag_returns_422_on_missing_scope_id_for_user(
     body = response.json()
     assert body["error"]["code"] == "FEATURE_FLAG_SCOPE_ID_REQUIRED"
     assert body["error"]["details"]["scope_type"] == "user"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# POST /api/v1/feature-flags/evaluate — batch evaluation
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+async def test_evaluate_feature_flags_resolves_all_keys_and_scopes(
+    admin_http_client: AsyncClient,
+    db: AsyncSession,
+) -> None:
+    # Arrange
+    disabled_key = f"test_flag_{uuid.uuid4().hex[:8]}"
+    unknown_key = f"test_flag_{uuid.uuid4().hex[:8]}"
+    merchant_id = str(uuid.uuid4())
+    other_merchant_id = str(uuid.uuid4())
+    await _seed_flag(db, key=disabled_key, enabled=False, scope_type="global")
+    await _seed_flag(
+        db, key=disabled_key, enabled=True, scope_type="merchant", scope_id=merchant_id
+    )
+
+    # Act
+    response = await admin_http_client.post(
+        "/api/v1/feature-flags/evaluate",
+        json={
+            "keys": [disabled_key, unknown_key],
+            "scopes": [
+                {"scope_type": "merchant", "scope_id": merchant_id},
+                {"scope_type": "merchant", "scope_id": other_merchant_id},
+            ],
+        },
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    results = {
+        (item["key"], item["scope_id"]): item["enabled"]
+        for item in response.json()["data"]
+    }
+    assert results == {
+        (disabled_key, merchant_id): True,  # scoped override
+        (disabled_key, other_merchant_id): False,  # global flag
+        (unknown_key, merchant_id): True,  # fail-open
+        (unknown_key, other_merchant_id): True,
+    }
+
+
+async def test_evaluate_feature_flags_sees_flags_set_through_the_api(
+    admin_http_client: AsyncClient,
+) -> None:
+    # Arrange
+    key = f"test_flag_{uuid.uuid4().hex[:8]}"
+    before = await admin_http_client.post(
+        "/api/v1/feature-flags/evaluate", json={"keys": [key]}
+    )
+    assert before.json()["data"][0]["enabled"] is True
+
+    # Act
+    await admin_http_client.put(f"/api/v1/feature-flags/{key}", json={"enabled": False})
+    after = await admin_http_client.post(
+        "/api/v1/feature-flags/evaluate", json={"keys": [key]}
+    )
+
+    # Assert
+    assert after.status_code == status.HTTP_200_OK
+    assert after.json()["data"][0]["enabled"] is False
+
+
+async def test_evaluate_feature_flags_returns_422_on_missing_scope_id(
+    admin_http_client: AsyncClient,
+) -> None:
+    # Act
+    response = await admin_http_client.post(
+        "/api/v1/feature-flags/evaluate",
+        json={"keys": ["some_flag"], "scopes": [{"scope_type": "merchant"}]},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    body = response.json()
+    assert body["error"]["code"] == "FEATURE_FLAG_SCOPE_ID_REQUIRED"
@@ -32,6 +32,46 @@ async def test_list_merchants_returns_200_with_pagination(
     assert body["pagination"]["limit"] == 10
 
 
+async def test_list_merchants_counts_total_past_the_last_page(
+    admin_http_client: AsyncClient,
+) -> None:
+    # Arrange
+    await admin_http_client.post(
+        "/api/v1/merchants/",
+        json={"name": "Merchant Gamma", "default_cashback_percentage": 3.0},
+    )
+    first_page = await admin_http_client.get("/api/v1/merchants/?limit=1")
+    total = first_page.json()["pagination"]["total"]
+
+    # Act: an empty page carries no COUNT(*) OVER () row to read the total from
+    response = await admin_http_client.get(f"/api/v1/merchants/?offset={total}")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["data"] == []
+    assert body["pagination"]["total"] == total
+
+
+async def test_list_merchants_returns_null_total_when_not_requested(
+    admin_http_client: AsyncClient,
+) -> None:
+    # Arrange
+    await admin_http_client.post(
+        "/api/v1/merchants/",
+        json={"name": "Merchant Delta", "default_cashback_percentage": 3.0},
+    )
+
+    # Act
+    response = await admin_http_client.get("/api/v1/merchants/?total=skip")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["data"]
+    assert body["pagination"]["total"] is None
+
+
 async def test_list_merchants_filters_by_active_status(
     admin_http_client: AsyncClient,
 ) -> None:
@@ -60,6 +100,54 @@ async def test_list_merchants_filters_by_active_status(
     assert all(item["active"] for item in body["data"])
 
 
+async def test_list_merchants_search_ranks_closest_names_first(
+    admin_http_client: AsyncClient,
+) -> None:
+    # Arrange
+    for name in ("Zephyrbook Store", "Zephyrbooks", "Unrelated Outlet"):
+        await admin_http_client.post(
+            "/api/v1/merchants/",
+            json={"name": name, "default_cashback_percentage": 3.0},
+        )
+
+    # Act
+    response = await admin_http_client.get("/api/v1/merchants/?q=zephyrbook")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    names = [item["name"] for item in response.json()["data"]]
+    assert names[0] == "Zephyrbook Store"
+    assert "Zephyrbooks" in names
+    assert "Unrelated Outlet" not in names
+
+
+async def test_list_merchants_search_walks_pages_with_cursor(
+    admin_http_client: AsyncClient,
+) -> None:
+    # Arrange
+    for suffix in ("A", "B", "C"):
+        await admin_http_client.post(
+            "/api/v1/merchants/",
+            json={"name": f"Quillmarket {suffix}", "default_cashback_percentage": 3.0},
+        )
+
+    # Act: walk the results two at a time
+    names: list[str] = []
+    url = "/api/v1/merchants/?q=quillmarket&limit=2"
+    while url:
+        body = (await admin_http_client.get(url)).json()
+        names.extend(item["name"] for item in body["data"])
+        cursor = body["pagination"]["next_cursor"]
+        url = (
+            f"/api/v1/merchants/?q=quillmarket&limit=2&cursor={cursor}"
+            if cursor
+            else ""
+        )
+
+    # Assert
+    assert sorted(names) == ["Quillmarket A", "Quillmarket B", "Quillmarket C"]
+
+
 async def test_list_merchants_returns_401_on_unauthenticated(
     http_client: AsyncClient,
 ) -> None:
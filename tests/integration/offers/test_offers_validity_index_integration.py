@@ -0,0 +1,109 @@
+"""Plan regression: the admin listing's date filter uses ix_offers_validity."""
+
+import json
+import uuid
+from datetime import date
+from typing import Any
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.offers.models import Offer
+from app.offers.repositories import (
+    _validity_overlaps,  # pyright: ignore[reportPrivateUsage]
+)
+from app.offers.repositories import (
+    OfferRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+# Enough offers that a sequential scan is clearly the more expensive plan.
+_OFFER_COUNT = 50_000
+_FIRST_START = date(2020, 1, 1)
+
+
+async def _seed_offers(db: AsyncSession) -> None:
+    merchant_id = str(uuid.uuid4())
+    await db.execute(
+        text(
+            "INSERT INTO merchants (id, name, default_cashback_percentage, active) "
+            "VALUES (:id, :name, 5.0, true)"
+        ),
+        {"id": merchant_id, "name": f"Plan Merchant {merchant_id}"},
+    )
+    # 30-day offers whose start dates spread over about five and a half years.
+    await db.execute(
+        text(
+            "INSERT INTO offers (id, merchant_id, percentage, start_date, end_date, "
+            "monthly_cap_per_user, active) "
+            "SELECT gen_random_uuid()::text, :merchant_id, 5.0, s, s + 30, 100.0, true "
+            "FROM generate_series(1, :count) AS g, "
+            "LATERAL (SELECT CAST(:first_start AS date) + g % 2000 AS s) AS d"
+        ),
+        {
+            "merchant_id": merchant_id,
+            "first_start": _FIRST_START,
+            "count": _OFFER_COUNT,
+        },
+    )
+    await db.execute(text("ANALYZE offers"))
+
+
+async def _explain(
+    db: AsyncSession, date_from: date | None, date_to: date | None
+) -> Any:
+    stmt = select(Offer).where(_validity_overlaps(date_from, date_to))
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    return result.scalar_one()
+
+
+def _index_names(plan: Any) -> set[str]:
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    names: set[str] = set()
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            if "Index Name" in node:
+                names.add(node["Index Name"])
+            stack.extend(node.values())
+    return names
+
+
+async def test_date_window_filter_uses_validity_index(db: AsyncSession) -> None:
+    # Arrange
+    await _seed_offers(db)
+
+    # Act
+    plan = await _explain(db, date(2023, 3, 1), date(2023, 3, 7))
+
+    # Assert
+    assert "ix_offers_validity" in _index_names(plan)
+
+
+async def test_date_window_filter_matches_offers_that_overlap_it(
+    db: AsyncSession,
+) -> None:
+    # Arrange
+    await _seed_offers(db)
+    window_start, window_end = date(2023, 3, 1), date(2023, 3, 7)
+
+    # Act
+    offers, total = await OfferRepository().list_offers(
+        db, offset=0, limit=10, date_from=window_start, date_to=window_end
+    )
+
+    # Assert
+    assert total is not None and total > 0
+    for offer in offers:
+        assert offer.start_date <= window_end
+        assert offer.end_date >= window_start
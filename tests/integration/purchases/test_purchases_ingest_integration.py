@@ -20,7 +20,9 @@ _TODAY = date.today()
 _FUTURE = date.today() + timedelta(days=30)
 
 
-async def _seed_merchant_with_offer(db: AsyncSession) -> Merchant:
+async def _seed_merchant_with_offer(
+    db: AsyncSession, monthly_cap_per_user: float = 100.0
+) -> Merchant:
     """Insert an active merchant and a valid active offer into the test session."""
     merchant = Merchant(
         name=f"Purchase Merchant {uuid.uuid4().hex[:6]}",
@@ -36,7 +38,7 @@ async def _seed_merchant_with_offer(db: AsyncSession) -> Merchant:
         fixed_amount=None,
         start_date=_TODAY,
         end_date=_FUTURE,
-        monthly_cap_per_user=100.0,
+        monthly_cap_per_user=monthly_cap_per_user,
         active=True,
     )
     db.add(offer)
@@ -104,6 +106,32 @@ async def test_ingest_purchase_returns_409_on_duplicate_external_id(
     assert body["error"]["details"]["external_id"] == external_id
 
 
+async def test_ingest_purchase_caps_cashback_at_monthly_limit(
+    user_http_client_with_user: tuple[AsyncClient, User],
+    db: AsyncSession,
+) -> None:
+    # Arrange: 5% of 50.00 is 2.50 per purchase, against a 3.00 monthly cap
+    client, user = user_http_client_with_user
+    merchant = await _seed_merchant_with_offer(db, monthly_cap_per_user=3.0)
+
+    # Act
+    responses = [
+        await client.post(
+            "/api/v1/purchases/",
+            json=_payload(str(user.id), merchant.id, f"cap-{uuid.uuid4()}"),
+        )
+        for _ in range(3)
+    ]
+
+    # Assert
+    assert all(r.status_code == status.HTTP_201_CREATED for r in responses)
+    assert [Decimal(str(r.json()["cashback_amount"])) for r in responses] == [
+        Decimal("2.50"),
+        Decimal("0.50"),
+        Decimal("0.00"),
+    ]
+
+
 async def test_ingest_purchase_returns_403_on_wrong_user_id(
     user_http_client_with_user: tuple[AsyncClient, User],
     db: AsyncSession,
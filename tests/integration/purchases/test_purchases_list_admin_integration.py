@@ -1,7 +1,8 @@
 """Integration tests for GET /api/v1/purchases/ (admin)."""
 
 import uuid
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 
 import pytest
 from fastapi import status
@@ -10,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.merchants.models import Merchant
 from app.offers.models import Offer
+from app.purchases.models import Purchase
 from app.users.models import User
 
 pytestmark = pytest.mark.asyncio
@@ -83,6 +85,48 @@ async def test_list_all_purchases_returns_empty_list_when_no_purchases(
     assert body["pagination"]["total"] == 0
 
 
+async def test_list_all_purchases_walks_every_purchase_once_by_cursor(
+    admin_http_client: AsyncClient,
+    user_http_client_with_user: tuple[AsyncClient, User],
+    db: AsyncSession,
+) -> None:
+    # Arrange: three purchases, two sharing created_at to exercise the id tiebreak
+    _, user = user_http_client_with_user
+    merchant = await _seed_merchant_with_offer(db)
+    created = [datetime(2026, 1, 1, 10), datetime(2026, 1, 1, 10), datetime(2026, 1, 2)]
+    for created_at in created:
+        db.add(
+            Purchase(
+                external_id=f"ext-{uuid.uuid4()}",
+                user_id=str(user.id),
+                merchant_id=merchant.id,
+                amount=Decimal("10.00"),
+                currency="EUR",
+                created_at=created_at,
+            )
+        )
+    await db.flush()
+
+    # Act: first page by offset, then follow next_cursor until it runs out
+    seen: list[str] = []
+    response = await admin_http_client.get("/api/v1/purchases/?limit=2")
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        seen.extend(item["id"] for item in body["data"])
+        next_cursor = body["pagination"]["next_cursor"]
+        if next_cursor is None:
+            break
+        response = await admin_http_client.get(
+            "/api/v1/purchases/", params={"limit": 2, "cursor": next_cursor}
+        )
+
+    # Assert
+    assert len(seen) == 3
+    assert len(set(seen)) == 3
+    assert body["pagination"]["total"] is None
+
+
 async def test_list_all_purchases_returns_401_for_non_admin(
     user_http_client: AsyncClient,
 ) -> None:
@@ -95,3 +95,33 @@ async def test_list_user_purchases_returns_401_on_unauthenticated(
 
     # Assert
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_list_user_purchases_total_follows_purchase_counters(
+    user_http_client_with_user: tuple[AsyncClient, User],
+    db: AsyncSession,
+) -> None:
+    # Arrange: ingest two purchases, which count as pending
+    client, user = user_http_client_with_user
+    merchant = await _seed_merchant_with_offer(db)
+    for _ in range(2):
+        await client.post(
+            "/api/v1/purchases/",
+            json={
+                "external_id": f"ext-{uuid.uuid4()}",
+                "user_id": str(user.id),
+                "merchant_id": merchant.id,
+                "amount": "10.00",
+                "currency": "EUR",
+            },
+        )
+
+    # Act
+    all_response = await client.get("/api/v1/users/me/purchases")
+    pending_response = await client.get("/api/v1/users/me/purchases?status=pending")
+    confirmed_response = await client.get("/api/v1/users/me/purchases?status=confirmed")
+
+    # Assert
+    assert all_response.json()["pagination"]["total"] == 2
+    assert pending_response.json()["pagination"]["total"] == 2
+    assert confirmed_response.json()["pagination"]["total"] == 0
@@ -0,0 +1,118 @@
+"""Unit tests for make_purge_refresh_tokens_task.
+
+Module under test: app.auth.jobs.purge_refresh_tokens
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.jobs.purge_refresh_tokens import make_purge_refresh_tokens_task
+from app.auth.repositories import RefreshTokenRepositoryABC
+from app.core.scheduler import ScheduledTask
+
+_NOW = datetime(2026, 3, 28, 12, 0, tzinfo=timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_session_factory() -> tuple[async_sessionmaker[AsyncSession], AsyncMock]:
+    session = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return (
+        cast(async_sessionmaker[AsyncSession], MagicMock(return_value=session)),
+        session,
+    )
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    return create_autospec(RefreshTokenRepositoryABC)
+
+
+def _make_task(
+    repository: MagicMock,
+    factory: async_sessionmaker[AsyncSession],
+    sleep: AsyncMock,
+) -> ScheduledTask:
+    return make_purge_refresh_tokens_task(
+        repository=repository,
+        db_session_factory=factory,
+        batch_size=2,
+        pause_seconds=0.5,
+        used_retention=timedelta(hours=24),
+        now_provider=lambda: _NOW,
+        sleep=sleep,
+    )
+
+
+# ---------------------------------------------------------------------------
+# make_purge_refresh_tokens_task
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_in_keyset_batches_until_a_short_batch(
+    repository: MagicMock,
+) -> None:
+    # Arrange
+    factory, session = _make_session_factory()
+    sleep = AsyncMock()
+    repository.delete_stale_batch.side_effect = [["b", "a"], ["d", "c"], ["e"]]
+    task = _make_task(repository, factory, sleep)
+
+    # Act
+    await task()
+
+    # Assert
+    after_ids = [
+        call.kwargs["after_id"] for call in repository.delete_stale_batch.call_args_list
+    ]
+    assert after_ids == [None, "b", "d"]
+    assert session.commit.await_count == 3
+    repository.delete_stale_batch.assert_called_with(
+        session,
+        now=_NOW,
+        used_before=_NOW - timedelta(hours=24),
+        after_id="d",
+        batch_size=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_purge_pauses_between_full_batches_only(repository: MagicMock) -> None:
+    # Arrange
+    factory, _ = _make_session_factory()
+    sleep = AsyncMock()
+    repository.delete_stale_batch.side_effect = [["a", "b"], ["c", "d"], []]
+    task = _make_task(repository, factory, sleep)
+
+    # Act
+    await task()
+
+    # Assert
+    assert sleep.await_count == 2
+    sleep.assert_awaited_with(0.5)
+
+
+@pytest.mark.asyncio
+async def test_purge_swallows_errors_so_the_schedule_keeps_running(
+    repository: MagicMock,
+) -> None:
+    # Arrange
+    factory, session = _make_session_factory()
+    repository.delete_stale_batch.side_effect = RuntimeError("db down")
+    task = _make_task(repository, factory, AsyncMock())
+
+    # Act
+    await task()
+
+    # Assert
+    session.commit.assert_not_awaited()
@@ -14,10 +14,17 @@ from app.auth.exceptions import (
 )
 from app.auth.models import TokenResponse
 from app.auth.services import AuthService
+from app.core.current_user import get_current_admin_user
 from app.core.database import get_async_db
 from app.core.errors.codes import ErrorCode
+from app.core.password_hashing import (
+    PasswordHasher,
+    PasswordHashingBusyException,
+    PasswordHashingStats,
+)
 from app.core.unit_of_work import UnitOfWorkABC
 from app.main import app
+from app.users.composition import get_password_hasher_pool
 
 
 @pytest.fixture
@@ -104,6 +111,11 @@ def test_login_returns_200_on_success(
             status.HTTP_401_UNAUTHORIZED,
             ErrorCode.INVALID_CREDENTIALS,
         ),
+        (
+            PasswordHashingBusyException(retry_after_seconds=1),
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            ErrorCode.SERVICE_UNAVAILABLE,
+        ),
         (
             Exception("Something broke"),
             status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -192,3 +204,38 @@ def test_refresh_returns_error_on_exception(
     # Assert
     assert response.status_code == expected_status
     _assert_error_payload(response.json(), expected_code)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# GET /api/v1/auth/password-hashing
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_get_password_hashing_stats_returns_200_with_stats(
+    client: TestClient,
+) -> None:
+    # Arrange
+    password_hasher = create_autospec(PasswordHasher, instance=True)
+    password_hasher.stats.return_value = PasswordHashingStats(
+        max_workers=4,
+        max_queue=64,
+        in_flight=2,
+        waiting=5,
+        peak_waiting=9,
+        completed=120,
+        rejected=3,
+        wait_ewma_ms=41.5,
+        run_ewma_ms=230.0,
+    )
+    app.dependency_overrides[get_password_hasher_pool] = lambda: password_hasher
+    app.dependency_overrides[get_current_admin_user] = lambda: Mock()
+
+    # Act
+    response = client.get("/api/v1/auth/password-hashing")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["waiting"] == 5
+    assert data["peak_waiting"] == 9
+    assert data["rejected"] == 3
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
 from unittest.mock import AsyncMock, Mock, create_autospec
 
@@ -42,8 +42,8 @@ def refresh_token_repository() -> Mock:
 
 
 @pytest.fixture
-def verify_password() -> Mock:
-    return Mock()
+def verify_password() -> AsyncMock:
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -145,7 +145,6 @@ async def test_login_calls_enforce_password_valid_policy(
 async def test_refresh_returns_new_tokens_on_success(
     auth_service: AuthService,
     uow: Mock,
-    users_client: Mock,
     token_provider: Mock,
     refresh_token_repository: Mock,
     user_factory: Callable[..., Any],
@@ -163,19 +162,8 @@ async def test_refresh_returns_new_tokens_on_success(
     token_provider.create_refresh_token.return_value = "new_refresh_token"
 
     # Mock repository methods
-    refresh_token_repository.get_by_hash = AsyncMock(
-        return_value=Mock(
-            id="token_id",
-            user_id=user.id,
-            is_expired=Mock(return_value=False),
-            is_used=Mock(return_value=False),
-        )
-    )
-    refresh_token_repository.mark_as_used = AsyncMock()
-    refresh_token_repository.create = AsyncMock()
-
-    # Mock users client
-    users_client.get_user_by_id = AsyncMock(return_value=user)
+    refresh_token_repository.consume = AsyncMock(return_value=user.id)
+    refresh_token_repository.issue = AsyncMock(return_value=user.role)
 
     # Act
     response = await auth_service.refresh(refresh_token, uow)
@@ -185,11 +173,45 @@ async def test_refresh_returns_new_tokens_on_success(
     assert response.access_token == "new_access_token"
     assert response.refresh_token == "new_refresh_token"
     assert response.token_type == "bearer"
-    refresh_token_repository.mark_as_used.assert_called_once()
-    refresh_token_repository.create.assert_called_once()
+    refresh_token_repository.consume.assert_called_once()
+    refresh_token_repository.issue.assert_called_once()
     uow.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_refresh_rotates_without_reading_token_or_user(
+    auth_service: AuthService,
+    uow: Mock,
+    users_client: Mock,
+    token_provider: Mock,
+    refresh_token_repository: Mock,
+    user_factory: Callable[..., Any],
+) -> None:
+    # Arrange
+    user = user_factory()
+    token_provider.verify_refresh_token.return_value = user.id
+    token_provider.hash_refresh_token.side_effect = ["old_hash", "new_hash"]
+    token_provider.refresh_ttl_in_minutes = 60
+    token_provider.create_refresh_token.return_value = "new_refresh_token"
+    refresh_token_repository.consume = AsyncMock(return_value=user.id)
+    refresh_token_repository.issue = AsyncMock(return_value=user.role)
+
+    # Act
+    await auth_service.refresh("valid_refresh_token", uow)
+
+    # Assert
+    consume_args = refresh_token_repository.consume.call_args.args
+    assert consume_args[1] == "old_hash"
+    issue_kwargs = refresh_token_repository.issue.call_args.kwargs
+    assert issue_kwargs["user_id"] == user.id
+    assert issue_kwargs["token_hash"] == "new_hash"
+    assert issue_kwargs["expires_at"] - issue_kwargs["issued_at"] == timedelta(
+        minutes=60
+    )
+    refresh_token_repository.get_by_hash.assert_not_called()
+    users_client.get_user_by_id.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_refresh_raises_on_invalid_token_signature(
     auth_service: AuthService,
@@ -219,11 +241,13 @@ async def test_refresh_enforces_refresh_token_exists_policy(
 
     token_provider.verify_refresh_token.return_value = user_id
     token_provider.hash_refresh_token.return_value = token_hash
+    refresh_token_repository.consume = AsyncMock(return_value=None)
     refresh_token_repository.get_by_hash = AsyncMock(return_value=None)
 
     # Act & Assert — policy will raise the exception
     with pytest.raises(InvalidRefreshTokenException):
         await auth_service.refresh(refresh_token, uow)
+    refresh_token_repository.issue.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -247,6 +271,7 @@ async def test_refresh_enforces_refresh_token_not_expired_policy(
 
     token_provider.verify_refresh_token.return_value = user_id
     token_provider.hash_refresh_token.return_value = token_hash
+    refresh_token_repository.consume = AsyncMock(return_value=None)
     refresh_token_repository.get_by_hash = AsyncMock(return_value=mock_token)
 
     # Act & Assert — policy will raise the exception
@@ -275,6 +300,7 @@ async def test_refresh_enforces_refresh_token_not_used_policy(
 
     token_provider.verify_refresh_token.return_value = user_id
     token_provider.hash_refresh_token.return_value = token_hash
+    refresh_token_repository.consume = AsyncMock(return_value=None)
     refresh_token_repository.get_by_hash = AsyncMock(return_value=mock_token)
 
     # Act & Assert — policy will raise the exception
@@ -282,31 +308,52 @@ async def test_refresh_enforces_refresh_token_not_used_policy(
         await auth_service.refresh(refresh_token, uow)
 
 
+@pytest.mark.asyncio
+async def test_refresh_raises_when_token_is_consumed_concurrently(
+    auth_service: AuthService,
+    uow: Mock,
+    token_provider: Mock,
+    refresh_token_repository: Mock,
+) -> None:
+    # Arrange: the update matched nothing, yet the token now reads as valid
+    user_id = "user-123"
+    token_provider.verify_refresh_token.return_value = user_id
+    token_provider.hash_refresh_token.return_value = "hashed_token"
+    refresh_token_repository.consume = AsyncMock(return_value=None)
+    refresh_token_repository.get_by_hash = AsyncMock(
+        return_value=Mock(
+            user_id=user_id,
+            is_expired=Mock(return_value=False),
+            is_used=Mock(return_value=False),
+        )
+    )
+
+    # Act & Assert
+    with pytest.raises(InvalidRefreshTokenException):
+        await auth_service.refresh("raced_token", uow)
+    uow.commit.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_refresh_enforces_user_exists_for_refresh_policy(
     auth_service: AuthService,
     uow: Mock,
     token_provider: Mock,
     refresh_token_repository: Mock,
-    users_client: Mock,
 ) -> None:
     # Arrange
     refresh_token = "valid_token"
     user_id = "user-123"
     token_hash = "hashed_token"
 
-    mock_token = Mock(
-        id="token_id",
-        user_id=user_id,
-        is_expired=Mock(return_value=False),
-        is_used=Mock(return_value=False),
-    )
-
     token_provider.verify_refresh_token.return_value = user_id
     token_provider.hash_refresh_token.return_value = token_hash
-    refresh_token_repository.get_by_hash = AsyncMock(return_value=mock_token)
-    users_client.get_user_by_id = AsyncMock(return_value=None)
+    token_provider.refresh_ttl_in_minutes = 43200
+    token_provider.create_refresh_token.return_value = "new_refresh_token"
+    refresh_token_repository.consume = AsyncMock(return_value=user_id)
+    refresh_token_repository.issue = AsyncMock(return_value=None)
 
     # Act & Assert — policy will raise the exception
     with pytest.raises(InvalidRefreshTokenException):
         await auth_service.refresh(refresh_token, uow)
+    uow.commit.assert_not_called()
@@ -1,5 +1,10 @@
+import hashlib
+import time
+from typing import Any
+
 import pytest
 
+from app.auth import token_provider as token_provider_module
 from app.auth.exceptions import (
     ExpiredRefreshTokenException,
     ExpiredTokenException,
@@ -8,6 +13,7 @@ from app.auth.exceptions import (
 )
 from app.auth.models import TokenPayload
 from app.auth.token_provider import JwtOAuth2TokenProvider
+from app.core.cache import TTLCache
 
 
 # Fixtures
@@ -16,6 +22,18 @@ def token_provider() -> JwtOAuth2TokenProvider:
     return JwtOAuth2TokenProvider()
 
 
+@pytest.fixture
+def verified_token_cache() -> TTLCache[bytes, Any]:
+    return TTLCache(max_size=10, ttl_seconds=900)
+
+
+@pytest.fixture
+def cached_token_provider(
+    verified_token_cache: TTLCache[bytes, Any],
+) -> JwtOAuth2TokenProvider:
+    return JwtOAuth2TokenProvider(verified_token_cache=verified_token_cache)
+
+
 @pytest.fixture
 def token_payload() -> TokenPayload:
     return TokenPayload(
@@ -67,6 +85,88 @@ def test_token_provider_raises_on_invalid_token(
         token_provider.verify_access_token(invalid_token)
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# JwtOAuth2TokenProvider - Verified Token Cache
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _count_decodes(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    decode = token_provider_module.jwt.decode
+
+    def counting_decode(token: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(token_provider_module.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_verify_access_token_serves_repeat_tokens_from_cache(
+    cached_token_provider: JwtOAuth2TokenProvider,
+    token_payload: TokenPayload,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    token = cached_token_provider.create_access_token(token_payload)
+    decodes = _count_decodes(monkeypatch)
+
+    # Act
+    first = cached_token_provider.verify_access_token(token)
+    second = cached_token_provider.verify_access_token(token)
+
+    # Assert
+    assert first == second == token_payload
+    assert len(decodes) == 1
+
+
+def test_verify_access_token_never_serves_cached_entry_past_exp(
+    cached_token_provider: JwtOAuth2TokenProvider,
+    verified_token_cache: TTLCache[bytes, Any],
+    token_payload: TokenPayload,
+) -> None:
+    # Arrange: an expired token whose entry was cached while it was valid
+    cached_token_provider.access_ttl_in_minutes = -1
+    token = cached_token_provider.create_access_token(token_payload)
+    digest = hashlib.sha256(token.encode()).digest()
+    verified_token_cache.set(digest, (token_payload, time.time() - 1))
+
+    # Act & Assert
+    with pytest.raises(ExpiredTokenException):
+        cached_token_provider.verify_access_token(token)
+    assert verified_token_cache.get(digest) is None
+
+
+def test_verify_access_token_does_not_cache_rejected_tokens(
+    cached_token_provider: JwtOAuth2TokenProvider,
+    verified_token_cache: TTLCache[bytes, Any],
+) -> None:
+    # Act
+    with pytest.raises(InternalJwtErrorException):
+        cached_token_provider.verify_access_token("not.a.valid.token")
+
+    # Assert
+    assert verified_token_cache.stats().size == 0
+
+
+def test_verify_access_token_caches_entry_until_token_exp(
+    cached_token_provider: JwtOAuth2TokenProvider,
+    verified_token_cache: TTLCache[bytes, Any],
+    token_payload: TokenPayload,
+) -> None:
+    # Arrange
+    token = cached_token_provider.create_access_token(token_payload)
+
+    # Act
+    cached_token_provider.verify_access_token(token)
+
+    # Assert
+    digest = hashlib.sha256(token.encode()).digest()
+    _, expires_at = verified_token_cache.get(digest)
+    expected = time.time() + cached_token_provider.access_ttl_in_minutes * 60
+    assert expires_at == pytest.approx(expected, abs=5)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # JwtOAuth2TokenProvider - Refresh Token Methods
 # ──────────────────────────────────────────────────────────────────────────────
@@ -201,3 +201,46 @@ def test_calculate_returns_zero_for_zero_purchase_amount(
 
     # Assert
     assert result.cashback_amount == Decimal("0.00")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# CashbackCalculator.calculate — remaining monthly cap
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "fixed_amount, remaining_cap, expected",
+    [
+        (None, Decimal("100.00"), Decimal("15.00")),
+        (None, Decimal("4.50"), Decimal("4.50")),
+        (8.0, Decimal("3.00"), Decimal("3.00")),
+        (None, Decimal("0"), Decimal("0.00")),
+        (None, Decimal("-2.00"), Decimal("0.00")),
+        (None, Decimal("7.339"), Decimal("7.33")),
+    ],
+    ids=[
+        "cap_not_reached",
+        "percentage_clamped",
+        "fixed_clamped",
+        "cap_exhausted",
+        "cap_overdrawn",
+        "cap_rounded_down",
+    ],
+)
+def test_calculate_clamps_cashback_to_remaining_cap(
+    calculator: CashbackCalculator,
+    fixed_amount: float | None,
+    remaining_cap: Decimal,
+    expected: Decimal,
+) -> None:
+    # Act
+    result = calculator.calculate(
+        offer_id="f0e1d2c3-b4a5-4678-9012-3456789abcde",
+        percentage=10.0,
+        fixed_amount=fixed_amount,
+        purchase_amount=Decimal("150.00"),
+        remaining_cap=remaining_cap,
+    )
+
+    # Assert
+    assert result.cashback_amount == expected
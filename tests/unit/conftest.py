@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Callable
 
@@ -116,7 +116,7 @@ def purchase_factory() -> Callable[..., Purchase]:
             "cashback_amount": Decimal("0"),
             "currency": "EUR",
             "status": "pending",
-            "created_at": "2026-03-01T10:00:00",
+            "created_at": datetime(2026, 3, 1, 10, 0, 0),
         }
         defaults.update(kwargs)
         return Purchase(**defaults)
@@ -0,0 +1,228 @@
+import asyncio
+
+import pytest
+
+from app.core.admission import AdaptiveAdmissionController, AdmissionRejectedException
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_controller(
+    clock: _FakeClock | None = None,
+    *,
+    initial_limit: int = 1,
+    min_limit: int = 1,
+    max_limit: int = 4,
+    max_queue: int = 1,
+    max_queue_wait_ms: int = 1000,
+    target_latency_ms: int = 100,
+) -> AdaptiveAdmissionController:
+    return AdaptiveAdmissionController(
+        initial_limit=initial_limit,
+        min_limit=min_limit,
+        max_limit=max_limit,
+        max_queue=max_queue,
+        max_queue_wait_ms=max_queue_wait_ms,
+        target_latency_ms=target_latency_ms,
+        decrease_factor=0.5,
+        retry_after_seconds=2,
+        clock=clock or _FakeClock(),
+    )
+
+
+async def _hold_slot(
+    controller: AdaptiveAdmissionController,
+    entered: asyncio.Event,
+    release: asyncio.Event,
+) -> None:
+    async with controller.slot():
+        entered.set()
+        await release.wait()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# AdaptiveAdmissionController — admission and rejection
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_init_rejects_inconsistent_limits() -> None:
+    # Act & Assert
+    with pytest.raises(ValueError):
+        _make_controller(initial_limit=5, max_limit=4)
+
+
+@pytest.mark.asyncio
+async def test_slot_admits_immediately_below_limit() -> None:
+    # Arrange
+    controller = _make_controller()
+
+    # Act
+    async with controller.slot():
+        stats = controller.stats()
+
+    # Assert
+    assert stats.in_flight == 1
+    assert controller.stats().in_flight == 0
+    assert controller.stats().admitted == 1
+
+
+@pytest.mark.asyncio
+async def test_slot_rejects_when_queue_full() -> None:
+    # Arrange
+    controller = _make_controller(max_queue=0)
+    entered, release = asyncio.Event(), asyncio.Event()
+    holder = asyncio.create_task(_hold_slot(controller, entered, release))
+    await entered.wait()
+
+    # Act & Assert
+    with pytest.raises(AdmissionRejectedException) as exc_info:
+        async with controller.slot():
+            pass
+    assert exc_info.value.reason == "queue_full"
+    assert exc_info.value.retry_after_seconds == 2
+    assert controller.stats().rejected == 1
+
+    release.set()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_slot_rejects_after_queue_wait_deadline() -> None:
+    # Arrange
+    controller = _make_controller(max_queue_wait_ms=10)
+    entered, release = asyncio.Event(), asyncio.Event()
+    holder = asyncio.create_task(_hold_slot(controller, entered, release))
+    await entered.wait()
+
+    # Act & Assert
+    with pytest.raises(AdmissionRejectedException) as exc_info:
+        async with controller.slot():
+            pass
+    assert exc_info.value.reason == "queue_timeout"
+    assert controller.stats().waiting == 0
+
+    release.set()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_slot_grants_waiters_in_arrival_order_on_release() -> None:
+    # Arrange
+    controller = _make_controller(max_queue=2)
+    entered, release = asyncio.Event(), asyncio.Event()
+    holder = asyncio.create_task(_hold_slot(controller, entered, release))
+    await entered.wait()
+    order: list[str] = []
+
+    async def waiter(name: str) -> None:
+        async with controller.slot():
+            order.append(name)
+
+    first = asyncio.create_task(waiter("first"))
+    second = asyncio.create_task(waiter("second"))
+    await asyncio.sleep(0)
+    assert controller.stats().waiting == 2
+
+    # Act
+    release.set()
+    await asyncio.gather(holder, first, second)
+
+    # Assert
+    assert order == ["first", "second"]
+    assert controller.stats().in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_cancelled_waiter_does_not_leak_a_slot() -> None:
+    # Arrange
+    controller = _make_controller()
+    entered, release = asyncio.Event(), asyncio.Event()
+    holder = asyncio.create_task(_hold_slot(controller, entered, release))
+    await entered.wait()
+
+    async def waiter() -> None:
+        async with controller.slot():
+            pass
+
+    waiting = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+
+    # Act
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    release.set()
+    await holder
+
+    # Assert
+    stats = controller.stats()
+    assert stats.in_flight == 0
+    assert stats.waiting == 0
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# AdaptiveAdmissionController — limit adaptation
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+async def _run_request(
+    controller: AdaptiveAdmissionController, clock: _FakeClock, latency_ms: float
+) -> None:
+    async with controller.slot():
+        clock.now += latency_ms / 1000
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_stays_under_target() -> None:
+    # Arrange
+    clock = _FakeClock()
+    controller = _make_controller(clock, initial_limit=1, max_limit=3)
+
+    # Act
+    for _ in range(10):
+        await _run_request(controller, clock, latency_ms=10)
+
+    # Assert — additive increase, capped at max_limit
+    assert controller.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_limit_shrinks_once_per_interval_when_latency_exceeds_target() -> None:
+    # Arrange
+    clock = _FakeClock()
+    controller = _make_controller(
+        clock, initial_limit=4, min_limit=1, target_latency_ms=100
+    )
+    clock.now = 10.0
+
+    # Act — first slow completion halves the limit
+    await _run_request(controller, clock, latency_ms=400)
+    after_first = controller.limit
+    # A completion within the same target interval is the same congestion signal
+    async with controller.slot():
+        pass
+
+    # Assert
+    assert after_first == 2
+    assert controller.limit == 2
+    assert controller.stats().latency_ewma_ms > 100
+
+
+@pytest.mark.asyncio
+async def test_limit_never_drops_below_min_limit() -> None:
+    # Arrange
+    clock = _FakeClock()
+    controller = _make_controller(clock, initial_limit=2, min_limit=2)
+
+    # Act
+    for _ in range(5):
+        await _run_request(controller, clock, latency_ms=500)
+
+    # Assert
+    assert controller.limit == 2
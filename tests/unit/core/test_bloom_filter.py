@@ -0,0 +1,62 @@
+import pytest
+
+from app.core.bloom_filter import BloomFilter
+
+
+def test_bloom_filter_contains_every_added_item() -> None:
+    # Arrange
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"txn_{i}" for i in range(1000)]
+
+    # Act
+    for item in items:
+        bloom.add(item)
+
+    # Assert — Bloom filters never produce false negatives
+    assert all(item in bloom for item in items)
+    assert len(bloom) == 1000
+
+
+def test_bloom_filter_false_positive_rate_stays_near_target_at_capacity() -> None:
+    # Arrange
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"txn_{i}")
+
+    # Act
+    false_positives = sum(f"other_{i}" in bloom for i in range(10_000))
+
+    # Assert — generous bound: 1% target, 10k probes
+    assert false_positives / 10_000 < 0.02
+
+
+def test_bloom_filter_sizes_bits_and_hashes_from_capacity_and_error_rate() -> None:
+    # Act
+    bloom = BloomFilter(capacity=1_000_000, error_rate=0.01)
+
+    # Assert — ~9.6 bits per item and 7 hashes for a 1% target
+    assert bloom.bit_count == 9_585_059
+    assert bloom.hash_count == 7
+    assert bloom.size_bytes == 1_198_133
+
+
+def test_bloom_filter_empty_has_no_members() -> None:
+    # Arrange
+    bloom = BloomFilter(capacity=10, error_rate=0.01)
+
+    # Assert
+    assert "txn_1" not in bloom
+    assert bloom.estimated_false_positive_rate() == 0.0
+
+
+@pytest.mark.parametrize(
+    "capacity, error_rate",
+    [(0, 0.01), (10, 0.0), (10, 1.0)],
+    ids=["zero_capacity", "zero_error_rate", "error_rate_one"],
+)
+def test_bloom_filter_rejects_invalid_parameters(
+    capacity: int, error_rate: float
+) -> None:
+    # Act & Assert
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=capacity, error_rate=error_rate)
@@ -0,0 +1,269 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import TTLCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_cache(
+    clock: _FakeClock | None = None, *, max_size: int = 2, ttl_seconds: float = 10
+) -> TTLCache[str, str]:
+    return TTLCache(
+        max_size=max_size, ttl_seconds=ttl_seconds, clock=clock or _FakeClock()
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# TTLCache — lookups and expiry
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_init_rejects_non_positive_max_size() -> None:
+    # Act & Assert
+    with pytest.raises(ValueError):
+        _make_cache(max_size=0)
+
+
+def test_get_returns_value_and_counts_hits_and_misses() -> None:
+    # Arrange
+    cache = _make_cache()
+    cache.set("a", "alpha")
+
+    # Act
+    hit = cache.get("a")
+    miss = cache.get("b")
+
+    # Assert
+    assert hit == "alpha"
+    assert miss is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.hit_ratio) == (1, 1, 0.5)
+
+
+def test_get_drops_entry_once_ttl_has_passed() -> None:
+    # Arrange
+    clock = _FakeClock()
+    cache = _make_cache(clock, ttl_seconds=10)
+    cache.set("a", "alpha")
+
+    # Act
+    clock.now = 10.0
+    result = cache.get("a")
+
+    # Assert
+    assert result is None
+    assert cache.stats().size == 0
+
+
+def test_get_many_splits_cached_values_from_missing_keys() -> None:
+    # Arrange
+    cache = _make_cache()
+    cache.set("a", "alpha")
+
+    # Act
+    found, missing = cache.get_many(["a", "b"])
+
+    # Assert
+    assert found == {"a": "alpha"}
+    assert missing == ["b"]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# TTLCache — bounds and invalidation
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_set_evicts_least_recently_used_entry_when_full() -> None:
+    # Arrange
+    cache = _make_cache(max_size=2)
+    cache.set("a", "alpha")
+    cache.set("b", "beta")
+    cache.get("a")  # "b" is now the least recently used
+
+    # Act
+    cache.set("c", "gamma")
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == "alpha"
+    assert cache.stats().evictions == 1
+
+
+def test_invalidate_removes_entry_and_counts_it() -> None:
+    # Arrange
+    cache = _make_cache()
+    cache.set("a", "alpha")
+
+    # Act
+    cache.invalidate("a")
+    cache.invalidate("missing")
+
+    # Assert
+    assert cache.get("a") is None
+    assert cache.stats().invalidations == 1
+
+
+def test_clear_removes_every_entry() -> None:
+    # Arrange
+    cache = _make_cache()
+    cache.set("a", "alpha")
+    cache.set("b", "beta")
+
+    # Act
+    cache.clear()
+
+    # Assert
+    stats = cache.stats()
+    assert stats.size == 0
+    assert stats.invalidations == 2
+
+
+def test_invalidate_where_removes_only_matching_entries() -> None:
+    # Arrange
+    cache = _make_cache(max_size=3)
+    cache.set("a:1", "alpha")
+    cache.set("a:2", "alpha-2")
+    cache.set("b:1", "beta")
+
+    # Act
+    cache.invalidate_where(lambda key: key.startswith("a:"))
+
+    # Assert
+    assert cache.get("a:1") is None
+    assert cache.get("a:2") is None
+    assert cache.get("b:1") == "beta"
+    assert cache.stats().invalidations == 2
+
+
+def test_generation_advances_on_every_invalidation_but_not_on_set() -> None:
+    # Arrange
+    cache = _make_cache()
+    start = cache.generation
+
+    # Act
+    cache.set("a", "alpha")
+    after_set = cache.generation
+    cache.invalidate("missing")
+    cache.invalidate_where(lambda key: False)
+    cache.clear()
+
+    # Assert
+    assert after_set == start
+    assert cache.generation == start + 3
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# TTLCache — single-flight loading
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_loads_once_and_caches_the_value() -> None:
+    # Arrange
+    cache = _make_cache()
+    calls: list[str] = []
+
+    async def loader() -> str:
+        calls.append("load")
+        return "alpha"
+
+    # Act
+    first = await cache.get_or_load("a", loader)
+    second = await cache.get_or_load("a", loader)
+
+    # Assert
+    assert (first, second) == ("alpha", "alpha")
+    assert calls == ["load"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_caches_none_results() -> None:
+    # Arrange
+    cache: TTLCache[str, str | None] = TTLCache(max_size=2, ttl_seconds=10)
+    calls: list[str] = []
+
+    async def loader() -> None:
+        calls.append("load")
+        return None
+
+    # Act
+    await cache.get_or_load("a", loader)
+    result = await cache.get_or_load("a", loader)
+
+    # Assert
+    assert result is None
+    assert calls == ["load"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_shares_one_load_between_concurrent_misses() -> None:
+    # Arrange
+    cache = _make_cache()
+    release = asyncio.Event()
+    calls: list[str] = []
+
+    async def loader() -> str:
+        calls.append("load")
+        await release.wait()
+        return "alpha"
+
+    # Act
+    tasks = [asyncio.create_task(cache.get_or_load("a", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    # Assert
+    assert results == ["alpha", "alpha", "alpha"]
+    assert calls == ["load"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_propagates_failure_without_caching_it() -> None:
+    # Arrange
+    cache = _make_cache()
+
+    async def failing() -> str:
+        raise RuntimeError("db down")
+
+    async def loader() -> str:
+        return "alpha"
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("a", failing)
+    assert await cache.get_or_load("a", loader) == "alpha"
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_does_not_cache_a_load_overlapping_invalidation() -> None:
+    # Arrange
+    cache = _make_cache()
+    release = asyncio.Event()
+
+    async def stale_loader() -> str:
+        await release.wait()
+        return "stale"
+
+    async def fresh_loader() -> str:
+        return "fresh"
+
+    # Act
+    task = asyncio.create_task(cache.get_or_load("a", stale_loader))
+    await asyncio.sleep(0)
+    cache.invalidate("a")
+    release.set()
+    stale = await task
+    fresh = await cache.get_or_load("a", fresh_loader)
+
+    # Assert — the in-flight caller still gets its result, but it is not kept
+    assert stale == "stale"
+    assert fresh == "fresh"
@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Any, Callable
 from unittest.mock import AsyncMock, Mock, create_autospec
 
 import pytest
@@ -6,6 +6,7 @@ import pytest
 from app.auth.exceptions import InvalidTokenException, UserInactiveException
 from app.auth.models import TokenPayload
 from app.auth.token_provider import OAuth2TokenProviderABC
+from app.core.cache import TTLCache
 from app.core.current_user import get_current_admin_user, get_current_user
 from app.users.models import User, UserRoleEnum
 from app.users.repositories import UserRepositoryABC
@@ -26,6 +27,11 @@ def user_repository() -> Mock:
     return create_autospec(UserRepositoryABC)
 
 
+@pytest.fixture
+def principal_cache() -> TTLCache[str, Any]:
+    return TTLCache(max_size=10, ttl_seconds=60)
+
+
 def build_token_payload(user_role: UserRoleEnum = UserRoleEnum.user) -> TokenPayload:
     return TokenPayload(user_id="admin123", user_role=user_role.value)
 
@@ -40,6 +46,7 @@ async def test_get_current_user_returns_user_on_valid_token(
     db: AsyncMock,
     token_provider: Mock,
     user_repository: Mock,
+    principal_cache: TTLCache[str, Any],
     user_factory: Callable[..., User],
 ) -> None:
     # Arrange
@@ -53,10 +60,13 @@ async def test_get_current_user_returns_user_on_valid_token(
         db=db,
         token_provider=token_provider,
         user_repository=user_repository,
+        principal_cache=principal_cache,
     )
 
     # Assert
-    assert result == user
+    assert result.id == user.id
+    assert result.role == user.role
+    assert result.active is True
 
 
 @pytest.mark.asyncio
@@ -64,6 +74,7 @@ async def test_get_current_user_raises_on_user_not_found(
     db: AsyncMock,
     token_provider: Mock,
     user_repository: Mock,
+    principal_cache: TTLCache[str, Any],
 ) -> None:
     # Arrange
     token_provider.verify_access_token.return_value = build_token_payload()
@@ -76,6 +87,7 @@ async def test_get_current_user_raises_on_user_not_found(
             db=db,
             token_provider=token_provider,
             user_repository=user_repository,
+            principal_cache=principal_cache,
         )
 
 
@@ -84,6 +96,7 @@ async def test_get_current_user_raises_on_inactive_user(
     db: AsyncMock,
     token_provider: Mock,
     user_repository: Mock,
+    principal_cache: TTLCache[str, Any],
     user_factory: Callable[..., User],
 ) -> None:
     # Arrange
@@ -100,6 +113,73 @@ async def test_get_current_user_raises_on_inactive_user(
             db=db,
             token_provider=token_provider,
             user_repository=user_repository,
+            principal_cache=principal_cache,
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_serves_repeat_requests_from_principal_cache(
+    db: AsyncMock,
+    token_provider: Mock,
+    user_repository: Mock,
+    principal_cache: TTLCache[str, Any],
+    user_factory: Callable[..., User],
+) -> None:
+    # Arrange
+    user = user_factory(id="admin123", role=UserRoleEnum.admin, active=True)
+    token_provider.verify_access_token.return_value = build_token_payload(user.role)
+    user_repository.get_user_by_id.return_value = user
+
+    # Act
+    for _ in range(3):
+        result = await get_current_user(
+            token="token",
+            db=db,
+            token_provider=token_provider,
+            user_repository=user_repository,
+            principal_cache=principal_cache,
+        )
+
+    # Assert
+    assert result.id == "admin123"
+    user_repository.get_user_by_id.assert_awaited_once_with(db, "admin123")
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_user_deactivated_after_invalidation(
+    db: AsyncMock,
+    token_provider: Mock,
+    user_repository: Mock,
+    principal_cache: TTLCache[str, Any],
+    user_factory: Callable[..., User],
+) -> None:
+    # Arrange: the active principal is cached by a first request
+    token_provider.verify_access_token.return_value = build_token_payload()
+    user_repository.get_user_by_id.return_value = user_factory(
+        id="admin123", role=UserRoleEnum.user, active=True
+    )
+    await get_current_user(
+        token="token",
+        db=db,
+        token_provider=token_provider,
+        user_repository=user_repository,
+        principal_cache=principal_cache,
+    )
+    user_repository.get_user_by_id.return_value = user_factory(
+        id="admin123", role=UserRoleEnum.user, active=False
+    )
+
+    # Act
+    principal_cache.invalidate("admin123")
+
+    # Assert
+    with pytest.raises(UserInactiveException):
+        await get_current_user(
+            token="token",
+            db=db,
+            token_provider=token_provider,
+            user_repository=user_repository,
+            principal_cache=principal_cache,
         )
 
 
@@ -0,0 +1,71 @@
+import pytest
+
+from app.core.http_cache import (
+    PRIVATE_REVALIDATE,
+    conditional_json,
+    etag_matches,
+    weak_etag,
+)
+
+# ──────────────────────────────────────────────────────────────────────────────
+# weak_etag / etag_matches
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_weak_etag_is_stable_and_depends_on_version() -> None:
+    # Act
+    first = weak_etag("v1")
+    again = weak_etag(b"v1")
+    other = weak_etag("v2")
+
+    # Assert
+    assert first.startswith('W/"') and first.endswith('"')
+    assert first == again
+    assert first != other
+
+
+@pytest.mark.parametrize(
+    "if_none_match,expected",
+    [
+        (None, False),
+        ('W/"abc"', True),
+        ('"abc"', True),  # weak comparison ignores W/
+        ('W/"other", W/"abc"', True),
+        ("*", True),
+        ('W/"other"', False),
+    ],
+)
+def test_etag_matches_uses_weak_comparison(
+    if_none_match: str | None, expected: bool
+) -> None:
+    # Act & Assert
+    assert etag_matches(if_none_match, 'W/"abc"') is expected
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# conditional_json
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_conditional_json_returns_body_with_etag_and_cache_control() -> None:
+    # Act
+    response = conditional_json(b'{"a":1}', None)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.body == b'{"a":1}'
+    assert response.headers["etag"] == weak_etag(b'{"a":1}')
+    assert response.headers["cache-control"] == PRIVATE_REVALIDATE
+
+
+def test_conditional_json_returns_304_without_body_on_match() -> None:
+    # Arrange
+    etag = weak_etag(b'{"a":1}')
+
+    # Act
+    response = conditional_json(b'{"a":1}', etag)
+
+    # Assert
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
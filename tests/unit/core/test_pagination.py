@@ -0,0 +1,223 @@
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.pagination import (
+    InvalidCursorException,
+    TotalCount,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    fetch_scalar_page,
+    select_total_count,
+)
+from app.merchants.models import Merchant
+
+# ──────────────────────────────────────────────────────────────────────────────
+# encode_cursor / decode_cursor
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_decode_cursor_returns_encoded_values() -> None:
+    # Arrange
+    cursor = encode_cursor("2026-03-01T10:00:00", "a1b2c3d4")
+
+    # Act
+    values = decode_cursor(cursor, 2)
+
+    # Assert
+    assert values == ["2026-03-01T10:00:00", "a1b2c3d4"]
+
+
+def test_encode_cursor_is_url_safe() -> None:
+    # Act
+    cursor = encode_cursor("??>>", "ÿÿ")
+
+    # Assert
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["%%%", "bm90IGpzb24", encode_cursor("a"), encode_cursor("a", "b", "c")],
+    ids=["not_base64", "not_json", "too_few_values", "too_many_values"],
+)
+def test_decode_cursor_raises_on_invalid_cursor(cursor: str) -> None:
+    # Act & Assert
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, 2)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# select_total_count
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "requested, filtered, expected",
+    [
+        (TotalCount.EXACT, False, TotalCount.EXACT),
+        (TotalCount.EXACT, True, TotalCount.EXACT),
+        (TotalCount.ESTIMATED, False, TotalCount.ESTIMATED),
+        (TotalCount.ESTIMATED, True, TotalCount.EXACT),
+        (TotalCount.SKIP, False, TotalCount.SKIP),
+        (TotalCount.SKIP, True, TotalCount.SKIP),
+    ],
+)
+def test_select_total_count_estimates_only_when_requested_and_unfiltered(
+    requested: TotalCount, filtered: bool, expected: TotalCount
+) -> None:
+    # Act & Assert
+    assert select_total_count(requested, filtered=filtered) == expected
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# fetch_page / fetch_scalar_page
+# ──────────────────────────────────────────────────────────────────────────────
+
+_STMT = select(Merchant)
+
+
+def _db_returning(*results: Any) -> AsyncMock:
+    """Session whose successive execute() calls yield *results*.
+
+    A list becomes the rows of ``.all()``; anything else the value of
+    ``.scalar_one()`` / ``.scalar_one_or_none()``.
+    """
+    db = AsyncMock()
+    side_effect = []
+    for result in results:
+        mock = Mock()
+        mock.all.return_value = result if isinstance(result, list) else []
+        mock.scalar_one.return_value = result
+        mock.scalar_one_or_none.return_value = result
+        side_effect.append(mock)
+    db.execute.side_effect = side_effect
+    return db
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_reads_exact_total_from_the_page_query() -> None:
+    # Arrange
+    db = _db_returning([("m-1", "Shoply", 7), ("m-2", "Tecno", 7)])
+
+    # Act
+    rows, total = await fetch_page(db, _STMT, offset=0, limit=2)
+
+    # Assert
+    assert rows == [("m-1", "Shoply"), ("m-2", "Tecno")]
+    assert total == 7
+    assert db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_returns_zero_total_for_empty_first_page() -> None:
+    # Arrange
+    db = _db_returning([])
+
+    # Act
+    rows, total = await fetch_page(db, _STMT, offset=0, limit=10)
+
+    # Assert
+    assert rows == []
+    assert total == 0
+    assert db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_counts_separately_when_page_is_past_the_end() -> None:
+    # Arrange
+    db = _db_returning([], 12)
+
+    # Act
+    rows, total = await fetch_page(db, _STMT, offset=50, limit=10)
+
+    # Assert
+    assert rows == []
+    assert total == 12
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_skips_total() -> None:
+    # Arrange
+    db = _db_returning([("m-1",)])
+
+    # Act
+    rows, total = await fetch_page(
+        db, _STMT, offset=0, limit=10, total_count=TotalCount.SKIP
+    )
+
+    # Assert
+    assert rows == [("m-1",)]
+    assert total is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_uses_planner_estimate_for_large_tables(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "pagination_estimated_total_min_rows", 1000)
+    db = _db_returning([("m-1", 250_000)])
+
+    # Act
+    rows, total = await fetch_page(
+        db,
+        _STMT,
+        offset=0,
+        limit=10,
+        total_count=TotalCount.ESTIMATED,
+        table=Merchant.__table__,
+    )
+
+    # Assert
+    assert rows == [("m-1",)]
+    assert total == 250_000
+    assert db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_counts_exactly_when_estimate_is_small(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange — -1 is what PostgreSQL reports for a never-analyzed table
+    monkeypatch.setattr(settings, "pagination_estimated_total_min_rows", 1000)
+    db = _db_returning([("m-1", -1)], 3)
+
+    # Act
+    _, total = await fetch_page(
+        db,
+        _STMT,
+        offset=0,
+        limit=10,
+        total_count=TotalCount.ESTIMATED,
+        table=Merchant.__table__,
+    )
+
+    # Assert
+    assert total == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_raises_when_estimate_has_no_table() -> None:
+    # Act & Assert
+    with pytest.raises(ValueError):
+        await fetch_page(
+            AsyncMock(), _STMT, offset=0, limit=10, total_count=TotalCount.ESTIMATED
+        )
+
+
+@pytest.mark.asyncio
+async def test_fetch_scalar_page_returns_entities() -> None:
+    # Arrange
+    db = _db_returning([("m-1", 2), ("m-2", 2)])
+
+    # Act
+    items, total = await fetch_scalar_page(db, _STMT, offset=0, limit=10)
+
+    # Assert
+    assert items == ["m-1", "m-2"]
+    assert total == 2
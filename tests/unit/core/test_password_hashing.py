@@ -0,0 +1,154 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from app.core.password_hashing import PasswordHasher, PasswordHashingBusyException
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _BlockingContext:
+    """CryptContext stand-in whose calls block until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.thread_names: list[str] = []
+
+    def hash(self, password: str) -> str:
+        self._block()
+        return f"hashed:{password}"
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        self._block()
+        return hashed_password == f"hashed:{password}"
+
+    def _block(self) -> None:
+        self.thread_names.append(threading.current_thread().name)
+        self.started.release()
+        self.release.wait(timeout=5)
+
+
+def _make_hasher(context: object, **overrides: int) -> PasswordHasher:
+    options = {"max_workers": 2, "max_queue": 2}
+    options.update(overrides)
+    return PasswordHasher(context, clock=_FakeClock(), **options)  # type: ignore[arg-type]
+
+
+async def _wait_started(context: _BlockingContext, count: int) -> None:
+    for _ in range(count):
+        await asyncio.to_thread(context.started.acquire, True, 5)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PasswordHasher.hash / verify
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_run_in_pool_threads() -> None:
+    # Arrange
+    context = _BlockingContext()
+    context.release.set()
+    hasher = _make_hasher(context)
+
+    # Act
+    hashed = await hasher.hash("secret")
+    valid = await hasher.verify("secret", hashed)
+
+    # Assert
+    assert hashed == "hashed:secret"
+    assert valid is True
+    assert all(name.startswith("password-hashing") for name in context.thread_names)
+    assert hasher.stats().completed == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_keeps_running_while_hashing() -> None:
+    # Arrange
+    context = _BlockingContext()
+    hasher = _make_hasher(context)
+    task = asyncio.create_task(hasher.hash("secret"))
+    await _wait_started(context, 1)
+
+    # Act: the loop still serves other coroutines while bcrypt blocks a thread
+    ticked = await asyncio.wait_for(asyncio.sleep(0, result=True), timeout=1)
+
+    # Assert
+    assert ticked is True
+    assert not task.done()
+    context.release.set()
+    assert await task == "hashed:secret"
+
+
+@pytest.mark.asyncio
+async def test_calls_beyond_max_workers_wait_for_a_slot() -> None:
+    # Arrange
+    context = _BlockingContext()
+    hasher = _make_hasher(context, max_workers=1, max_queue=5)
+    first = asyncio.create_task(hasher.hash("a"))
+    await _wait_started(context, 1)
+
+    # Act
+    second = asyncio.create_task(hasher.hash("b"))
+    await asyncio.sleep(0)
+
+    # Assert
+    stats = hasher.stats()
+    assert stats.in_flight == 1
+    assert stats.waiting == 1
+    assert stats.peak_waiting == 1
+    context.release.set()
+    assert await asyncio.gather(first, second) == ["hashed:a", "hashed:b"]
+    assert hasher.stats().waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_wait_queue_is_full() -> None:
+    # Arrange
+    context = _BlockingContext()
+    hasher = _make_hasher(context, max_workers=1, max_queue=1)
+    running = asyncio.create_task(hasher.hash("a"))
+    await _wait_started(context, 1)
+    queued = asyncio.create_task(hasher.hash("b"))
+    await asyncio.sleep(0)
+
+    # Act & Assert
+    with pytest.raises(PasswordHashingBusyException):
+        await hasher.hash("c")
+    assert hasher.stats().rejected == 1
+    context.release.set()
+    await asyncio.gather(running, queued)
+
+
+@pytest.mark.asyncio
+async def test_failed_call_releases_its_slot() -> None:
+    # Arrange
+    context = Mock()
+    context.hash.side_effect = [ValueError("bad salt"), "hashed"]
+    hasher = _make_hasher(context, max_workers=1)
+
+    # Act
+    with pytest.raises(ValueError):
+        await hasher.hash("a")
+    result = await hasher.hash("b")
+
+    # Assert
+    assert result == "hashed"
+    stats = hasher.stats()
+    assert stats.in_flight == 0
+    assert stats.completed == 2
+
+
+def test_rejects_pool_without_workers() -> None:
+    # Act & Assert
+    with pytest.raises(ValueError):
+        _make_hasher(Mock(), max_workers=0)
@@ -10,6 +10,7 @@ from app.core.current_user import get_current_admin_user
 from app.core.database import get_async_db
 from app.core.errors.builders import forbidden_error
 from app.core.errors.codes import ErrorCode
+from app.core.pagination import TotalCount
 from app.feature_flags.composition import get_feature_flag_service
 from app.feature_flags.errors import ErrorCode as FeatureFlagErrorCode
 from app.feature_flags.exceptions import FeatureFlagScopeIdRequiredException
@@ -318,6 +319,135 @@ def test_evaluate_feature_flag_returns_500_on_unexpected_error(
     _assert_error_payload(response.json(), ErrorCode.INTERNAL_SERVER_ERROR)
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# POST /api/v1/feature-flags/evaluate
+# ──────────────────────────────────────────────────────────────────────────────
+
+_MERCHANT_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+
+
+def test_evaluate_feature_flags_returns_200_with_one_result_per_pair(
+    client: TestClient,
+    feature_flag_service_mock: Mock,
+) -> None:
+    # Arrange
+    feature_flag_service_mock.evaluate_many.return_value = {
+        ("fraud_check", "global", None): True,
+        ("fraud_check", "merchant", _MERCHANT_ID): False,
+    }
+
+    # Act
+    response = client.post(
+        "/api/v1/feature-flags/evaluate",
+        json={
+            "keys": ["fraud_check", "fraud_check"],
+            "scopes": [
+                {"scope_type": "global"},
+                {"scope_type": "merchant", "scope_id": _MERCHANT_ID},
+            ],
+        },
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == [
+        {
+            "key": "fraud_check",
+            "scope_type": "global",
+            "scope_id": None,
+            "enabled": True,
+        },
+        {
+            "key": "fraud_check",
+            "scope_type": "merchant",
+            "scope_id": _MERCHANT_ID,
+            "enabled": False,
+        },
+    ]
+    args = feature_flag_service_mock.evaluate_many.call_args.args
+    assert args[0] == ["fraud_check"]  # duplicates dropped
+    assert args[2] == [("global", None), ("merchant", _MERCHANT_ID)]
+
+
+def test_evaluate_feature_flags_defaults_to_global_scope(
+    client: TestClient,
+    feature_flag_service_mock: Mock,
+) -> None:
+    # Arrange
+    feature_flag_service_mock.evaluate_many.return_value = {}
+
+    # Act
+    response = client.post(
+        "/api/v1/feature-flags/evaluate", json={"keys": ["fraud_check"]}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    args = feature_flag_service_mock.evaluate_many.call_args.args
+    assert args[2] == [("global", None)]
+
+
+@pytest.mark.parametrize("body", [{"keys": []}, {"keys": ["a"] * 101}, {}])
+def test_evaluate_feature_flags_returns_422_on_invalid_keys(
+    client: TestClient,
+    feature_flag_service_mock: Mock,
+    body: dict[str, Any],
+) -> None:
+    # Act
+    response = client.post("/api/v1/feature-flags/evaluate", json=body)
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    feature_flag_service_mock.evaluate_many.assert_not_called()
+
+
+def test_evaluate_feature_flags_returns_422_on_missing_scope_id(
+    client: TestClient,
+    feature_flag_service_mock: Mock,
+) -> None:
+    # Act
+    response = client.post(
+        "/api/v1/feature-flags/evaluate",
+        json={"keys": ["fraud_check"], "scopes": [{"scope_type": "user"}]},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    data = response.json()
+    assert data["error"]["code"] == FeatureFlagErrorCode.FEATURE_FLAG_SCOPE_ID_REQUIRED
+    assert data["error"]["details"]["scope_type"] == "user"
+    feature_flag_service_mock.evaluate_many.assert_not_called()
+
+
+def test_evaluate_feature_flags_enforces_admin_user(
+    non_admin_client: TestClient,
+) -> None:
+    # Act
+    response = non_admin_client.post(
+        "/api/v1/feature-flags/evaluate", json={"keys": ["fraud_check"]}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_evaluate_feature_flags_returns_500_on_unexpected_error(
+    client: TestClient,
+    feature_flag_service_mock: Mock,
+) -> None:
+    # Arrange
+    feature_flag_service_mock.evaluate_many.side_effect = Exception("DB error")
+
+    # Act
+    response = client.post(
+        "/api/v1/feature-flags/evaluate", json={"keys": ["fraud_check"]}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    _assert_error_payload(response.json(), ErrorCode.INTERNAL_SERVER_ERROR)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # GET /api/v1/feature-flags (list)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -336,7 +466,7 @@ def test_list_feature_flags_returns_200_with_all_flags(
         scope_type="merchant",
         scope_id="f0000000-0000-0000-0000-000000000001",
     )
-    feature_flag_service_mock.list_flags.return_value = ([flag1, flag2], 2)
+    feature_flag_service_mock.list_flags.return_value = ([flag1, flag2], 2, False)
 
     # Act
     response = client.get("/api/v1/feature-flags")
@@ -345,9 +475,29 @@ def test_list_feature_flags_returns_200_with_all_flags(
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert data["pagination"]["total"] == 2
+    assert data["pagination"]["total_estimated"] is False
     assert len(data["data"]) == 2
     _assert_flag_out_response(data["data"][0], flag1)
     _assert_flag_out_response(data["data"][1], flag2)
+    call_kwargs = feature_flag_service_mock.list_flags.call_args.kwargs
+    assert call_kwargs["total_count"] == TotalCount.EXACT
+
+
+def test_list_feature_flags_flags_an_estimated_total(
+    client: TestClient,
+    feature_flag_service_mock: Mock,
+) -> None:
+    # Arrange
+    feature_flag_service_mock.list_flags.return_value = ([], 250_000, True)
+
+    # Act
+    response = client.get("/api/v1/feature-flags?total=estimated")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["pagination"]["total_estimated"] is True
+    call_kwargs = feature_flag_service_mock.list_flags.call_args.kwargs
+    assert call_kwargs["total_count"] == TotalCount.ESTIMATED
 
 
 @pytest.mark.parametrize(
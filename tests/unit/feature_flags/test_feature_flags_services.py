@@ -4,11 +4,13 @@ from unittest.mock import AsyncMock, Mock, create_autospec
 
 import pytest
 
+from app.core.pagination import TotalCount
 from app.feature_flags.exceptions import FeatureFlagScopeIdRequiredException
 from app.feature_flags.models import FeatureFlag
 from app.feature_flags.repositories import FeatureFlagRepositoryABC
 from app.feature_flags.schemas import FeatureFlagSet
 from app.feature_flags.services import FeatureFlagService
+from app.feature_flags.snapshot import FeatureFlagSnapshot
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Fixtures
@@ -17,12 +19,26 @@ from app.feature_flags.services import FeatureFlagService
 
 @pytest.fixture
 def feature_flag_repository() -> Mock:
-    return create_autospec(FeatureFlagRepositoryABC)
+    repository = create_autospec(FeatureFlagRepositoryABC)
+    repository.list_all.return_value = []
+    repository.get_version.return_value = (0, None)
+    return repository
 
 
 @pytest.fixture
-def feature_flag_service(feature_flag_repository: Mock) -> FeatureFlagService:
-    return FeatureFlagService(repository=feature_flag_repository)
+def feature_flag_snapshot(feature_flag_repository: Mock) -> FeatureFlagSnapshot:
+    return FeatureFlagSnapshot(
+        feature_flag_repository, staleness_seconds=5, max_age_seconds=300
+    )
+
+
+@pytest.fixture
+def feature_flag_service(
+    feature_flag_repository: Mock, feature_flag_snapshot: FeatureFlagSnapshot
+) -> FeatureFlagService:
+    return FeatureFlagService(
+        repository=feature_flag_repository, snapshot=feature_flag_snapshot
+    )
 
 
 def _make_uow() -> Mock:
@@ -125,6 +141,30 @@ async def test_set_flag_passes_scope_id_to_repository(
     uow.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_set_flag_makes_next_evaluation_reload_the_snapshot(
+    feature_flag_service: FeatureFlagService,
+    feature_flag_repository: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    assert await feature_flag_service.is_enabled("fraud_check", db) is True
+    disabled = _make_flag(key="fraud_check", enabled=False)
+    feature_flag_repository.get_by_key_and_scope.return_value = None
+    feature_flag_repository.upsert.return_value = disabled
+    feature_flag_repository.list_all.return_value = [disabled]
+
+    # Act
+    await feature_flag_service.set_flag(
+        "fraud_check", FeatureFlagSet(enabled=False), _make_uow()
+    )
+    result = await feature_flag_service.is_enabled("fraud_check", db)
+
+    # Assert
+    assert result is False
+    assert feature_flag_repository.list_all.await_count == 2
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # FeatureFlagService.set_flag — sad paths
 # ──────────────────────────────────────────────────────────────────────────────
@@ -176,7 +216,6 @@ async def test_is_enabled_returns_true_when_no_flag_exists(
 ) -> None:
     # Arrange
     db = AsyncMock()
-    feature_flag_repository.get_by_key_and_scope.return_value = None
 
     # Act
     result = await feature_flag_service.is_enabled("unknown_flag", db)
@@ -193,7 +232,7 @@ async def test_is_enabled_returns_global_flag_value_when_set(
     # Arrange
     db = AsyncMock()
     global_flag = _make_flag(enabled=False)
-    feature_flag_repository.get_by_key_and_scope.return_value = global_flag
+    feature_flag_repository.list_all.return_value = [global_flag]
 
     # Act
     result = await feature_flag_service.is_enabled("purchase_confirmation_job", db)
@@ -211,8 +250,10 @@ async def test_is_enabled_returns_scoped_flag_over_global(
     db = AsyncMock()
     merchant_id = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
     scoped_flag = _make_flag(scope_type="merchant", scope_id=merchant_id, enabled=False)
-    # First call returns scoped; second call (global) should not be reached
-    feature_flag_repository.get_by_key_and_scope.return_value = scoped_flag
+    feature_flag_repository.list_all.return_value = [
+        _make_flag(enabled=True),
+        scoped_flag,
+    ]
 
     # Act
     result = await feature_flag_service.is_enabled(
@@ -224,9 +265,6 @@ async def test_is_enabled_returns_scoped_flag_over_global(
 
     # Assert
     assert result is False
-    feature_flag_repository.get_by_key_and_scope.assert_called_once_with(
-        db, "purchase_confirmation_job", "merchant", merchant_id
-    )
 
 
 @pytest.mark.asyncio
@@ -239,7 +277,7 @@ async def test_is_enabled_falls_back_to_global_when_scoped_flag_missing(
     merchant_id = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
     global_flag = _make_flag(enabled=True)
     # Scoped flag not found → fall through to global
-    feature_flag_repository.get_by_key_and_scope.side_effect = [None, global_flag]
+    feature_flag_repository.list_all.return_value = [global_flag]
 
     # Act
     result = await feature_flag_service.is_enabled(
@@ -275,14 +313,44 @@ async def test_list_flags_returns_all_flags_without_filters(
     feature_flag_repository.list.return_value = ([flag1, flag2], 2)
 
     # Act
-    flags, total = await feature_flag_service.list_flags(db)
+    flags, total, total_estimated = await feature_flag_service.list_flags(db)
 
     # Assert
     assert len(flags) == 2
     assert total == 2
+    assert total_estimated is False
     assert flags[0] == flag1
     assert flags[1] == flag2
-    feature_flag_repository.list.assert_called_once_with(db, None, None, None, 0, 100)
+    feature_flag_repository.list.assert_called_once_with(
+        db, None, None, None, 0, 100, total_count=TotalCount.EXACT
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_flags_estimates_the_total_only_when_requested_and_unfiltered(
+    feature_flag_service: FeatureFlagService,
+    feature_flag_repository: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    feature_flag_repository.list.return_value = ([], 0)
+
+    # Act
+    *_, unfiltered_estimated = await feature_flag_service.list_flags(
+        db, total_count=TotalCount.ESTIMATED
+    )
+    *_, filtered_estimated = await feature_flag_service.list_flags(
+        db, key="purchase_confirmation_job", total_count=TotalCount.ESTIMATED
+    )
+
+    # Assert
+    assert unfiltered_estimated is True
+    assert filtered_estimated is False
+    modes = [
+        call.kwargs["total_count"]
+        for call in feature_flag_repository.list.call_args_list
+    ]
+    assert modes == [TotalCount.ESTIMATED, TotalCount.EXACT]
 
 
 @pytest.mark.asyncio
@@ -296,7 +364,7 @@ async def test_list_flags_filters_by_key(
     feature_flag_repository.list.return_value = ([flag], 1)
 
     # Act
-    flags, total = await feature_flag_service.list_flags(
+    flags, total, _ = await feature_flag_service.list_flags(
         db, key="purchase_confirmation_job"
     )
 
@@ -304,7 +372,13 @@ async def test_list_flags_filters_by_key(
     assert len(flags) == 1
     assert total == 1
     feature_flag_repository.list.assert_called_once_with(
-        db, "purchase_confirmation_job", None, None, 0, 100
+        db,
+        "purchase_confirmation_job",
+        None,
+        None,
+        0,
+        100,
+        total_count=TotalCount.EXACT,
     )
 
 
@@ -319,12 +393,14 @@ async def test_list_flags_filters_by_scope_type(
     feature_flag_repository.list.return_value = ([flag], 1)
 
     # Act
-    flags, total = await feature_flag_service.list_flags(db, scope_type="merchant")
+    flags, total, _ = await feature_flag_service.list_flags(db, scope_type="merchant")
 
     # Assert
     assert len(flags) == 1
     assert total == 1
-    feature_flag_repository.list.assert_called_once_with(db, None, "merchant", None, 0, 100)
+    feature_flag_repository.list.assert_called_once_with(
+        db, None, "merchant", None, 0, 100, total_count=TotalCount.EXACT
+    )
 
 
 @pytest.mark.asyncio
@@ -339,12 +415,14 @@ async def test_list_flags_filters_by_scope_id(
     feature_flag_repository.list.return_value = ([flag], 1)
 
     # Act
-    flags, total = await feature_flag_service.list_flags(db, scope_id=scope_id)
+    flags, total, _ = await feature_flag_service.list_flags(db, scope_id=scope_id)
 
     # Assert
     assert len(flags) == 1
     assert total == 1
-    feature_flag_repository.list.assert_called_once_with(db, None, None, scope_id, 0, 100)
+    feature_flag_repository.list.assert_called_once_with(
+        db, None, None, scope_id, 0, 100, total_count=TotalCount.EXACT
+    )
 
 
 @pytest.mark.asyncio
@@ -357,7 +435,7 @@ async def test_list_flags_returns_empty_when_no_match(
     feature_flag_repository.list.return_value = ([], 0)
 
     # Act
-    flags, total = await feature_flag_service.list_flags(db, key="nonexistent")
+    flags, total, _ = await feature_flag_service.list_flags(db, key="nonexistent")
 
     # Assert
     assert len(flags) == 0
@@ -383,7 +461,7 @@ async def test_evaluate_scopes_returns_empty_dict_for_empty_scopes(
     # Assert
     assert result == {}
     # Should not call repository if no scopes provided
-    feature_flag_repository.get_multiple_by_key_and_scopes.assert_not_called()
+    feature_flag_repository.list_all.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -398,10 +476,17 @@ async def test_evaluate_scopes_all_scopes_enabled_with_scoped_flags(
     scopes = [("user", user_id), ("merchant", merchant_id)]
 
     scoped_flags = [
-        _make_flag(scope_type="user", scope_id=user_id, enabled=True),
-        _make_flag(scope_type="merchant", scope_id=merchant_id, enabled=True),
+        _make_flag(
+            key="auto_confirm", scope_type="user", scope_id=user_id, enabled=True
+        ),
+        _make_flag(
+            key="auto_confirm",
+            scope_type="merchant",
+            scope_id=merchant_id,
+            enabled=True,
+        ),
     ]
-    feature_flag_repository.get_multiple_by_key_and_scopes.return_value = scoped_flags
+    feature_flag_repository.list_all.return_value = scoped_flags
 
     # Act
     result = await feature_flag_service.evaluate_scopes("auto_confirm", db, scopes)
@@ -425,7 +510,7 @@ async def test_evaluate_scopes_fail_open_when_no_flags_exist(
     scopes = [("user", user_id), ("merchant", merchant_id)]
 
     # No flags found → should fail-open to True
-    feature_flag_repository.get_multiple_by_key_and_scopes.return_value = []
+    feature_flag_repository.list_all.return_value = []
 
     # Act
     result = await feature_flag_service.evaluate_scopes("auto_confirm", db, scopes)
@@ -449,10 +534,14 @@ async def test_evaluate_scopes_scoped_flag_disabled_overrides_global_enabled(
     scopes = [("user", user_id), ("merchant", merchant_id)]
 
     flags = [
-        _make_flag(scope_type="global", scope_id=None, enabled=True),
-        _make_flag(scope_type="user", scope_id=user_id, enabled=False),  # Disabled
+        _make_flag(
+            key="auto_confirm", scope_type="global", scope_id=None, enabled=True
+        ),
+        _make_flag(
+            key="auto_confirm", scope_type="user", scope_id=user_id, enabled=False
+        ),  # Disabled
     ]
-    feature_flag_repository.get_multiple_by_key_and_scopes.return_value = flags
+    feature_flag_repository.list_all.return_value = flags
 
     # Act
     result = await feature_flag_service.evaluate_scopes("auto_confirm", db, scopes)
@@ -479,11 +568,13 @@ async def test_evaluate_scopes_global_flag_disabled_affects_all_without_scoped_o
 
     flags = [
         _make_flag(
-            scope_type="global", scope_id=None, enabled=False
+            key="auto_confirm", scope_type="global", scope_id=None, enabled=False
         ),  # Global disabled
-        _make_flag(scope_type="user", scope_id=user_id, enabled=True),  # Scoped enabled
+        _make_flag(
+            key="auto_confirm", scope_type="user", scope_id=user_id, enabled=True
+        ),  # Scoped enabled
     ]
-    feature_flag_repository.get_multiple_by_key_and_scopes.return_value = flags
+    feature_flag_repository.list_all.return_value = flags
 
     # Act
     result = await feature_flag_service.evaluate_scopes("auto_confirm", db, scopes)
@@ -510,13 +601,13 @@ async def test_evaluate_scopes_scoped_enabled_overrides_global_disabled(
 
     flags = [
         _make_flag(
-            scope_type="global", scope_id=None, enabled=False
+            key="auto_confirm", scope_type="global", scope_id=None, enabled=False
         ),  # Global disabled
         _make_flag(
-            scope_type="user", scope_id=user_id, enabled=True
+            key="auto_confirm", scope_type="user", scope_id=user_id, enabled=True
         ),  # Scoped enabled - overrides global
     ]
-    feature_flag_repository.get_multiple_by_key_and_scopes.return_value = flags
+    feature_flag_repository.list_all.return_value = flags
 
     # Act
     result = await feature_flag_service.evaluate_scopes("auto_confirm", db, scopes)
@@ -544,14 +635,23 @@ async def test_evaluate_scopes_mixed_state_multiple_scopes(
     ]
 
     flags = [
-        _make_flag(scope_type="global", scope_id=None, enabled=False),
+        _make_flag(
+            key="auto_confirm", scope_type="global", scope_id=None, enabled=False
+        ),
         # user scope: enabled (overrides global disabled)
-        _make_flag(scope_type="user", scope_id="user-123", enabled=True),
+        _make_flag(
+            key="auto_confirm", scope_type="user", scope_id="user-123", enabled=True
+        ),
         # merchant scope: disabled (overrides global disabled, explicit disable)
-        _make_flag(scope_type="merchant", scope_id="merchant-456", enabled=False),
+        _make_flag(
+            key="auto_confirm",
+            scope_type="merchant",
+            scope_id="merchant-456",
+            enabled=False,
+        ),
         # wallet scope: no flag → falls back to global (disabled)
     ]
-    feature_flag_repository.get_multiple_by_key_and_scopes.return_value = flags
+    feature_flag_repository.list_all.return_value = flags
 
     # Act
     result = await feature_flag_service.evaluate_scopes("auto_confirm", db, scopes)
@@ -574,8 +674,10 @@ async def test_evaluate_scopes_only_global_flag_present(
     scopes = [("user", "user-123"), ("merchant", "merchant-456")]
 
     # Only global flag exists
-    flags = [_make_flag(scope_type="global", scope_id=None, enabled=True)]
-    feature_flag_repository.get_multiple_by_key_and_scopes.return_value = flags
+    flags = [
+        _make_flag(key="auto_confirm", scope_type="global", scope_id=None, enabled=True)
+    ]
+    feature_flag_repository.list_all.return_value = flags
 
     # Act
     result = await feature_flag_service.evaluate_scopes("auto_confirm", db, scopes)
@@ -586,3 +688,59 @@ async def test_evaluate_scopes_only_global_flag_present(
         ("user", "user-123"): True,
         ("merchant", "merchant-456"): True,
     }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# FeatureFlagService.evaluate_many — multi-key batch evaluation
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_resolves_every_key_for_every_scope(
+    feature_flag_service: FeatureFlagService,
+    feature_flag_repository: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    scopes = [("merchant", "merchant-456"), ("user", "user-123")]
+    feature_flag_repository.list_all.return_value = [
+        _make_flag(key="fraud_check", scope_type="global", enabled=False),
+        _make_flag(
+            key="fraud_check",
+            scope_type="merchant",
+            scope_id="merchant-456",
+            enabled=True,
+        ),
+        _make_flag(
+            key="auto_confirm", scope_type="user", scope_id="user-123", enabled=False
+        ),
+    ]
+
+    # Act
+    result = await feature_flag_service.evaluate_many(
+        ["fraud_check", "auto_confirm"], db, scopes
+    )
+
+    # Assert
+    assert list(result.items()) == [
+        (("fraud_check", "merchant", "merchant-456"), True),
+        (("fraud_check", "user", "user-123"), False),
+        (("auto_confirm", "merchant", "merchant-456"), True),
+        (("auto_confirm", "user", "user-123"), False),
+    ]
+    feature_flag_repository.list_all.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_many_returns_empty_dict_without_keys(
+    feature_flag_service: FeatureFlagService,
+    feature_flag_repository: Mock,
+) -> None:
+    # Act
+    result = await feature_flag_service.evaluate_many(
+        [], AsyncMock(), [("global", None)]
+    )
+
+    # Assert
+    assert result == {}
+    feature_flag_repository.list_all.assert_not_called()
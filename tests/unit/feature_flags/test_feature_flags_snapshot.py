@@ -0,0 +1,207 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock, Mock, create_autospec
+
+import pytest
+
+from app.feature_flags.models import FeatureFlag
+from app.feature_flags.repositories import FeatureFlagRepositoryABC
+from app.feature_flags.snapshot import FeatureFlagSnapshot, resolve_flag
+
+_UPDATED_AT = datetime(2026, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def feature_flag_repository() -> Mock:
+    repository = create_autospec(FeatureFlagRepositoryABC)
+    repository.list_all.return_value = []
+    repository.get_version.return_value = (0, None)
+    return repository
+
+
+def _make_snapshot(
+    repository: Mock, clock: _FakeClock, max_age_seconds: float = 300
+) -> FeatureFlagSnapshot:
+    return FeatureFlagSnapshot(
+        repository,
+        staleness_seconds=5,
+        max_age_seconds=max_age_seconds,
+        clock=clock,
+    )
+
+
+def _make_flag(**kwargs: Any) -> FeatureFlag:
+    defaults: dict[str, Any] = {
+        "key": "purchase_auto_confirm",
+        "enabled": True,
+        "scope_type": "global",
+        "scope_id": None,
+    }
+    defaults.update(kwargs)
+    return FeatureFlag(**defaults)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# FeatureFlagSnapshot.flags — loading and indexing
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_flags_are_indexed_by_key_and_scope(
+    feature_flag_repository: Mock,
+) -> None:
+    # Arrange
+    feature_flag_repository.list_all.return_value = [
+        _make_flag(enabled=False),
+        _make_flag(scope_type="merchant", scope_id="m-1", enabled=True),
+    ]
+    snapshot = _make_snapshot(feature_flag_repository, _FakeClock())
+
+    # Act
+    flags = await snapshot.flags(AsyncMock())
+
+    # Assert
+    assert flags == {
+        ("purchase_auto_confirm", "global", None): False,
+        ("purchase_auto_confirm", "merchant", "m-1"): True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_flags_within_staleness_window_skip_the_database(
+    feature_flag_repository: Mock,
+) -> None:
+    # Arrange
+    clock = _FakeClock()
+    snapshot = _make_snapshot(feature_flag_repository, clock)
+    await snapshot.flags(AsyncMock())
+    clock.now = 4.9
+
+    # Act
+    for _ in range(100):
+        await snapshot.flags(AsyncMock())
+
+    # Assert
+    assert feature_flag_repository.get_version.await_count == 1
+    assert feature_flag_repository.list_all.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_version_keeps_the_snapshot(
+    feature_flag_repository: Mock,
+) -> None:
+    # Arrange
+    clock = _FakeClock()
+    snapshot = _make_snapshot(feature_flag_repository, clock)
+    await snapshot.flags(AsyncMock())
+    clock.now = 6
+
+    # Act
+    await snapshot.flags(AsyncMock())
+    await snapshot.flags(AsyncMock())
+
+    # Assert: one version check for the new window, no reload
+    assert feature_flag_repository.get_version.await_count == 2
+    assert feature_flag_repository.list_all.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_version_reloads_the_snapshot(
+    feature_flag_repository: Mock,
+) -> None:
+    # Arrange
+    clock = _FakeClock()
+    snapshot = _make_snapshot(feature_flag_repository, clock)
+    await snapshot.flags(AsyncMock())
+    feature_flag_repository.get_version.return_value = (1, _UPDATED_AT)
+    feature_flag_repository.list_all.return_value = [_make_flag(enabled=False)]
+    clock.now = 6
+
+    # Act
+    flags = await snapshot.flags(AsyncMock())
+
+    # Assert
+    assert flags == {("purchase_auto_confirm", "global", None): False}
+    assert feature_flag_repository.list_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_past_max_age_reloads_even_with_same_version(
+    feature_flag_repository: Mock,
+) -> None:
+    # Arrange
+    clock = _FakeClock()
+    snapshot = _make_snapshot(feature_flag_repository, clock, max_age_seconds=60)
+    await snapshot.flags(AsyncMock())
+    clock.now = 61
+
+    # Act
+    await snapshot.flags(AsyncMock())
+
+    # Assert
+    assert feature_flag_repository.list_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_reloads_on_next_read(feature_flag_repository: Mock) -> None:
+    # Arrange
+    snapshot = _make_snapshot(feature_flag_repository, _FakeClock())
+    await snapshot.flags(AsyncMock())
+
+    # Act
+    snapshot.invalidate()
+    await snapshot.flags(AsyncMock())
+
+    # Assert
+    assert feature_flag_repository.list_all.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_one_load(feature_flag_repository: Mock) -> None:
+    # Arrange
+    release = asyncio.Event()
+
+    async def slow_list_all(db: Any) -> list[FeatureFlag]:
+        await release.wait()
+        return []
+
+    feature_flag_repository.list_all.side_effect = slow_list_all
+    snapshot = _make_snapshot(feature_flag_repository, _FakeClock())
+
+    # Act
+    readers = [asyncio.create_task(snapshot.flags(AsyncMock())) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*readers)
+
+    # Assert
+    assert feature_flag_repository.list_all.await_count == 1
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# resolve_flag
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_resolve_flag_prefers_scoped_over_global() -> None:
+    # Arrange
+    flags = {("k", "global", None): True, ("k", "merchant", "m-1"): False}
+
+    # Act & Assert
+    assert resolve_flag(flags, "k", "merchant", "m-1") is False
+    assert resolve_flag(flags, "k", "merchant", "m-2") is True
+
+
+def test_resolve_flag_fails_open_without_flags() -> None:
+    # Act & Assert
+    assert resolve_flag({}, "k", "user", "u-1") is True
+    assert resolve_flag({}, "k") is True
@@ -5,13 +5,15 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from app.core.cache import CacheStats, TTLCache
 from app.core.config import settings
 from app.core.current_user import get_current_admin_user
 from app.core.database import get_async_db
 from app.core.errors.builders import forbidden_error
 from app.core.errors.codes import ErrorCode
+from app.core.pagination import InvalidCursorException, TotalCount
 from app.main import app
-from app.merchants.composition import get_merchant_service
+from app.merchants.composition import get_merchant_cache, get_merchant_service
 from app.merchants.exceptions import (
     CashbackPercentageNotValidException,
     MerchantNotFoundException,
@@ -109,6 +111,56 @@ def test_create_merchant_returns_201_on_success(
     _assert_merchant_out_response(response.json(), merchant)
 
 
+@pytest.mark.parametrize(
+    "query_string, expected_total_count",
+    [
+        ("", TotalCount.EXACT),
+        ("?total=estimated", TotalCount.ESTIMATED),
+        ("?total=skip", TotalCount.SKIP),
+    ],
+)
+def test_list_merchants_passes_the_requested_total_mode(
+    client: TestClient,
+    merchant_service_mock: Mock,
+    query_string: str,
+    expected_total_count: TotalCount,
+) -> None:
+    # Arrange
+    merchant_service_mock.list_merchants.return_value = ([], None, False)
+
+    # Act
+    response = client.get(f"/api/v1/merchants{query_string}")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    call_kwargs = merchant_service_mock.list_merchants.call_args.kwargs
+    assert call_kwargs["total_count"] == expected_total_count
+
+
+def test_list_merchants_flags_an_estimated_total(
+    client: TestClient,
+    merchant_service_mock: Mock,
+) -> None:
+    # Arrange
+    merchant_service_mock.list_merchants.return_value = ([], 250_000, True)
+
+    # Act
+    response = client.get("/api/v1/merchants?total=estimated")
+
+    # Assert
+    pagination = response.json()["pagination"]
+    assert pagination["total"] == 250_000
+    assert pagination["total_estimated"] is True
+
+
+def test_list_merchants_rejects_an_unknown_total_mode(client: TestClient) -> None:
+    # Act
+    response = client.get("/api/v1/merchants?total=approximate")
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
 @pytest.mark.parametrize(
     "exception,expected_status,expected_code",
     [
@@ -196,7 +248,7 @@ def test_list_merchants_returns_200_on_success(
         "c3d4e5f6-a7b8-9012-cdef-123456789012",
     ]
     merchants = [merchant_factory(id=uuids[i], name=f"Shop {i}") for i in range(3)]
-    merchant_service_mock.list_merchants.return_value = (merchants, 3)
+    merchant_service_mock.list_merchants.return_value = (merchants, 3, False)
 
     # Act
     response = client.get("/api/v1/merchants")
@@ -217,7 +269,7 @@ def test_list_merchants_returns_200_on_empty_results(
     merchant_service_mock: Mock,
 ) -> None:
     # Arrange
-    merchant_service_mock.list_merchants.return_value = ([], 0)
+    merchant_service_mock.list_merchants.return_value = ([], 0, False)
 
     # Act
     response = client.get("/api/v1/merchants")
@@ -301,7 +353,7 @@ def test_list_merchants_returns_200_on_valid_pagination_params(
     query_string: str,
 ) -> None:
     # Arrange
-    merchant_service_mock.list_merchants.return_value = ([], 0)
+    merchant_service_mock.list_merchants.return_value = ([], 0, False)
 
     # Act
     response = client.get(f"/api/v1/merchants?{query_string}")
@@ -310,6 +362,74 @@ def test_list_merchants_returns_200_on_valid_pagination_params(
     assert response.status_code == status.HTTP_200_OK
 
 
+def test_list_merchants_with_q_searches_by_name(
+    client: TestClient,
+    merchant_service_mock: Mock,
+    merchant_factory: Callable[..., Merchant],
+) -> None:
+    # Arrange
+    merchant = merchant_factory(id="a1b2c3d4-e5f6-7890-abcd-ef1234567890")
+    merchant_service_mock.search_merchants.return_value = ([merchant], "next")
+
+    # Act
+    response = client.get("/api/v1/merchants?q=shop&limit=5&offset=10&active=true")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    _assert_merchant_out_response(data["data"][0], merchant)
+    assert data["pagination"] == {
+        "offset": 0,
+        "limit": 5,
+        "total": None,
+        "total_estimated": False,
+        "next_cursor": "next",
+    }
+    merchant_service_mock.search_merchants.assert_called_once()
+    args = merchant_service_mock.search_merchants.call_args
+    assert args.args[:3] == ("shop", 5, True)
+    assert args.kwargs["cursor"] is None
+    merchant_service_mock.list_merchants.assert_not_called()
+
+
+def test_list_merchants_returns_422_on_too_short_q(
+    client: TestClient,
+) -> None:
+    # Act
+    response = client.get("/api/v1/merchants?q=ab")
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+def test_list_merchants_returns_400_on_cursor_without_q(
+    client: TestClient,
+    merchant_service_mock: Mock,
+) -> None:
+    # Act
+    response = client.get("/api/v1/merchants?cursor=abc")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    _assert_error_payload(response.json(), ErrorCode.VALIDATION_ERROR)
+    merchant_service_mock.list_merchants.assert_not_called()
+
+
+def test_list_merchants_returns_400_on_malformed_search_cursor(
+    client: TestClient,
+    merchant_service_mock: Mock,
+) -> None:
+    # Arrange
+    merchant_service_mock.search_merchants.side_effect = InvalidCursorException("x")
+
+    # Act
+    response = client.get("/api/v1/merchants?q=shop&cursor=x")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    _assert_error_payload(response.json(), ErrorCode.VALIDATION_ERROR)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # PATCH /api/v1/merchants/{merchant_id}/status
 # ──────────────────────────────────────────────────────────────────────────────
@@ -437,3 +557,46 @@ def test_set_merchant_status_returns_422_on_invalid_status_value(
 
     # Assert
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# GET /api/v1/merchants/cache
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_get_merchant_cache_stats_returns_200_with_stats(
+    client: TestClient,
+) -> None:
+    # Arrange
+    merchant_cache = create_autospec(TTLCache, instance=True)
+    merchant_cache.stats.return_value = CacheStats(
+        size=12,
+        max_size=10000,
+        ttl_seconds=300,
+        hits=90,
+        misses=10,
+        evictions=0,
+        invalidations=2,
+        hit_ratio=0.9,
+    )
+    app.dependency_overrides[get_merchant_cache] = lambda: merchant_cache
+
+    # Act
+    response = client.get("/api/v1/merchants/cache")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["hits"] == 90
+    assert body["hit_ratio"] == 0.9
+    assert body["invalidations"] == 2
+
+
+def test_get_merchant_cache_stats_enforces_admin_user(
+    non_admin_client: TestClient,
+) -> None:
+    # Act
+    response = non_admin_client.get("/api/v1/merchants/cache")
+
+    # Assert
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -3,6 +3,10 @@ from unittest.mock import AsyncMock, Mock, create_autospec
 
 import pytest
 
+from app.core.broker import MessageBrokerABC
+from app.core.cache import TTLCache
+from app.core.events.merchant_events import MerchantStatusChanged
+from app.core.pagination import InvalidCursorException, TotalCount, encode_cursor
 from app.merchants.exceptions import (
     CashbackPercentageNotValidException,
     MerchantNameAlreadyExistsException,
@@ -23,14 +27,28 @@ def merchant_repository() -> Mock:
     return create_autospec(MerchantRepositoryABC)
 
 
+@pytest.fixture
+def merchant_cache() -> Mock:
+    return create_autospec(TTLCache, instance=True)
+
+
+@pytest.fixture
+def broker() -> Mock:
+    return create_autospec(MessageBrokerABC)
+
+
 @pytest.fixture
 def merchant_service(
     enforce_cashback_percentage_validity: Callable[[float], None],
     merchant_repository: Mock,
+    merchant_cache: Mock,
+    broker: Mock,
 ) -> MerchantService:
     return MerchantService(
         enforce_cashback_percentage_validity=enforce_cashback_percentage_validity,
         merchant_repository=merchant_repository,
+        merchant_cache=merchant_cache,
+        broker=broker,
     )
 
 
@@ -75,6 +93,27 @@ async def test_create_merchant_returns_merchant_on_success(
     uow.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_create_merchant_invalidates_merchant_cache(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+    merchant_cache: Mock,
+    merchant_factory: Callable[..., Merchant],
+    merchant_input_data: Callable[[Merchant], dict[str, Any]],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    new_merchant = merchant_factory()
+    merchant_repository.get_merchant_by_name.return_value = None
+    merchant_repository.add_merchant.return_value = new_merchant
+
+    # Act
+    await merchant_service.create_merchant(merchant_input_data(new_merchant), uow)
+
+    # Assert
+    merchant_cache.invalidate.assert_called_once_with(str(new_merchant.id))
+
+
 @pytest.mark.asyncio
 async def test_create_merchant_raises_on_name_already_exists(
     merchant_service: MerchantService,
@@ -147,14 +186,167 @@ async def test_list_merchants_returns_repository_result_on_call(
     merchant_repository.list_merchants.return_value = (merchants, expected_total)
 
     # Act
-    items, total = await merchant_service.list_merchants(
+    items, total, total_estimated = await merchant_service.list_merchants(
         offset=0, limit=20, active=active_filter, db=db
     )
 
     # Assert
     assert items == merchants
     assert total == expected_total
-    merchant_repository.list_merchants.assert_called_once_with(db, 0, 20, active_filter)
+    assert total_estimated is False
+    merchant_repository.list_merchants.assert_called_once_with(
+        db, 0, 20, active_filter, total_count=TotalCount.EXACT
+    )
+
+
+@pytest.mark.parametrize(
+    "active_filter, expected_total_count, expected_estimated",
+    [
+        (None, TotalCount.ESTIMATED, True),
+        (True, TotalCount.EXACT, False),  # estimates ignore filters
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_merchants_estimates_the_total_only_for_unfiltered_lists(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+    active_filter: bool | None,
+    expected_total_count: TotalCount,
+    expected_estimated: bool,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    merchant_repository.list_merchants.return_value = ([], 0)
+
+    # Act
+    *_, total_estimated = await merchant_service.list_merchants(
+        offset=0,
+        limit=20,
+        active=active_filter,
+        db=db,
+        total_count=TotalCount.ESTIMATED,
+    )
+
+    # Assert
+    assert total_estimated is expected_estimated
+    call_kwargs = merchant_repository.list_merchants.call_args.kwargs
+    assert call_kwargs["total_count"] == expected_total_count
+
+
+@pytest.mark.asyncio
+async def test_list_merchants_skips_total_when_not_requested(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    merchant_repository.list_merchants.return_value = ([], None)
+
+    # Act
+    _, total, _ = await merchant_service.list_merchants(
+        offset=0, limit=20, active=None, db=db, total_count=TotalCount.SKIP
+    )
+
+    # Assert
+    assert total is None
+    assert (
+        merchant_repository.list_merchants.call_args.kwargs["total_count"]
+        == TotalCount.SKIP
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# MerchantService.search_merchants
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_search_merchants_returns_cursor_when_more_results_exist(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+    merchant_factory: Callable[..., Merchant],
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    merchants = [merchant_factory(id=f"id-{i}", name=f"Shop {i}") for i in range(3)]
+    merchant_repository.search_merchants.return_value = [
+        (merchants[0], 1.0),
+        (merchants[1], 0.75),
+        (merchants[2], 0.5),
+    ]
+
+    # Act
+    items, next_cursor = await merchant_service.search_merchants(
+        "shop", limit=2, active=None, db=db
+    )
+
+    # Assert — one extra row is fetched to detect the next page
+    assert items == merchants[:2]
+    assert next_cursor == encode_cursor("0.75", "id-1")
+    merchant_repository.search_merchants.assert_called_once_with(
+        db, "shop", 3, None, after=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_merchants_returns_no_cursor_on_last_page(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+    merchant_factory: Callable[..., Merchant],
+) -> None:
+    # Arrange
+    merchant = merchant_factory(name="Shop")
+    merchant_repository.search_merchants.return_value = [(merchant, 1.0)]
+
+    # Act
+    items, next_cursor = await merchant_service.search_merchants(
+        "shop", limit=2, active=True, db=AsyncMock()
+    )
+
+    # Assert
+    assert items == [merchant]
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_search_merchants_resumes_after_cursor(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+) -> None:
+    # Arrange
+    merchant_repository.search_merchants.return_value = []
+    cursor = encode_cursor("0.75", "id-1")
+
+    # Act
+    await merchant_service.search_merchants(
+        "shop", limit=2, active=None, db=AsyncMock(), cursor=cursor
+    )
+
+    # Assert
+    call_kwargs = merchant_repository.search_merchants.call_args.kwargs
+    assert call_kwargs["after"] == (0.75, "id-1")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor("high", "id-1"),  # score is not a number
+        encode_cursor("0.75"),  # missing ID
+    ],
+)
+@pytest.mark.asyncio
+async def test_search_merchants_raises_on_malformed_cursor(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+    cursor: str,
+) -> None:
+    # Act & Assert
+    with pytest.raises(InvalidCursorException):
+        await merchant_service.search_merchants(
+            "shop", limit=2, active=None, db=AsyncMock(), cursor=cursor
+        )
+    merchant_repository.search_merchants.assert_not_called()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -192,10 +384,53 @@ async def test_set_merchant_status_returns_updated_merchant(
     uow.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_set_merchant_status_invalidates_merchant_cache(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+    merchant_cache: Mock,
+    merchant_factory: Callable[..., Merchant],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    existing = merchant_factory(active=True)
+    merchant_repository.get_merchant_by_id.return_value = existing
+    merchant_repository.update_merchant_status.return_value = existing
+
+    # Act
+    await merchant_service.set_merchant_status(existing.id, False, uow)
+
+    # Assert
+    merchant_cache.invalidate.assert_called_once_with(existing.id)
+
+
+@pytest.mark.asyncio
+async def test_set_merchant_status_publishes_status_changed_event(
+    merchant_service: MerchantService,
+    merchant_repository: Mock,
+    broker: Mock,
+    merchant_factory: Callable[..., Merchant],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    existing = merchant_factory(active=True)
+    merchant_repository.get_merchant_by_id.return_value = existing
+    merchant_repository.update_merchant_status.return_value = existing
+
+    # Act
+    await merchant_service.set_merchant_status(existing.id, False, uow)
+
+    # Assert
+    broker.publish.assert_awaited_once_with(
+        MerchantStatusChanged(merchant_id=existing.id, active=False)
+    )
+
+
 @pytest.mark.asyncio
 async def test_set_merchant_status_raises_on_merchant_not_found(
     merchant_service: MerchantService,
     merchant_repository: Mock,
+    merchant_cache: Mock,
 ) -> None:
     # Arrange
     uow = _make_uow()
@@ -206,3 +441,4 @@ async def test_set_merchant_status_raises_on_merchant_not_found(
         await merchant_service.set_merchant_status("nonexistent-id", True, uow)
 
     uow.commit.assert_not_called()
+    merchant_cache.invalidate.assert_not_called()
@@ -0,0 +1,104 @@
+"""Unit tests for make_sweep_offers_task.
+
+Module under test: app.offers.jobs.sweep_offers
+"""
+
+from datetime import date
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.offers.jobs.sweep_offers import make_sweep_offers_task
+from app.offers.repositories import OfferRepositoryABC
+
+_TODAY = date(2026, 3, 28)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_session_factory() -> tuple[async_sessionmaker[AsyncSession], AsyncMock]:
+    session = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return (
+        cast(async_sessionmaker[AsyncSession], MagicMock(return_value=session)),
+        session,
+    )
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    return create_autospec(OfferRepositoryABC)
+
+
+# ---------------------------------------------------------------------------
+# make_sweep_offers_task
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_sweep_deactivates_in_batches_until_a_short_batch(
+    repository: MagicMock,
+) -> None:
+    # Arrange
+    factory, session = _make_session_factory()
+    repository.deactivate_expired_offers.side_effect = [["m1", "m2"], ["m3"]]
+    task = make_sweep_offers_task(
+        repository=repository,
+        db_session_factory=factory,
+        batch_size=2,
+        today_provider=lambda: _TODAY,
+    )
+
+    # Act
+    await task()
+
+    # Assert
+    assert repository.deactivate_expired_offers.call_count == 2
+    repository.deactivate_expired_offers.assert_called_with(session, _TODAY, 2)
+    assert session.commit.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sweep_stops_after_an_empty_batch(repository: MagicMock) -> None:
+    # Arrange
+    factory, session = _make_session_factory()
+    repository.deactivate_expired_offers.side_effect = [["m1", "m2"], []]
+    task = make_sweep_offers_task(
+        repository=repository,
+        db_session_factory=factory,
+        batch_size=2,
+        today_provider=lambda: _TODAY,
+    )
+
+    # Act
+    await task()
+
+    # Assert
+    assert repository.deactivate_expired_offers.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sweep_swallows_errors_so_the_schedule_keeps_running(
+    repository: MagicMock,
+) -> None:
+    # Arrange
+    factory, session = _make_session_factory()
+    repository.deactivate_expired_offers.side_effect = RuntimeError("db down")
+    task = make_sweep_offers_task(
+        repository=repository,
+        db_session_factory=factory,
+        batch_size=2,
+        today_provider=lambda: _TODAY,
+    )
+
+    # Act
+    await task()
+
+    # Assert
+    session.commit.assert_not_awaited()
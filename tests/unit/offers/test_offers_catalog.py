@@ -0,0 +1,283 @@
+import asyncio
+import json
+from datetime import date
+from typing import Any, Callable
+from unittest.mock import AsyncMock, Mock, create_autospec
+
+import pytest
+
+from app.core.broker import InMemoryMessageBroker
+from app.core.events.merchant_events import MerchantStatusChanged
+from app.offers.catalog import ActiveOfferCatalog
+from app.offers.composition import subscribe_offer_handlers
+from app.offers.models import Offer
+from app.offers.repositories import OfferRepositoryABC
+
+_TODAY = date(2026, 3, 28)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def offer_repository_mock() -> Mock:
+    repository = create_autospec(OfferRepositoryABC)
+    repository.list_active_offers.return_value = []
+    return repository
+
+
+def _make_catalog(
+    repository: Mock, clock: _FakeClock | None = None, max_age_seconds: float = 60
+) -> ActiveOfferCatalog:
+    return ActiveOfferCatalog(
+        repository=repository,
+        max_age_seconds=max_age_seconds,
+        clock=clock or _FakeClock(),
+    )
+
+
+def _offers(offer_factory: Callable[..., Offer], count: int) -> list[tuple[Offer, str]]:
+    return [
+        (offer_factory(id=f"a000000{i}-0000-0000-0000-00000000000{i}"), f"Shop {i}")
+        for i in range(1, count + 1)
+    ]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# ActiveOfferCatalog.page — encoding and slicing
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_page_encodes_offers_in_active_offer_shape(
+    offer_repository_mock: Mock, offer_factory: Callable[..., Offer]
+) -> None:
+    # Arrange
+    percent = offer_factory(id="a0000001-0000-0000-0000-000000000001")
+    fixed = offer_factory(
+        id="a0000002-0000-0000-0000-000000000002", percentage=0.0, fixed_amount=5.0
+    )
+    offer_repository_mock.list_active_offers.return_value = [
+        (percent, "Shoply"),
+        (fixed, "QuickCart"),
+    ]
+    catalog = _make_catalog(offer_repository_mock)
+
+    # Act
+    page = await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+
+    # Assert
+    data = json.loads(page.body)
+    assert data["pagination"] == {
+        "offset": 0,
+        "limit": 10,
+        "total": 2,
+        "total_estimated": False,
+    }
+    assert data["data"][0] == {
+        "id": percent.id,
+        "merchant_name": "Shoply",
+        "cashback_type": "percent",
+        "cashback_value": 10.0,
+        "monthly_cap": 50.0,
+        "start_date": "2026-03-01",
+        "end_date": "2026-12-31",
+    }
+    assert data["data"][1]["cashback_type"] == "fixed"
+    assert data["data"][1]["cashback_value"] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_page_slices_snapshot_by_offset_and_limit(
+    offer_repository_mock: Mock, offer_factory: Callable[..., Offer]
+) -> None:
+    # Arrange
+    offer_repository_mock.list_active_offers.return_value = _offers(offer_factory, 3)
+    catalog = _make_catalog(offer_repository_mock)
+
+    # Act
+    page = await catalog.page(AsyncMock(), _TODAY, offset=1, limit=1)
+
+    # Assert
+    data = json.loads(page.body)
+    assert [item["merchant_name"] for item in data["data"]] == ["Shop 2"]
+    assert data["pagination"]["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_page_omits_total_when_not_requested(offer_repository_mock: Mock) -> None:
+    # Arrange
+    catalog = _make_catalog(offer_repository_mock)
+
+    # Act
+    page = await catalog.page(
+        AsyncMock(), _TODAY, offset=0, limit=10, include_total=False
+    )
+
+    # Assert
+    assert json.loads(page.body)["pagination"]["total"] is None
+
+
+@pytest.mark.asyncio
+async def test_page_etag_depends_on_content_and_page(
+    offer_repository_mock: Mock, offer_factory: Callable[..., Offer]
+) -> None:
+    # Arrange
+    offer_repository_mock.list_active_offers.return_value = _offers(offer_factory, 2)
+    catalog = _make_catalog(offer_repository_mock)
+    db = AsyncMock()
+
+    # Act
+    first = await catalog.page(db, _TODAY, offset=0, limit=1)
+    second_page = await catalog.page(db, _TODAY, offset=1, limit=1)
+    catalog.invalidate()
+    rebuilt_same = await catalog.page(db, _TODAY, offset=0, limit=1)
+    offer_repository_mock.list_active_offers.return_value = _offers(offer_factory, 3)
+    catalog.invalidate()
+    rebuilt_changed = await catalog.page(db, _TODAY, offset=0, limit=1)
+
+    # Assert
+    assert first.etag != second_page.etag
+    assert first.etag == rebuilt_same.etag
+    assert first.etag != rebuilt_changed.etag
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# ActiveOfferCatalog — rebuilding the snapshot
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_page_serves_repeat_reads_from_snapshot(
+    offer_repository_mock: Mock,
+) -> None:
+    # Arrange
+    catalog = _make_catalog(offer_repository_mock)
+
+    # Act
+    await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+    await catalog.page(AsyncMock(), _TODAY, offset=10, limit=10)
+
+    # Assert
+    offer_repository_mock.list_active_offers.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_page_rebuilds_after_invalidate(offer_repository_mock: Mock) -> None:
+    # Arrange
+    catalog = _make_catalog(offer_repository_mock)
+    await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+
+    # Act
+    catalog.invalidate()
+    await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+
+    # Assert
+    assert offer_repository_mock.list_active_offers.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_page_rebuilds_when_the_day_changes(offer_repository_mock: Mock) -> None:
+    # Arrange
+    catalog = _make_catalog(offer_repository_mock)
+    db = AsyncMock()
+    await catalog.page(db, _TODAY, offset=0, limit=10)
+
+    # Act
+    await catalog.page(db, date(2026, 3, 29), offset=0, limit=10)
+
+    # Assert
+    offer_repository_mock.list_active_offers.assert_called_with(db, date(2026, 3, 29))
+    assert offer_repository_mock.list_active_offers.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_page_rebuilds_once_snapshot_reaches_max_age(
+    offer_repository_mock: Mock,
+) -> None:
+    # Arrange
+    clock = _FakeClock()
+    catalog = _make_catalog(offer_repository_mock, clock, max_age_seconds=60)
+    await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+
+    # Act
+    clock.now = 59.0
+    await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+    clock.now = 60.0
+    await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+
+    # Assert
+    assert offer_repository_mock.list_active_offers.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_page_shares_one_rebuild_between_concurrent_reads(
+    offer_repository_mock: Mock,
+) -> None:
+    # Arrange
+    release = asyncio.Event()
+
+    async def slow_list(db: Any, today: date) -> list[tuple[Offer, str]]:
+        await release.wait()
+        return []
+
+    offer_repository_mock.list_active_offers.side_effect = slow_list
+    catalog = _make_catalog(offer_repository_mock)
+
+    # Act
+    tasks = [
+        asyncio.create_task(catalog.page(AsyncMock(), _TODAY, offset=0, limit=10))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    # Assert
+    offer_repository_mock.list_active_offers.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_rebuild_leaves_snapshot_stale(
+    offer_repository_mock: Mock,
+) -> None:
+    # Arrange
+    catalog = _make_catalog(offer_repository_mock)
+
+    async def list_then_invalidate(db: Any, today: date) -> list[tuple[Offer, str]]:
+        catalog.invalidate()  # a write lands while the snapshot is being read
+        return []
+
+    offer_repository_mock.list_active_offers.side_effect = list_then_invalidate
+
+    # Act
+    await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+    offer_repository_mock.list_active_offers.side_effect = None
+    await catalog.page(AsyncMock(), _TODAY, offset=0, limit=10)
+
+    # Assert
+    assert offer_repository_mock.list_active_offers.call_count == 2
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# subscribe_offer_handlers
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_merchant_status_change_invalidates_the_catalog() -> None:
+    # Arrange
+    broker = InMemoryMessageBroker()
+    catalog = create_autospec(ActiveOfferCatalog, instance=True)
+    subscribe_offer_handlers(broker, catalog)
+
+    # Act
+    await broker.publish(MerchantStatusChanged(merchant_id="m-1", active=False))
+
+    # Assert
+    catalog.invalidate.assert_called_once()
@@ -58,6 +58,27 @@ def test_get_offer_details_returns_200_on_success(
     _assert_offer_details_response(response.json(), offer, merchant_name)
 
 
+def test_get_offer_details_returns_304_when_etag_matches(
+    user_client: TestClient,
+    offer_service_mock: Mock,
+    offer_factory: Callable[..., Offer],
+) -> None:
+    # Arrange
+    offer = offer_factory(id=_ACTIVE_OFFER_ID, active=True)
+    offer_service_mock.get_offer_details.return_value = (offer, "Shoply")
+    etag = user_client.get(f"/api/v1/offers/{_ACTIVE_OFFER_ID}").headers["etag"]
+
+    # Act
+    response = user_client.get(
+        f"/api/v1/offers/{_ACTIVE_OFFER_ID}", headers={"If-None-Match": etag}
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
 def test_get_offer_details_maps_fixed_cashback_correctly(
     user_client: TestClient,
     offer_service_mock: Mock,
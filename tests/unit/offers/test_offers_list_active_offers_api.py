@@ -1,4 +1,5 @@
-from typing import Any, Callable
+import json
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
@@ -7,36 +8,30 @@ from fastapi.testclient import TestClient
 
 from app.core.config import settings
 from app.core.errors.codes import ErrorCode
-from app.offers.models import Offer
+from app.core.schemas import PaginationOut
+from app.offers.catalog import ActiveOfferPage
 from tests.unit.offers.conftest import assert_error_code
 
 
-def _assert_active_offers_response(
-    data: dict[str, Any],
-    items: list[tuple[Offer, str]],
-    total: int,
-    offset: int,
-    limit: int,
-) -> None:
-    assert data["pagination"]["total"] == total
-    assert data["pagination"]["offset"] == offset
-    assert data["pagination"]["limit"] == limit
-    assert len(data["data"]) == len(items)
-    for i, (offer, merchant_name) in enumerate(items):
-        item = data["data"][i]
-        assert item["id"] == str(offer.id)
-        assert item["merchant_name"] == merchant_name
-        expected_cashback_type = (
-            "fixed" if offer.fixed_amount is not None else "percent"
-        )
-        assert item["cashback_type"] == expected_cashback_type
-        expected_cashback_value = (
-            offer.fixed_amount if offer.fixed_amount is not None else offer.percentage
-        )
-        assert item["cashback_value"] == expected_cashback_value
-        assert item["monthly_cap"] == offer.monthly_cap_per_user
-        assert item["start_date"] == offer.start_date.isoformat()
-        assert item["end_date"] == offer.end_date.isoformat()
+def _page(items: list[dict[str, Any]], total: int | None) -> ActiveOfferPage:
+    return ActiveOfferPage(
+        etag='W/"v1"',
+        items=tuple(json.dumps(item).encode() for item in items),
+        pagination=PaginationOut(
+            offset=0, limit=settings.default_page_size, total=total
+        ),
+    )
+
+
+_ITEM: dict[str, Any] = {
+    "id": "a0000001-0000-0000-0000-000000000001",
+    "merchant_name": "Shoply",
+    "cashback_type": "percent",
+    "cashback_value": 10.0,
+    "monthly_cap": 50.0,
+    "start_date": "2026-03-01",
+    "end_date": "2026-12-31",
+}
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -44,58 +39,58 @@ def _assert_active_offers_response(
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-def test_list_active_offers_returns_200_on_success(
+def test_list_active_offers_returns_200_with_catalog_page_and_etag(
     user_client: TestClient,
     offer_service_mock: Mock,
-    offer_factory: Callable[..., Offer],
 ) -> None:
     # Arrange
-    offer_ids = [
-        "a0000001-0000-0000-0000-000000000001",
-        "a0000002-0000-0000-0000-000000000002",
-    ]
-    merchant_names = ["Shoply", "QuickCart"]
-    offers = [offer_factory(id=offer_ids[i]) for i in range(2)]
-    items: list[tuple[Offer, str]] = list(zip(offers, merchant_names))
-    offer_service_mock.list_active_offers.return_value = (items, 2)
+    offer_service_mock.list_active_offers.return_value = _page([_ITEM], 1)
 
     # Act
     response = user_client.get("/api/v1/offers/active")
 
     # Assert
     assert response.status_code == status.HTTP_200_OK
-    _assert_active_offers_response(
-        response.json(),
-        items,
-        total=2,
-        offset=0,
-        limit=settings.default_page_size,
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert response.headers["cache-control"] == "private, no-cache"
+    data = response.json()
+    assert data["data"] == [_ITEM]
+    assert data["pagination"]["total"] == 1
+
+
+def test_list_active_offers_returns_304_when_etag_matches(
+    user_client: TestClient,
+    offer_service_mock: Mock,
+) -> None:
+    # Arrange
+    offer_service_mock.list_active_offers.return_value = _page([_ITEM], 1)
+
+    # Act
+    response = user_client.get(
+        "/api/v1/offers/active", headers={"If-None-Match": 'W/"v1"'}
     )
 
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == 'W/"v1"'
 
-def test_list_active_offers_maps_fixed_cashback_correctly(
+
+def test_list_active_offers_passes_pagination_to_service(
     user_client: TestClient,
     offer_service_mock: Mock,
-    offer_factory: Callable[..., Offer],
 ) -> None:
     # Arrange
-    fixed_offer = offer_factory(percentage=0.0, fixed_amount=5.0)
-    merchant_name = "QuickCart"
-    items: list[tuple[Offer, str]] = [(fixed_offer, merchant_name)]
-    offer_service_mock.list_active_offers.return_value = (items, 1)
+    offer_service_mock.list_active_offers.return_value = _page([], None)
 
     # Act
-    response = user_client.get("/api/v1/offers/active")
+    user_client.get("/api/v1/offers/active?offset=5&limit=2&include_total=false")
 
     # Assert
-    assert response.status_code == status.HTTP_200_OK
-    _assert_active_offers_response(
-        response.json(),
-        items,
-        total=1,
-        offset=0,
-        limit=settings.default_page_size,
-    )
+    call = offer_service_mock.list_active_offers.call_args
+    assert call.args[:2] == (5, 2)
+    assert call.kwargs["include_total"] is False
 
 
 def test_list_active_offers_returns_200_on_empty_results(
@@ -103,7 +98,7 @@ def test_list_active_offers_returns_200_on_empty_results(
     offer_service_mock: Mock,
 ) -> None:
     # Arrange
-    offer_service_mock.list_active_offers.return_value = ([], 0)
+    offer_service_mock.list_active_offers.return_value = _page([], 0)
 
     # Act
     response = user_client.get("/api/v1/offers/active")
@@ -177,7 +172,7 @@ def test_list_active_offers_returns_200_on_valid_pagination_params(
     query_string: str,
 ) -> None:
     # Arrange
-    offer_service_mock.list_active_offers.return_value = ([], 0)
+    offer_service_mock.list_active_offers.return_value = _page([], 0)
 
     # Act
     response = user_client.get(f"/api/v1/offers/active?{query_string}")
@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 
 from app.core.config import settings
 from app.core.errors.codes import ErrorCode
+from app.core.pagination import TotalCount
 from app.offers.models import Offer
 from tests.unit.offers.conftest import assert_error_code
 
@@ -57,7 +58,7 @@ def test_list_offers_returns_200_on_success(
         "a0000003-0000-0000-0000-000000000003",
     ]
     offers = [offer_factory(id=offer_ids[i]) for i in range(3)]
-    offer_service_mock.list_offers.return_value = (offers, 3)
+    offer_service_mock.list_offers.return_value = (offers, 3, False)
 
     # Act
     response = user_client.get("/api/v1/offers")
@@ -74,7 +75,7 @@ def test_list_offers_returns_200_on_empty_results(
     offer_service_mock: Mock,
 ) -> None:
     # Arrange
-    offer_service_mock.list_offers.return_value = ([], 0)
+    offer_service_mock.list_offers.return_value = ([], 0, False)
 
     # Act
     response = user_client.get("/api/v1/offers")
@@ -86,6 +87,23 @@ def test_list_offers_returns_200_on_empty_results(
     assert data["data"] == []
 
 
+def test_list_offers_flags_an_estimated_total(
+    user_client: TestClient,
+    offer_service_mock: Mock,
+) -> None:
+    # Arrange
+    offer_service_mock.list_offers.return_value = ([], 250_000, True)
+
+    # Act
+    response = user_client.get("/api/v1/offers?total=estimated")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["pagination"]["total_estimated"] is True
+    call_kwargs = offer_service_mock.list_offers.call_args.kwargs
+    assert call_kwargs["total_count"] == TotalCount.ESTIMATED
+
+
 def test_list_offers_returns_500_on_unexpected_error(
     user_client: TestClient,
     offer_service_mock: Mock,
@@ -150,7 +168,7 @@ def test_list_offers_returns_200_on_valid_pagination_params(
     query_string: str,
 ) -> None:
     # Arrange
-    offer_service_mock.list_offers.return_value = ([], 0)
+    offer_service_mock.list_offers.return_value = ([], 0, False)
 
     # Act
     response = user_client.get(f"/api/v1/offers?{query_string}")
@@ -4,9 +4,12 @@ from unittest.mock import AsyncMock, Mock, create_autospec
 
 import pytest
 
+from app.core.cache import TTLCache
+from app.core.pagination import TotalCount
 from app.merchants.exceptions import MerchantNotFoundException
 from app.merchants.models import Merchant
 from app.merchants.repository import MerchantRepositoryABC
+from app.offers.catalog import ActiveOfferCatalog
 from app.offers.exceptions import (
     ActiveOfferAlreadyExistsException,
     InactiveMerchantForOfferException,
@@ -68,6 +71,16 @@ def merchant_repository_mock() -> Mock:
     return create_autospec(MerchantRepositoryABC)
 
 
+@pytest.fixture
+def active_offer_cache() -> TTLCache[tuple[str, date], Any]:
+    return TTLCache(max_size=10, ttl_seconds=60)
+
+
+@pytest.fixture
+def active_offer_catalog_mock() -> Mock:
+    return create_autospec(ActiveOfferCatalog, instance=True)
+
+
 @pytest.fixture
 def offer_service(
     enforce_cashback_value_validity_mock: Mock,
@@ -79,6 +92,8 @@ def offer_service(
     enforce_offer_merchant_visibility_mock: Mock,
     offer_repository_mock: Mock,
     merchant_repository_mock: Mock,
+    active_offer_cache: TTLCache[tuple[str, date], Any],
+    active_offer_catalog_mock: Mock,
 ) -> OfferService:
     return OfferService(
         enforce_cashback_value_validity=enforce_cashback_value_validity_mock,
@@ -90,6 +105,8 @@ def offer_service(
         enforce_offer_merchant_visibility=enforce_offer_merchant_visibility_mock,
         offer_repository=offer_repository_mock,
         merchant_repository=merchant_repository_mock,
+        active_offer_cache=active_offer_cache,
+        active_offer_catalog=active_offer_catalog_mock,
     )
 
 
@@ -145,6 +162,39 @@ async def test_create_offer_returns_offer_on_success(
     uow.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_create_offer_invalidates_active_offer_cache_and_catalog(
+    offer_service: OfferService,
+    offer_repository_mock: Mock,
+    merchant_repository_mock: Mock,
+    offer_factory: Callable[..., Offer],
+    merchant_factory: Callable[..., Merchant],
+    active_offer_cache: TTLCache[tuple[str, date], Any],
+    active_offer_catalog_mock: Mock,
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    data = _make_offer_create()
+    merchant_id = data["merchant_id"]
+    merchant_repository_mock.get_merchant_by_id.return_value = merchant_factory(
+        active=True
+    )
+    offer_repository_mock.has_active_offer_for_merchant.return_value = False
+    offer_repository_mock.add_offer.return_value = offer_factory()
+    active_offer_cache.set((merchant_id, date(2026, 3, 1)), "cached")
+    active_offer_cache.set((merchant_id, date(2026, 3, 2)), "cached")
+    active_offer_cache.set(("other-merchant", date(2026, 3, 1)), "cached")
+
+    # Act
+    await offer_service.create_offer(data, uow)
+
+    # Assert — every cached day of this merchant, and only this merchant
+    assert active_offer_cache.get((merchant_id, date(2026, 3, 1))) is None
+    assert active_offer_cache.get((merchant_id, date(2026, 3, 2))) is None
+    assert active_offer_cache.get(("other-merchant", date(2026, 3, 1))) == "cached"
+    active_offer_catalog_mock.invalidate.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_create_offer_enforces_cashback_value_validity_policy(
     offer_service: OfferService,
@@ -352,7 +402,7 @@ async def test_list_offers_returns_repository_result_on_call(
     offer_repository_mock.list_offers.return_value = (offers, expected_total)
 
     # Act
-    items, total = await offer_service.list_offers(
+    items, total, total_estimated = await offer_service.list_offers(
         offset=0,
         limit=20,
         active=active_filter,
@@ -365,16 +415,60 @@ async def test_list_offers_returns_repository_result_on_call(
     # Assert
     assert items == offers
     assert total == expected_total
+    assert total_estimated is False
     offer_repository_mock.list_offers.assert_called_once_with(
-        db, 0, 20, active=active_filter, merchant_id=None, date_from=None, date_to=None
+        db,
+        0,
+        20,
+        active=active_filter,
+        merchant_id=None,
+        date_from=None,
+        date_to=None,
+        total_count=TotalCount.EXACT,
     )
 
 
+@pytest.mark.parametrize(
+    "active_filter, expected_total_count, expected_estimated",
+    [
+        (None, TotalCount.ESTIMATED, True),
+        (True, TotalCount.EXACT, False),  # estimates ignore filters
+    ],
+)
+@pytest.mark.asyncio
+async def test_list_offers_estimates_the_total_only_for_unfiltered_lists(
+    offer_service: OfferService,
+    offer_repository_mock: Mock,
+    active_filter: bool | None,
+    expected_total_count: TotalCount,
+    expected_estimated: bool,
+) -> None:
+    # Arrange
+    offer_repository_mock.list_offers.return_value = ([], 0)
+
+    # Act
+    *_, total_estimated = await offer_service.list_offers(
+        offset=0,
+        limit=20,
+        active=active_filter,
+        merchant_id=None,
+        date_from=None,
+        date_to=None,
+        db=AsyncMock(),
+        total_count=TotalCount.ESTIMATED,
+    )
+
+    # Assert
+    assert total_estimated is expected_estimated
+    call_kwargs = offer_repository_mock.list_offers.call_args.kwargs
+    assert call_kwargs["total_count"] == expected_total_count
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # OfferService.list_active_offers
 # ──────────────────────────────────────────────────────────────────────────────
 
-# It is a simple forwarding method to the repository, no tests required.
+# It is a simple forwarding method to the active offer catalog, no tests required.
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -409,6 +503,32 @@ async def test_set_offer_status_returns_updated_offer(
     uow.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_set_offer_status_invalidates_active_offer_cache_and_catalog(
+    offer_service: OfferService,
+    offer_repository_mock: Mock,
+    offer_factory: Callable[..., Offer],
+    active_offer_cache: TTLCache[tuple[str, date], Any],
+    active_offer_catalog_mock: Mock,
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    existing = offer_factory(active=True)
+    offer_repository_mock.get_offer_by_id.return_value = existing
+    offer_repository_mock.update_offer_status.return_value = offer_factory(
+        merchant_id=existing.merchant_id, active=False
+    )
+    key = (str(existing.merchant_id), date(2026, 3, 28))
+    active_offer_cache.set(key, "cached")
+
+    # Act
+    await offer_service.set_offer_status(existing.id, False, uow)
+
+    # Assert
+    assert active_offer_cache.get(key) is None
+    active_offer_catalog_mock.invalidate.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_set_offer_status_raises_on_offer_not_found(
     offer_service: OfferService,
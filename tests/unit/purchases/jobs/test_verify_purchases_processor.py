@@ -7,7 +7,7 @@ and publishes domain events with correct financial details.
 Module under test: app.purchases.jobs.verify_purchases._processor
 """
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock, create_autospec
 
@@ -55,6 +55,7 @@ def purchase() -> Purchase:
         cashback_amount=_CASHBACK_AMOUNT,
         currency=_CURRENCY,
         status=PurchaseStatus.PENDING.value,
+        created_at=datetime(2026, 3, 10, 9, 0, 0),
     )
 
 
@@ -319,6 +320,42 @@ async def test_reject_purchase_reverses_cashback_when_nonzero(
     cashback_client.reverse.assert_called_once_with(db, _PURCHASE_ID)
 
 
+@pytest.mark.asyncio
+async def test_reject_purchase_releases_monthly_cap_usage(
+    purchase: Purchase,
+    db: Mock,
+    repository: Mock,
+    wallets_client: Mock,
+    cashback_client: Mock,
+    broker: Mock,
+) -> None:
+    """Verify _reject_purchase gives the cashback back to the monthly cap."""
+    # Arrange
+    repository.update_status = AsyncMock()
+
+    # Act
+    await _reject_purchase(
+        purchase=purchase,
+        reason="Bank declined",
+        attempt=1,
+        failed_at=_FAILED_AT,
+        db=db,
+        repository=repository,
+        wallets_client=wallets_client,
+        cashback_client=cashback_client,
+        broker=broker,
+    )
+
+    # Assert
+    cashback_client.release_monthly_usage.assert_called_once_with(
+        db,
+        "o1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d",
+        _USER_ID,
+        date(2026, 3, 1),
+        _CASHBACK_AMOUNT,
+    )
+
+
 @pytest.mark.asyncio
 async def test_reject_purchase_reverses_wallet_pending_when_nonzero(
     purchase: Purchase,
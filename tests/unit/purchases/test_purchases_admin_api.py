@@ -1,18 +1,28 @@
+import json
 from decimal import Decimal
-from typing import Any, AsyncGenerator, Callable, Generator
-from unittest.mock import AsyncMock, Mock, create_autospec
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Generator
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
 from app.auth.exceptions import InvalidTokenException
+from app.core.config import settings
 from app.core.current_user import get_current_admin_user
 from app.core.database import get_async_db
 from app.core.errors.codes import ErrorCode
+from app.core.pagination import InvalidCursorException
 from app.core.unit_of_work import UnitOfWorkABC
 from app.main import app
-from app.purchases.composition import get_purchase_service, get_unit_of_work
+from app.purchases.bulk_import import PurchaseImporter
+from app.purchases.composition import (
+    get_external_id_filter,
+    get_purchase_exporter,
+    get_purchase_importer,
+    get_purchase_service,
+    get_unit_of_work,
+)
 from app.purchases.errors import ErrorCode as PurchaseErrorCode
 from app.purchases.exceptions import (
     InvalidPurchaseStatusException,
@@ -20,6 +30,11 @@ from app.purchases.exceptions import (
     PurchaseNotFoundException,
     PurchaseNotPendingException,
 )
+from app.purchases.export import PurchaseExporter, PurchaseExportFormat
+from app.purchases.external_id_filter import (
+    ExternalIdFilterABC,
+    ExternalIdFilterStats,
+)
 from app.purchases.models import Purchase
 from app.purchases.services import PurchaseService
 
@@ -138,7 +153,7 @@ def test_list_all_purchases_returns_200_on_success(
 ) -> None:
     # Arrange
     purchase = purchase_factory()
-    purchase_service_mock.list_purchases.return_value = ([purchase], 1)
+    purchase_service_mock.list_purchases.return_value = ([purchase], 1, None)
 
     # Act
     response = client.get("/api/v1/purchases")
@@ -158,7 +173,7 @@ def test_list_all_purchases_returns_empty_list_when_no_results(
     purchase_service_mock: Mock,
 ) -> None:
     # Arrange
-    purchase_service_mock.list_purchases.return_value = ([], 0)
+    purchase_service_mock.list_purchases.return_value = ([], 0, None)
 
     # Act
     response = client.get("/api/v1/purchases")
@@ -179,7 +194,7 @@ def test_list_all_purchases_returns_correct_item_fields(
 ) -> None:
     # Arrange
     purchase = purchase_factory()
-    purchase_service_mock.list_purchases.return_value = ([purchase], 1)
+    purchase_service_mock.list_purchases.return_value = ([purchase], 1, None)
 
     # Act
     response = client.get("/api/v1/purchases")
@@ -195,7 +210,7 @@ def test_list_all_purchases_reflects_pagination_params(
     purchase_service_mock: Mock,
 ) -> None:
     # Arrange
-    purchase_service_mock.list_purchases.return_value = ([], 0)
+    purchase_service_mock.list_purchases.return_value = ([], 0, None)
     requested_offset = 10
     requested_limit = 5
 
@@ -211,12 +226,37 @@ def test_list_all_purchases_reflects_pagination_params(
     assert data["pagination"]["limit"] == requested_limit
 
 
+def test_list_all_purchases_follows_cursor_and_returns_next_cursor(
+    client: TestClient,
+    purchase_service_mock: Mock,
+) -> None:
+    # Arrange
+    purchase_service_mock.list_purchases.return_value = ([], None, "next-page")
+
+    # Act
+    response = client.get("/api/v1/purchases?cursor=this-page&limit=50")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    pagination = response.json()["pagination"]
+    assert pagination == {
+        "offset": 0,
+        "limit": 50,
+        "total": None,
+        "total_estimated": False,
+        "next_cursor": "next-page",
+    }
+    assert purchase_service_mock.list_purchases.call_args.kwargs["cursor"] == (
+        "this-page"
+    )
+
+
 def test_list_all_purchases_passes_filters_to_service(
     client: TestClient,
     purchase_service_mock: Mock,
 ) -> None:
     # Arrange
-    purchase_service_mock.list_purchases.return_value = ([], 0)
+    purchase_service_mock.list_purchases.return_value = ([], 0, None)
     user_id = "b7e2c1a2-4f3a-4e2b-9c1a-8d2e3f4b5c6d"
     merchant_id = "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d"
 
@@ -249,6 +289,11 @@ def test_list_all_purchases_passes_filters_to_service(
             status.HTTP_422_UNPROCESSABLE_CONTENT,
             PurchaseErrorCode.INVALID_PURCHASE_STATUS,
         ),
+        (
+            InvalidCursorException("garbage"),
+            status.HTTP_400_BAD_REQUEST,
+            ErrorCode.VALIDATION_ERROR,
+        ),
         (
             Exception("unexpected failure"),
             status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -322,9 +367,9 @@ def test_list_all_purchases_returns_422_on_invalid_pagination_params(
     response = client.get(f"/api/v1/purchases?{query_string}")
 
     # Assert
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT, (
-        f"Expected 422 for: {description}"
-    )
+    assert (
+        response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    ), f"Expected 422 for: {description}"
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -613,3 +658,209 @@ def test_admin_confirm_purchase_returns_401_on_non_admin(
     # Assert
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     _assert_error_payload(response.json(), ErrorCode.INVALID_TOKEN)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# POST /api/v1/purchases/import
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def import_client(
+    client: TestClient, purchase_service_mock: Mock
+) -> Generator[TestClient, None, None]:
+    session_context = MagicMock()
+    session_context.__aenter__ = AsyncMock(return_value=AsyncMock())
+    session_context.__aexit__ = AsyncMock(return_value=False)
+    importer = PurchaseImporter(
+        service=purchase_service_mock,
+        db_session_factory=Mock(return_value=session_context),
+        chunk_size=100,
+    )
+    purchase_service_mock.get_import_checkpoint.return_value = None
+    app.dependency_overrides[get_purchase_importer] = lambda: importer
+    yield client
+
+
+def _import_line(external_id: str, amount: str = "10.00") -> str:
+    return json.dumps(
+        {
+            "external_id": external_id,
+            "user_id": "b7e2c1a2-4f3a-4e2b-9c1a-8d2e3f4b5c6d",
+            "merchant_id": "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d",
+            "amount": amount,
+            "currency": "EUR",
+        }
+    )
+
+
+def test_import_purchases_streams_progress_and_row_errors(
+    import_client: TestClient,
+    purchase_service_mock: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    purchase_service_mock.import_purchase_chunk.return_value = [purchase_factory()]
+    body = "\n".join([_import_line("txn_1", amount="-1"), _import_line("txn_2")])
+
+    # Act
+    response = import_client.post(
+        "/api/v1/purchases/import?import_id=backfill-1&format=ndjson",
+        content=body,
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e["type"] for e in events] == ["started", "error", "progress", "completed"]
+    assert events[1]["line"] == 1
+    assert events[-1]["imported"] == 1
+    assert events[-1]["rejected"] == 1
+
+
+def test_import_purchases_returns_404_when_source_file_unavailable(
+    import_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "purchase_import_dir", "")
+
+    # Act
+    response = import_client.post(
+        "/api/v1/purchases/import?import_id=backfill-1&source_file=backfill.ndjson"
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["error"]["code"] == ErrorCode.NOT_FOUND
+
+
+def test_import_purchases_returns_401_for_non_admin(
+    non_admin_client: TestClient,
+) -> None:
+    # Act
+    response = non_admin_client.post(
+        "/api/v1/purchases/import?import_id=backfill-1", content=_import_line("txn_1")
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# GET /api/v1/purchases/export
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def exporter_mock(client: TestClient) -> Generator[Mock, None, None]:
+    exporter = create_autospec(PurchaseExporter, instance=True)
+    app.dependency_overrides[get_purchase_exporter] = lambda: exporter
+    yield exporter
+
+
+async def _export_pieces(*pieces: str) -> AsyncIterator[str]:
+    for piece in pieces:
+        yield piece
+
+
+def test_export_purchases_streams_csv_attachment(
+    client: TestClient, exporter_mock: Mock
+) -> None:
+    # Arrange
+    exporter_mock.export.return_value = _export_pieces("id,status\n", "p-1,pending\n")
+
+    # Act
+    response = client.get("/api/v1/purchases/export?status=pending")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert "purchases.csv" in response.headers["content-disposition"]
+    assert response.text == "id,status\np-1,pending\n"
+    call = exporter_mock.export.call_args
+    assert call.args[0] == PurchaseExportFormat.CSV
+    assert call.kwargs["status"] == "pending"
+
+
+def test_export_purchases_streams_ndjson_when_requested(
+    client: TestClient, exporter_mock: Mock
+) -> None:
+    # Arrange
+    exporter_mock.export.return_value = _export_pieces('{"id": "p-1"}\n')
+
+    # Act
+    response = client.get("/api/v1/purchases/export?format=ndjson")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert exporter_mock.export.call_args.args[0] == PurchaseExportFormat.NDJSON
+
+
+def test_export_purchases_returns_422_on_invalid_status(
+    client: TestClient, exporter_mock: Mock
+) -> None:
+    # Arrange
+    exporter_mock.export.side_effect = InvalidPurchaseStatusException("unknown")
+
+    # Act
+    response = client.get("/api/v1/purchases/export?status=unknown")
+
+    # Assert
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert response.json()["error"]["code"] == PurchaseErrorCode.INVALID_PURCHASE_STATUS
+
+
+def test_export_purchases_returns_401_for_non_admin(
+    non_admin_client: TestClient,
+) -> None:
+    # Act
+    response = non_admin_client.get("/api/v1/purchases/export")
+
+    # Assert
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# GET /api/v1/purchases/external-id-filter
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_get_external_id_filter_stats_returns_200_with_stats(
+    client: TestClient,
+) -> None:
+    # Arrange
+    external_id_filter = create_autospec(ExternalIdFilterABC)
+    external_id_filter.stats.return_value = ExternalIdFilterStats(
+        loaded=True,
+        item_count=1200,
+        capacity=1_000_000,
+        size_bytes=1_198_132,
+        hash_count=7,
+        estimated_false_positive_rate=0.0,
+        positive_lookups=40,
+        false_positives=1,
+    )
+    app.dependency_overrides[get_external_id_filter] = lambda: external_id_filter
+
+    # Act
+    response = client.get("/api/v1/purchases/external-id-filter")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["loaded"] is True
+    assert body["item_count"] == 1200
+    assert body["false_positives"] == 1
+
+
+def test_get_external_id_filter_stats_returns_401_on_non_admin(
+    non_admin_client: TestClient,
+) -> None:
+    # Act
+    response = non_admin_client.get("/api/v1/purchases/external-id-filter")
+
+    # Assert
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,393 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec
+
+import pytest
+
+from app.purchases.bulk_import import (
+    ImportRow,
+    PurchaseImporter,
+    parse_csv,
+    parse_ndjson,
+    resolve_import_file,
+)
+from app.purchases.exceptions import (
+    DuplicatePurchaseException,
+    PurchaseImportSourceUnavailableException,
+)
+from app.purchases.models import Purchase, PurchaseImportCheckpoint
+from app.purchases.services import PurchaseService
+
+_USER_ID = "b7e2c1a2-4f3a-4e2b-9c1a-8d2e3f4b5c6d"
+_MERCHANT_ID = "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d"
+
+
+@pytest.fixture
+def purchase_service() -> Mock:
+    service = create_autospec(PurchaseService, instance=True)
+    service.get_import_checkpoint.return_value = None
+    return service
+
+
+@pytest.fixture
+def db_session_factory() -> Mock:
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=AsyncMock())
+    context.__aexit__ = AsyncMock(return_value=False)
+    return Mock(return_value=context)
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+async def _rows(rows: list[ImportRow]) -> AsyncIterator[ImportRow]:
+    for row in rows:
+        yield row
+
+
+async def _collect(iterator: AsyncIterator[Any]) -> list[Any]:
+    return [item async for item in iterator]
+
+
+def _row_data(external_id: str) -> dict[str, Any]:
+    return {
+        "external_id": external_id,
+        "user_id": _USER_ID,
+        "merchant_id": _MERCHANT_ID,
+        "amount": "10.00",
+        "currency": "EUR",
+    }
+
+
+def _make_importer(
+    purchase_service: Mock, db_session_factory: Mock, chunk_size: int = 2
+) -> PurchaseImporter:
+    return PurchaseImporter(
+        service=purchase_service,
+        db_session_factory=db_session_factory,
+        chunk_size=chunk_size,
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# parse_ndjson / parse_csv
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_parse_ndjson_handles_lines_split_across_chunks() -> None:
+    # Act
+    rows = await _collect(
+        parse_ndjson(_chunks(b'{"external_id": "a"}\n{"exter', b'nal_id": "b"}'))
+    )
+
+    # Assert
+    assert [(r.line, r.data) for r in rows] == [
+        (1, {"external_id": "a"}),
+        (2, {"external_id": "b"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parse_ndjson_reports_invalid_lines_and_skips_blank_ones() -> None:
+    # Act
+    rows = await _collect(parse_ndjson(_chunks(b"\n{not json}\n[1, 2]\n")))
+
+    # Assert
+    assert [r.line for r in rows] == [1, 2]
+    assert all(r.data is None and r.error for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_maps_columns_from_header() -> None:
+    # Act
+    rows = await _collect(
+        parse_csv(_chunks(b"external_id,amount\r\n", b"txn_1,10.00\r\ntxn_2,5\r\n"))
+    )
+
+    # Assert
+    assert [r.data for r in rows] == [
+        {"external_id": "txn_1", "amount": "10.00"},
+        {"external_id": "txn_2", "amount": "5"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_reports_rows_with_wrong_column_count() -> None:
+    # Act
+    rows = await _collect(parse_csv(_chunks(b"external_id,amount\ntxn_1\n")))
+
+    # Assert
+    assert rows[0].line == 1
+    assert rows[0].data is None
+    assert rows[0].error is not None
+
+
+@pytest.mark.asyncio
+async def test_parse_ndjson_reports_undecodable_lines_and_keeps_going() -> None:
+    # Act
+    rows = await _collect(
+        parse_ndjson(_chunks(b'{"external_id": "\xff"}\n{"external_id": "b"}\n'))
+    )
+
+    # Assert
+    assert rows[0].line == 1
+    assert rows[0].data is None
+    assert rows[0].error == "Line is not valid UTF-8."
+    assert rows[1].data == {"external_id": "b"}
+
+
+@pytest.mark.asyncio
+async def test_parse_ndjson_reports_overlong_lines_without_buffering_them() -> None:
+    # Arrange — an overlong line spread over many chunks, then a normal one
+    overlong = [b"x" * 4096] * 10
+    source = _chunks(*overlong, b'\n{"external_id": "b"}')
+
+    # Act
+    rows = await _collect(parse_ndjson(source))
+
+    # Assert
+    assert [r.line for r in rows] == [1, 2]
+    assert rows[0].data is None
+    assert rows[0].error is not None and "longer than" in rows[0].error
+    assert rows[1].data == {"external_id": "b"}
+
+
+@pytest.mark.asyncio
+async def test_parse_csv_reports_undecodable_rows() -> None:
+    # Act
+    rows = await _collect(
+        parse_csv(_chunks(b"external_id,amount\ntxn_\xff,1\ntxn_2,5\n"))
+    )
+
+    # Assert
+    assert [(r.line, r.data) for r in rows] == [
+        (1, None),
+        (2, {"external_id": "txn_2", "amount": "5"}),
+    ]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# resolve_import_file
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_resolve_import_file_returns_file_inside_import_dir(tmp_path: Path) -> None:
+    # Arrange
+    (tmp_path / "backfill.ndjson").write_text("")
+
+    # Act
+    path = resolve_import_file(str(tmp_path), "backfill.ndjson")
+
+    # Assert
+    assert path == tmp_path / "backfill.ndjson"
+
+
+@pytest.mark.parametrize(
+    "import_dir_name, source_file",
+    [
+        ("", "backfill.ndjson"),
+        ("imports", "../secret.ndjson"),
+        ("imports", "missing.ndjson"),
+    ],
+    ids=["import_dir_disabled", "path_traversal", "missing_file"],
+)
+def test_resolve_import_file_raises_when_unavailable(
+    tmp_path: Path, import_dir_name: str, source_file: str
+) -> None:
+    # Arrange
+    (tmp_path / "imports").mkdir()
+    (tmp_path / "secret.ndjson").write_text("")
+    import_dir = str(tmp_path / import_dir_name) if import_dir_name else ""
+
+    # Act & Assert
+    with pytest.raises(PurchaseImportSourceUnavailableException):
+        resolve_import_file(import_dir, source_file)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseImporter.run
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_run_commits_rows_in_chunks_with_checkpoint(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    importer = _make_importer(purchase_service, db_session_factory, chunk_size=2)
+    purchase_service.import_purchase_chunk.side_effect = lambda _id, items, uow, **kw: [
+        purchase_factory() for _ in items
+    ]
+    rows = [ImportRow(line=i, data=_row_data(f"txn_{i}")) for i in range(1, 4)]
+
+    # Act
+    events = await _collect(importer.run("backfill-1", _rows(rows)))
+
+    # Assert — two chunks (2 + 1 rows), each carrying its checkpoint position
+    calls = purchase_service.import_purchase_chunk.call_args_list
+    assert [len(call.args[1]) for call in calls] == [2, 1]
+    assert [call.kwargs["rows_processed"] for call in calls] == [2, 3]
+    assert [e["type"] for e in events] == [
+        "started",
+        "progress",
+        "progress",
+        "completed",
+    ]
+    assert events[-1]["imported"] == 3
+
+
+@pytest.mark.asyncio
+async def test_run_reports_invalid_rows_without_ingesting_them(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    importer = _make_importer(purchase_service, db_session_factory)
+    purchase_service.import_purchase_chunk.return_value = [purchase_factory()]
+    rows = [
+        ImportRow(line=1, data=_row_data("txn_1") | {"amount": "-5"}),
+        ImportRow(line=2, data=_row_data("txn_2")),
+    ]
+
+    # Act
+    events = await _collect(importer.run("backfill-1", _rows(rows)))
+
+    # Assert
+    errors = [e for e in events if e["type"] == "error"]
+    assert [(e["line"], e["code"]) for e in errors] == [(1, "VALIDATION_ERROR")]
+    call = purchase_service.import_purchase_chunk.call_args
+    assert len(call.args[1]) == 1
+    assert call.kwargs["prior_rejected_count"] == 1
+    assert events[-1]["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_passes_the_purchase_date_of_backfilled_rows(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    importer = _make_importer(purchase_service, db_session_factory)
+    purchase_service.import_purchase_chunk.return_value = [
+        purchase_factory(),
+        purchase_factory(),
+    ]
+    rows = [
+        ImportRow(
+            line=1, data=_row_data("txn_1") | {"created_at": "2026-01-15T10:30:00"}
+        ),
+        # An empty CSV cell means the purchase has no date of its own.
+        ImportRow(line=2, data=_row_data("txn_2") | {"created_at": ""}),
+    ]
+
+    # Act
+    await _collect(importer.run("backfill-1", _rows(rows)))
+
+    # Assert
+    items = purchase_service.import_purchase_chunk.call_args.args[1]
+    assert [data["created_at"] for data, _ in items] == [
+        datetime(2026, 1, 15, 10, 30),
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_rejects_purchase_dates_with_a_utc_offset(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+) -> None:
+    # Arrange
+    importer = _make_importer(purchase_service, db_session_factory)
+    rows = [
+        ImportRow(
+            line=1, data=_row_data("txn_1") | {"created_at": "2026-01-15T10:30:00Z"}
+        )
+    ]
+
+    # Act
+    events = await _collect(importer.run("backfill-1", _rows(rows)))
+
+    # Assert
+    errors = [e for e in events if e["type"] == "error"]
+    assert [(e["line"], e["code"]) for e in errors] == [(1, "VALIDATION_ERROR")]
+    assert "created_at" in errors[0]["message"]
+    assert purchase_service.import_purchase_chunk.call_args.args[1] == []
+
+
+@pytest.mark.asyncio
+async def test_run_reports_business_rule_rejections_per_row(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    importer = _make_importer(purchase_service, db_session_factory)
+    existing = purchase_factory(external_id="txn_1")
+    purchase_service.import_purchase_chunk.return_value = [
+        DuplicatePurchaseException("txn_1", existing.created_at, existing.amount)
+    ]
+
+    # Act
+    events = await _collect(
+        importer.run("backfill-1", _rows([ImportRow(1, _row_data("txn_1"))]))
+    )
+
+    # Assert
+    error = next(e for e in events if e["type"] == "error")
+    assert error["external_id"] == "txn_1"
+    assert error["code"] == "DUPLICATE_PURCHASE"
+
+
+@pytest.mark.asyncio
+async def test_run_resumes_after_committed_checkpoint(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    importer = _make_importer(purchase_service, db_session_factory)
+    purchase_service.get_import_checkpoint.return_value = PurchaseImportCheckpoint(
+        import_id="backfill-1", rows_processed=2, imported_count=2, rejected_count=0
+    )
+    purchase_service.import_purchase_chunk.return_value = [purchase_factory()]
+    rows = [ImportRow(line=i, data=_row_data(f"txn_{i}")) for i in range(1, 4)]
+
+    # Act
+    events = await _collect(importer.run("backfill-1", _rows(rows)))
+
+    # Assert — only the row after the checkpoint is ingested
+    items = purchase_service.import_purchase_chunk.call_args.args[1]
+    assert [data["external_id"] for data, _ in items] == ["txn_3"]
+    assert events[0]["resume_after"] == 2
+    assert events[-1]["imported"] == 3
+
+
+@pytest.mark.asyncio
+async def test_run_aborts_with_last_durable_progress_on_unexpected_error(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    importer = _make_importer(purchase_service, db_session_factory, chunk_size=1)
+    purchase_service.import_purchase_chunk.side_effect = [
+        [purchase_factory()],
+        RuntimeError("connection lost"),
+    ]
+    rows = [ImportRow(line=i, data=_row_data(f"txn_{i}")) for i in range(1, 3)]
+
+    # Act
+    events = await _collect(importer.run("backfill-1", _rows(rows)))
+
+    # Assert
+    assert events[-1]["type"] == "aborted"
+    assert events[-1]["rows_processed"] == 1
@@ -1,5 +1,6 @@
 from datetime import date
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Any, Callable
 from unittest.mock import AsyncMock, Mock, create_autospec
 
@@ -7,7 +8,11 @@ import pytest
 
 from app.cashback.calculator import CashbackCalculatorABC
 from app.cashback.models import CashbackResult, CashbackTransactionStatus
-from app.cashback.repositories import CashbackTransactionRepositoryABC
+from app.cashback.repositories import (
+    CashbackTransactionRepositoryABC,
+    OfferUserMonthlyUsageRepositoryABC,
+)
+from app.core.cache import TTLCache
 from app.feature_flags.services import FeatureFlagService
 from app.merchants.models import Merchant
 from app.offers.models import Offer
@@ -15,16 +20,16 @@ from app.purchases.clients import (
     CashbackClient,
     CashbackResultDTO,
     FeatureFlagClient,
+    IngestContextClient,
     MerchantDTO,
     MerchantsClient,
     OfferDTO,
     OffersClient,
+    OffersClientABC,
     UserDTO,
-    UsersClient,
     WalletsClient,
 )
 from app.purchases.models import Purchase
-from app.users.models import User
 from app.wallets.repositories import WalletRepositoryABC
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -32,6 +37,14 @@ from app.wallets.repositories import WalletRepositoryABC
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+def _merchants_client() -> MerchantsClient:
+    return MerchantsClient(cache=TTLCache(max_size=10, ttl_seconds=60))
+
+
+def _offers_client() -> OffersClient:
+    return OffersClient(cache=TTLCache(max_size=10, ttl_seconds=60))
+
+
 def _stub_scalar_one_or_none(db: AsyncMock, value: Any) -> None:
     """Configure db.execute to return a result whose scalar_one_or_none() == value."""
     mock_result = Mock()
@@ -49,7 +62,7 @@ async def test_merchants_client_get_by_id_returns_none_on_merchant_not_found() -
     # Arrange
     db = AsyncMock()
     _stub_scalar_one_or_none(db, None)
-    client = MerchantsClient()
+    client = _merchants_client()
 
     # Act
     result = await client.get_merchant_by_id(db, merchant_id="non-existent-id")
@@ -66,7 +79,7 @@ async def test_merchants_client_get_by_id_returns_dto_on_merchant_found(
     merchant = merchant_factory()
     db = AsyncMock()
     _stub_scalar_one_or_none(db, merchant)
-    client = MerchantsClient()
+    client = _merchants_client()
 
     # Act
     result = await client.get_merchant_by_id(db, merchant_id=str(merchant.id))
@@ -82,7 +95,7 @@ async def test_merchants_client_get_by_id_returns_dto_on_merchant_found(
 async def test_merchants_client_get_by_ids_returns_empty_dict_on_empty_list() -> None:
     # Arrange
     db = AsyncMock()
-    client = MerchantsClient()
+    client = _merchants_client()
 
     # Act
     result = await client.get_merchants_by_ids(db, merchant_ids=[])
@@ -103,7 +116,7 @@ async def test_merchants_client_get_by_ids_returns_dto_dict_on_merchants_found(
     mock_result.scalars.return_value.all.return_value = [merchant_a, merchant_b]
     db = AsyncMock()
     db.execute.return_value = mock_result
-    client = MerchantsClient()
+    client = _merchants_client()
 
     # Act
     result = await client.get_merchants_by_ids(db, merchant_ids=["m-id-1", "m-id-2"])
@@ -115,42 +128,116 @@ async def test_merchants_client_get_by_ids_returns_dto_dict_on_merchants_found(
     assert result["m-id-2"].active is False
 
 
-# ──────────────────────────────────────────────────────────────────────────────
-# UsersClient
-# ──────────────────────────────────────────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_merchants_client_get_by_id_serves_repeat_lookups_from_cache(
+    merchant_factory: Callable[..., Merchant],
+) -> None:
+    # Arrange
+    merchant = merchant_factory()
+    db = AsyncMock()
+    _stub_scalar_one_or_none(db, merchant)
+    client = _merchants_client()
+    await client.get_merchant_by_id(db, merchant_id=str(merchant.id))
+
+    # Act
+    result = await client.get_merchant_by_id(db, merchant_id=str(merchant.id))
+
+    # Assert
+    assert result is not None
+    assert result.name == merchant.name
+    db.execute.assert_awaited_once()
+    assert client.cache.stats().hits == 1
 
 
 @pytest.mark.asyncio
-async def test_users_client_get_by_id_returns_none_on_user_not_found() -> None:
+async def test_merchants_client_get_by_ids_queries_only_uncached_ids(
+    merchant_factory: Callable[..., Merchant],
+) -> None:
     # Arrange
+    merchant_b = merchant_factory(id="m-id-2", name="Beta")
+    mock_result = Mock()
+    mock_result.scalars.return_value.all.return_value = [merchant_b]
     db = AsyncMock()
-    _stub_scalar_one_or_none(db, None)
-    client = UsersClient()
+    db.execute.return_value = mock_result
+    client = _merchants_client()
+    client.cache.set("m-id-1", MerchantDTO(id="m-id-1", active=True, name="Alpha"))
 
     # Act
-    result = await client.get_user_by_id(db, user_id="non-existent-id")
+    result = await client.get_merchants_by_ids(db, merchant_ids=["m-id-1", "m-id-2"])
 
     # Assert
-    assert result is None
+    assert {k: v.name for k, v in result.items()} == {
+        "m-id-1": "Alpha",
+        "m-id-2": "Beta",
+    }
+    db.execute.assert_awaited_once()
+    assert client.cache.get("m-id-2") is not None
+
+
+@pytest.mark.asyncio
+async def test_merchants_client_get_by_ids_skips_db_when_all_cached() -> None:
+    # Arrange
+    db = AsyncMock()
+    client = _merchants_client()
+    client.cache.set("m-id-1", MerchantDTO(id="m-id-1", active=True, name="Alpha"))
+
+    # Act
+    result = await client.get_merchants_by_ids(db, merchant_ids=["m-id-1"])
+
+    # Assert
+    assert result["m-id-1"].name == "Alpha"
+    db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_merchants_client_get_by_id_skips_caching_across_invalidation(
+    merchant_factory: Callable[..., Merchant],
+) -> None:
+    # Arrange
+    merchant = merchant_factory()
+    client = _merchants_client()
+    mock_result = Mock()
+    mock_result.scalar_one_or_none.return_value = merchant
+
+    async def execute_racing_a_write(*args: Any, **kwargs: Any) -> Mock:
+        # A merchant write commits and invalidates while the query runs.
+        client.cache.invalidate(str(merchant.id))
+        return mock_result
+
+    db = AsyncMock()
+    db.execute.side_effect = execute_racing_a_write
+
+    # Act
+    result = await client.get_merchant_by_id(db, merchant_id=str(merchant.id))
+
+    # Assert
+    assert result is not None
+    assert client.cache.get(str(merchant.id)) is None
 
 
 @pytest.mark.asyncio
-async def test_users_client_get_by_id_returns_dto_on_user_found(
-    user_factory: Callable[..., User],
+async def test_merchants_client_get_by_ids_skips_caching_across_invalidation(
+    merchant_factory: Callable[..., Merchant],
 ) -> None:
     # Arrange
-    user = user_factory()
+    merchant = merchant_factory(id="m-id-1", name="Alpha")
+    client = _merchants_client()
+    mock_result = Mock()
+    mock_result.scalars.return_value.all.return_value = [merchant]
+
+    async def execute_racing_a_write(*args: Any, **kwargs: Any) -> Mock:
+        client.cache.invalidate("m-id-1")
+        return mock_result
+
     db = AsyncMock()
-    _stub_scalar_one_or_none(db, user)
-    client = UsersClient()
+    db.execute.side_effect = execute_racing_a_write
 
     # Act
-    result = await client.get_user_by_id(db, user_id=str(user.id))
+    result = await client.get_merchants_by_ids(db, merchant_ids=["m-id-1"])
 
     # Assert
-    assert isinstance(result, UserDTO)
-    assert result.id == user.id
-    assert result.active == user.active
+    assert result["m-id-1"].name == "Alpha"
+    assert client.cache.get("m-id-1") is None
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -163,7 +250,7 @@ async def test_offers_client_get_active_offer_returns_none_on_offer_not_found()
     # Arrange
     db = AsyncMock()
     _stub_scalar_one_or_none(db, None)
-    client = OffersClient()
+    client = _offers_client()
 
     # Act
     result = await client.get_active_offer_for_merchant(
@@ -182,7 +269,7 @@ async def test_offers_client_get_active_offer_returns_dto_on_offer_found(
     offer = offer_factory()
     db = AsyncMock()
     _stub_scalar_one_or_none(db, offer)
-    client = OffersClient()
+    client = _offers_client()
 
     # Act
     result = await client.get_active_offer_for_merchant(
@@ -200,6 +287,209 @@ async def test_offers_client_get_active_offer_returns_dto_on_offer_found(
     assert result.fixed_amount == offer.fixed_amount
 
 
+@pytest.mark.asyncio
+async def test_offers_client_serves_repeat_lookups_from_cache(
+    offer_factory: Callable[..., Offer],
+) -> None:
+    # Arrange
+    offer = offer_factory()
+    db = AsyncMock()
+    _stub_scalar_one_or_none(db, offer)
+    client = _offers_client()
+    today = date(2026, 3, 28)
+
+    # Act
+    first = await client.get_active_offer_for_merchant(db, offer.merchant_id, today)
+    second = await client.get_active_offer_for_merchant(db, offer.merchant_id, today)
+
+    # Assert
+    assert first == second
+    db.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_offers_client_caches_missing_offer() -> None:
+    # Arrange
+    db = AsyncMock()
+    _stub_scalar_one_or_none(db, None)
+    client = _offers_client()
+    today = date(2026, 3, 28)
+
+    # Act
+    await client.get_active_offer_for_merchant(db, "m-id-1", today)
+    result = await client.get_active_offer_for_merchant(db, "m-id-1", today)
+
+    # Assert
+    assert result is None
+    db.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_offers_client_looks_up_again_on_a_new_day(
+    offer_factory: Callable[..., Offer],
+) -> None:
+    # Arrange — the offer ends on the 28th, so the 29th must not reuse it
+    offer = offer_factory(end_date=date(2026, 3, 28))
+    db = AsyncMock()
+    _stub_scalar_one_or_none(db, offer)
+    client = _offers_client()
+    await client.get_active_offer_for_merchant(db, offer.merchant_id, date(2026, 3, 28))
+    _stub_scalar_one_or_none(db, None)
+
+    # Act
+    result = await client.get_active_offer_for_merchant(
+        db, offer.merchant_id, date(2026, 3, 29)
+    )
+
+    # Assert
+    assert result is None
+    assert db.execute.call_count == 2
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# IngestContextClient
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _stub_ingest_context_row(db: AsyncMock, **overrides: Any) -> None:
+    """Configure db.execute to return a single joined ingest-context row."""
+    row: dict[str, Any] = {
+        "user_id": "u-id-1",
+        "user_active": True,
+        "merchant_id": "m-id-1",
+        "merchant_active": True,
+        "merchant_name": "Acme Corp",
+        "cap_month": date(2026, 3, 1),
+        "monthly_cashback_used": None,
+    }
+    row.update(overrides)
+    mock_result = Mock()
+    mock_result.one.return_value = SimpleNamespace(**row)
+    db.execute.return_value = mock_result
+
+
+_OFFER = OfferDTO(
+    id="o-id-1",
+    merchant_id="m-id-1",
+    active=True,
+    start_date=date(2026, 3, 1),
+    end_date=date(2026, 12, 31),
+    percentage=10.0,
+    fixed_amount=None,
+    monthly_cap_per_user=50.0,
+)
+
+
+def _ingest_context_client(offer: OfferDTO | None = _OFFER) -> IngestContextClient:
+    offers_client = create_autospec(OffersClientABC, instance=True)
+    offers_client.get_active_offer_for_merchant.return_value = offer
+    return IngestContextClient(offers_client=offers_client)
+
+
+@pytest.mark.asyncio
+async def test_ingest_context_client_returns_all_dtos_in_single_query() -> None:
+    # Arrange
+    db = AsyncMock()
+    _stub_ingest_context_row(db, monthly_cashback_used=Decimal("4.50"))
+    client = _ingest_context_client()
+
+    # Act
+    result = await client.get_ingest_context(
+        db, user_id="u-id-1", merchant_id="m-id-1", today=date(2026, 3, 28)
+    )
+
+    # Assert
+    db.execute.assert_called_once()
+    assert result.user == UserDTO(id="u-id-1", active=True)
+    assert result.merchant == MerchantDTO(id="m-id-1", active=True, name="Acme Corp")
+    assert result.offer == _OFFER
+    assert result.cap_month == date(2026, 3, 1)
+    assert result.monthly_cashback_used == Decimal("4.50")
+
+
+@pytest.mark.asyncio
+async def test_ingest_context_client_reads_offer_through_offers_client() -> None:
+    # Arrange
+    db = AsyncMock()
+    _stub_ingest_context_row(db)
+    client = _ingest_context_client()
+
+    # Act
+    await client.get_ingest_context(
+        db, user_id="u-id-1", merchant_id="m-id-1", today=date(2026, 3, 28)
+    )
+
+    # Assert
+    client.offers_client.get_active_offer_for_merchant.assert_called_once_with(  # type: ignore[attr-defined]
+        db, "m-id-1", date(2026, 3, 28)
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_context_client_reads_usage_for_the_requested_month() -> None:
+    # Arrange
+    db = AsyncMock()
+    _stub_ingest_context_row(db)
+    client = _ingest_context_client()
+
+    # Act
+    await client.get_ingest_context(
+        db,
+        user_id="u-id-1",
+        merchant_id="m-id-1",
+        today=date(2026, 1, 15),
+        cap_month=date(2026, 1, 1),
+    )
+
+    # Assert — a backfill's month is bound instead of the database clock's
+    stmt = db.execute.call_args.args[0]
+    assert date(2026, 1, 1) in stmt.compile().params.values()
+    assert "localtimestamp" not in str(stmt).lower()
+
+
+@pytest.mark.asyncio
+async def test_ingest_context_client_returns_none_for_missing_rows() -> None:
+    # Arrange
+    db = AsyncMock()
+    _stub_ingest_context_row(
+        db,
+        user_id=None,
+        user_active=None,
+        merchant_id=None,
+        merchant_active=None,
+        merchant_name=None,
+    )
+    client = _ingest_context_client(offer=None)
+
+    # Act
+    result = await client.get_ingest_context(
+        db, user_id="u-id-1", merchant_id="m-id-1", today=date(2026, 3, 28)
+    )
+
+    # Assert
+    assert result.user is None
+    assert result.merchant is None
+    assert result.offer is None
+    assert result.monthly_cashback_used == Decimal("0")
+
+
+@pytest.mark.asyncio
+async def test_ingest_context_client_returns_inactive_flags_as_is() -> None:
+    # Arrange
+    db = AsyncMock()
+    _stub_ingest_context_row(db, user_active=False, merchant_active=False)
+    client = _ingest_context_client()
+
+    # Act
+    result = await client.get_ingest_context(
+        db, user_id="u-id-1", merchant_id="m-id-1", today=date(2026, 3, 28)
+    )
+
+    # Assert — policies, not the client, decide what inactive means
+    assert result.user is not None and result.user.active is False
+    assert result.merchant is not None and result.merchant.active is False
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # CashbackClient
 # ──────────────────────────────────────────────────────────────────────────────
@@ -216,9 +506,17 @@ def cashback_repo_mock() -> Mock:
 
 
 @pytest.fixture
-def cashback_client(calculator_mock: Mock, cashback_repo_mock: Mock) -> CashbackClient:
+def usage_repo_mock() -> Mock:
+    return create_autospec(OfferUserMonthlyUsageRepositoryABC)
+
+
+@pytest.fixture
+def cashback_client(
+    calculator_mock: Mock, cashback_repo_mock: Mock, usage_repo_mock: Mock
+) -> CashbackClient:
     client = CashbackClient(calculator=calculator_mock)
     client._repository = cashback_repo_mock  # pyright: ignore[reportPrivateUsage]
+    client._usage_repository = usage_repo_mock  # pyright: ignore[reportPrivateUsage]
     return client
 
 
@@ -307,6 +605,46 @@ async def test_cashback_client_reverse_delegates_to_repository_with_reversed_sta
     )
 
 
+@pytest.mark.asyncio
+async def test_cashback_client_add_monthly_usage_delegates_to_usage_repository(
+    cashback_client: CashbackClient,
+    usage_repo_mock: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    usage_repo_mock.add_usage.return_value = True
+
+    # Act
+    result = await cashback_client.add_monthly_usage(
+        db, "o-id-1", "u-id-1", date(2026, 3, 1), Decimal("5.00"), Decimal("50")
+    )
+
+    # Assert
+    assert result is True
+    usage_repo_mock.add_usage.assert_called_once_with(
+        db, "o-id-1", "u-id-1", date(2026, 3, 1), Decimal("5.00"), Decimal("50")
+    )
+
+
+@pytest.mark.asyncio
+async def test_cashback_client_release_monthly_usage_delegates_to_usage_repository(
+    cashback_client: CashbackClient,
+    usage_repo_mock: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+
+    # Act
+    await cashback_client.release_monthly_usage(
+        db, "o-id-1", "u-id-1", date(2026, 3, 1), Decimal("5.00")
+    )
+
+    # Assert
+    usage_repo_mock.release_usage.assert_called_once_with(
+        db, "o-id-1", "u-id-1", date(2026, 3, 1), Decimal("5.00")
+    )
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # WalletsClient
 # ──────────────────────────────────────────────────────────────────────────────
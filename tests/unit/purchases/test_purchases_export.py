@@ -0,0 +1,199 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec
+
+import pytest
+
+from app.purchases import export
+from app.purchases.exceptions import InvalidPurchaseStatusException
+from app.purchases.export import (
+    EXPORT_COLUMNS,
+    PurchaseExporter,
+    PurchaseExportFormat,
+)
+from app.purchases.repositories import PurchaseRepositoryABC
+
+_USER_ID = "b7e2c1a2-4f3a-4e2b-9c1a-8d2e3f4b5c6d"
+_MERCHANT_ID = "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d"
+
+
+@pytest.fixture
+def purchase_repository() -> Mock:
+    return create_autospec(PurchaseRepositoryABC, instance=True)
+
+
+@pytest.fixture
+def db_session_factory() -> Mock:
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=AsyncMock())
+    context.__aexit__ = AsyncMock(return_value=False)
+    return Mock(return_value=context)
+
+
+def _row(index: int, **overrides: Any) -> SimpleNamespace:
+    values: dict[str, Any] = {
+        "id": f"purchase-{index}",
+        "external_id": f"ext-{index}",
+        "user_id": _USER_ID,
+        "merchant_id": _MERCHANT_ID,
+        "offer_id": None,
+        "amount": Decimal("10.50"),
+        "cashback_amount": Decimal("0.53"),
+        "currency": "EUR",
+        "status": "pending",
+        "created_at": datetime(2026, 1, 2, 3, 4, 5),
+    }
+    values.update(overrides)
+    return SimpleNamespace(_mapping=values)
+
+
+async def _rows(rows: list[SimpleNamespace]) -> AsyncIterator[SimpleNamespace]:
+    for row in rows:
+        yield row
+
+
+async def _collect(iterator: AsyncIterator[str]) -> str:
+    return "".join([piece async for piece in iterator])
+
+
+def _make_exporter(
+    purchase_repository: Mock, db_session_factory: Mock, fetch_size: int = 100
+) -> PurchaseExporter:
+    return PurchaseExporter(
+        repository=purchase_repository,
+        db_session_factory=db_session_factory,
+        fetch_size=fetch_size,
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseExporter.export — encoding
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_export_csv_writes_header_and_one_line_per_purchase(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    purchase_repository.stream_purchases.return_value = _rows([_row(1), _row(2)])
+    exporter = _make_exporter(purchase_repository, db_session_factory)
+
+    # Act
+    output = await _collect(exporter.export(PurchaseExportFormat.CSV))
+
+    # Assert
+    lines = list(csv.reader(io.StringIO(output)))
+    assert lines[0] == list(EXPORT_COLUMNS)
+    assert len(lines) == 3
+    first = dict(zip(lines[0], lines[1]))
+    assert first["id"] == "purchase-1"
+    assert first["offer_id"] == ""
+    assert first["amount"] == "10.50"
+    assert first["created_at"] == "2026-01-02T03:04:05"
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_writes_one_object_per_line(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    purchase_repository.stream_purchases.return_value = _rows([_row(1)])
+    exporter = _make_exporter(purchase_repository, db_session_factory)
+
+    # Act
+    output = await _collect(exporter.export(PurchaseExportFormat.NDJSON))
+
+    # Assert
+    lines = output.splitlines()
+    assert len(lines) == 1
+    item = json.loads(lines[0])
+    assert item["external_id"] == "ext-1"
+    assert item["offer_id"] is None
+    assert item["cashback_amount"] == "0.53"
+
+
+@pytest.mark.asyncio
+async def test_export_csv_of_no_purchases_is_header_only(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    purchase_repository.stream_purchases.return_value = _rows([])
+    exporter = _make_exporter(purchase_repository, db_session_factory)
+
+    # Act
+    output = await _collect(exporter.export(PurchaseExportFormat.CSV))
+
+    # Assert
+    assert output == ",".join(EXPORT_COLUMNS) + "\n"
+
+
+@pytest.mark.asyncio
+async def test_export_groups_rows_into_pieces_of_bounded_size(
+    purchase_repository: Mock,
+    db_session_factory: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(export, "_FLUSH_BYTES", 1)
+    purchase_repository.stream_purchases.return_value = _rows(
+        [_row(i) for i in range(3)]
+    )
+    exporter = _make_exporter(purchase_repository, db_session_factory)
+
+    # Act
+    pieces = [p async for p in exporter.export(PurchaseExportFormat.NDJSON)]
+
+    # Assert — with the smallest flush size every row is sent on its own
+    assert len(pieces) == 3
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseExporter.export — filters and validation
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_export_streams_with_filters_and_fetch_size(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    purchase_repository.stream_purchases.return_value = _rows([])
+    exporter = _make_exporter(purchase_repository, db_session_factory, fetch_size=50)
+
+    # Act
+    await _collect(
+        exporter.export(
+            PurchaseExportFormat.NDJSON,
+            status="confirmed",
+            merchant_id=_MERCHANT_ID,
+            start_date=date(2026, 1, 1),
+        )
+    )
+
+    # Assert
+    call_kwargs = purchase_repository.stream_purchases.call_args.kwargs
+    assert call_kwargs["fetch_size"] == 50
+    assert call_kwargs["status"] == "confirmed"
+    assert call_kwargs["merchant_id"] == _MERCHANT_ID
+    assert call_kwargs["start_date"] == date(2026, 1, 1)
+    assert call_kwargs["user_id"] is None
+    db_session_factory.assert_called_once()
+
+
+def test_export_raises_on_invalid_status_before_streaming(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    exporter = _make_exporter(purchase_repository, db_session_factory)
+
+    # Act & Assert
+    with pytest.raises(InvalidPurchaseStatusException):
+        exporter.export(PurchaseExportFormat.CSV, status="unknown")
+    db_session_factory.assert_not_called()
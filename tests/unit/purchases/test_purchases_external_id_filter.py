@@ -0,0 +1,136 @@
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec
+
+import pytest
+
+from app.purchases.external_id_filter import BloomExternalIdFilter
+from app.purchases.repositories import PurchaseRepositoryABC
+
+
+@pytest.fixture
+def purchase_repository() -> Mock:
+    return create_autospec(PurchaseRepositoryABC)
+
+
+@pytest.fixture
+def db_session_factory() -> Mock:
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=AsyncMock())
+    context.__aexit__ = AsyncMock(return_value=False)
+    return Mock(return_value=context)
+
+
+def _make_filter(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> BloomExternalIdFilter:
+    return BloomExternalIdFilter(
+        repository=purchase_repository,
+        db_session_factory=db_session_factory,
+        capacity=1000,
+        error_rate=0.01,
+    )
+
+
+def _stream(*external_ids: str) -> Callable[[object], AsyncIterator[str]]:
+    async def _gen(_db: object) -> AsyncIterator[str]:
+        for external_id in external_ids:
+            yield external_id
+
+    return _gen
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# BloomExternalIdFilter.might_contain / add
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_might_contain_returns_false_until_loaded(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    external_id_filter = _make_filter(purchase_repository, db_session_factory)
+
+    # Act
+    external_id_filter.add("txn_1")
+
+    # Assert
+    assert external_id_filter.might_contain("txn_1") is False
+    assert external_id_filter.stats().loaded is False
+
+
+@pytest.mark.asyncio
+async def test_might_contain_returns_true_for_added_ids_after_rebuild(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    external_id_filter = _make_filter(purchase_repository, db_session_factory)
+    purchase_repository.stream_external_ids.side_effect = _stream()
+    await external_id_filter.rebuild()
+
+    # Act
+    external_id_filter.add("txn_new")
+
+    # Assert
+    assert external_id_filter.might_contain("txn_new") is True
+    assert external_id_filter.stats().positive_lookups == 1
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# BloomExternalIdFilter.rebuild
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_rebuild_loads_every_streamed_external_id(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    external_id_filter = _make_filter(purchase_repository, db_session_factory)
+    purchase_repository.stream_external_ids.side_effect = _stream("txn_1", "txn_2")
+
+    # Act
+    await external_id_filter.rebuild()
+
+    # Assert
+    assert external_id_filter.might_contain("txn_1")
+    assert external_id_filter.might_contain("txn_2")
+    stats = external_id_filter.stats()
+    assert stats.loaded is True
+    assert stats.item_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rebuild_keeps_previous_filter_on_error(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    external_id_filter = _make_filter(purchase_repository, db_session_factory)
+    purchase_repository.stream_external_ids.side_effect = _stream("txn_1")
+    await external_id_filter.rebuild()
+    purchase_repository.stream_external_ids.side_effect = RuntimeError("db down")
+
+    # Act
+    await external_id_filter.rebuild()
+
+    # Assert
+    assert external_id_filter.might_contain("txn_1")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_resets_lookup_counters(
+    purchase_repository: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    external_id_filter = _make_filter(purchase_repository, db_session_factory)
+    purchase_repository.stream_external_ids.side_effect = _stream("txn_1")
+    await external_id_filter.rebuild()
+    external_id_filter.might_contain("txn_1")
+    external_id_filter.record_false_positive()
+
+    # Act
+    await external_id_filter.rebuild()
+
+    # Assert
+    stats = external_id_filter.stats()
+    assert stats.positive_lookups == 0
+    assert stats.false_positives == 0
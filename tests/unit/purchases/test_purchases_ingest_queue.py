@@ -0,0 +1,220 @@
+import asyncio
+from typing import Any, Callable
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec
+
+import pytest
+
+from app.purchases.exceptions import (
+    DuplicatePurchaseException,
+    PurchaseIngestQueueFullException,
+)
+from app.purchases.ingest_queue import IngestTicketStatus, InMemoryPurchaseIngestQueue
+from app.purchases.models import Purchase
+from app.purchases.services import PurchaseService
+
+_USER_ID = "b7e2c1a2-4f3a-4e2b-9c1a-8d2e3f4b5c6d"
+
+
+@pytest.fixture
+def purchase_service() -> Mock:
+    return create_autospec(PurchaseService, instance=True)
+
+
+@pytest.fixture
+def db_session_factory() -> Mock:
+    session = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return Mock(return_value=context)
+
+
+def _make_queue(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    **overrides: Any,
+) -> InMemoryPurchaseIngestQueue:
+    kwargs: dict[str, Any] = {
+        "service_factory": lambda: purchase_service,
+        "db_session_factory": db_session_factory,
+        "max_batch_size": 10,
+        "max_wait_ms": 5,
+        "queue_size": 100,
+    }
+    kwargs.update(overrides)
+    return InMemoryPurchaseIngestQueue(**kwargs)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# InMemoryPurchaseIngestQueue.submit
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_submit_returns_queued_ticket_owned_by_user(
+    purchase_service: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    queue = _make_queue(purchase_service, db_session_factory)
+
+    # Act
+    ticket = queue.submit({"external_id": "txn_1"}, _USER_ID)
+
+    # Assert
+    assert ticket.status == IngestTicketStatus.QUEUED
+    assert ticket.user_id == _USER_ID
+    assert queue.get_ticket(ticket.ticket_id) is ticket
+
+
+def test_submit_raises_when_queue_is_full(
+    purchase_service: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    queue = _make_queue(purchase_service, db_session_factory, queue_size=1)
+    queue.submit({"external_id": "txn_1"}, _USER_ID)
+
+    # Act & Assert
+    with pytest.raises(PurchaseIngestQueueFullException):
+        queue.submit({"external_id": "txn_2"}, _USER_ID)
+
+
+def test_submit_evicts_oldest_tickets_beyond_max_tickets(
+    purchase_service: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    queue = _make_queue(purchase_service, db_session_factory, max_tickets=1)
+    first = queue.submit({"external_id": "txn_1"}, _USER_ID)
+
+    # Act
+    second = queue.submit({"external_id": "txn_2"}, _USER_ID)
+
+    # Assert
+    assert queue.get_ticket(first.ticket_id) is None
+    assert queue.get_ticket(second.ticket_id) is second
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# InMemoryPurchaseIngestQueue — writer / group commit
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_writer_flushes_queued_purchases_in_one_batch(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    queue = _make_queue(purchase_service, db_session_factory)
+    purchase_service.ingest_purchase_batch.return_value = [
+        purchase_factory(id="p1"),
+        purchase_factory(id="p2"),
+    ]
+    first = queue.submit({"external_id": "txn_1"}, _USER_ID)
+    second = queue.submit({"external_id": "txn_2"}, _USER_ID)
+
+    # Act
+    await queue.start()
+    await queue.stop()
+
+    # Assert
+    purchase_service.ingest_purchase_batch.assert_called_once()
+    items = purchase_service.ingest_purchase_batch.call_args[0][0]
+    assert items == [
+        ({"external_id": "txn_1"}, _USER_ID),
+        ({"external_id": "txn_2"}, _USER_ID),
+    ]
+    assert first.status == IngestTicketStatus.COMPLETED
+    assert first.purchase_id == "p1"
+    assert second.purchase_id == "p2"
+
+
+@pytest.mark.asyncio
+async def test_writer_splits_batches_at_max_batch_size(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    queue = _make_queue(purchase_service, db_session_factory, max_batch_size=2)
+    purchase_service.ingest_purchase_batch.side_effect = lambda items, uow: [
+        purchase_factory() for _ in items
+    ]
+    for i in range(3):
+        queue.submit({"external_id": f"txn_{i}"}, _USER_ID)
+
+    # Act
+    await queue.start()
+    await queue.stop()
+
+    # Assert
+    batch_sizes = [
+        len(call.args[0])
+        for call in purchase_service.ingest_purchase_batch.call_args_list
+    ]
+    assert batch_sizes == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_writer_marks_rejected_items_with_error_code(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    queue = _make_queue(purchase_service, db_session_factory)
+    existing = purchase_factory(external_id="txn_1")
+    purchase_service.ingest_purchase_batch.return_value = [
+        DuplicatePurchaseException("txn_1", existing.created_at, existing.amount)
+    ]
+    ticket = queue.submit({"external_id": "txn_1"}, _USER_ID)
+
+    # Act
+    await queue.start()
+    await queue.stop()
+
+    # Assert
+    assert ticket.status == IngestTicketStatus.REJECTED
+    assert ticket.error_code == "DUPLICATE_PURCHASE"
+    assert ticket.purchase_id is None
+
+
+@pytest.mark.asyncio
+async def test_writer_falls_back_to_per_item_ingest_when_batch_fails(
+    purchase_service: Mock,
+    db_session_factory: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    queue = _make_queue(purchase_service, db_session_factory)
+    purchase_service.ingest_purchase_batch.side_effect = RuntimeError("deadlock")
+    purchase_service.ingest_purchase.side_effect = [
+        purchase_factory(id="p1"),
+        RuntimeError("bad row"),
+    ]
+    ok = queue.submit({"external_id": "txn_1"}, _USER_ID)
+    bad = queue.submit({"external_id": "txn_2"}, _USER_ID)
+
+    # Act
+    await queue.start()
+    await queue.stop()
+
+    # Assert — one bad purchase does not fail its batch peers
+    assert purchase_service.ingest_purchase.call_count == 2
+    assert ok.status == IngestTicketStatus.COMPLETED
+    assert bad.status == IngestTicketStatus.FAILED
+    assert bad.error_code == "INTERNAL_SERVER_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_stop_without_start_returns_immediately(
+    purchase_service: Mock, db_session_factory: Mock
+) -> None:
+    # Arrange
+    queue = _make_queue(purchase_service, db_session_factory)
+    queue.submit({"external_id": "txn_1"}, _USER_ID)
+
+    # Act
+    await asyncio.wait_for(queue.stop(), timeout=1)
+
+    # Assert
+    purchase_service.ingest_purchase_batch.assert_not_called()
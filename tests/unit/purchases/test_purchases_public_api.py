@@ -6,17 +6,25 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from app.core.admission import AdmissionControllerABC, AdmissionRejectedException
+from app.core.config import settings
 from app.core.current_user import get_current_user
 from app.core.database import get_async_db
 from app.core.errors.codes import ErrorCode
+from app.core.pagination import InvalidCursorException
 from app.main import app
-from app.purchases.composition import get_purchase_service
+from app.purchases.composition import (
+    get_ingest_admission_controller,
+    get_purchase_ingest_queue,
+    get_purchase_service,
+)
 from app.purchases.exceptions import (
     DuplicatePurchaseException,
     InvalidPurchaseStatusException,
     MerchantInactiveException,
     MerchantNotFoundException,
     OfferNotAvailableException,
+    PurchaseIngestQueueFullException,
     PurchaseNotFoundException,
     PurchaseOwnershipViolationException,
     PurchaseViewForbiddenException,
@@ -24,6 +32,11 @@ from app.purchases.exceptions import (
     UserInactiveException,
     UserNotFoundException,
 )
+from app.purchases.ingest_queue import (
+    IngestTicket,
+    IngestTicketStatus,
+    PurchaseIngestQueueABC,
+)
 from app.purchases.models import Purchase
 from app.purchases.services import PurchaseService
 
@@ -247,6 +260,26 @@ def test_ingest_purchase_returns_409_with_details_on_duplicate(
     assert "action" in error["details"]
 
 
+def test_ingest_purchase_returns_409_without_original_when_it_is_gone(
+    client: TestClient,
+    purchase_service_mock: Mock,
+) -> None:
+    # Arrange
+    exc = DuplicatePurchaseException("txn_test_001")
+    purchase_service_mock.ingest_purchase.side_effect = exc
+
+    # Act
+    response = client.post("/api/v1/purchases", json=_ingest_input_data())
+
+    # Assert
+    assert response.status_code == status.HTTP_409_CONFLICT
+    details = response.json()["error"]["details"]
+    assert details["external_id"] == "txn_test_001"
+    assert "previously_created_at" not in details
+    assert "previously_processed_amount" not in details
+    assert "action" in details
+
+
 def test_ingest_purchase_returns_422_with_details_on_user_not_found(
     client: TestClient,
     purchase_service_mock: Mock,
@@ -448,6 +481,215 @@ def test_ingest_purchase_returns_401_on_missing_auth(
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# POST /api/v1/purchases — group-commit mode (Prefer: respond-async)
+# ──────────────────────────────────────────────────────────────────────────────
+
+_ASYNC_USER_ID = "b7e2c1a2-4f3a-4e2b-9c1a-8d2e3f4b5c6d"
+
+
+@pytest.fixture
+def ingest_queue_mock() -> Mock:
+    return create_autospec(PurchaseIngestQueueABC)
+
+
+@pytest.fixture
+def async_ingest_client(
+    client: TestClient,
+    ingest_queue_mock: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> TestClient:
+    monkeypatch.setattr(settings, "purchase_group_commit_enabled", True)
+    app.dependency_overrides[get_purchase_ingest_queue] = lambda: ingest_queue_mock
+    app.dependency_overrides[get_current_user] = lambda: Mock(id=_ASYNC_USER_ID)
+    return client
+
+
+def test_ingest_purchase_returns_202_with_status_url_when_async_preferred(
+    async_ingest_client: TestClient,
+    purchase_service_mock: Mock,
+    ingest_queue_mock: Mock,
+) -> None:
+    # Arrange
+    ingest_queue_mock.submit.return_value = IngestTicket(
+        ticket_id="ticket-1", user_id=_ASYNC_USER_ID
+    )
+
+    # Act
+    response = async_ingest_client.post(
+        "/api/v1/purchases",
+        json=_ingest_input_data(),
+        headers={"Prefer": "respond-async"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    data = response.json()
+    assert data["ticket_id"] == "ticket-1"
+    assert data["status"] == IngestTicketStatus.QUEUED
+    assert data["status_url"].endswith("/api/v1/purchases/ingestions/ticket-1")
+    assert response.headers["Location"] == data["status_url"]
+    purchase_service_mock.ingest_purchase.assert_not_called()
+
+
+def test_ingest_purchase_ignores_prefer_header_when_group_commit_disabled(
+    async_ingest_client: TestClient,
+    purchase_service_mock: Mock,
+    ingest_queue_mock: Mock,
+    purchase_factory: Callable[..., Purchase],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "purchase_group_commit_enabled", False)
+    purchase_service_mock.ingest_purchase.return_value = purchase_factory()
+
+    # Act
+    response = async_ingest_client.post(
+        "/api/v1/purchases",
+        json=_ingest_input_data(),
+        headers={"Prefer": "respond-async"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_201_CREATED
+    ingest_queue_mock.submit.assert_not_called()
+
+
+def test_ingest_purchase_async_rejects_ownership_violation_before_queueing(
+    async_ingest_client: TestClient,
+    purchase_service_mock: Mock,
+    ingest_queue_mock: Mock,
+) -> None:
+    # Arrange
+    purchase_service_mock.validate_purchase_request.side_effect = (
+        PurchaseOwnershipViolationException(_ASYNC_USER_ID, "other-user")
+    )
+
+    # Act
+    response = async_ingest_client.post(
+        "/api/v1/purchases",
+        json=_ingest_input_data(),
+        headers={"Prefer": "respond-async"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    ingest_queue_mock.submit.assert_not_called()
+
+
+def test_ingest_purchase_returns_503_with_retry_after_when_queue_full(
+    async_ingest_client: TestClient,
+    ingest_queue_mock: Mock,
+) -> None:
+    # Arrange
+    ingest_queue_mock.submit.side_effect = PurchaseIngestQueueFullException(10)
+
+    # Act
+    response = async_ingest_client.post(
+        "/api/v1/purchases",
+        json=_ingest_input_data(),
+        headers={"Prefer": "respond-async"},
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert "Retry-After" in response.headers
+    _assert_error_payload(response.json(), ErrorCode.SERVICE_UNAVAILABLE)
+
+
+def test_ingest_purchase_async_returns_503_with_several_workers(
+    async_ingest_client: TestClient,
+    purchase_service_mock: Mock,
+    ingest_queue_mock: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(settings, "web_concurrency", 2)
+
+    # Act
+    response = async_ingest_client.post(
+        "/api/v1/purchases",
+        json=_ingest_input_data(),
+        headers={"Prefer": "respond-async"},
+    )
+
+    # Assert — another worker could never answer the ticket's status poll
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    _assert_error_payload(response.json(), ErrorCode.SERVICE_UNAVAILABLE)
+    ingest_queue_mock.submit.assert_not_called()
+    purchase_service_mock.ingest_purchase.assert_not_called()
+
+
+def test_ingest_purchase_returns_503_with_retry_after_when_admission_rejects(
+    client: TestClient,
+    purchase_service_mock: Mock,
+) -> None:
+    # Arrange
+    controller = create_autospec(AdmissionControllerABC, instance=True)
+    controller.slot.side_effect = AdmissionRejectedException("queue_timeout", 3)
+    app.dependency_overrides[get_ingest_admission_controller] = lambda: controller
+
+    # Act
+    response = client.post("/api/v1/purchases", json=_ingest_input_data())
+
+    # Assert
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "3"
+    _assert_error_payload(response.json(), ErrorCode.SERVICE_UNAVAILABLE)
+    purchase_service_mock.ingest_purchase.assert_not_called()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# GET /api/v1/purchases/ingestions/{ticket_id}
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_get_purchase_ingestion_status_returns_200_for_owner(
+    async_ingest_client: TestClient,
+    ingest_queue_mock: Mock,
+) -> None:
+    # Arrange
+    ingest_queue_mock.get_ticket.return_value = IngestTicket(
+        ticket_id="ticket-1",
+        user_id=_ASYNC_USER_ID,
+        status=IngestTicketStatus.COMPLETED,
+        purchase_id="p1",
+    )
+
+    # Act
+    response = async_ingest_client.get("/api/v1/purchases/ingestions/ticket-1")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["status"] == IngestTicketStatus.COMPLETED
+    assert data["purchase_id"] == "p1"
+
+
+@pytest.mark.parametrize(
+    "ticket",
+    [
+        None,
+        IngestTicket(ticket_id="ticket-1", user_id="someone-else"),
+    ],
+    ids=["unknown_ticket", "other_users_ticket"],
+)
+def test_get_purchase_ingestion_status_returns_404_when_not_visible(
+    async_ingest_client: TestClient,
+    ingest_queue_mock: Mock,
+    ticket: IngestTicket | None,
+) -> None:
+    # Arrange
+    ingest_queue_mock.get_ticket.return_value = ticket
+
+    # Act
+    response = async_ingest_client.get("/api/v1/purchases/ingestions/ticket-1")
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    _assert_error_payload(response.json(), ErrorCode.NOT_FOUND)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # GET /api/v1/purchases/{purchase_id} — helpers
 # ──────────────────────────────────────────────────────────────────────────────
@@ -494,6 +736,34 @@ def test_get_purchase_details_returns_200_on_success(
     _assert_purchase_details_response(response.json(), purchase, _MERCHANT_NAME_DETAILS)
 
 
+def test_get_purchase_details_returns_304_until_purchase_changes(
+    client: TestClient,
+    purchase_service_mock: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    purchase = purchase_factory(id=_PURCHASE_ID, status="pending")
+    purchase_service_mock.get_purchase_details.return_value = (
+        purchase,
+        _MERCHANT_NAME_DETAILS,
+    )
+    etag = client.get(f"/api/v1/purchases/{_PURCHASE_ID}").headers["etag"]
+
+    # Act
+    unchanged = client.get(
+        f"/api/v1/purchases/{_PURCHASE_ID}", headers={"If-None-Match": etag}
+    )
+    purchase.status = "confirmed"
+    changed = client.get(
+        f"/api/v1/purchases/{_PURCHASE_ID}", headers={"If-None-Match": etag}
+    )
+
+    # Assert
+    assert unchanged.status_code == status.HTTP_304_NOT_MODIFIED
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["etag"] != etag
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # GET /api/v1/purchases/{purchase_id} — all exceptions → status code + error code
 # ──────────────────────────────────────────────────────────────────────────────
@@ -609,6 +879,7 @@ def test_list_user_purchases_returns_200_with_paginated_items(
     purchase_service_mock.list_user_purchases.return_value = (
         [(purchase, _MERCHANT_NAME_LIST)],
         1,
+        None,
     )
 
     # Act
@@ -632,7 +903,7 @@ def test_list_user_purchases_returns_empty_list(
     purchase_service_mock: Mock,
 ) -> None:
     # Arrange
-    purchase_service_mock.list_user_purchases.return_value = ([], 0)
+    purchase_service_mock.list_user_purchases.return_value = ([], 0, None)
 
     # Act
     response = client.get("/api/v1/users/me/purchases")
@@ -649,7 +920,7 @@ def test_list_user_purchases_passes_pagination_params_to_service(
     purchase_service_mock: Mock,
 ) -> None:
     # Arrange
-    purchase_service_mock.list_user_purchases.return_value = ([], 0)
+    purchase_service_mock.list_user_purchases.return_value = ([], 0, None)
 
     # Act
     response = client.get("/api/v1/users/me/purchases?offset=5&limit=5")
@@ -674,6 +945,7 @@ def test_list_user_purchases_passes_status_filter_to_service(
     purchase_service_mock.list_user_purchases.return_value = (
         [(purchase, _MERCHANT_NAME_LIST)],
         1,
+        None,
     )
 
     # Act
@@ -685,6 +957,26 @@ def test_list_user_purchases_passes_status_filter_to_service(
     assert call_kwargs["status"] == "confirmed"
 
 
+def test_list_user_purchases_follows_cursor_and_returns_next_cursor(
+    client: TestClient,
+    purchase_service_mock: Mock,
+) -> None:
+    # Arrange
+    purchase_service_mock.list_user_purchases.return_value = ([], None, "next-page")
+
+    # Act
+    response = client.get("/api/v1/users/me/purchases?cursor=this-page&offset=20")
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    pagination = response.json()["pagination"]
+    assert pagination["offset"] == 0
+    assert pagination["total"] is None
+    assert pagination["next_cursor"] == "next-page"
+    call_kwargs = purchase_service_mock.list_user_purchases.call_args[1]
+    assert call_kwargs["cursor"] == "this-page"
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # GET /api/v1/users/me/purchases — failure responses
 # ──────────────────────────────────────────────────────────────────────────────
@@ -731,6 +1023,23 @@ def test_list_user_purchases_returns_422_on_invalid_status(
     assert response.json()["error"]["code"] == "INVALID_PURCHASE_STATUS"
 
 
+def test_list_user_purchases_returns_400_on_invalid_cursor(
+    client: TestClient,
+    purchase_service_mock: Mock,
+) -> None:
+    # Arrange
+    purchase_service_mock.list_user_purchases.side_effect = InvalidCursorException(
+        "garbage"
+    )
+
+    # Act
+    response = client.get("/api/v1/users/me/purchases?cursor=garbage")
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    _assert_error_payload(response.json(), ErrorCode.VALIDATION_ERROR)
+
+
 def test_list_user_purchases_returns_422_on_invalid_offset_param(
     client: TestClient,
     purchase_service_mock: Mock,
@@ -7,12 +7,13 @@ import pytest
 
 from app.core.broker import MessageBrokerABC
 from app.core.events.purchase_events import PurchaseConfirmedByAdmin, PurchaseReversed
+from app.core.pagination import InvalidCursorException, TotalCount, encode_cursor
 from app.purchases.clients import (
     CashbackClientABC,
     CashbackResultDTO,
+    IngestContextClientABC,
+    IngestContextDTO,
     MerchantsClientABC,
-    OffersClientABC,
-    UsersClientABC,
     WalletsClientABC,
 )
 from app.purchases.exceptions import (
@@ -30,6 +31,7 @@ from app.purchases.exceptions import (
     UserInactiveException,
     UserNotFoundException,
 )
+from app.purchases.external_id_filter import ExternalIdFilterABC
 from app.purchases.models import Purchase
 from app.purchases.repositories import PurchaseRepositoryABC
 from app.purchases.services import PurchaseService
@@ -47,22 +49,35 @@ def wallets_client() -> Mock:
 
 @pytest.fixture
 def cashback_client() -> Mock:
-    return create_autospec(CashbackClientABC)
+    client = create_autospec(CashbackClientABC)
+    client.calculate.return_value = CashbackResultDTO(
+        offer_id="offer-1", cashback_amount=Decimal("10.00")
+    )
+    return client
 
 
 @pytest.fixture
-def users_client() -> Mock:
-    return create_autospec(UsersClientABC)
+def merchants_client() -> Mock:
+    return create_autospec(MerchantsClientABC)
 
 
 @pytest.fixture
-def merchants_client() -> Mock:
-    return create_autospec(MerchantsClientABC)
+def ingest_context_client() -> Mock:
+    client = create_autospec(IngestContextClientABC)
+    client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=Mock(id="offer-1", monthly_cap_per_user=None),
+        cap_month=_CAP_MONTH,
+    )
+    return client
 
 
 @pytest.fixture
-def offers_client() -> Mock:
-    return create_autospec(OffersClientABC)
+def external_id_filter() -> Mock:
+    external_id_filter = create_autospec(ExternalIdFilterABC)
+    external_id_filter.might_contain.return_value = False
+    return external_id_filter
 
 
 @pytest.fixture
@@ -115,9 +130,9 @@ def purchase_service(
     purchase_repository: Mock,
     cashback_client: Mock,
     wallets_client: Mock,
-    users_client: Mock,
     merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
+    external_id_filter: Mock,
     enforce_purchase_ownership: Mock,
     enforce_user_active: Mock,
     enforce_merchant_active: Mock,
@@ -132,9 +147,9 @@ def purchase_service(
         repository=purchase_repository,
         cashback_client=cashback_client,
         wallets_client=wallets_client,
-        users_client=users_client,
         merchants_client=merchants_client,
-        offers_client=offers_client,
+        ingest_context_client=ingest_context_client,
+        external_id_filter=external_id_filter,
         enforce_purchase_ownership=enforce_purchase_ownership,
         enforce_user_active=enforce_user_active,
         enforce_merchant_active=enforce_merchant_active,
@@ -161,6 +176,7 @@ def _make_ingest_data(**overrides: Any) -> dict[str, Any]:
 
 # Matches the default user_id in _make_ingest_data — used as the current_user_id argument
 _CURRENT_USER_ID = "b7e2c1a2-4f3a-4e2b-9c1a-8d2e3f4b5c6d"
+_CAP_MONTH = date(2026, 3, 1)
 
 
 def _make_uow() -> Mock:
@@ -181,22 +197,25 @@ def _make_uow() -> Mock:
 async def test_ingest_purchase_returns_purchase_on_success(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     uow = _make_uow()
     new_purchase = purchase_factory()
     offer_mock = Mock(
-        id="f0e1d2c3-b4a5-4678-9012-3456789abcde", percentage=10.0, fixed_amount=None
+        id="f0e1d2c3-b4a5-4678-9012-3456789abcde",
+        percentage=10.0,
+        fixed_amount=None,
+        monthly_cap_per_user=None,
     )
 
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = offer_mock
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=offer_mock,
+        cap_month=_CAP_MONTH,
+    )
     purchase_repository.add_purchase.return_value = new_purchase
 
     data = _make_ingest_data()
@@ -213,20 +232,25 @@ async def test_ingest_purchase_returns_purchase_on_success(
 async def test_ingest_purchase_stores_resolved_offer_id(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     uow = _make_uow()
     resolved_offer_id = "f0e1d2c3-b4a5-4678-9012-3456789abcde"
-    offer_mock = Mock(id=resolved_offer_id, percentage=10.0, fixed_amount=None)
+    offer_mock = Mock(
+        id=resolved_offer_id,
+        percentage=10.0,
+        fixed_amount=None,
+        monthly_cap_per_user=None,
+    )
 
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = offer_mock
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=offer_mock,
+        cap_month=_CAP_MONTH,
+    )
     purchase_repository.add_purchase.return_value = purchase_factory(
         offer_id=resolved_offer_id
     )
@@ -250,21 +274,24 @@ async def test_ingest_purchase_commits_uow_on_success(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
     wallets_client: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     uow = _make_uow()
     offer_mock = Mock(
-        id="f0e1d2c3-b4a5-4678-9012-3456789abcde", percentage=10.0, fixed_amount=None
+        id="f0e1d2c3-b4a5-4678-9012-3456789abcde",
+        percentage=10.0,
+        fixed_amount=None,
+        monthly_cap_per_user=None,
     )
 
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = offer_mock
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=offer_mock,
+        cap_month=_CAP_MONTH,
+    )
     purchase_repository.add_purchase.return_value = purchase_factory()
 
     # Act
@@ -282,6 +309,7 @@ async def test_ingest_purchase_does_not_commit_uow_on_duplicate_error(
 ) -> None:
     # Arrange
     uow = _make_uow()
+    purchase_repository.add_purchase.return_value = None
     purchase_repository.get_by_external_id.return_value = purchase_factory()
 
     # Act & Assert
@@ -311,6 +339,7 @@ async def test_ingest_purchase_raises_on_duplicate_external_id(
         amount=Decimal("100.00"),
         created_at=datetime(2026, 3, 1, 10, 0, 0),
     )
+    purchase_repository.add_purchase.return_value = None
     purchase_repository.get_by_external_id.return_value = existing
 
     # Act & Assert
@@ -324,13 +353,35 @@ async def test_ingest_purchase_raises_on_duplicate_external_id(
 
 
 @pytest.mark.asyncio
-async def test_ingest_purchase_does_not_call_repository_add_on_duplicate(
+async def test_ingest_purchase_raises_duplicate_when_conflicting_row_is_gone(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+) -> None:
+    # Arrange — the insert conflicted, then the original was deleted
+    uow = _make_uow()
+    purchase_repository.add_purchase.return_value = None
+    purchase_repository.get_by_external_id.return_value = None
+
+    # Act & Assert
+    with pytest.raises(DuplicatePurchaseException) as exc_info:
+        await purchase_service.ingest_purchase(
+            _make_ingest_data(), _CURRENT_USER_ID, uow
+        )
+
+    assert exc_info.value.external_id == "txn_test_001"
+    assert exc_info.value.created_at is None
+    assert exc_info.value.amount is None
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_fetches_existing_purchase_only_on_conflict(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     uow = _make_uow()
+    purchase_repository.add_purchase.return_value = None
     purchase_repository.get_by_external_id.return_value = purchase_factory()
 
     # Act & Assert
@@ -339,7 +390,325 @@ async def test_ingest_purchase_does_not_call_repository_add_on_duplicate(
             _make_ingest_data(), _CURRENT_USER_ID, uow
         )
 
+    purchase_repository.get_by_external_id.assert_called_once_with(
+        uow.session, "txn_test_001"
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_does_not_look_up_external_id_on_success(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert — the insert itself arbitrates idempotency on the happy path
+    purchase_repository.get_by_external_id.assert_not_called()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseService.ingest_purchase — external_id filter fast path
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_raises_on_filter_hit_without_reserving_cap(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    cashback_client: Mock,
+    external_id_filter: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    external_id_filter.might_contain.return_value = True
+    purchase_repository.get_by_external_id.return_value = purchase_factory()
+
+    # Act & Assert
+    with pytest.raises(DuplicatePurchaseException):
+        await purchase_service.ingest_purchase(
+            _make_ingest_data(), _CURRENT_USER_ID, uow
+        )
+
+    cashback_client.add_monthly_usage.assert_not_called()
     purchase_repository.add_purchase.assert_not_called()
+    external_id_filter.record_false_positive.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("might_contain", [True, False])
+async def test_ingest_purchase_retry_gets_same_error_with_or_without_filter_hit(
+    might_contain: bool,
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    external_id_filter: Mock,
+    enforce_merchant_active: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange — a retry after the merchant was deactivated
+    uow = _make_uow()
+    external_id_filter.might_contain.return_value = might_contain
+    purchase_repository.get_by_external_id.return_value = purchase_factory()
+    purchase_repository.add_purchase.return_value = None
+    enforce_merchant_active.side_effect = MerchantInactiveException("m-1")
+
+    # Act & Assert — the filter hit does not change which error is returned
+    with pytest.raises(MerchantInactiveException):
+        await purchase_service.ingest_purchase(
+            _make_ingest_data(), _CURRENT_USER_ID, uow
+        )
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_continues_on_filter_false_positive(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    external_id_filter: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    external_id_filter.might_contain.return_value = True
+    purchase_repository.get_by_external_id.return_value = None
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=Mock(
+            id="offer-1",
+            percentage=10.0,
+            fixed_amount=None,
+            monthly_cap_per_user=None,
+        ),
+        cap_month=_CAP_MONTH,
+    )
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert
+    external_id_filter.record_false_positive.assert_called_once()
+    purchase_repository.add_purchase.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_adds_external_id_to_filter_after_insert(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    external_id_filter: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert
+    external_id_filter.add.assert_called_once_with("txn_test_001")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseService.ingest_purchase — monthly cap per user
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _capped_context(cap: float, used: Decimal) -> IngestContextDTO:
+    return IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=Mock(
+            id="offer-1",
+            percentage=10.0,
+            fixed_amount=None,
+            monthly_cap_per_user=cap,
+        ),
+        cap_month=_CAP_MONTH,
+        monthly_cashback_used=used,
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_clamps_cashback_to_remaining_monthly_cap(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    cashback_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = _capped_context(
+        50.0, Decimal("45.00")
+    )
+    cashback_client.calculate.return_value = CashbackResultDTO(
+        offer_id="offer-1", cashback_amount=Decimal("5.00")
+    )
+    cashback_client.add_monthly_usage.return_value = True
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert
+    assert cashback_client.calculate.call_args.kwargs["remaining_cap"] == Decimal(
+        "5.00"
+    )
+    cashback_client.add_monthly_usage.assert_called_once_with(
+        uow.session,
+        "offer-1",
+        _CURRENT_USER_ID,
+        _CAP_MONTH,
+        Decimal("5.00"),
+        Decimal("50.0"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_charges_the_database_cap_month(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    cashback_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange — the database clock disagrees with the process date
+    uow = _make_uow()
+    context = _capped_context(50.0, Decimal("0.00"))
+    context.cap_month = date.today().replace(year=date.today().year + 1, day=1)
+    ingest_context_client.get_ingest_context.return_value = context
+    cashback_client.calculate.return_value = CashbackResultDTO(
+        offer_id="offer-1", cashback_amount=Decimal("5.00")
+    )
+    cashback_client.add_monthly_usage.return_value = True
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert — the month now() stamps into created_at, not the process date
+    charged_month = cashback_client.add_monthly_usage.call_args.args[3]
+    assert charged_month == context.cap_month
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_skips_usage_when_cap_is_exhausted(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    cashback_client: Mock,
+    wallets_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = _capped_context(
+        50.0, Decimal("50.00")
+    )
+    cashback_client.calculate.return_value = CashbackResultDTO(
+        offer_id="offer-1", cashback_amount=Decimal("0.00")
+    )
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert — the purchase is still recorded, just without cashback
+    cashback_client.add_monthly_usage.assert_not_called()
+    wallets_client.credit_pending.assert_called_once_with(
+        uow.session, _CURRENT_USER_ID, Decimal("0.00")
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_reclamps_when_cap_was_used_concurrently(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    cashback_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = _capped_context(
+        50.0, Decimal("40.00")
+    )
+    cashback_client.calculate.side_effect = [
+        CashbackResultDTO(offer_id="offer-1", cashback_amount=Decimal("10.00")),
+        CashbackResultDTO(offer_id="offer-1", cashback_amount=Decimal("2.00")),
+    ]
+    cashback_client.add_monthly_usage.side_effect = [False, True]
+    cashback_client.get_monthly_usage.return_value = Decimal("48.00")
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert
+    assert cashback_client.calculate.call_args.kwargs["remaining_cap"] == Decimal("2.0")
+    assert cashback_client.add_monthly_usage.call_args.args[4] == Decimal("2.00")
+    assert purchase_repository.add_purchase.call_args.args[1].cashback_amount == (
+        Decimal("2.00")
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_does_not_track_usage_for_uncapped_offer(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    cashback_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert
+    assert cashback_client.calculate.call_args.kwargs["remaining_cap"] is None
+    cashback_client.add_monthly_usage.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_releases_monthly_usage_on_duplicate(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    cashback_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = _capped_context(
+        50.0, Decimal("0.00")
+    )
+    cashback_client.add_monthly_usage.return_value = True
+    purchase_repository.add_purchase.return_value = None
+    purchase_repository.get_by_external_id.return_value = purchase_factory()
+
+    # Act & Assert
+    with pytest.raises(DuplicatePurchaseException):
+        await purchase_service.ingest_purchase(
+            _make_ingest_data(), _CURRENT_USER_ID, uow
+        )
+
+    cashback_client.release_monthly_usage.assert_called_once_with(
+        uow.session,
+        "offer-1",
+        _CURRENT_USER_ID,
+        _CAP_MONTH,
+        Decimal("10.00"),
+    )
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -351,14 +720,18 @@ async def test_ingest_purchase_does_not_call_repository_add_on_duplicate(
 async def test_ingest_purchase_raises_on_user_not_found(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
+    ingest_context_client: Mock,
     enforce_user_active: Mock,
 ) -> None:
     # Arrange
     uow = _make_uow()
     missing_user_id = "00000000-0000-0000-0000-000000000001"
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = None
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=None,
+        merchant=None,
+        offer=None,
+        cap_month=_CAP_MONTH,
+    )
     enforce_user_active.side_effect = UserNotFoundException(missing_user_id)
 
     data = _make_ingest_data(user_id=missing_user_id)
@@ -374,14 +747,18 @@ async def test_ingest_purchase_raises_on_user_not_found(
 async def test_ingest_purchase_raises_on_inactive_user(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
+    ingest_context_client: Mock,
     enforce_user_active: Mock,
 ) -> None:
     # Arrange
     uow = _make_uow()
     inactive_user_id = "b7e2c1a2-4f3a-4e2b-9c1a-8d2e3f4b5c6d"
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=False)
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=False),
+        merchant=None,
+        offer=None,
+        cap_month=_CAP_MONTH,
+    )
     enforce_user_active.side_effect = UserInactiveException(inactive_user_id)
 
     # Act & Assert
@@ -400,16 +777,18 @@ async def test_ingest_purchase_raises_on_inactive_user(
 async def test_ingest_purchase_raises_on_merchant_not_found(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
+    ingest_context_client: Mock,
     enforce_merchant_active: Mock,
 ) -> None:
     # Arrange
     uow = _make_uow()
     missing_merchant_id = "00000000-0000-0000-0000-000000000002"
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = None
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=None,
+        offer=None,
+        cap_month=_CAP_MONTH,
+    )
     enforce_merchant_active.side_effect = MerchantNotFoundException(missing_merchant_id)
 
     data = _make_ingest_data(merchant_id=missing_merchant_id)
@@ -425,16 +804,18 @@ async def test_ingest_purchase_raises_on_merchant_not_found(
 async def test_ingest_purchase_raises_on_inactive_merchant(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
+    ingest_context_client: Mock,
     enforce_merchant_active: Mock,
 ) -> None:
     # Arrange
     uow = _make_uow()
     inactive_merchant_id = "a5b6c7d8-e9f0-4a1b-2c3d-4e5f6a7b8c9d"
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=False)
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=False),
+        offer=None,
+        cap_month=_CAP_MONTH,
+    )
     enforce_merchant_active.side_effect = MerchantInactiveException(
         inactive_merchant_id
     )
@@ -455,18 +836,18 @@ async def test_ingest_purchase_raises_on_inactive_merchant(
 async def test_ingest_purchase_raises_on_no_active_offer(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     enforce_offer_available: Mock,
 ) -> None:
     # Arrange
     uow = _make_uow()
     merchant_id = "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d"
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = None
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=None,
+        cap_month=_CAP_MONTH,
+    )
     enforce_offer_available.side_effect = OfferNotAvailableException(merchant_id)
 
     # Act & Assert
@@ -482,29 +863,32 @@ async def test_ingest_purchase_raises_on_no_active_offer(
 async def test_ingest_purchase_queries_offer_with_todays_date(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     uow = _make_uow()
     offer_mock = Mock(
-        id="f0e1d2c3-b4a5-4678-9012-3456789abcde", percentage=10.0, fixed_amount=None
+        id="f0e1d2c3-b4a5-4678-9012-3456789abcde",
+        percentage=10.0,
+        fixed_amount=None,
+        monthly_cap_per_user=None,
     )
 
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = offer_mock
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=offer_mock,
+        cap_month=_CAP_MONTH,
+    )
     purchase_repository.add_purchase.return_value = purchase_factory()
 
     # Act
     await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
 
     # Assert — the client was called with today's date for date-range validation
-    call_args = offers_client.get_active_offer_for_merchant.call_args
-    today_arg = call_args[0][2]  # third positional arg is `today`
+    call_args = ingest_context_client.get_ingest_context.call_args
+    today_arg = call_args[0][3]  # fourth positional arg is `today`
     assert today_arg == date.today()
 
 
@@ -521,7 +905,6 @@ async def test_ingest_purchase_raises_on_unsupported_currency(
 ) -> None:
     # Arrange
     uow = _make_uow()
-    purchase_repository.get_by_external_id.return_value = None
     enforce_currency_supported.side_effect = UnsupportedCurrencyException("USD")
 
     # Act & Assert
@@ -537,12 +920,11 @@ async def test_ingest_purchase_raises_on_unsupported_currency(
 async def test_ingest_purchase_does_not_call_clients_on_unsupported_currency(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    users_client: Mock,
+    ingest_context_client: Mock,
     enforce_currency_supported: Mock,
 ) -> None:
     # Arrange
     uow = _make_uow()
-    purchase_repository.get_by_external_id.return_value = None
     enforce_currency_supported.side_effect = UnsupportedCurrencyException("GBP")
 
     # Act & Assert
@@ -551,7 +933,7 @@ async def test_ingest_purchase_does_not_call_clients_on_unsupported_currency(
             _make_ingest_data(currency="GBP"), _CURRENT_USER_ID, uow
         )
 
-    users_client.get_user_by_id.assert_not_called()
+    ingest_context_client.get_ingest_context.assert_not_called()
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -582,50 +964,153 @@ async def test_ingest_purchase_raises_on_ownership_violation(
 
 
 @pytest.mark.asyncio
-async def test_ingest_purchase_does_not_check_duplicate_on_ownership_violation(
+async def test_ingest_purchase_does_not_check_duplicate_on_ownership_violation(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    enforce_purchase_ownership: Mock,
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    other_user_id = "00000000-0000-0000-0000-000000000099"
+    enforce_purchase_ownership.side_effect = PurchaseOwnershipViolationException(
+        _CURRENT_USER_ID, other_user_id
+    )
+
+    data = _make_ingest_data(user_id=other_user_id)
+
+    # Act & Assert
+    with pytest.raises(PurchaseOwnershipViolationException):
+        await purchase_service.ingest_purchase(data, _CURRENT_USER_ID, uow)
+
+    purchase_repository.get_by_external_id.assert_not_called()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseService.list_purchases
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_list_purchases_raises_on_invalid_status(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    invalid_status = "not_a_valid_status"
+
+    # Act & Assert
+    with pytest.raises(InvalidPurchaseStatusException) as exc_info:
+        await purchase_service.list_purchases(
+            db,
+            status=invalid_status,
+        )
+
+    assert exc_info.value.status == invalid_status
+    assert "not a valid purchase status" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_list_purchases_returns_next_cursor_when_offset_page_is_not_last(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    last = purchase_factory(id="p-2")
+    purchase_repository.list_purchases.return_value = ([purchase_factory(), last], 5)
+
+    # Act
+    items, total, next_cursor = await purchase_service.list_purchases(
+        db, offset=0, limit=2
+    )
+
+    # Assert
+    assert total == 5
+    assert next_cursor == encode_cursor(last.created_at.isoformat(), "p-2")
+
+
+@pytest.mark.asyncio
+async def test_list_purchases_returns_no_next_cursor_on_last_offset_page(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    purchase_repository.list_purchases.return_value = ([purchase_factory()], 3)
+
+    # Act
+    _, _, next_cursor = await purchase_service.list_purchases(db, offset=2, limit=2)
+
+    # Assert
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_purchases_with_cursor_fetches_keyset_page_without_total(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
-    enforce_purchase_ownership: Mock,
+    purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
-    uow = _make_uow()
-    other_user_id = "00000000-0000-0000-0000-000000000099"
-    enforce_purchase_ownership.side_effect = PurchaseOwnershipViolationException(
-        _CURRENT_USER_ID, other_user_id
-    )
-
-    data = _make_ingest_data(user_id=other_user_id)
-
-    # Act & Assert
-    with pytest.raises(PurchaseOwnershipViolationException):
-        await purchase_service.ingest_purchase(data, _CURRENT_USER_ID, uow)
-
-    purchase_repository.get_by_external_id.assert_not_called()
+    db = AsyncMock()
+    created_at = datetime(2026, 3, 1, 10, 0, 0)
+    cursor = encode_cursor(created_at.isoformat(), "p-0")
+    page = [purchase_factory(id=f"p-{i}") for i in range(1, 4)]
+    purchase_repository.list_purchases_after.return_value = page
 
+    # Act
+    items, total, next_cursor = await purchase_service.list_purchases(
+        db, status="pending", limit=2, cursor=cursor
+    )
 
-# ──────────────────────────────────────────────────────────────────────────────
-# PurchaseService.list_purchases
-# ──────────────────────────────────────────────────────────────────────────────
+    # Assert — limit + 1 rows fetched; the extra one only signals a next page
+    call = purchase_repository.list_purchases_after.call_args
+    assert call.kwargs["after"] == (created_at, "p-0")
+    assert call.kwargs["limit"] == 3
+    assert call.kwargs["status"] == "pending"
+    purchase_repository.list_purchases.assert_not_called()
+    assert items == page[:2]
+    assert total is None
+    assert next_cursor == encode_cursor(page[1].created_at.isoformat(), "p-2")
 
 
 @pytest.mark.asyncio
-async def test_list_purchases_raises_on_invalid_status(
+async def test_list_purchases_with_cursor_returns_no_next_cursor_on_last_page(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
+    purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     db = AsyncMock()
-    invalid_status = "not_a_valid_status"
+    cursor = encode_cursor("2026-03-01T10:00:00", "p-0")
+    purchase_repository.list_purchases_after.return_value = [purchase_factory()]
 
-    # Act & Assert
-    with pytest.raises(InvalidPurchaseStatusException) as exc_info:
-        await purchase_service.list_purchases(
-            db,
-            status=invalid_status,
-        )
+    # Act
+    items, _, next_cursor = await purchase_service.list_purchases(
+        db, limit=2, cursor=cursor
+    )
 
-    assert exc_info.value.status == invalid_status
-    assert "not a valid purchase status" in str(exc_info.value)
+    # Assert
+    assert len(items) == 1
+    assert next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-base64!", encode_cursor("only-one"), encode_cursor("not-a-date", "p-1")],
+    ids=["garbage", "wrong_arity", "bad_timestamp"],
+)
+@pytest.mark.asyncio
+async def test_list_purchases_raises_on_invalid_cursor(
+    purchase_service: PurchaseService,
+    cursor: str,
+) -> None:
+    # Act & Assert
+    with pytest.raises(InvalidCursorException):
+        await purchase_service.list_purchases(AsyncMock(), cursor=cursor)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -817,7 +1302,8 @@ async def test_list_user_purchases_returns_enriched_purchases(
     # Arrange
     db = AsyncMock()
     purchase = purchase_factory(user_id=_LIST_USER_ID, merchant_id=_LIST_MERCHANT_ID)
-    purchase_repository.list_purchases.return_value = ([purchase], 1)
+    purchase_repository.list_purchases.return_value = ([purchase], None)
+    purchase_repository.count_user_purchases.return_value = 1
     merchant_mock = Mock()
     merchant_mock.name = _LIST_MERCHANT_NAME
     merchants_client.get_merchants_by_ids.return_value = {
@@ -825,7 +1311,7 @@ async def test_list_user_purchases_returns_enriched_purchases(
     }
 
     # Act
-    enriched, total = await purchase_service.list_user_purchases(db, _LIST_USER_ID)
+    enriched, total, _ = await purchase_service.list_user_purchases(db, _LIST_USER_ID)
 
     # Assert
     assert total == 1
@@ -843,11 +1329,12 @@ async def test_list_user_purchases_returns_empty_list_when_no_purchases(
 ) -> None:
     # Arrange
     db = AsyncMock()
-    purchase_repository.list_purchases.return_value = ([], 0)
+    purchase_repository.list_purchases.return_value = ([], None)
+    purchase_repository.count_user_purchases.return_value = 0
     merchants_client.get_merchants_by_ids.return_value = {}
 
     # Act
-    enriched, total = await purchase_service.list_user_purchases(db, _LIST_USER_ID)
+    enriched, total, _ = await purchase_service.list_user_purchases(db, _LIST_USER_ID)
 
     # Assert
     assert total == 0
@@ -871,7 +1358,8 @@ async def test_list_user_purchases_batch_loads_merchants_in_one_call(
         purchase_factory(merchant_id=merchant_id_b),
         purchase_factory(merchant_id=merchant_id_a),  # same merchant as first
     ]
-    purchase_repository.list_purchases.return_value = (purchases, 3)
+    purchase_repository.list_purchases.return_value = (purchases, None)
+    purchase_repository.count_user_purchases.return_value = 3
     merchant_a = Mock()
     merchant_a.name = "Alpha"
     merchant_b = Mock()
@@ -905,14 +1393,15 @@ async def test_list_user_purchases_falls_back_to_unknown_when_merchant_missing(
         purchase_factory(merchant_id=known_id),
         purchase_factory(merchant_id=unknown_id),
     ]
-    purchase_repository.list_purchases.return_value = (purchases, 2)
+    purchase_repository.list_purchases.return_value = (purchases, None)
+    purchase_repository.count_user_purchases.return_value = 2
     # Only the known merchant is returned from the batch query
     known_merchant_mock = Mock()
     known_merchant_mock.name = "KnownShop"
     merchants_client.get_merchants_by_ids.return_value = {known_id: known_merchant_mock}
 
     # Act
-    enriched, _ = await purchase_service.list_user_purchases(db, _LIST_USER_ID)
+    enriched, _, _ = await purchase_service.list_user_purchases(db, _LIST_USER_ID)
 
     # Assert
     names = [name for _, name in enriched]
@@ -928,7 +1417,8 @@ async def test_list_user_purchases_filters_by_current_user(
 ) -> None:
     # Arrange
     db = AsyncMock()
-    purchase_repository.list_purchases.return_value = ([], 0)
+    purchase_repository.list_purchases.return_value = ([], None)
+    purchase_repository.count_user_purchases.return_value = 0
     merchants_client.get_merchants_by_ids.return_value = {}
 
     # Act
@@ -939,6 +1429,54 @@ async def test_list_user_purchases_filters_by_current_user(
     assert call_kwargs["user_id"] == _LIST_USER_ID
 
 
+@pytest.mark.asyncio
+async def test_list_user_purchases_reads_total_from_user_counters(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    merchants_client: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    purchase_repository.list_purchases.return_value = ([], None)
+    purchase_repository.count_user_purchases.return_value = 42
+    merchants_client.get_merchants_by_ids.return_value = {}
+
+    # Act
+    _, total, _ = await purchase_service.list_user_purchases(
+        db, _LIST_USER_ID, status="confirmed"
+    )
+
+    # Assert — the page query skips counting; the counters answer the total
+    assert total == 42
+    purchase_repository.count_user_purchases.assert_awaited_once_with(
+        db, _LIST_USER_ID, status="confirmed"
+    )
+    call_kwargs = purchase_repository.list_purchases.call_args.kwargs
+    assert call_kwargs["total_count"] == TotalCount.SKIP
+
+
+@pytest.mark.asyncio
+async def test_list_user_purchases_skips_counters_in_cursor_mode(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    merchants_client: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    purchase_repository.list_purchases_after.return_value = []
+    merchants_client.get_merchants_by_ids.return_value = {}
+    cursor = encode_cursor("2026-01-01T00:00:00", "purchase-id")
+
+    # Act
+    _, total, _ = await purchase_service.list_user_purchases(
+        db, _LIST_USER_ID, cursor=cursor
+    )
+
+    # Assert
+    assert total is None
+    purchase_repository.count_user_purchases.assert_not_called()
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # PurchaseService.list_user_purchases — status validation
 # ──────────────────────────────────────────────────────────────────────────────
@@ -972,25 +1510,28 @@ async def test_ingest_purchase_credits_wallet_with_cashback_clients_amount(
     purchase_repository: Mock,
     cashback_client: Mock,
     wallets_client: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     uow = _make_uow()
     offer_mock = Mock(
-        id="f0e1d2c3-b4a5-4678-9012-3456789abcde", percentage=10.0, fixed_amount=None
+        id="f0e1d2c3-b4a5-4678-9012-3456789abcde",
+        percentage=10.0,
+        fixed_amount=None,
+        monthly_cap_per_user=None,
     )
     expected_cashback = Decimal("10.00")
     cashback_client.calculate.return_value = CashbackResultDTO(
         offer_id=offer_mock.id, cashback_amount=expected_cashback
     )
 
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = offer_mock
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=offer_mock,
+        cap_month=_CAP_MONTH,
+    )
     purchase_repository.add_purchase.return_value = purchase_factory()
 
     # Act
@@ -1009,9 +1550,7 @@ async def test_ingest_purchase_delegates_calculation_to_cashback_client(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
     cashback_client: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
@@ -1020,15 +1559,22 @@ async def test_ingest_purchase_delegates_calculation_to_cashback_client(
     percentage = 10.0
     fixed_amount = None
     purchase_amount = Decimal("100.00")
-    offer_mock = Mock(id=offer_id, percentage=percentage, fixed_amount=fixed_amount)
+    offer_mock = Mock(
+        id=offer_id,
+        percentage=percentage,
+        fixed_amount=fixed_amount,
+        monthly_cap_per_user=None,
+    )
     cashback_client.calculate.return_value = CashbackResultDTO(
         offer_id=offer_id, cashback_amount=Decimal("10.00")
     )
 
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = offer_mock
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=offer_mock,
+        cap_month=_CAP_MONTH,
+    )
     purchase_repository.add_purchase.return_value = purchase_factory()
 
     # Act
@@ -1042,6 +1588,7 @@ async def test_ingest_purchase_delegates_calculation_to_cashback_client(
         percentage=percentage,
         fixed_amount=fixed_amount,
         purchase_amount=purchase_amount,
+        remaining_cap=None,
     )
 
 
@@ -1051,25 +1598,30 @@ async def test_ingest_purchase_uses_fixed_amount_cashback_when_available(
     purchase_repository: Mock,
     cashback_client: Mock,
     wallets_client: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     uow = _make_uow()
     offer_id = "f0e1d2c3-b4a5-4678-9012-3456789abcde"
     fixed_amount = 5.0
-    fixed_offer = Mock(id=offer_id, percentage=10.0, fixed_amount=fixed_amount)
+    fixed_offer = Mock(
+        id=offer_id,
+        percentage=10.0,
+        fixed_amount=fixed_amount,
+        monthly_cap_per_user=None,
+    )
     expected_cashback = Decimal("5.00")
     cashback_client.calculate.return_value = CashbackResultDTO(
         offer_id=offer_id, cashback_amount=expected_cashback
     )
 
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = fixed_offer
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=fixed_offer,
+        cap_month=_CAP_MONTH,
+    )
     purchase_repository.add_purchase.return_value = purchase_factory()
 
     # Act
@@ -1093,6 +1645,7 @@ async def test_ingest_purchase_wallet_not_credited_on_failure(
     # Arrange
     db = AsyncMock()
     existing = purchase_factory(external_id="txn_test_001")
+    purchase_repository.add_purchase.return_value = None
     purchase_repository.get_by_external_id.return_value = existing
 
     # Act & Assert
@@ -1114,15 +1667,16 @@ async def test_ingest_purchase_creates_cashback_transaction_on_success(
     purchase_service: PurchaseService,
     purchase_repository: Mock,
     cashback_client: Mock,
-    users_client: Mock,
-    merchants_client: Mock,
-    offers_client: Mock,
+    ingest_context_client: Mock,
     purchase_factory: Callable[..., Purchase],
 ) -> None:
     # Arrange
     uow = _make_uow()
     offer_mock = Mock(
-        id="f0e1d2c3-b4a5-4678-9012-3456789abcde", percentage=10.0, fixed_amount=None
+        id="f0e1d2c3-b4a5-4678-9012-3456789abcde",
+        percentage=10.0,
+        fixed_amount=None,
+        monthly_cap_per_user=None,
     )
     expected_cashback = Decimal("10.00")
     cashback_client.calculate.return_value = CashbackResultDTO(
@@ -1130,10 +1684,12 @@ async def test_ingest_purchase_creates_cashback_transaction_on_success(
     )
     new_purchase = purchase_factory()
 
-    purchase_repository.get_by_external_id.return_value = None
-    users_client.get_user_by_id.return_value = Mock(active=True)
-    merchants_client.get_merchant_by_id.return_value = Mock(active=True)
-    offers_client.get_active_offer_for_merchant.return_value = offer_mock
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=offer_mock,
+        cap_month=_CAP_MONTH,
+    )
     purchase_repository.add_purchase.return_value = new_purchase
 
     # Act
@@ -1156,6 +1712,7 @@ async def test_ingest_purchase_cashback_transaction_not_created_on_failure(
 ) -> None:
     # Arrange
     uow = _make_uow()
+    purchase_repository.add_purchase.return_value = None
     purchase_repository.get_by_external_id.return_value = purchase_factory(
         external_id="txn_test_001"
     )
@@ -1169,6 +1726,281 @@ async def test_ingest_purchase_cashback_transaction_not_created_on_failure(
     cashback_client.create.assert_not_called()
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseService.ingest_purchase_batch
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_batch_commits_once_for_whole_batch(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=Mock(id="offer-1", monthly_cap_per_user=None),
+        cap_month=_CAP_MONTH,
+    )
+    first = purchase_factory(id="p1", external_id="txn_1")
+    second = purchase_factory(id="p2", external_id="txn_2")
+    purchase_repository.add_purchase.side_effect = [first, second]
+    items = [
+        (_make_ingest_data(external_id="txn_1"), _CURRENT_USER_ID),
+        (_make_ingest_data(external_id="txn_2"), _CURRENT_USER_ID),
+    ]
+
+    # Act
+    result = await purchase_service.ingest_purchase_batch(items, uow)
+
+    # Assert
+    assert result == [first, second]
+    uow.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_batch_aggregates_wallet_credits_per_user(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    cashback_client: Mock,
+    wallets_client: Mock,
+    ingest_context_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=Mock(id="offer-1", monthly_cap_per_user=None),
+        cap_month=_CAP_MONTH,
+    )
+    cashback_client.calculate.side_effect = [
+        CashbackResultDTO(offer_id="offer-1", cashback_amount=Decimal("2.50")),
+        CashbackResultDTO(offer_id="offer-1", cashback_amount=Decimal("7.50")),
+    ]
+    purchase_repository.add_purchase.side_effect = [
+        purchase_factory(id="p1", external_id="txn_1"),
+        purchase_factory(id="p2", external_id="txn_2"),
+    ]
+    items = [
+        (_make_ingest_data(external_id="txn_1"), _CURRENT_USER_ID),
+        (_make_ingest_data(external_id="txn_2"), _CURRENT_USER_ID),
+    ]
+
+    # Act
+    await purchase_service.ingest_purchase_batch(items, uow)
+
+    # Assert — one wallet write per user, carrying the summed cashback
+    wallets_client.credit_pending.assert_called_once_with(
+        uow.session, _CURRENT_USER_ID, Decimal("10.00")
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_batch_reports_rejections_without_failing_batch(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=Mock(id="offer-1", monthly_cap_per_user=None),
+        cap_month=_CAP_MONTH,
+    )
+    accepted = purchase_factory(id="p2", external_id="txn_2")
+    purchase_repository.add_purchase.side_effect = [None, accepted]
+    purchase_repository.get_by_external_id.return_value = purchase_factory(
+        external_id="txn_1"
+    )
+    items = [
+        (_make_ingest_data(external_id="txn_1"), _CURRENT_USER_ID),
+        (_make_ingest_data(external_id="txn_2"), _CURRENT_USER_ID),
+    ]
+
+    # Act
+    result = await purchase_service.ingest_purchase_batch(items, uow)
+
+    # Assert — outcomes keep input order; the duplicate does not block its peer
+    assert isinstance(result[0], DuplicatePurchaseException)
+    assert result[1] == accepted
+    uow.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_batch_propagates_unexpected_errors(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=Mock(id="offer-1", monthly_cap_per_user=None),
+        cap_month=_CAP_MONTH,
+    )
+    purchase_repository.add_purchase.side_effect = RuntimeError("db down")
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        await purchase_service.ingest_purchase_batch(
+            [(_make_ingest_data(), _CURRENT_USER_ID)], uow
+        )
+
+    uow.commit.assert_not_called()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseService.import_purchase_chunk
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_import_purchase_chunk_saves_checkpoint_before_commit(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    ingest_context_client.get_ingest_context.return_value = IngestContextDTO(
+        user=Mock(active=True),
+        merchant=Mock(active=True),
+        offer=Mock(id="offer-1", monthly_cap_per_user=None),
+        cap_month=_CAP_MONTH,
+    )
+    purchase_repository.add_purchase.side_effect = [
+        purchase_factory(id="p1", external_id="txn_1"),
+        None,
+    ]
+    purchase_repository.get_by_external_id.return_value = purchase_factory(
+        external_id="txn_2"
+    )
+    calls = Mock()
+    calls.attach_mock(purchase_repository.save_import_checkpoint, "save")
+    calls.attach_mock(uow.commit, "commit")
+    items = [
+        (_make_ingest_data(external_id="txn_1"), _CURRENT_USER_ID),
+        (_make_ingest_data(external_id="txn_2"), _CURRENT_USER_ID),
+    ]
+
+    # Act
+    await purchase_service.import_purchase_chunk(
+        "backfill-1",
+        items,
+        uow,
+        rows_processed=12,
+        prior_imported_count=5,
+        prior_rejected_count=5,
+    )
+
+    # Assert — counters include this chunk; checkpoint lands in the same commit
+    purchase_repository.save_import_checkpoint.assert_called_once_with(
+        uow.session,
+        "backfill-1",
+        rows_processed=12,
+        imported_count=6,
+        rejected_count=6,
+    )
+    assert [name for name, _, _ in calls.mock_calls] == ["save", "commit"]
+
+
+@pytest.mark.asyncio
+async def test_import_purchase_chunk_backfills_past_month_purchases(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    cashback_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    purchased_at = datetime(2026, 1, 31, 23, 45, 0)
+    context = _capped_context(50.0, Decimal("0.00"))
+    context.cap_month = date(2026, 1, 1)
+    ingest_context_client.get_ingest_context.return_value = context
+    cashback_client.calculate.return_value = CashbackResultDTO(
+        offer_id="offer-1", cashback_amount=Decimal("5.00")
+    )
+    cashback_client.add_monthly_usage.return_value = True
+    purchase_repository.add_purchase.return_value = purchase_factory()
+    items = [(_make_ingest_data(created_at=purchased_at), _CURRENT_USER_ID)]
+
+    # Act
+    await purchase_service.import_purchase_chunk(
+        "backfill-1",
+        items,
+        uow,
+        rows_processed=1,
+        prior_imported_count=0,
+        prior_rejected_count=0,
+    )
+
+    # Assert — offer, cap month and created_at all follow the purchase date
+    call = ingest_context_client.get_ingest_context.call_args
+    assert call.args[3] == date(2026, 1, 31)
+    assert call.kwargs["cap_month"] == date(2026, 1, 1)
+    assert cashback_client.add_monthly_usage.call_args.args[3] == date(2026, 1, 1)
+    inserted = purchase_repository.add_purchase.call_args.args[1]
+    assert inserted.created_at == purchased_at
+
+
+@pytest.mark.asyncio
+async def test_ingest_purchase_leaves_created_at_and_cap_month_to_the_database(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    ingest_context_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    purchase_repository.add_purchase.return_value = purchase_factory()
+
+    # Act
+    await purchase_service.ingest_purchase(_make_ingest_data(), _CURRENT_USER_ID, uow)
+
+    # Assert
+    call = ingest_context_client.get_ingest_context.call_args
+    assert call.kwargs["cap_month"] is None
+    assert purchase_repository.add_purchase.call_args.args[1].created_at is None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# PurchaseService.validate_purchase_request
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_validate_purchase_request_runs_ownership_and_currency_checks(
+    purchase_service: PurchaseService,
+    enforce_purchase_ownership: Mock,
+    enforce_currency_supported: Mock,
+    ingest_context_client: Mock,
+) -> None:
+    # Arrange
+    data = _make_ingest_data(currency="EUR")
+
+    # Act
+    purchase_service.validate_purchase_request(data, _CURRENT_USER_ID)
+
+    # Assert — only the checks that need no database round trip
+    enforce_purchase_ownership.assert_called_once_with(
+        _CURRENT_USER_ID, data["user_id"]
+    )
+    enforce_currency_supported.assert_called_once_with("EUR")
+    ingest_context_client.get_ingest_context.assert_not_called()
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # PurchaseService.reverse_purchase — happy path
 # ──────────────────────────────────────────────────────────────────────────────
@@ -1335,6 +2167,39 @@ async def test_reverse_purchase_calls_cashback_reverse(
     cashback_client.reverse.assert_called_once_with(uow.session, _REVERSE_PURCHASE_ID)
 
 
+@pytest.mark.asyncio
+async def test_reverse_purchase_releases_monthly_cap_usage(
+    purchase_service: PurchaseService,
+    purchase_repository: Mock,
+    cashback_client: Mock,
+    purchase_factory: Callable[..., Purchase],
+) -> None:
+    # Arrange
+    uow = _make_uow()
+    original_purchase = purchase_factory(
+        id=_REVERSE_PURCHASE_ID,
+        user_id=_REVERSE_USER_ID,
+        offer_id="offer-1",
+        cashback_amount=Decimal("5.00"),
+        status="confirmed",
+        created_at=datetime(2026, 3, 14, 8, 30, 0),
+    )
+    purchase_repository.get_by_id.return_value = original_purchase
+    purchase_repository.reverse_purchase.return_value = purchase_factory(
+        status="reversed", cashback_amount=Decimal("0")
+    )
+
+    # Act
+    await purchase_service.reverse_purchase(
+        _REVERSE_PURCHASE_ID, _REVERSE_ADMIN_ID, uow
+    )
+
+    # Assert — released in the month the purchase was counted in
+    cashback_client.release_monthly_usage.assert_called_once_with(
+        uow.session, "offer-1", _REVERSE_USER_ID, date(2026, 3, 1), Decimal("5.00")
+    )
+
+
 @pytest.mark.asyncio
 async def test_reverse_purchase_publishes_domain_event_on_success(
     purchase_service: PurchaseService,
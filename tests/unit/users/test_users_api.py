@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 
 from app.core.database import get_async_db
 from app.core.errors.codes import ErrorCode as CoreErrorCode
+from app.core.password_hashing import PasswordHashingBusyException
 from app.main import app
 from app.users.api import get_user_service
 from app.users.errors import ErrorCode as UserErrorCode
@@ -104,6 +105,11 @@ def test_create_user_returns_201_on_success(
             status.HTTP_409_CONFLICT,
             UserErrorCode.EMAIL_ALREADY_REGISTERED,
         ),
+        (
+            PasswordHashingBusyException(retry_after_seconds=1),
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            CoreErrorCode.SERVICE_UNAVAILABLE,
+        ),
         (
             Exception("Something broke"),
             status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,4 +1,5 @@
-from typing import Any, Callable
+from collections.abc import Awaitable, Callable
+from typing import Any
 from unittest.mock import AsyncMock, Mock, create_autospec
 
 import pytest
@@ -18,8 +19,8 @@ def enforce_password_complexity() -> Callable[[str], None]:
 
 
 @pytest.fixture
-def hash_password() -> Callable[[str], str]:
-    return Mock(return_value="hashed_pw")
+def hash_password() -> Callable[[str], Awaitable[str]]:
+    return AsyncMock(return_value="hashed_pw")
 
 
 @pytest.fixture
@@ -30,7 +31,7 @@ def user_repository() -> Mock:
 @pytest.fixture
 def user_service(
     enforce_password_complexity: Callable[[str], None],
-    hash_password: Callable[[str], str],
+    hash_password: Callable[[str], Awaitable[str]],
     user_repository: Mock,
 ) -> UserService:
     return UserService(
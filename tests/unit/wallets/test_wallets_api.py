@@ -130,6 +130,31 @@ def test_get_wallet_summary_returns_200_on_success(
     assert Decimal(str(data["paid_balance"])) == expected_paid
 
 
+def test_get_wallet_summary_returns_304_when_etag_matches(
+    client: TestClient,
+    wallet_service_mock: Mock,
+) -> None:
+    # Arrange
+    wallet_service_mock.get_wallet_summary = AsyncMock(
+        return_value=WalletSummaryOut(
+            pending_balance=Decimal("5.00"),
+            available_balance=Decimal("25.50"),
+            paid_balance=Decimal("100.00"),
+        )
+    )
+    first = client.get("/api/v1/users/me/wallet")
+
+    # Act
+    response = client.get(
+        "/api/v1/users/me/wallet", headers={"If-None-Match": first.headers["etag"]}
+    )
+
+    # Assert
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # GET /api/v1/users/me/wallet — 500
 # ──────────────────────────────────────────────────────────────────────────────
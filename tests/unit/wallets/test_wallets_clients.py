@@ -6,6 +6,7 @@ import pytest
 
 from app.cashback.models import CashbackTransaction
 from app.cashback.repositories import CashbackTransactionRepositoryABC
+from app.core.pagination import TotalCount
 from app.wallets.clients.cashback import CashbackClient, CashbackTransactionDTO
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -103,4 +104,28 @@ async def test_cashback_client_list_by_user_id_delegates_pagination_params(
     await cashback_client.list_by_user_id(db, user_id, limit=20, offset=40)
 
     # Assert
-    cashback_repo_mock.list_by_user_id.assert_called_once_with(db, user_id, 20, 40)
+    cashback_repo_mock.list_by_user_id.assert_called_once_with(
+        db, user_id, 20, 40, total_count=TotalCount.EXACT
+    )
+
+
+@pytest.mark.asyncio
+async def test_cashback_client_list_by_user_id_skips_total_when_not_requested(
+    cashback_client: CashbackClient,
+    cashback_repo_mock: Mock,
+) -> None:
+    # Arrange
+    db = AsyncMock()
+    cashback_repo_mock.list_by_user_id.return_value = ([], None)
+
+    # Act
+    _, total = await cashback_client.list_by_user_id(
+        db, "user-1", limit=20, offset=0, include_total=False
+    )
+
+    # Assert
+    assert total is None
+    assert (
+        cashback_repo_mock.list_by_user_id.call_args.kwargs["total_count"]
+        == TotalCount.SKIP
+    )
@@ -156,7 +156,9 @@ async def test_list_wallet_transactions_forwards_limit_and_offset_to_client(
     await wallet_service.list_wallet_transactions(_USER_ID, 25, 50, db)
 
     # Assert
-    cashback_client.list_by_user_id.assert_called_once_with(db, _USER_ID, 25, 50)
+    cashback_client.list_by_user_id.assert_called_once_with(
+        db, _USER_ID, 25, 50, include_total=True
+    )
 
 
 # ──────────────────────────────────────────────────────────────────────────────